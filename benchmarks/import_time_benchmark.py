@@ -0,0 +1,60 @@
+"""
+smtm import 시간 벤치마크
+
+Runs each statement in a fresh interpreter with `python -X importtime` and reports
+the median import time it adds on top of a bare interpreter, plus which heavy
+dependencies ended up loaded. `import smtm` must stay in the tens of milliseconds
+and must not load anthropic, numpy, pandas or jwt.
+
+python -m benchmarks.import_time_benchmark
+"""
+
+import statistics
+import subprocess
+import sys
+
+STATEMENTS = (
+    "import smtm",
+    "from smtm import TradingOperator",
+    "from smtm import SessionManager",
+    "from smtm import StrategySma",
+    "from smtm import TelegramController",
+)
+HEAVY_MODULES = ("anthropic", "numpy", "pandas", "jwt")
+RUNS = 5
+
+
+def _import_time_us(statement):
+    """statement를 새 인터프리터에서 실행하고 최상위 import들의 누적 시간 합(us)을 돌려준다"""
+    code = (
+        f"{statement}\n"
+        "import sys\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not name.startswith("  "):
+            total += int(cumulative)
+    return total, result.stdout.strip()
+
+
+def main():
+    baseline = statistics.median(_import_time_us("pass")[0] for _ in range(RUNS))
+    for statement in STATEMENTS:
+        samples = [_import_time_us(statement) for _ in range(RUNS)]
+        elapsed = statistics.median(total for total, _ in samples) - baseline
+        heavy = samples[-1][1] or "-"
+        print(f"{statement:<40} {elapsed / 1000:8.1f} ms   loaded: {heavy}")
+
+
+if __name__ == "__main__":
+    main()
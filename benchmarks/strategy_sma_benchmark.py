@@ -0,0 +1,50 @@
+"""
+StrategySma 틱당 처리 시간 벤치마크
+
+Measures StrategySma per-tick latency after 10k, 100k and 1M candles.
+The per-tick cost must stay flat as the session grows.
+
+python -m benchmarks.strategy_sma_benchmark
+"""
+
+import logging
+import math
+import time
+from smtm import StrategySma
+
+CHECKPOINTS = (10_000, 100_000, 1_000_000)
+MEASURE_TICKS = 1000
+
+
+def _candle(idx):
+    price = 50000000 + 100000 * math.sin(idx / 50) + (idx % 7) * 1000
+    return [
+        {
+            "type": "primary_candle",
+            "market": "BTC",
+            "date_time": "2020-02-25T15:41:09",
+            "closing_price": float(price),
+        }
+    ]
+
+
+def main():
+    logging.disable(logging.CRITICAL)
+    strategy = StrategySma()
+    strategy.initialize(1000000, 5000)
+    idx = 0
+    for checkpoint in CHECKPOINTS:
+        while idx < checkpoint:
+            strategy.update_trading_info(_candle(idx))
+            idx += 1
+
+        start = time.perf_counter()
+        for _ in range(MEASURE_TICKS):
+            strategy.update_trading_info(_candle(idx))
+            idx += 1
+        elapsed = time.perf_counter() - start
+        print(f"{checkpoint:>9} candles: {elapsed / MEASURE_TICKS * 1e6:8.2f} us/tick")
+
+
+if __name__ == "__main__":
+    main()
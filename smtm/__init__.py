@@ -1,76 +1,90 @@
 """
 Description for Package
+
+공개 클래스는 처음 접근할 때 해당 모듈을 import한다 (PEP 562).
+`import smtm`만으로 anthropic, numpy, 거래소 Trader와 모든 DataProvider를 불러오지 않으므로
+CLI, 테스트 워커, 하위 프로세스의 시작 시간이 짧다.
 """
 
 from .config import Config
-from .worker import Worker
-from .date_converter import DateConverter
 from .log_manager import LogManager
-from .data.upbit_data_provider import UpbitDataProvider
-from .data.upbit_binance_data_provider import UpbitBinanceDataProvider
-from .data.bithumb_data_provider import BithumbDataProvider
-from .data.binance_data_provider import BinanceDataProvider
-from .data.news_data_provider import NewsDataProvider
-from .data.news_sources import (
-    CoinTelegraphNewsDataProvider,
-    DecryptNewsDataProvider,
-    CryptoSlateNewsDataProvider,
-    BitcoinMagazineNewsDataProvider,
-    TheBlockNewsDataProvider,
-    WSJMarketsNewsDataProvider,
-    MarketWatchNewsDataProvider,
-    CNBCFinanceNewsDataProvider,
-)
-from .data.multi_news_data_provider import MultiNewsDataProvider
-from .data.reddit_data_provider import (
-    RedditDataProvider,
-    CryptoCurrencyRedditDataProvider,
-    BitcoinRedditDataProvider,
-)
-from .data.fear_greed_data_provider import FearGreedDataProvider
-from .data.coingecko_data_provider import CoinGeckoDataProvider
-from .data.blockchain_info_data_provider import BlockchainInfoDataProvider
-from .data.mempool_fees_data_provider import MempoolFeesDataProvider
-from .data.binance_funding_rate_data_provider import BinanceFundingRateDataProvider
-from .data.upbit_notice_data_provider import UpbitNoticeDataProvider
-from .data.exchange_rate_data_provider import ExchangeRateDataProvider
-from .data.hackernews_data_provider import HackerNewsDataProvider
-from .data.yahoo_finance_data_provider import YahooFinanceDataProvider
-from .data.crypto_global_data_provider import CryptoGlobalDataProvider
-from .data.binance_open_interest_data_provider import BinanceOpenInterestDataProvider
-from .data.binance_long_short_ratio_data_provider import BinanceLongShortRatioDataProvider
-from .data.etherscan_gas_data_provider import EtherscanGasDataProvider
-from .data.coincap_data_provider import CoinCapDataProvider
-from .data.upbit_news_data_provider import UpbitNewsDataProvider
-from .data.upbit_multi_news_data_provider import UpbitMultiNewsDataProvider
-from .data.upbit_social_data_provider import UpbitSocialDataProvider
-from .data.upbit_full_context_data_provider import UpbitFullContextDataProvider
-from .data.data_provider_factory import DataProviderFactory
-from .trader.upbit_trader import UpbitTrader
-from .trader.bithumb_trader import BithumbTrader
-from .trader.binance_trader import BinanceTrader
-from .trader.trader_factory import TraderFactory
-from .controller.jpt_controller import JptController
-from .controller.telegram import TelegramController
-from .llm.llm_client import LlmClient
-from .llm.claude_llm_client import ClaudeLlmClient
-from .llm.safety_guard import SafetyGuard, SafetyConfig
-from .llm.system_monitor import SystemMonitor
-from .analyzer import Analyzer
-from .trading_operator import TradingOperator
-from .strategy.strategy import Strategy
-from .strategy.strategy_bnh import StrategyBuyAndHold
-from .strategy.strategy_rsi import StrategyRsi
-from .strategy.strategy_sma import StrategySma
-from .strategy.strategy_llm import StrategyLlm
-from .strategy.strategy_factory import StrategyFactory
-from .profile_store import ProfileStore
-from .account_store import AccountStore
-from .session_manager import SessionManager, TradingSession
+from .lazy_import import lazy_attributes
+
+_LAZY_ATTRIBUTES = {
+    "Worker": ".worker",
+    "DateConverter": ".date_converter",
+    "UpbitDataProvider": ".data.upbit_data_provider",
+    "UpbitBinanceDataProvider": ".data.upbit_binance_data_provider",
+    "BithumbDataProvider": ".data.bithumb_data_provider",
+    "BinanceDataProvider": ".data.binance_data_provider",
+    "UpbitStreamDataProvider": ".data.upbit_stream_data_provider",
+    "BinanceStreamDataProvider": ".data.binance_stream_data_provider",
+    "NewsDataProvider": ".data.news_data_provider",
+    "CoinTelegraphNewsDataProvider": ".data.news_sources",
+    "DecryptNewsDataProvider": ".data.news_sources",
+    "CryptoSlateNewsDataProvider": ".data.news_sources",
+    "BitcoinMagazineNewsDataProvider": ".data.news_sources",
+    "TheBlockNewsDataProvider": ".data.news_sources",
+    "WSJMarketsNewsDataProvider": ".data.news_sources",
+    "MarketWatchNewsDataProvider": ".data.news_sources",
+    "CNBCFinanceNewsDataProvider": ".data.news_sources",
+    "MultiNewsDataProvider": ".data.multi_news_data_provider",
+    "RedditDataProvider": ".data.reddit_data_provider",
+    "CryptoCurrencyRedditDataProvider": ".data.reddit_data_provider",
+    "BitcoinRedditDataProvider": ".data.reddit_data_provider",
+    "FearGreedDataProvider": ".data.fear_greed_data_provider",
+    "CoinGeckoDataProvider": ".data.coingecko_data_provider",
+    "BlockchainInfoDataProvider": ".data.blockchain_info_data_provider",
+    "MempoolFeesDataProvider": ".data.mempool_fees_data_provider",
+    "BinanceFundingRateDataProvider": ".data.binance_funding_rate_data_provider",
+    "UpbitNoticeDataProvider": ".data.upbit_notice_data_provider",
+    "ExchangeRateDataProvider": ".data.exchange_rate_data_provider",
+    "HackerNewsDataProvider": ".data.hackernews_data_provider",
+    "YahooFinanceDataProvider": ".data.yahoo_finance_data_provider",
+    "CryptoGlobalDataProvider": ".data.crypto_global_data_provider",
+    "BinanceOpenInterestDataProvider": ".data.binance_open_interest_data_provider",
+    "BinanceLongShortRatioDataProvider": ".data.binance_long_short_ratio_data_provider",
+    "EtherscanGasDataProvider": ".data.etherscan_gas_data_provider",
+    "CoinCapDataProvider": ".data.coincap_data_provider",
+    "UpbitNewsDataProvider": ".data.upbit_news_data_provider",
+    "UpbitMultiNewsDataProvider": ".data.upbit_multi_news_data_provider",
+    "UpbitSocialDataProvider": ".data.upbit_social_data_provider",
+    "UpbitFullContextDataProvider": ".data.upbit_full_context_data_provider",
+    "DataProviderFactory": ".data.data_provider_factory",
+    "UpbitTrader": ".trader.upbit_trader",
+    "BithumbTrader": ".trader.bithumb_trader",
+    "BinanceTrader": ".trader.binance_trader",
+    "TraderFactory": ".trader.trader_factory",
+    "JptController": ".controller.jpt_controller",
+    "TelegramController": ".controller.telegram.telegram_controller",
+    "LlmClient": ".llm.llm_client",
+    "ClaudeLlmClient": ".llm.claude_llm_client",
+    "SafetyGuard": ".llm.safety_guard",
+    "SafetyConfig": ".llm.safety_guard",
+    "SystemMonitor": ".llm.system_monitor",
+    "Analyzer": ".analyzer",
+    "TradingOperator": ".trading_operator",
+    "AsyncTradingOperator": ".async_trading_operator",
+    "EventTradingOperator": ".event_trading_operator",
+    "Backtester": ".backtester",
+    "Strategy": ".strategy.strategy",
+    "StrategyBuyAndHold": ".strategy.strategy_bnh",
+    "StrategyRsi": ".strategy.strategy_rsi",
+    "StrategySma": ".strategy.strategy_sma",
+    "StrategyLlm": ".strategy.strategy_llm",
+    "StrategyFactory": ".strategy.strategy_factory",
+    "ProfileStore": ".profile_store",
+    "AccountStore": ".account_store",
+    "SessionManager": ".session_manager",
+    "TradingSession": ".session_manager",
+}
+
+__getattr__, __dir__ = lazy_attributes(__name__, _LAZY_ATTRIBUTES)
 
 __all__ = [
     "LogManager",
     "Analyzer",
+    "Backtester",
     "JptController",
     "TelegramController",
     "ProfileStore",
@@ -2,7 +2,7 @@ import argparse
 from argparse import RawTextHelpFormatter
 import sys
 
-from .controller.telegram import TelegramController
+from .config import Config
 from .log_manager import LogManager
 from .__init__ import __version__
 
@@ -24,6 +24,27 @@ python -m smtm --token <telegram-bot-token> --chatid <chat-id>
     parser.add_argument("--token", help="telegram chat-bot token", default=None)
     parser.add_argument("--chatid", help="telegram chat id", default=None)
     parser.add_argument("--log", help="log file name", default=None)
+    parser.add_argument(
+        "--metrics-port",
+        help="serve Prometheus metrics at http://127.0.0.1:<port>/metrics",
+        type=int,
+        default=None,
+    )
+    parser.add_argument(
+        "--batch-market-data",
+        help="fetch all markets of an exchange with one request per tick",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--stream-market-data",
+        help="build Upbit/Binance candles from the exchange WebSocket trade stream",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--stream-url",
+        help="WebSocket url to stream from instead of the exchange, e.g. a replay server",
+        default=None,
+    )
     parser.add_argument(
         "--version", action="version", version=f"smtm version: {__version__}"
     )
@@ -38,6 +59,17 @@ def main(argv=None):
     args = parse_args(argv)
     if args.log is not None:
         LogManager.change_log_file(args.log)
+    if args.metrics_port is not None:
+        Config.metrics_port = args.metrics_port
+    if args.batch_market_data:
+        Config.market_data_batch = True
+    if args.stream_market_data:
+        Config.market_data_stream = True
+    if args.stream_url is not None:
+        Config.stream_url = args.stream_url
+
+    # --help, --version만으로 LLM SDK와 트레이더를 불러오지 않도록 여기서 import한다
+    from .controller.telegram.telegram_controller import TelegramController
 
     try:
         controller = TelegramController(token=args.token, chat_id=args.chatid)
@@ -1,23 +1,62 @@
+import math
+from array import array
+from collections import deque
+from datetime import datetime
 from .log_manager import LogManager
 
 
 class Analyzer:
-    """SystemMonitor 위에서 Strategy 콜백 계약과 최소 성과 집계를 제공하는 경량 분석 계층"""
+    """SystemMonitor 위에서 Strategy 콜백 계약과 최소 성과 집계를 제공하는 경량 분석 계층
+
+    틱마다 update_portfolio_value로 받은 자산 가치와 put_result로 받은 체결 결과로
+    성과 통계를 누적한다. 모든 통계는 값이 들어올 때 O(1)로 갱신되므로
+    get_return_report는 기록을 다시 훑지 않는다.
+
+    ROLLING_WINDOW: 변동성과 샤프 지수를 계산하는 최근 틱 수
+    """
+
+    ROLLING_WINDOW = 30
+    ISO_DATEFORMAT = "%Y-%m-%dT%H:%M:%S"
 
     def __init__(self, system_monitor, session_name=None):
         self.logger = LogManager.get_logger(__class__.__name__)
         self.system_monitor = system_monitor
         self.session_name = session_name
         self.get_account_info_func = None
+        self.commission_ratio = 0
         self.start_value = None
         self.spots = []
         self.lines = []
+        self._reset_stats()
 
-    def initialize(self, get_account_info_func):
+    def initialize(self, get_account_info_func, commission_ratio=0):
+        """commission_ratio: 체결 결과에 fee가 없을 때 거래 금액에 곱해 수수료를 추정하는 비율"""
         self.get_account_info_func = get_account_info_func
+        self.commission_ratio = (
+            commission_ratio if isinstance(commission_ratio, (int, float)) else 0
+        )
 
     def make_start_point(self):
         self.start_value = self.current_account_value()
+        self._reset_stats()
+        self.update_portfolio_value(self.start_value)
+
+    def _reset_stats(self):
+        self.equity = array("d")
+        self.peak_value = 0.0
+        self.max_drawdown = 0.0
+        self.returns = deque()
+        self.return_sum = 0.0
+        self.return_square_sum = 0.0
+        self.win_count = 0
+        self.loss_count = 0
+        self.realized_pnl = 0.0
+        self.turnover = 0.0
+        self.total_fee = 0.0
+        self.closed_positions = 0
+        self.total_holding_seconds = 0.0
+        # 통화별 (평균 매입 단가(수수료 포함), 수량, 포지션 진입 시간)
+        self.positions = {}
 
     def put_trading_info(self, info):
         self.system_monitor.log_market_data(info, session=self.session_name)
@@ -28,6 +67,102 @@ class Analyzer:
 
     def put_result(self, result):
         self.system_monitor.log_trade_result(result, session=self.session_name)
+        self._update_trade_stats(result)
+
+    def update_portfolio_value(self, value):
+        """틱마다 현재 자산 가치를 기록하고 낙폭, 변동성 통계를 갱신한다"""
+        value = float(value)
+        if self.equity and self.equity[-1] > 0:
+            self._push_return(value / self.equity[-1] - 1)
+        self.equity.append(value)
+        if value > self.peak_value:
+            self.peak_value = value
+        elif self.peak_value > 0:
+            self.max_drawdown = max(self.max_drawdown, (self.peak_value - value) / self.peak_value)
+
+    def _push_return(self, ret):
+        self.returns.append(ret)
+        self.return_sum += ret
+        self.return_square_sum += ret * ret
+        if len(self.returns) > self.ROLLING_WINDOW:
+            old = self.returns.popleft()
+            self.return_sum -= old
+            self.return_square_sum -= old * old
+
+    def get_volatility(self):
+        """최근 ROLLING_WINDOW 틱 수익률의 표본 표준편차"""
+        count = len(self.returns)
+        if count < 2:
+            return 0.0
+        variance = (self.return_square_sum - self.return_sum * self.return_sum / count) / (
+            count - 1
+        )
+        return math.sqrt(max(variance, 0.0))
+
+    def get_sharpe_ratio(self):
+        """최근 ROLLING_WINDOW 틱의 평균 수익률 / 표준편차, 무위험 수익률 0, 연율화하지 않는다"""
+        volatility = self.get_volatility()
+        if volatility <= 1e-12:
+            return 0.0
+        return self.return_sum / len(self.returns) / volatility
+
+    def _update_trade_stats(self, result):
+        if not isinstance(result, dict) or result.get("state") != "done":
+            return
+        trade_type = result.get("type")
+        if trade_type not in ("buy", "sell"):
+            return
+        try:
+            price = float(result.get("price", 0))
+            amount = float(result.get("amount", 0))
+        except (TypeError, ValueError):
+            return
+        if price <= 0 or amount <= 0:
+            return
+
+        value = price * amount
+        fee = result.get("fee")
+        fee = float(fee) if isinstance(fee, (int, float)) else value * self.commission_ratio
+        self.turnover += value
+        self.total_fee += fee
+
+        request = result.get("request") or {}
+        currency = request.get("currency") or result.get("currency")
+        avg_cost, held, opened_at = self.positions.get(currency, (0.0, 0.0, None))
+        if trade_type == "buy":
+            if held <= 0:
+                opened_at = self._parse_date_time(result.get("date_time"))
+            new_amount = held + amount
+            avg_cost = (avg_cost * held + value + fee) / new_amount
+            self.positions[currency] = (avg_cost, new_amount, opened_at)
+            return
+
+        if held <= 0:
+            # 분석 시작 전부터 보유한 수량의 매도는 매입 단가를 모르므로 손익에서 뺀다
+            return
+        sold = min(amount, held)
+        pnl = value - fee - avg_cost * sold
+        self.realized_pnl += pnl
+        if pnl > 0:
+            self.win_count += 1
+        elif pnl < 0:
+            self.loss_count += 1
+        remaining = held - sold
+        if remaining > 1e-9:
+            self.positions[currency] = (avg_cost, remaining, opened_at)
+            return
+        self.positions.pop(currency, None)
+        closed_at = self._parse_date_time(result.get("date_time"))
+        if opened_at is not None and closed_at is not None:
+            self.closed_positions += 1
+            self.total_holding_seconds += (closed_at - opened_at).total_seconds()
+
+    @classmethod
+    def _parse_date_time(cls, date_time):
+        try:
+            return datetime.strptime(str(date_time)[:19], cls.ISO_DATEFORMAT)
+        except ValueError:
+            return None
 
     def put_safety_event(self, event):
         self.system_monitor.log_safety_event(event, session=self.session_name)
@@ -50,11 +185,50 @@ class Analyzer:
         return value
 
     def get_return_report(self) -> dict:
+        """수익률 리포트
+
+        Returns:
+        {
+            "start_value": 시작 자산 가치
+            "current_value": 현재 자산 가치
+            "cumulative_return": 누적 수익률 (%)
+            "max_drawdown": 최고점 대비 최대 하락률 (%)
+            "volatility": 최근 틱 수익률의 표준편차 (%)
+            "sharpe_ratio": 최근 틱 평균 수익률 / 표준편차
+            "win_count": 이익으로 끝난 매도 수
+            "loss_count": 손실로 끝난 매도 수
+            "win_rate": 승률 (%)
+            "realized_pnl": 실현 손익
+            "avg_holding_time": 청산된 포지션의 평균 보유 시간 (초)
+            "turnover": 누적 거래 금액
+            "turnover_ratio": 시작 자산 가치 대비 누적 거래 금액 비율
+            "total_fee": 누적 수수료
+        }
+        """
         current_value = self.current_account_value()
         start_value = self.start_value
-        if not start_value:
-            return {"start_value": current_value, "current_value": current_value,
-                    "cumulative_return": 0}
-        cumulative_return = round((current_value - start_value) / start_value * 100, 3)
-        return {"start_value": start_value, "current_value": current_value,
-                "cumulative_return": cumulative_return}
+        report = {"start_value": current_value, "current_value": current_value,
+                  "cumulative_return": 0}
+        if start_value:
+            cumulative_return = round((current_value - start_value) / start_value * 100, 3)
+            report = {"start_value": start_value, "current_value": current_value,
+                      "cumulative_return": cumulative_return}
+
+        closed = self.win_count + self.loss_count
+        report.update({
+            "max_drawdown": round(self.max_drawdown * 100, 3),
+            "volatility": round(self.get_volatility() * 100, 4),
+            "sharpe_ratio": round(self.get_sharpe_ratio(), 4),
+            "win_count": self.win_count,
+            "loss_count": self.loss_count,
+            "win_rate": round(self.win_count / closed * 100, 3) if closed else 0,
+            "realized_pnl": round(self.realized_pnl, 4),
+            "avg_holding_time": (
+                round(self.total_holding_seconds / self.closed_positions, 1)
+                if self.closed_positions else 0
+            ),
+            "turnover": round(self.turnover, 4),
+            "turnover_ratio": round(self.turnover / start_value, 4) if start_value else 0,
+            "total_fee": round(self.total_fee, 4),
+        })
+        return report
@@ -0,0 +1,85 @@
+import asyncio
+import threading
+import time
+from .tick_scheduler import TickJob, TickScheduler
+from .trading_operator import TradingOperator
+from .trading_event_loop import TradingEventLoop
+
+
+class AsyncTradingOperator(TradingOperator):
+    """
+    세션별 스레드 없이 틱을 프로세스 공용 스레드 풀에서 실행하는 TradingOperator (shared 모드)
+
+    Same pipeline and Strategy/Trader contracts as TradingOperator, but instead of a
+    Worker thread per session and a new threading.Timer per tick, each running
+    session is one scheduled job on the process-wide TradingEventLoop: it runs the tick
+    on the shared thread pool and then waits for the next interval boundary
+    (TickScheduler.get_next_time), so boundaries that pass during a slow tick are
+    coalesced the same way the TickScheduler does. Exchange traders that support
+    use_shared_pool() also run their orders and order status checks on that pool
+    instead of their own Worker thread. See TradingEventLoop for the queueing limit.
+
+    event_loop: 사용할 TradingEventLoop, 지정하지 않으면 프로세스 공용 루프
+    """
+
+    def __init__(self, interval=60, currency="BTC", event_loop=None):
+        super().__init__(interval=interval, currency=currency)
+        self.event_loop = event_loop
+        self.future = None
+        # 틱은 이 락을 잡고 실행하므로 stop()은 진행 중인 틱이 끝난 뒤에 주문을 취소한다
+        self._tick_lock = threading.RLock()
+
+    def _create_worker(self):
+        # 틱은 공유 이벤트 루프에서 실행하므로 세션별 Worker 스레드를 만들지 않는다
+        return None
+
+    def start(self) -> bool:
+        if self.state != "ready" or self.future is not None:
+            return False
+        self.logger.info("===== AsyncTradingOperator Start =====")
+        self.state = "running"
+        self.analyzer.make_start_point()
+        if self.event_loop is None:
+            self.event_loop = TradingEventLoop.get_instance()
+        use_shared_pool = getattr(self.trader, "use_shared_pool", None)
+        if use_shared_pool is not None:
+            use_shared_pool(self.event_loop)
+        self.timer = TickJob(None, self.interval, TickScheduler.get_offset(self.interval))
+        self.future = self.event_loop.submit(self._run())
+        return True
+
+    def stop(self):
+        if self.state != "running":
+            return
+        self.state = "ready"
+        if self.future is not None:
+            self.future.cancel()
+            self.future = None
+        with self._tick_lock:
+            self.trader.cancel_all_requests()
+        self.logger.info("===== AsyncTradingOperator Stop =====")
+
+    async def _run(self):
+        try:
+            await self.event_loop.run_blocking(self._run_scheduled_tick)
+            job = self.timer
+            previous_time = None
+            while self.state == "running":
+                scheduled_time = TickScheduler.get_next_time(job.interval, job.offset)
+                if previous_time is not None:
+                    # 틱이 길어져 지나간 경계는 다음 경계 하나로 합친다
+                    job.coalesced_count += max(
+                        0, round((scheduled_time - previous_time) / job.interval) - 1)
+                await asyncio.sleep(max(0.0, scheduled_time - time.time()))
+                job.record_start(scheduled_time)
+                previous_time = scheduled_time
+                await self.event_loop.run_blocking(self._run_scheduled_tick)
+        except asyncio.CancelledError:
+            pass
+
+    def _run_scheduled_tick(self):
+        # 코루틴을 취소해도 스레드 풀에 넘어간 틱은 멈추지 않으므로 stop() 이후의 틱은 건너뛴다
+        with self._tick_lock:
+            if self.state != "running":
+                return
+            self._run_tick()
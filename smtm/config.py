@@ -15,6 +15,19 @@ class Config:
     # SimulationDualDataProvider의 데이터를 사용할지 여부: normal, dual
     simulation_data_provider_type = "normal"
     candle_interval = 60
+    # DataProvider가 받은 캔들을 기록할 로컬 캔들 저장소 경로, None이면 기록하지 않음
+    candle_store_path = None
+    # TradingOperator 실행 방식: thread(세션별 워커와 타이머), shared(모든 세션과 Trader가 공유 스레드 풀에서
+    # 실행, async는 이전 이름), event(캔들이 닫힐 때마다 실행)
+    operator_mode = "thread"
+    # Prometheus 형식 지표를 내보낼 로컬 HTTP 포트 (/metrics), None이면 서버를 띄우지 않음
+    metrics_port = None
+    # 거래소와 인터벌이 같고 통화만 다른 세션들의 시세를 틱마다 한 번의 요청으로 함께 조회할지 여부
+    market_data_batch = False
+    # 거래소 캔들을 REST 조회 대신 WebSocket 체결 스트림으로 받을지 여부
+    market_data_stream = False
+    # 스트리밍 DataProvider가 접속할 WebSocket 주소, None이면 거래소 주소 (로컬 재생 서버 테스트용)
+    stream_url = None
     """
     스트림 핸들러의 레벨 levels of stream handlers
     CRITICAL  50
@@ -3,8 +3,12 @@ Telegram Controller Module
 텔레그램 컨트롤러 모듈
 """
 
-from .telegram_controller import TelegramController
-from .message_handler import TelegramMessageHandler
+from ...lazy_import import lazy_attributes
+
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    "TelegramController": ".telegram_controller",
+    "TelegramMessageHandler": ".message_handler",
+})
 
 __all__ = [
     "TelegramController",
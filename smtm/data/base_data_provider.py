@@ -1,3 +1,4 @@
+from datetime import datetime, timedelta, timezone
 import requests
 from .data_provider import DataProvider
 from ..log_manager import LogManager
@@ -15,22 +16,91 @@ class BaseDataProvider(DataProvider):
     And set:
         - self._api_url: API endpoint URL
         - self._query_params: query parameters dict or None
+        - self.candle_interval: 캔들 인터벌(초), CandleStore 기록 단위
+    Optionally implement:
+        - _fetch_recent_candles(count): 한 번의 요청으로 최근 완성 캔들 조회, 전략 워밍업용
+        - get_batch_info(providers) (classmethod): 같은 클래스의 여러 통화 DataProvider를
+          한 번의 요청으로 조회해서 {market: 캔들 리스트}로 반환, MarketDataHub 일괄 조회용
     """
 
+    KST = timezone(timedelta(hours=9))
+
     def __init__(self, logger_name):
         self.logger = LogManager.get_logger(logger_name)
         self._api_url = None
         self._query_params = None
         self.market = None
+        self.candle_interval = 60
+        self.candle_store = None
+
+    def _store_candles(self, candles):
+        """candle_store가 설정된 경우 캔들을 기록한다. 기록 실패가 매매 루프를 막지 않는다"""
+        if self.candle_store is None:
+            return
+        try:
+            self.candle_store.append(
+                self.CODE,
+                self.market,
+                self.candle_interval,
+                [candle for candle in candles if candle is not None],
+            )
+        except (OSError, ValueError, KeyError, TypeError) as err:
+            self.logger.warning(f"fail to store candles: {err}")
+
+    def get_recent_candles(self, count):
+        """전략 워밍업에 쓸 최근 완성 캔들 count개를 시간순 리스트로 반환한다
+
+        candle_store에 최근 캔들이 빠짐없이 있으면 저장소에서 읽고, 아니면 거래소에
+        한 번 요청해서 받은 뒤 저장소에도 기록한다. 아직 만들어지고 있는 현재 캔들은
+        첫 실시간 틱에서 들어오므로 제외한다.
+        """
+        if count <= 0:
+            return []
+
+        candles = self._read_recent_candles(count)
+        if len(candles) >= count:
+            return candles
+
+        candles = self._fetch_recent_candles(count)
+        self._store_candles(candles)
+        return candles[-count:]
+
+    def _read_recent_candles(self, count):
+        if self.candle_store is None:
+            return []
+
+        from .candle_store import CandleStore
+
+        now = CandleStore.to_timestamp(
+            datetime.now(self.KST).strftime(CandleStore.ISO_DATEFORMAT)
+        )
+        try:
+            columns = self.candle_store.read(
+                self.CODE,
+                self.market,
+                self.candle_interval,
+                start=now - (count + 1) * self.candle_interval,
+                end=now - self.candle_interval,
+                count=count,
+            )
+        except (OSError, ValueError) as err:
+            self.logger.warning(f"fail to read stored candles: {err}")
+            return []
+        return CandleStore.to_candles(columns, self.market)
+
+    def _fetch_recent_candles(self, count):
+        """최근 완성 캔들 count개를 거래소에서 조회한다. 지원하지 않는 거래소는 빈 리스트"""
+        del count
+        return []
 
-    def _get_data_from_server(self):
+    def _get_data_from_server(self, query_params=None, url=None):
+        query_params = query_params or self._query_params
+        api_url = url or self._api_url
         try:
-            if self._query_params is not None:
-                response = request_with_retry(
-                    requests.get, self._api_url, params=self._query_params
-                )
+            if query_params is not None:
+                response = request_with_retry(requests.get, api_url, params=query_params)
             else:
-                response = request_with_retry(requests.get, self._api_url)
+                response = request_with_retry(requests.get, api_url)
             response.raise_for_status()
             return response.json()
         except ValueError as error:
@@ -1,3 +1,4 @@
+import json
 from datetime import datetime, timezone, timedelta
 from ..date_converter import DateConverter
 from .base_data_provider import BaseDataProvider
@@ -15,6 +16,7 @@ class BinanceDataProvider(BaseDataProvider):
     """
 
     URL = "https://api.binance.com/api/v3/klines"
+    TICKER_URL = "https://api.binance.com/api/v3/ticker"
     AVAILABLE_CURRENCY = {
         "BTC": "BTCUSDT",
         "ETH": "ETHUSDT",
@@ -23,6 +25,7 @@ class BinanceDataProvider(BaseDataProvider):
     }
     NAME = "BINANCE DP"
     CODE = "BNC"
+    PAGE_SIZE = 1000
     KST = timezone(timedelta(hours=9))
 
     def __init__(self, currency="BTC", interval=60):
@@ -31,6 +34,7 @@ class BinanceDataProvider(BaseDataProvider):
 
         super().__init__(logger_name="BinanceDataProvider")
         self.market = currency
+        self.candle_interval = interval
         if interval == 60:
             self.interval = "1m"
         elif interval == 180:
@@ -44,7 +48,8 @@ class BinanceDataProvider(BaseDataProvider):
         self._api_url = self.URL
         self._query_params = {
             "symbol": self.AVAILABLE_CURRENCY[currency],
-            "limit": 1,
+            # 직전의 완성 캔들과 현재 캔들을 함께 받는다
+            "limit": 2,
             "interval": self.interval,
         }
 
@@ -64,7 +69,67 @@ class BinanceDataProvider(BaseDataProvider):
         }
         """
         data = self._get_data_from_server()
-        return [self._create_candle_info(data[0])]
+        # 시간순 응답의 마지막은 아직 만들어지고 있는 캔들이므로 저장소에는 그 앞의 캔들만 기록한다
+        self._store_candles([self._create_candle_info(item) for item in data[-2:-1]])
+        return [self._create_candle_info(data[-1])]
+
+    @classmethod
+    def get_batch_info(cls, providers):
+        """여러 통화를 rolling window ticker 요청 한 번으로 받아 통화별 캔들 리스트를 반환한다
+
+        kline API는 심볼을 하나씩만 받으므로 symbols 목록을 받는 ticker API에 캔들 인터벌을
+        windowSize로 준다. 응답은 지금까지의 인터벌 길이 구간 OHLCV로, kline과 달리 구간이
+        분 경계에 맞춰져 있지 않다. date_time은 구간 끝 시각이 속한 캔들의 시작 시각이다.
+        같은 date_time의 kline과 값이 다르므로 캔들 저장소에 기록하지 않는다.
+
+        https://binance-docs.github.io/apidocs/spot/en/#rolling-window-price-change-statistics
+
+        Returns: {market: [캔들 정보]}
+        """
+        symbols = {provider._query_params["symbol"]: provider for provider in providers}
+        data = providers[0]._get_data_from_server(
+            {
+                "symbols": json.dumps(list(symbols), separators=(",", ":")),
+                "windowSize": providers[0].interval,
+            },
+            url=cls.TICKER_URL,
+        )
+        infos = {}
+        for ticker in data:
+            provider = symbols.get(ticker.get("symbol"))
+            if provider is None:
+                continue
+            candle = provider._create_candle_from_ticker(ticker)
+            if candle is None:
+                continue
+            infos[provider.market] = [candle]
+        return infos
+
+    def _create_candle_from_ticker(self, ticker):
+        try:
+            close_time = ticker["closeTime"]
+            close_time -= close_time % (self.candle_interval * 1000)
+            return {
+                "type": "primary_candle",
+                "market": self.market,
+                "date_time": self._get_kst_time_from_unix_time_ms(close_time),
+                "opening_price": float(ticker["openPrice"]),
+                "high_price": float(ticker["highPrice"]),
+                "low_price": float(ticker["lowPrice"]),
+                "closing_price": float(ticker["lastPrice"]),
+                "acc_price": float(ticker["quoteVolume"]),
+                "acc_volume": float(ticker["volume"]),
+            }
+        except (KeyError, TypeError, ValueError) as err:
+            self.logger.warning(f"invalid data for ticker candle info: {err}")
+            return None
+
+    def _fetch_recent_candles(self, count):
+        # 시간순으로 응답하고 마지막은 아직 만들어지고 있는 현재 캔들
+        query_params = dict(self._query_params, limit=min(count + 1, self.PAGE_SIZE))
+        data = self._get_data_from_server(query_params)
+        candles = [self._create_candle_info(item) for item in data[:-1]]
+        return [candle for candle in candles if candle is not None]
 
     def _create_candle_info(self, data):
         """
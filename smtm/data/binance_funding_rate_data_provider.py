@@ -19,6 +19,7 @@ class BinanceFundingRateDataProvider(DataProvider):
 
     NAME = "BINANCE FUNDING RATE DP"
     CODE = "BFR"
+    CACHE_TTL = 1800
 
     DEFAULT_URL = "https://fapi.binance.com/fapi/v1/premiumIndex"
     TIMEOUT = 5
@@ -0,0 +1,28 @@
+from .binance_data_provider import BinanceDataProvider
+from .stream_data_provider import StreamDataProvider
+
+
+class BinanceStreamDataProvider(StreamDataProvider):
+    """
+    바이낸스 WebSocket 체결 스트림으로 캔들을 만드는 DataProvider
+    DataProvider that builds candles from the Binance WebSocket trade stream
+
+    스트림 이름을 접속 경로에 넣으므로 구독 메시지를 따로 보내지 않는다.
+    https://binance-docs.github.io/apidocs/spot/en/#trade-streams
+    """
+
+    REST_PROVIDER_CLASS = BinanceDataProvider
+    STREAM_URL = "wss://stream.binance.com:9443/ws"
+    NAME = "BINANCE STREAM DP"
+    CODE = "BNS"
+
+    def __init__(self, currency="BTC", interval=60, url=None, record_path=None):
+        super().__init__(currency=currency, interval=interval, url=url, record_path=record_path)
+        self.symbol = BinanceDataProvider.AVAILABLE_CURRENCY[currency]
+        if url is None:
+            self.url = f"{self.url}/{self.symbol.lower()}@trade"
+
+    def _parse_trade(self, message):
+        if message.get("e") != "trade" or message.get("s") != self.symbol:
+            return None
+        return float(message["p"]), float(message["q"]), int(message["T"])
@@ -53,8 +53,19 @@ class BithumbDataProvider(BaseDataProvider):
         if data["status"] != "0000":
             raise UserWarning("Fail get data from sever")
 
+        # 마지막은 아직 만들어지고 있는 캔들이므로 저장소에는 그 앞의 완성 캔들만 기록한다
+        self._store_candles([self._create_candle_info(item) for item in data["data"][-2:-1]])
         return [self._create_candle_info(data["data"][-1])]
 
+    def _fetch_recent_candles(self, count):
+        # 시간순 최근 캔들 목록을 응답하고 마지막은 아직 만들어지고 있는 현재 캔들
+        data = self._get_data_from_server()
+        if data["status"] != "0000":
+            raise UserWarning("Fail get data from sever")
+
+        candles = [self._create_candle_info(item) for item in data["data"][-(count + 1):-1]]
+        return [candle for candle in candles if candle is not None]
+
     def _create_candle_info(self, data):
         try:
             return {
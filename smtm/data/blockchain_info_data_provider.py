@@ -18,6 +18,7 @@ class BlockchainInfoDataProvider(DataProvider):
 
     NAME = "BLOCKCHAIN.INFO ONCHAIN DP"
     CODE = "BCI"
+    CACHE_TTL = 1800
 
     DEFAULT_URL = "https://api.blockchain.info/stats"
     TIMEOUT = 5
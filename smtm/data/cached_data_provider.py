@@ -0,0 +1,115 @@
+import threading
+import time
+from .data_provider import DataProvider
+from ..log_manager import LogManager
+
+
+class CachedDataProvider(DataProvider):
+    """
+    느리게 바뀌는 부가 DataProvider의 결과를 TTL 동안 재사용하는 캐시 래퍼
+
+    Wraps a DataProvider and reuses its last non-empty get_info() result for `ttl`
+    seconds (the wrapped provider's CACHE_TTL by default). After the TTL the stale
+    result is still returned immediately while one background refresh runs on the
+    shared data-provider thread pool (stale-while-revalidate).
+
+    빈 결과는 조회 실패로 보고 캐시하지 않으며, 이전 결과가 있으면 그대로 유지한다.
+    갱신이 계속 실패해 결과가 max_stale 보다 오래되면 캐시를 버리고 직접 다시 조회하며,
+    그래도 실패하면 오래된 값 대신 빈 결과를 반환한다.
+
+    provider: 감쌀 DataProvider
+    ttl: 캐시 유지 시간(초), 지정하지 않으면 provider.CACHE_TTL
+    max_stale: 만료된 결과를 계속 쓸 수 있는 최대 경과 시간(초),
+        지정하지 않으면 ttl * MAX_STALE_RATIO, 0 이면 제한 없음
+    hits: 유효한 캐시로 응답한 횟수
+    stale_hits: 만료된 캐시로 응답하고 백그라운드 갱신을 요청한 횟수
+    misses: 캐시가 없어 직접 조회한 횟수
+    expired: max_stale 을 넘겨 캐시를 버린 횟수
+    """
+
+    MAX_STALE_RATIO = 3
+
+    def __init__(self, provider, ttl=None, max_stale=None):
+        self.logger = LogManager.get_logger(__class__.__name__)
+        self.provider = provider
+        self.ttl = ttl if ttl is not None else self.get_ttl(provider)
+        self.max_stale = max_stale if max_stale is not None else self.ttl * self.MAX_STALE_RATIO
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.expired = 0
+        self._items = None
+        self._fetched_at = None
+        self._refreshing = False
+        self._lock = threading.Lock()
+
+    @property
+    def NAME(self):
+        return getattr(self.provider, "NAME", type(self.provider).__name__)
+
+    @property
+    def CODE(self):
+        return getattr(self.provider, "CODE", None)
+
+    @staticmethod
+    def get_ttl(provider):
+        """provider 클래스에 선언된 CACHE_TTL, 없으면 0"""
+        ttl = getattr(type(provider), "CACHE_TTL", 0)
+        return ttl if isinstance(ttl, (int, float)) else 0
+
+    def get_info(self):
+        with self._lock:
+            if self._items is not None and self._is_expired():
+                self.logger.warning(
+                    f"{self.NAME} cache expired: no successful refresh for {self.max_stale}s"
+                )
+                self.expired += 1
+                self._items = None
+                self._fetched_at = None
+            if self._items is not None:
+                if time.monotonic() - self._fetched_at < self.ttl:
+                    self.hits += 1
+                else:
+                    self.stale_hits += 1
+                    self._request_refresh()
+                return self._copy(self._items)
+            self.misses += 1
+
+        return self._copy(self._refresh())
+
+    def get_stats(self):
+        return {
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "expired": self.expired,
+        }
+
+    def _is_expired(self):
+        return self.max_stale > 0 and time.monotonic() - self._fetched_at >= self.max_stale
+
+    def _request_refresh(self):
+        if self._refreshing:
+            return
+        from .parallel_fetcher import ParallelFetcher
+
+        self._refreshing = True
+        ParallelFetcher.get_executor().submit(self._refresh)
+
+    def _refresh(self):
+        try:
+            items = self.provider.get_info() or []
+        except Exception as err:
+            self.logger.warning(f"{self.NAME} refresh error: {err}")
+            items = []
+        with self._lock:
+            self._refreshing = False
+            if items:
+                self._items = items
+                self._fetched_at = time.monotonic()
+            return self._items or []
+
+    @staticmethod
+    def _copy(items):
+        return [dict(item) if isinstance(item, dict) else item for item in items]
@@ -0,0 +1,270 @@
+import argparse
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+import numpy as np
+import requests
+from ..date_converter import DateConverter
+from ..http_session import request_with_retry
+from ..log_manager import LogManager
+from .candle_store import CandleStore
+
+
+class CandleBackfiller:
+    """
+    거래소 캔들 API를 페이지 단위로 병렬 요청해서 과거 캔들을 CandleStore에 채우는 도구
+
+    Downloads historical candles page by page and writes them into a CandleStore.
+    DateConverter.to_end_min splits the period into page-sized chunks, pages are fetched
+    concurrently under the exchange's request rate limit, and results are appended in
+    time order. Only the periods of the requested range that are missing from the store
+    are requested, so an interrupted backfill resumes from the last candle stored inside
+    the range, and older history can still be filled in before live candles already
+    written to the store.
+
+    Upbit: /v1/candles/minutes/N, 페이지당 200개, 초당 10회
+    Binance: /api/v3/klines, 페이지당 1000개, 분당 요청 가중치 6000 (klines 1회 가중치 2)
+
+    store: 캔들을 기록할 CandleStore
+    exchange: 거래소 코드 UPB, BNC
+    currency: 거래 통화 BTC, ETH ...
+    interval: 캔들 인터벌(초) 60, 180, 300, 600
+    max_workers: 동시에 요청할 스레드 수
+    """
+
+    EXCHANGES = {
+        # 거래소 코드: (페이지당 캔들 수, 초당 최대 요청 수)
+        "UPB": (200, 10),
+        "BNC": (1000, 20),
+    }
+    KST = timezone(timedelta(hours=9))
+    TIMEOUT = 10
+    RETRY_ON_STATUS = (418, 429, 500, 502, 503, 504)
+    # 저장된 캔들 앞쪽을 채울 때는 저장소가 병합 후 다시 쓰므로 여러 페이지를 모아서 기록한다
+    FLUSH_ROWS = 50000
+
+    def __init__(self, store, exchange="UPB", currency="BTC", interval=60, max_workers=4):
+        if exchange not in self.EXCHANGES:
+            raise UserWarning(f"not supported exchange: {exchange}")
+
+        self.logger = LogManager.get_logger(__class__.__name__)
+        self.store = store
+        self.exchange = exchange
+        self.currency = currency
+        self.interval = interval
+        self.max_workers = max(1, max_workers)
+        self.page_size, rate = self.EXCHANGES[exchange]
+        self.provider = self._create_provider(exchange, currency, interval)
+        self._min_request_gap = 1.0 / rate
+        self._next_request_time = 0
+        self._rate_lock = threading.Lock()
+
+    @staticmethod
+    def _create_provider(exchange, currency, interval):
+        if exchange == "UPB":
+            from .upbit_data_provider import UpbitDataProvider
+
+            return UpbitDataProvider(currency=currency, interval=interval)
+
+        from .binance_data_provider import BinanceDataProvider
+
+        return BinanceDataProvider(currency=currency, interval=interval)
+
+    def backfill(self, from_dash_to):
+        """기간의 캔들을 내려받아 저장하고 새로 저장된 캔들 수를 반환한다
+
+        기간 안에서 저장소에 비어 있는 구간만 받는다. 페이지 요청이 실패하면
+        그때까지 순서대로 받은 캔들은 저장하고 UserWarning을 발생시킨다.
+
+        from_dash_to: yymmdd-yymmdd, yymmdd.HHMMSS-yymmdd.HHMMSS 형태의 KST 기간
+        """
+        chunks = self.get_chunks(from_dash_to)
+        if len(chunks) == 0:
+            self.logger.info(f"nothing to backfill: {from_dash_to}")
+            return 0
+
+        self.logger.info(
+            f"backfill start: {self.exchange} {self.currency} {chunks[0][0]} ~ {chunks[-1][1]}, "
+            f"{len(chunks)} pages"
+        )
+        stored = 0
+        buffer = []
+        pending = deque()
+        chunk_iter = iter(chunks)
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="backfill"
+        ) as executor:
+            try:
+                # 저장은 시간순이어야 하므로 먼저 요청한 페이지부터 기다리며 모은다
+                for chunk in chunk_iter:
+                    pending.append((chunk, executor.submit(self._fetch, chunk)))
+                    if len(pending) < self.max_workers * 2:
+                        continue
+                    buffer += self._get_page(*pending.popleft())
+                    if len(buffer) >= self.FLUSH_ROWS:
+                        stored += self._flush(buffer)
+                while pending:
+                    buffer += self._get_page(*pending.popleft())
+            finally:
+                for _, future in pending:
+                    future.cancel()
+                stored += self._flush(buffer)
+
+        self.logger.info(f"backfill done: {stored} candles stored")
+        return stored
+
+    def get_chunks(self, from_dash_to):
+        """기간을 페이지 단위 (start, end, count) 리스트로 나누고 저장된 구간은 제외한다"""
+        interval_min = self.interval // 60
+        period = DateConverter.to_end_min(from_dash_to, interval_min=interval_min)
+        if period is None:
+            return []
+
+        chunks = []
+        for start, end in self._get_missing_periods(period[0][0], period[-1][1]):
+            chunks += DateConverter.to_end_min(
+                start_iso=start,
+                end_iso=end,
+                max_count=self.page_size,
+                interval_min=interval_min,
+            )
+        return chunks
+
+    def _get_missing_periods(self, start, end):
+        """[start, end) 기간에서 저장된 캔들이 없는 [start, end) 구간 리스트를 반환한다
+
+        거래가 없던 시간의 캔들은 거래소에도 없으므로 한 페이지보다 짧은 중간 공백은
+        빈 구간으로 보지 않는다.
+        """
+        timestamps = self.store.read(
+            self.exchange,
+            self.currency,
+            self.interval,
+            start=start,
+            end=CandleStore.to_timestamp(end) - 1,
+        )["timestamp"]
+        if len(timestamps) == 0:
+            return [(start, end)]
+
+        periods = []
+        first = CandleStore.to_date_time(timestamps[0])
+        if start < first:
+            periods.append((start, first))
+        gaps = np.flatnonzero(np.diff(timestamps) > self.page_size * self.interval)
+        for idx in gaps:
+            periods.append(
+                (
+                    CandleStore.to_date_time(timestamps[idx] + self.interval),
+                    CandleStore.to_date_time(timestamps[idx + 1]),
+                )
+            )
+        resume = CandleStore.to_date_time(timestamps[-1] + self.interval)
+        if resume < end:
+            periods.append((resume, end))
+        return periods
+
+    def _get_page(self, chunk, future):
+        try:
+            return future.result()
+        except (UserWarning, requests.exceptions.RequestException) as err:
+            self.logger.error(f"fail to fetch page {chunk[0]} ~ {chunk[1]}: {err}")
+            raise UserWarning(f"backfill stopped at {chunk[0]}") from err
+
+    def _flush(self, buffer):
+        stored = self.store.append(self.exchange, self.currency, self.interval, buffer)
+        buffer.clear()
+        return stored
+
+    def _fetch(self, chunk):
+        """[start, end) 구간의 캔들을 한 번의 요청으로 받아 시간순 리스트로 반환한다"""
+        start, end, count = chunk
+        if self.exchange == "UPB":
+            params = {
+                "market": self.provider.AVAILABLE_CURRENCY[self.currency],
+                "to": f"{end}+09:00",
+                "count": count,
+            }
+        else:
+            params = {
+                "symbol": self.provider.AVAILABLE_CURRENCY[self.currency],
+                "interval": self.provider.interval,
+                "startTime": self._to_unix_time_ms(start),
+                "endTime": self._to_unix_time_ms(end) - 1,
+                "limit": count,
+            }
+
+        self._wait_rate_limit()
+        response = request_with_retry(
+            requests.get,
+            self.provider.URL,
+            params=params,
+            timeout=self.TIMEOUT,
+            retry_on_status=self.RETRY_ON_STATUS,
+        )
+        response.raise_for_status()
+        try:
+            data = response.json()
+        except ValueError as err:
+            raise UserWarning(f"invalid data from server: {err}") from err
+
+        candles = [self.provider._create_candle_info(item) for item in data]
+        candles = [
+            candle
+            for candle in candles
+            if candle is not None and start <= candle["date_time"] < end
+        ]
+        candles.sort(key=lambda candle: candle["date_time"])
+        return candles
+
+    def _wait_rate_limit(self):
+        """요청 시작 시각을 최소 간격만큼 벌려 초당 요청 수를 제한한다"""
+        with self._rate_lock:
+            now = time.monotonic()
+            wait = self._next_request_time - now
+            self._next_request_time = max(now, self._next_request_time) + self._min_request_gap
+        if wait > 0:
+            time.sleep(wait)
+
+    @classmethod
+    def _to_unix_time_ms(cls, date_time):
+        dt = datetime.strptime(date_time, DateConverter.ISO_DATEFORMAT)
+        return int(dt.replace(tzinfo=cls.KST).timestamp() * 1000)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="""
+거래소 과거 캔들을 로컬 캔들 저장소에 내려받습니다. 중단된 경우 이어서 받습니다.
+
+Example)
+python -m smtm.data.candle_backfiller --period 240101-240401 --exchange UPB --currency BTC
+""",
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+    parser.add_argument("--period", help="yymmdd-yymmdd (KST)", required=True)
+    parser.add_argument("--exchange", help="UPB, BNC", default="UPB")
+    parser.add_argument("--currency", help="BTC, ETH, DOGE, XRP", default="BTC")
+    parser.add_argument("--interval", help="candle interval sec", type=int, default=60)
+    parser.add_argument("--store", help="candle store path", default=None)
+    parser.add_argument("--workers", help="concurrent requests", type=int, default=4)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    store = CandleStore(args.store) if args.store else CandleStore.from_config() or CandleStore()
+    backfiller = CandleBackfiller(
+        store,
+        exchange=args.exchange,
+        currency=args.currency,
+        interval=args.interval,
+        max_workers=args.workers,
+    )
+    count = backfiller.backfill(args.period)
+    print(f"{count} candles stored to {store.root_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,242 @@
+import os
+import calendar
+import shutil
+import threading
+from datetime import datetime, timezone
+import numpy as np
+from ..config import Config
+from ..log_manager import LogManager
+
+
+class CandleStore:
+    """
+    (거래소, 마켓, 인터벌)별 캔들을 컬럼 단위 고정 폭 파일에 추가 기록하는 로컬 캔들 저장소
+
+    Per-(exchange, market, interval) columnar candle store.
+    Each column is a raw little-endian int64/float64 file, so readers get numpy memmap
+    views without copying and range lookups are a binary search on the sorted
+    timestamp column.
+
+    저장 위치: {root_path}/{exchange}/{market}/{interval}/{column}.bin
+    timestamp: date_time 문자열을 UTC로 간주한 초 단위 정수, 문자열로 그대로 되돌릴 수 있다
+    마지막 행 이후의 캔들은 파일 끝에 이어 쓰고, 같은 timestamp의 마지막 행은 최신 값으로
+    덮어쓴다. 마지막 행보다 이전 시간의 캔들이 섞여 있으면(과거 구간 백필) 기존 행과 시간순으로
+    병합한 컬럼 파일을 새 디렉터리에 쓴 뒤 디렉터리를 바꿔 끼운다. 같은 timestamp는 새 값이 이긴다.
+    """
+
+    ISO_DATEFORMAT = "%Y-%m-%dT%H:%M:%S"
+    COLUMNS = (
+        ("timestamp", np.dtype("<i8")),
+        ("opening_price", np.dtype("<f8")),
+        ("high_price", np.dtype("<f8")),
+        ("low_price", np.dtype("<f8")),
+        ("closing_price", np.dtype("<f8")),
+        ("acc_price", np.dtype("<f8")),
+        ("acc_volume", np.dtype("<f8")),
+    )
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, root_path="output/candles/"):
+        self.logger = LogManager.get_logger(__class__.__name__)
+        self.root_path = root_path
+        self._locks = {}
+        self._locks_guard = threading.Lock()
+
+    @classmethod
+    def from_config(cls):
+        """Config.candle_store_path에 해당하는 프로세스 공용 저장소, 설정이 없으면 None"""
+        path = Config.candle_store_path
+        if not path:
+            return None
+        with cls._instances_lock:
+            if path not in cls._instances:
+                cls._instances[path] = cls(path)
+            return cls._instances[path]
+
+    @classmethod
+    def to_timestamp(cls, date_time):
+        return calendar.timegm(datetime.strptime(date_time, cls.ISO_DATEFORMAT).timetuple())
+
+    @classmethod
+    def to_date_time(cls, timestamp):
+        return datetime.fromtimestamp(int(timestamp), tz=timezone.utc).strftime(
+            cls.ISO_DATEFORMAT
+        )
+
+    def append(self, exchange, market, interval, candles):
+        """primary_candle 형식의 캔들 리스트를 저장하고 새로 추가된 행 수를 반환한다"""
+        rows = {}
+        for candle in candles:
+            rows[self.to_timestamp(candle["date_time"])] = candle
+        if len(rows) == 0:
+            return 0
+
+        path = self._get_path(exchange, market, interval)
+        with self._get_lock(path):
+            self._restore(path)
+            os.makedirs(path, exist_ok=True)
+            count = self._recover(path)
+            last = self._last_timestamp(path, count)
+            timestamps = sorted(rows)
+            if last is not None and timestamps[0] < last:
+                return self._merge_rows(path, count, rows, timestamps)
+
+            if timestamps[0] == last:
+                self._write_rows(path, [rows[last]], [last], offset=count - 1)
+                timestamps = timestamps[1:]
+            self._write_rows(path, [rows[ts] for ts in timestamps], timestamps, offset=count)
+            return len(timestamps)
+
+    def read(self, exchange, market, interval, start=None, end=None, count=None):
+        """저장된 캔들을 컬럼별 읽기 전용 numpy 배열(memmap view)로 반환한다
+
+        start, end: date_time 문자열 또는 timestamp, 둘 다 포함
+        count: 범위 안에서 가장 최근 count개만 반환
+
+        Returns: {"timestamp": int64 배열, "opening_price": float64 배열, ...}
+        """
+        path = self._get_path(exchange, market, interval)
+        total = self._row_count(path)
+        if total == 0:
+            return {name: np.empty(0, dtype=dtype) for name, dtype in self.COLUMNS}
+
+        timestamps = self._open_column(path, "timestamp", total)
+        lo = 0
+        hi = total
+        if start is not None:
+            lo = int(np.searchsorted(timestamps, self._as_timestamp(start), side="left"))
+        if end is not None:
+            hi = int(np.searchsorted(timestamps, self._as_timestamp(end), side="right"))
+        if count is not None:
+            lo = max(lo, hi - count)
+        hi = max(lo, hi)
+
+        result = {"timestamp": timestamps[lo:hi]}
+        for name, _ in self.COLUMNS[1:]:
+            result[name] = self._open_column(path, name, total)[lo:hi]
+        return result
+
+    def count(self, exchange, market, interval):
+        return self._row_count(self._get_path(exchange, market, interval))
+
+    def last_timestamp(self, exchange, market, interval):
+        path = self._get_path(exchange, market, interval)
+        return self._last_timestamp(path, self._row_count(path))
+
+    @classmethod
+    def to_candles(cls, columns, market=None):
+        """read 결과를 primary_candle 딕셔너리 리스트로 변환한다"""
+        candles = []
+        for idx in range(len(columns["timestamp"])):
+            candle = {
+                "type": "primary_candle",
+                "market": market,
+                "date_time": cls.to_date_time(columns["timestamp"][idx]),
+            }
+            for name, _ in cls.COLUMNS[1:]:
+                candle[name] = float(columns[name][idx])
+            candles.append(candle)
+        return candles
+
+    def _as_timestamp(self, value):
+        if isinstance(value, str):
+            return self.to_timestamp(value)
+        return int(value)
+
+    def _get_path(self, exchange, market, interval):
+        return os.path.join(self.root_path, str(exchange), str(market), str(int(interval)))
+
+    def _get_lock(self, path):
+        with self._locks_guard:
+            if path not in self._locks:
+                self._locks[path] = threading.Lock()
+            return self._locks[path]
+
+    def _column_file(self, path, name):
+        return os.path.join(path, f"{name}.bin")
+
+    def _row_count(self, path):
+        counts = []
+        for name, dtype in self.COLUMNS:
+            try:
+                counts.append(os.path.getsize(self._column_file(path, name)) // dtype.itemsize)
+            except OSError:
+                return 0
+        return min(counts)
+
+    def _restore(self, path):
+        """병합 중 중단되어 남은 디렉터리를 정리한다. 바꿔 끼우기 전이면 기존 디렉터리를 되살린다"""
+        old_path = f"{path}.old"
+        if os.path.isdir(old_path):
+            if os.path.isdir(path):
+                shutil.rmtree(old_path)
+            else:
+                os.rename(old_path, path)
+        shutil.rmtree(f"{path}.merge", ignore_errors=True)
+
+    def _merge_rows(self, path, count, rows, timestamps):
+        """기존 행과 새 행을 timestamp 순으로 병합해 다시 쓰고 새로 추가된 행 수를 반환한다"""
+        existing = {
+            name: np.fromfile(self._column_file(path, name), dtype=dtype, count=count)
+            for name, dtype in self.COLUMNS
+        }
+        new_timestamps = np.asarray(timestamps, dtype="<i8")
+        merged_timestamps = np.union1d(existing["timestamp"], new_timestamps)
+        old_index = np.searchsorted(merged_timestamps, existing["timestamp"])
+        new_index = np.searchsorted(merged_timestamps, new_timestamps)
+
+        merge_path = f"{path}.merge"
+        shutil.rmtree(merge_path, ignore_errors=True)
+        os.makedirs(merge_path)
+        for name, dtype in self.COLUMNS:
+            if name == "timestamp":
+                values = merged_timestamps
+            else:
+                values = np.empty(len(merged_timestamps), dtype=dtype)
+                values[old_index] = existing[name]
+                values[new_index] = [float(rows[ts].get(name) or 0) for ts in timestamps]
+            values.astype(dtype).tofile(self._column_file(merge_path, name))
+
+        # 이미 열린 memmap은 이전 파일을 계속 본다
+        old_path = f"{path}.old"
+        os.rename(path, old_path)
+        os.rename(merge_path, path)
+        shutil.rmtree(old_path)
+        return len(merged_timestamps) - count
+
+    def _recover(self, path):
+        """쓰기 중 중단으로 일부 컬럼에만 남은 행을 잘라낸다"""
+        count = self._row_count(path)
+        for name, dtype in self.COLUMNS:
+            file_path = self._column_file(path, name)
+            if os.path.exists(file_path) and os.path.getsize(file_path) != count * dtype.itemsize:
+                with open(file_path, "r+b") as column_file:
+                    column_file.truncate(count * dtype.itemsize)
+        return count
+
+    def _last_timestamp(self, path, count):
+        if count == 0:
+            return None
+        with open(self._column_file(path, "timestamp"), "rb") as column_file:
+            column_file.seek((count - 1) * 8)
+            return int(np.frombuffer(column_file.read(8), dtype="<i8")[0])
+
+    def _open_column(self, path, name, count):
+        dtype = dict(self.COLUMNS)[name]
+        return np.memmap(self._column_file(path, name), dtype=dtype, mode="r", shape=(count,))
+
+    def _write_rows(self, path, candles, timestamps, offset):
+        if len(candles) == 0:
+            return
+        for name, dtype in self.COLUMNS:
+            if name == "timestamp":
+                values = timestamps
+            else:
+                values = [float(candle.get(name) or 0) for candle in candles]
+            data = np.asarray(values, dtype=dtype).tobytes()
+            file_path = self._column_file(path, name)
+            mode = "r+b" if os.path.exists(file_path) else "wb"
+            with open(file_path, mode) as column_file:
+                column_file.seek(offset * dtype.itemsize)
+                column_file.write(data)
@@ -19,6 +19,7 @@ class CoinGeckoDataProvider(DataProvider):
 
     NAME = "COINGECKO DP"
     CODE = "CGK"
+    CACHE_TTL = 600
 
     DEFAULT_URL = "https://api.coingecko.com/api/v3/simple/price"
     DEFAULT_VS_CURRENCIES = "usd,krw"
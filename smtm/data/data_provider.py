@@ -4,8 +4,12 @@ from abc import ABCMeta, abstractmethod
 class DataProvider(metaclass=ABCMeta):
     """
     거래에 관련된 데이터를 수집해서 정해진 데이터 포맷에 맞게 정보를 제공하는 DataProvider 추상클래스
+
+    CACHE_TTL: 복합 DataProvider가 이 소스의 결과를 재사용하는 시간(초), 0이면 매 틱 조회
     """
 
+    CACHE_TTL = 0
+
     @abstractmethod
     def get_info(self):
         """
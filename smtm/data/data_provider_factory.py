@@ -1,48 +1,79 @@
-from .binance_data_provider import BinanceDataProvider
-from .upbit_data_provider import UpbitDataProvider
-from .bithumb_data_provider import BithumbDataProvider
-from .upbit_binance_data_provider import UpbitBinanceDataProvider
-from .upbit_news_data_provider import UpbitNewsDataProvider
-from .upbit_multi_news_data_provider import UpbitMultiNewsDataProvider
-from .upbit_social_data_provider import UpbitSocialDataProvider
-from .upbit_full_context_data_provider import UpbitFullContextDataProvider
+from ..registry import Registry
+from .data_provider import DataProvider
+from .base_data_provider import BaseDataProvider
 
 
 class DataProviderFactory:
     """
     DataProvider 정보 조회 및 생성을 담당하는 Factory 클래스
     Factory class responsible for retrieving and creating DataProvider information
+
+    REGISTRY는 코드별 (모듈, 클래스 이름)만 들고 있고 클래스는 그 코드를 처음 쓸 때 import한다.
+    외부 패키지는 smtm.data_providers entry point로 DataProvider를 추가할 수 있다.
     """
 
-    DataProvider_LIST = [
-        BinanceDataProvider,
-        UpbitDataProvider,
-        BithumbDataProvider,
-        UpbitBinanceDataProvider,
-        UpbitNewsDataProvider,
-        UpbitMultiNewsDataProvider,
-        UpbitSocialDataProvider,
-        UpbitFullContextDataProvider,
-    ]
+    REGISTRY = Registry("smtm.data_providers", {
+        "BNC": (".binance_data_provider", "BinanceDataProvider"),
+        "UPB": (".upbit_data_provider", "UpbitDataProvider"),
+        "BTH": (".bithumb_data_provider", "BithumbDataProvider"),
+        "UBD": (".upbit_binance_data_provider", "UpbitBinanceDataProvider"),
+        "UPN": (".upbit_news_data_provider", "UpbitNewsDataProvider"),
+        "UMN": (".upbit_multi_news_data_provider", "UpbitMultiNewsDataProvider"),
+        "USC": (".upbit_social_data_provider", "UpbitSocialDataProvider"),
+        "UFC": (".upbit_full_context_data_provider", "UpbitFullContextDataProvider"),
+        "UPS": (".upbit_stream_data_provider", "UpbitStreamDataProvider"),
+        "BNS": (".binance_stream_data_provider", "BinanceStreamDataProvider"),
+    }, __package__)
+
+    # 복합 DataProvider가 거래소 캔들 DataProvider를 담아두는 속성 이름
+    EXCHANGE_PROVIDER_ATTRS = ("upbit_dp", "binance_dp", "rest_dp")
+
+    @staticmethod
+    def create(code, currency="BTC", interval=60, candle_store=None):
+        """code에 해당하는 DataProvider를 생성. candle_store가 주어지면 거래소 캔들을 기록한다"""
+        data_provider = DataProviderFactory.get_class(code)
+        if data_provider is None:
+            return None
+        provider = data_provider(currency=currency, interval=interval)
+        if candle_store is not None:
+            DataProviderFactory.attach_candle_store(provider, candle_store)
+        return provider
+
+    @staticmethod
+    def get_class(code):
+        """code에 해당하는 DataProvider 클래스, 그 모듈만 import한다"""
+        return DataProviderFactory.REGISTRY.get(code)
+
+    @staticmethod
+    def attach_candle_store(provider, candle_store):
+        for target in DataProviderFactory.get_exchange_providers(provider):
+            target.candle_store = candle_store
 
     @staticmethod
-    def create(code, currency="BTC", interval=60):
-        for data_provider in DataProviderFactory.DataProvider_LIST:
-            if data_provider.CODE == code:
-                return data_provider(currency=currency, interval=interval)
-        return None
+    def get_exchange_providers(provider):
+        """provider 자신 또는 복합 DataProvider 안의 거래소 캔들 DataProvider 리스트, 주거래소가 먼저"""
+        # MarketDataHub 구독처럼 다른 DataProvider를 감싼 경우 원본을 본다
+        source = getattr(provider, "provider", None)
+        if isinstance(source, DataProvider):
+            provider = source
+        targets = [provider] + [
+            getattr(provider, name, None)
+            for name in DataProviderFactory.EXCHANGE_PROVIDER_ATTRS
+        ]
+        return [target for target in targets if isinstance(target, BaseDataProvider)]
 
     @staticmethod
     def get_name(code):
-        for data_provider in DataProviderFactory.DataProvider_LIST:
-            if data_provider.CODE == code:
-                return data_provider.NAME
-        return None
+        data_provider = DataProviderFactory.get_class(code)
+        return data_provider.NAME if data_provider is not None else None
 
     @staticmethod
     def get_all_strategy_info():
         all_data_provider = []
-        for data_provider in DataProviderFactory.DataProvider_LIST:
+        for code in DataProviderFactory.REGISTRY.codes():
+            data_provider = DataProviderFactory.get_class(code)
+            if data_provider is None:
+                continue
             all_data_provider.append(
                 {
                     "name": data_provider.NAME,
@@ -20,6 +20,7 @@ class ExchangeRateDataProvider(DataProvider):
 
     NAME = "EXCHANGE RATE DP"
     CODE = "FXR"
+    CACHE_TTL = 3600
 
     DEFAULT_BASE = "USD"
     DEFAULT_QUOTES = ("KRW", "JPY", "EUR", "CNY")
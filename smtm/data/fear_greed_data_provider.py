@@ -20,6 +20,7 @@ class FearGreedDataProvider(DataProvider):
 
     NAME = "FEAR & GREED INDEX DP"
     CODE = "FGI"
+    CACHE_TTL = 3600
 
     DEFAULT_URL = "https://api.alternative.me/fng/"
     DEFAULT_LIMIT = 1
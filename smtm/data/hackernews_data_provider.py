@@ -19,6 +19,7 @@ class HackerNewsDataProvider(DataProvider):
 
     NAME = "HACKERNEWS DP"
     CODE = "HNS"
+    CACHE_TTL = 1800
 
     DEFAULT_URL = "https://hn.algolia.com/api/v1/search_by_date"
     DEFAULT_QUERY = "bitcoin OR crypto OR ethereum"
@@ -0,0 +1,221 @@
+import threading
+import time
+from .data_provider import DataProvider
+from .data_provider_factory import DataProviderFactory
+from ..log_manager import LogManager
+
+
+class MarketDataFeed:
+    """
+    (거래소 코드, 통화, 인터벌) 하나에 대한 공유 DataProvider와 마지막 조회 결과
+
+    max_age 안에 다시 요청되면 거래소를 다시 호출하지 않고 마지막 결과의 복사본을 준다.
+    조회 중에 들어온 요청은 같은 조회가 끝나기를 기다렸다가 그 결과를 함께 쓴다.
+    """
+
+    def __init__(self, key, provider, max_age):
+        self.key = key
+        self.provider = provider
+        self.max_age = max_age
+        self.subscribers = 0
+        self.fetch_count = 0
+        self.batch = None
+        self._info = None
+        self._fetched_at = None
+        self._lock = threading.Lock()
+
+    def is_fresh(self):
+        return self._info is not None and time.monotonic() - self._fetched_at < self.max_age
+
+    def update(self, info):
+        self._info = info
+        self._fetched_at = time.monotonic()
+        self.fetch_count += 1
+
+    def get_info(self):
+        with self._lock:
+            if not self.is_fresh():
+                # 일괄 조회 결과에 이 시장이 없으면 혼자 조회한다
+                if self.batch is None or not self.batch.refresh(self):
+                    self.update(self.provider.get_info())
+            info = self._info
+        # 구독자가 받은 결과를 바꿔도 다른 구독자에게 영향이 없도록 항목을 복사한다
+        return [dict(item) if isinstance(item, dict) else item for item in info or []]
+
+
+class MarketDataBatch:
+    """
+    같은 (거래소 코드, 인터벌)에서 통화만 다른 피드들을 한 번의 요청으로 함께 갱신하는 묶음
+
+    묶음 안의 피드 하나가 갱신이 필요하면 DataProvider 클래스의 get_batch_info로 모든 피드의
+    시장을 한꺼번에 조회하고 결과를 통화별로 나눠 각 피드에 넣는다. 같은 틱에 이어서 들어오는
+    다른 피드의 요청은 이미 채워진 결과를 쓴다.
+
+    첫 조회처럼 일괄 조회 결과에 빠진 시장은 같은 refresh 안에서 개별 조회로 채운다. 다음 요청
+    때 일괄 조회를 다시 보내면 요청이 하나 더 늘고, 직전 현재가와 몇 ms 차이로 만든 캔들을 받는다.
+    """
+
+    def __init__(self, key, provider_class):
+        self.logger = LogManager.get_logger(__class__.__name__)
+        self.key = key
+        self.provider_class = provider_class
+        self.feeds = []
+        self.fetch_count = 0
+        self._lock = threading.Lock()
+
+    def refresh(self, feed):
+        """feed가 속한 묶음 전체를 조회한다. feed의 결과를 받았으면 True"""
+        with self._lock:
+            if feed.is_fresh():
+                return True
+            feeds = list(self.feeds)
+            infos = self.provider_class.get_batch_info([item.provider for item in feeds])
+            self.fetch_count += 1
+            for item in feeds:
+                info = infos.get(item.provider.market)
+                if info is not None:
+                    item.update(info)
+                elif item is not feed:
+                    self._fetch_single(item)
+            # 요청한 피드가 빠졌으면 MarketDataFeed가 직접 개별 조회한다
+            return feed.provider.market in infos
+
+    def _fetch_single(self, feed):
+        try:
+            feed.update(feed.provider.get_info())
+        except Exception as err:
+            # 다른 피드의 실패가 refresh를 요청한 피드의 결과를 막지 않는다
+            self.logger.warning(f"{feed.key} single fetch fail: {err}")
+
+
+class MarketDataSubscription(DataProvider):
+    """TradingOperator에 DataProvider로 전달되는 MarketDataHub 구독 핸들"""
+
+    def __init__(self, feed):
+        self.feed = feed
+        self.is_active = True
+
+    @property
+    def provider(self):
+        return self.feed.provider
+
+    @property
+    def NAME(self):
+        return self.feed.provider.NAME
+
+    @property
+    def CODE(self):
+        return self.feed.provider.CODE
+
+    def get_info(self):
+        return self.feed.get_info()
+
+
+class MarketDataHub:
+    """
+    같은 시장을 거래하는 세션들이 틱마다 한 번의 조회 결과를 함께 쓰도록 하는 시장 데이터 허브
+
+    Market-data hub keyed by (exchange code, currency, interval). Sessions subscribe
+    instead of creating their own DataProvider, so ten sessions on Upbit KRW-BTC issue
+    one candle request per tick instead of ten. Subscriptions are reference counted
+    and the shared provider is dropped when the last session unsubscribes.
+
+    SessionManager가 허브 하나를 소유하고 모든 세션이 그 허브를 통해 DataProvider를 얻는다.
+
+    With batch enabled, feeds of the same exchange and interval whose DataProvider
+    class implements get_batch_info are grouped, so BTC, ETH, DOGE and XRP sessions on
+    Upbit refresh with one ticker request per tick instead of four candle requests.
+
+    With stream enabled, exchanges listed in STREAM_CODES are served by their WebSocket
+    streaming DataProvider instead. Its get_info() answers from memory, so those feeds
+    are not cached and the provider's connection is closed with the feed.
+
+    max_age: 조회 결과를 같은 틱으로 보고 재사용하는 시간(초)
+    batch: 통화만 다른 피드들을 한 번의 요청으로 함께 조회할지 여부
+    stream: 거래소 캔들을 WebSocket 스트리밍 DataProvider로 받을지 여부
+    """
+
+    MAX_AGE = 10
+    # 거래소 캔들 DataProvider 코드 → 같은 거래소의 스트리밍 DataProvider 코드
+    STREAM_CODES = {"UPB": "UPS", "BNC": "BNS"}
+
+    def __init__(self, max_age=None, batch=False, stream=False):
+        self.logger = LogManager.get_logger(__class__.__name__)
+        self.max_age = self.MAX_AGE if max_age is None else max_age
+        self.batch = batch
+        self.stream = stream
+        self.feeds = {}
+        self.batches = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, code, currency="BTC", interval=60, candle_store=None):
+        """시장 데이터를 구독하고 DataProvider로 쓸 구독 핸들을 반환한다. 잘못된 code는 None"""
+        streaming = self.stream and code in self.STREAM_CODES
+        if streaming:
+            code = self.STREAM_CODES[code]
+        key = (code, currency, interval)
+        with self._lock:
+            feed = self.feeds.get(key)
+            if feed is None:
+                provider = DataProviderFactory.create(
+                    code, currency=currency, interval=interval, candle_store=candle_store
+                )
+                if provider is None:
+                    return None
+                feed = MarketDataFeed(key, provider, 0 if streaming else self.max_age)
+                self.feeds[key] = feed
+                self._join_batch(feed)
+                self.logger.info(f"market data feed opened: {key}")
+            feed.subscribers += 1
+        return MarketDataSubscription(feed)
+
+    def unsubscribe(self, subscription):
+        """구독을 해제하고 마지막 구독자였으면 공유 DataProvider를 정리한다. 여러 번 호출해도 안전"""
+        if not isinstance(subscription, MarketDataSubscription) or not subscription.is_active:
+            return
+        subscription.is_active = False
+        feed = subscription.feed
+        with self._lock:
+            feed.subscribers -= 1
+            if feed.subscribers <= 0 and self.feeds.get(feed.key) is feed:
+                del self.feeds[feed.key]
+                self._leave_batch(feed)
+                close = getattr(feed.provider, "close", None)
+                if callable(close):
+                    close()
+                self.logger.info(f"market data feed closed: {feed.key}")
+
+    def _join_batch(self, feed):
+        provider_class = type(feed.provider)
+        if not self.batch or not hasattr(provider_class, "get_batch_info"):
+            return
+        code, _, interval = feed.key
+        batch = self.batches.get((code, interval))
+        if batch is None:
+            batch = MarketDataBatch((code, interval), provider_class)
+            self.batches[(code, interval)] = batch
+        with batch._lock:
+            batch.feeds.append(feed)
+        feed.batch = batch
+
+    def _leave_batch(self, feed):
+        batch = feed.batch
+        if batch is None:
+            return
+        with batch._lock:
+            batch.feeds.remove(feed)
+        if not batch.feeds and self.batches.get(batch.key) is batch:
+            del self.batches[batch.key]
+
+    def get_stats(self):
+        return [
+            {
+                "exchange": feed.key[0],
+                "currency": feed.key[1],
+                "interval": feed.key[2],
+                "subscribers": feed.subscribers,
+                "fetch_count": feed.fetch_count,
+                "batched": feed.batch is not None,
+            }
+            for feed in list(self.feeds.values())
+        ]
@@ -18,6 +18,7 @@ class MempoolFeesDataProvider(DataProvider):
 
     NAME = "MEMPOOL FEES DP"
     CODE = "MPF"
+    CACHE_TTL = 600
 
     DEFAULT_URL = "https://mempool.space/api/v1/fees/recommended"
     TIMEOUT = 5
@@ -1,4 +1,5 @@
 from .data_provider import DataProvider
+from .parallel_fetcher import ParallelFetcher
 from .news_data_provider import NewsDataProvider
 from .news_sources import (
     CoinTelegraphNewsDataProvider,
@@ -17,12 +18,14 @@ class MultiNewsDataProvider(DataProvider):
     - 기본 구성: CoinDesk + CoinTelegraph + Decrypt + CryptoSlate.
     - primary_candle을 생성하지 않으므로 단독 매매용으로는 사용하지 않는다.
     - 개별 소스가 실패하면 해당 소스만 빈 리스트가 되고 나머지는 정상 반환된다.
+    - 소스는 공유 스레드 풀에서 동시에 조회하고 DEADLINE 안에 끝난 결과만 합친다.
     """
 
     NAME = "MULTI NEWS DP"
     CODE = "MNS"
 
     DEFAULT_PER_SOURCE_COUNT = 3
+    DEADLINE = 8
 
     def __init__(
         self,
@@ -30,6 +33,7 @@ class MultiNewsDataProvider(DataProvider):
         interval=60,
         providers=None,
         per_source_count=None,
+        deadline=None,
     ):
         self.market = currency
         self.interval = interval
@@ -48,10 +52,15 @@ class MultiNewsDataProvider(DataProvider):
                 ),
             ]
         self.providers = providers
+        self.fetcher = ParallelFetcher(deadline or self.DEADLINE)
 
     def get_info(self):
-        results = []
-        for provider in self.providers:
-            items = provider.get_info() or []
-            results.extend(items)
-        return results
+        return self.fetcher.fetch(self.providers)
+
+    def get_latency(self):
+        """소스별 마지막 조회 소요 시간(초), 마감 시간을 넘긴 소스는 None"""
+        return dict(self.fetcher.latency)
+
+    def get_cache_stats(self):
+        """CACHE_TTL이 있는 소스별 캐시 hit/miss 통계"""
+        return self.fetcher.get_cache_stats()
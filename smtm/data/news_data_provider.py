@@ -19,6 +19,7 @@ class NewsDataProvider(DataProvider):
 
     NAME = "CRYPTO NEWS DP"
     CODE = "NWS"
+    CACHE_TTL = 1800
 
     DEFAULT_URL = "https://www.coindesk.com/arc/outboundfeeds/rss/?outputType=xml"
     DEFAULT_SOURCE = "coindesk"
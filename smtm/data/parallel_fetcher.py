@@ -0,0 +1,148 @@
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from ..log_manager import LogManager
+from .cached_data_provider import CachedDataProvider
+
+
+class ParallelFetcher:
+    """
+    복합 DataProvider의 하위 DataProvider들을 공유 스레드 풀에서 동시에 조회하는 도구
+
+    Fans get_info() of child providers out over one bounded, process-wide thread pool
+    and waits until a per-tick deadline. Whatever finished in time is returned in the
+    original provider order, so tick time is bounded by the slowest source (or the
+    deadline) rather than the sum of all sources.
+
+    실패한 소스는 빈 결과로 취급하고, 마감 시간을 넘긴 소스는 이번 틱에서 제외한다.
+    이전 틱의 요청이 아직 끝나지 않은 소스는 다시 요청하지 않아 풀이 밀리지 않는다.
+    풀 스레드 안에서 호출되면(복합 DataProvider 안의 복합 DataProvider) 하위 소스를 그 자리에서
+    차례로 조회한다. 풀 워커가 모두 자식 조회를 기다리며 멈추는 것을 막기 위해서다.
+    CACHE_TTL이 선언된 소스는 CachedDataProvider로 감싸 TTL 동안 결과를 재사용한다.
+
+    deadline: 틱마다 하위 소스를 기다리는 최대 시간(초)
+    latency: 소스 이름별 마지막 조회 소요 시간(초), 마감 시간을 넘긴 소스는 None
+    """
+
+    MAX_WORKERS = 16
+    _executor = None
+    _executor_lock = threading.Lock()
+    _local = threading.local()
+
+    def __init__(self, deadline=10):
+        self.logger = LogManager.get_logger(__class__.__name__)
+        self.deadline = deadline
+        self.latency = {}
+        self._pending = {}
+        self._caches = {}
+
+    @classmethod
+    def get_executor(cls):
+        """모든 복합 DataProvider가 함께 쓰는 스레드 풀"""
+        with cls._executor_lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(
+                    max_workers=cls.MAX_WORKERS,
+                    thread_name_prefix="DataProvider",
+                    initializer=cls._mark_pool_thread,
+                )
+            return cls._executor
+
+    @classmethod
+    def _mark_pool_thread(cls):
+        cls._local.in_pool = True
+
+    @classmethod
+    def is_pool_thread(cls):
+        """현재 스레드가 공유 스레드 풀의 워커인지 여부"""
+        return getattr(cls._local, "in_pool", False)
+
+    @staticmethod
+    def get_source_names(providers):
+        names = []
+        for provider in providers:
+            name = type(provider).__name__
+            if name in names:
+                name = f"{name}#{len(names)}"
+            names.append(name)
+        return names
+
+    def start(self, providers):
+        """하위 소스 조회를 시작하고 collect에 넘길 핸들을 반환한다
+
+        주 캔들처럼 반드시 필요한 조회는 start와 collect 사이에 호출 스레드에서 실행한다.
+        """
+        started_at = time.monotonic()
+        inline = self.is_pool_thread()
+        executor = None if inline else self.get_executor()
+        futures = []
+        for name, provider in zip(self.get_source_names(providers), providers):
+            previous = self._pending.get(name)
+            if previous is not None and not previous.done():
+                self.logger.warning(f"skip {name}: previous request is still running")
+                futures.append((name, None))
+                continue
+            source = self._get_source(name, provider)
+            if inline:
+                future = self._run_inline(name, source)
+            else:
+                future = executor.submit(self._timed_get_info, name, source)
+            self._pending[name] = future
+            futures.append((name, future))
+        return started_at, futures
+
+    def collect(self, handle):
+        """마감 시간까지 끝난 소스의 결과를 provider 순서대로 모아 하나의 리스트로 반환한다"""
+        started_at, futures = handle
+        remaining = max(0, self.deadline - (time.monotonic() - started_at))
+        wait([future for _, future in futures if future is not None], timeout=remaining)
+
+        results = []
+        timed_out = []
+        for name, future in futures:
+            if future is None or not future.done():
+                self.latency[name] = None
+                timed_out.append(name)
+                continue
+            try:
+                results.extend(future.result() or [])
+            except Exception as err:  # 한 소스의 실패가 다른 소스를 막지 않는다
+                self.logger.warning(f"{name} get_info error: {err}")
+        if timed_out:
+            self.logger.warning(f"deadline {self.deadline}s exceeded: {', '.join(timed_out)}")
+        return results
+
+    def get_cache_stats(self):
+        """캐시를 사용하는 소스 이름별 hit/miss 통계"""
+        return {name: cache.get_stats() for name, cache in self._caches.items()}
+
+    def _get_source(self, name, provider):
+        if CachedDataProvider.get_ttl(provider) <= 0:
+            return provider
+        cache = self._caches.get(name)
+        if cache is None or cache.provider is not provider:
+            cache = CachedDataProvider(provider)
+            self._caches[name] = cache
+        return cache
+
+    def run(self, provider):
+        """호출 스레드에서 바로 조회하고 소요 시간을 기록한다. 예외는 그대로 전달된다"""
+        return self._timed_get_info(type(provider).__name__, provider)
+
+    def fetch(self, providers):
+        return self.collect(self.start(providers))
+
+    def _run_inline(self, name, provider):
+        future = Future()
+        try:
+            future.set_result(self._timed_get_info(name, provider))
+        except Exception as err:
+            future.set_exception(err)
+        return future
+
+    def _timed_get_info(self, name, provider):
+        started_at = time.monotonic()
+        try:
+            return provider.get_info()
+        finally:
+            self.latency[name] = round(time.monotonic() - started_at, 3)
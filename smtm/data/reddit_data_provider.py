@@ -22,6 +22,7 @@ class RedditDataProvider(DataProvider):
 
     NAME = "REDDIT DP"
     CODE = "RDT"
+    CACHE_TTL = 1800
 
     DEFAULT_SUBREDDIT = "CryptoCurrency"
     DEFAULT_COUNT = 5
@@ -0,0 +1,280 @@
+import json
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from websockets.exceptions import WebSocketException
+from websockets.sync.client import connect
+from ..config import Config
+from ..date_converter import DateConverter
+from ..log_manager import LogManager
+from .data_provider import DataProvider
+
+
+class TradeCandleAggregator:
+    """
+    체결(가격, 수량, 시각)을 인터벌 캔들로 모으는 메모리 집계기
+
+    체결 시각이 새 인터벌에 들어오면 만들고 있던 캔들을 닫는다. 현재 캔들보다 이전
+    인터벌의 체결은 늦게 도착한 것으로 보고 버린다. 닫힌 캔들은 최근 MAX_CLOSED개를 보관한다.
+    """
+
+    KST = timezone(timedelta(hours=9))
+    MAX_CLOSED = 100
+
+    def __init__(self, market, interval):
+        self.market = market
+        self.interval = interval
+        self.candle = None
+        self.bucket = None
+        self.closed = deque(maxlen=self.MAX_CLOSED)
+        self._lock = threading.Lock()
+
+    def add_trade(self, price, volume, timestamp_ms):
+        """체결 하나를 반영하고 이 체결로 닫힌 캔들이 있으면 그 복사본을 반환한다"""
+        seconds = int(timestamp_ms // 1000)
+        bucket = seconds - seconds % self.interval
+        with self._lock:
+            if self.bucket is not None and bucket < self.bucket:
+                return None
+            if self.bucket is None or bucket > self.bucket:
+                closed = self.candle
+                if closed is not None:
+                    self.closed.append(closed)
+                self.bucket = bucket
+                self.candle = {
+                    "type": "primary_candle",
+                    "market": self.market,
+                    "date_time": DateConverter.to_iso_string(
+                        datetime.fromtimestamp(bucket, tz=self.KST)
+                    ),
+                    "opening_price": price,
+                    "high_price": price,
+                    "low_price": price,
+                    "closing_price": price,
+                    "acc_price": price * volume,
+                    "acc_volume": volume,
+                }
+                return dict(closed) if closed is not None else None
+            candle = self.candle
+            candle["high_price"] = max(candle["high_price"], price)
+            candle["low_price"] = min(candle["low_price"], price)
+            candle["closing_price"] = price
+            candle["acc_price"] += price * volume
+            candle["acc_volume"] += volume
+            return None
+
+    def seed(self, candle):
+        """REST로 받은 현재 캔들에서 이어서 집계한다. 이미 같거나 더 새 캔들이 있으면 무시"""
+        try:
+            bucket = int(
+                datetime.strptime(candle["date_time"], DateConverter.ISO_DATEFORMAT)
+                .replace(tzinfo=self.KST)
+                .timestamp()
+            )
+        except (KeyError, TypeError, ValueError):
+            return
+        with self._lock:
+            if self.bucket is not None and bucket <= self.bucket:
+                return
+            self.bucket = bucket
+            self.candle = dict(candle, market=self.market)
+
+    def get_candle(self):
+        """만들고 있는 캔들의 복사본, 아직 체결이 없으면 None"""
+        with self._lock:
+            return dict(self.candle) if self.candle is not None else None
+
+
+class StreamDataProvider(DataProvider):
+    """
+    거래소 WebSocket 체결 스트림으로 메모리에서 캔들을 만드는 DataProvider
+
+    A background thread keeps one WebSocket to the exchange trade stream, reconnecting
+    with exponential backoff, and folds every trade into the current candle. get_info()
+    returns that candle without any network call. Until the stream delivers its first
+    trade, or while it is disconnected, get_info() falls back to the REST provider and
+    continues aggregating from the candle it returned. A connection that delivers no
+    message for STALL_TIMEOUT seconds is treated as half-open: get_info() stops serving
+    the frozen candle and the stream thread drops the connection and reconnects.
+
+    add_candle_listener()로 등록한 콜백은 캔들이 닫히는 즉시 스트림 스레드에서 호출된다.
+
+    거래소 REST DataProvider를 rest_dp로 갖고 있어서 전략 워밍업, 캔들 저장소 기록은 REST
+    DataProvider와 같은 코드로 처리된다. 스트림 스레드는 첫 get_info()에서 시작한다.
+
+    Subclasses set REST_PROVIDER_CLASS, STREAM_URL and implement:
+        - _get_subscribe_message(): 접속 직후 보낼 메시지 문자열, 없으면 None
+        - _parse_trade(message): 메시지 dict에서 (가격, 수량, 체결 시각 ms), 이 시장의 체결이
+          아니면 None. 여러 시장을 섞어 보내는 스트림이나 재생 파일도 있으므로 시장을 확인한다
+
+    url: 접속할 WebSocket 주소, None이면 Config.stream_url 또는 STREAM_URL
+    record_path: 받은 메시지를 한 줄에 하나씩 기록할 파일, 재생 서버의 입력으로 쓴다
+    """
+
+    REST_PROVIDER_CLASS = None
+    STREAM_URL = None
+    RECV_TIMEOUT = 1
+    STALL_TIMEOUT = 30
+    RECONNECT_DELAY = 1
+    MAX_RECONNECT_DELAY = 30
+
+    def __init__(self, currency="BTC", interval=60, url=None, record_path=None):
+        self.rest_dp = self.REST_PROVIDER_CLASS(currency=currency, interval=interval)
+        self.logger = LogManager.get_logger(self.__class__.__name__)
+        self.market = currency
+        self.candle_interval = interval
+        self.url = url or Config.stream_url or self.STREAM_URL
+        self.record_path = record_path
+        self.aggregator = TradeCandleAggregator(currency, interval)
+        self.connected = False
+        self.message_count = 0
+        self.trade_count = 0
+        self.reconnect_count = 0
+        self.last_message_time = 0
+        self.connection = None
+        self.candle_listeners = []
+        self._record_file = None
+        self._thread = None
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+
+    def get_info(self):
+        """스트림으로 만든 현재 캔들을 바로 전달한다, 형식은 REST DataProvider와 같다"""
+        self.start()
+        candle = self.aggregator.get_candle() if self._is_live() else None
+        if candle is not None:
+            return [candle]
+        candles = self.rest_dp.get_info()
+        if candles and candles[0] is not None:
+            self.aggregator.seed(candles[0])
+        return candles
+
+    def get_recent_candles(self, count):
+        return self.rest_dp.get_recent_candles(count)
+
+    def start(self):
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._stop_event.clear()
+            self._thread = threading.Thread(
+                target=self._run, name=f"{self.__class__.__name__}-{self.market}", daemon=True
+            )
+            self._thread.start()
+
+    def close(self):
+        """스트림 스레드를 멈추고 연결을 닫는다"""
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+            self._stop_event.set()
+            connection = self.connection
+        if connection is not None:
+            connection.close()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=self.RECV_TIMEOUT * 2)
+
+    def add_candle_listener(self, listener):
+        """캔들이 닫힐 때마다 스트림 스레드에서 listener(닫힌 캔들)를 호출한다"""
+        with self._lock:
+            self.candle_listeners = self.candle_listeners + [listener]
+
+    def remove_candle_listener(self, listener):
+        with self._lock:
+            self.candle_listeners = [item for item in self.candle_listeners if item != listener]
+
+    def get_stream_stats(self):
+        return {
+            "connected": self.connected,
+            "messages": self.message_count,
+            "trades": self.trade_count,
+            "reconnects": self.reconnect_count,
+        }
+
+    def _is_live(self):
+        return self.connected and time.monotonic() - self.last_message_time <= self.STALL_TIMEOUT
+
+    def _run(self):
+        if self.record_path is not None:
+            try:
+                self._record_file = open(self.record_path, "a", encoding="utf-8")
+            except OSError as err:
+                self.logger.warning(f"fail to open stream record file: {err}")
+        try:
+            self._run_stream()
+        finally:
+            if self._record_file is not None:
+                self._record_file.close()
+                self._record_file = None
+
+    def _run_stream(self):
+        delay = self.RECONNECT_DELAY
+        while not self._stop_event.is_set():
+            try:
+                with connect(self.url, close_timeout=self.RECV_TIMEOUT) as connection:
+                    self._on_connect(connection)
+                    delay = self.RECONNECT_DELAY
+                    self._receive_loop()
+            except (OSError, WebSocketException) as err:
+                if not self._stop_event.is_set():
+                    self.logger.warning(f"stream disconnected: {err}")
+            finally:
+                self.connected = False
+                self.connection = None
+            if self._stop_event.wait(delay):
+                break
+            delay = min(delay * 2, self.MAX_RECONNECT_DELAY)
+            self.reconnect_count += 1
+
+    def _on_connect(self, connection):
+        self.connection = connection
+        message = self._get_subscribe_message()
+        if message is not None:
+            self.connection.send(message)
+        self.last_message_time = time.monotonic()
+        self.connected = True
+        self.logger.info(f"stream connected: {self.url}")
+
+    def _receive_loop(self):
+        while not self._stop_event.is_set():
+            try:
+                message = self.connection.recv(timeout=self.RECV_TIMEOUT)
+            except TimeoutError:
+                idle = time.monotonic() - self.last_message_time
+                if idle > self.STALL_TIMEOUT:
+                    self.connected = False
+                    raise ConnectionError(f"no message for {idle:.1f}s")
+                continue
+            self.last_message_time = time.monotonic()
+            self._handle_message(message)
+
+    def _handle_message(self, message):
+        if isinstance(message, bytes):
+            message = message.decode("utf-8")
+        self.message_count += 1
+        if self._record_file is not None:
+            self._record_file.write(message.replace("\n", " ") + "\n")
+        try:
+            trade = self._parse_trade(json.loads(message))
+        except (ValueError, KeyError, TypeError) as err:
+            self.logger.warning(f"invalid stream message: {err}")
+            return
+        if trade is None:
+            return
+        self.trade_count += 1
+        closed = self.aggregator.add_trade(*trade)
+        if closed is None:
+            return
+        self.rest_dp._store_candles([closed])
+        for listener in self.candle_listeners:
+            try:
+                listener(dict(closed))
+            except Exception as err:
+                self.logger.error(f"candle listener error: {err}")
+
+    def _get_subscribe_message(self):
+        return None
+
+    def _parse_trade(self, message):
+        raise NotImplementedError()
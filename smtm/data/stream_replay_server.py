@@ -0,0 +1,161 @@
+"""
+기록한 거래소 스트림 메시지를 로컬 WebSocket으로 재생하는 서버
+
+StreamDataProvider(record_path=...)가 기록한 파일을 그대로 입력으로 쓴다.
+
+python -m smtm.data.stream_replay_server trades.jsonl --port 8765 --speed 10 --rebase-time
+python -m smtm --stream-market-data --stream-url ws://127.0.0.1:8765
+"""
+
+import argparse
+import json
+import threading
+import time
+from websockets.exceptions import WebSocketException
+from websockets.sync.server import serve
+from ..log_manager import LogManager
+
+
+class StreamReplayServer:
+    """
+    기록한 스트림 메시지를 접속한 클라이언트마다 처음부터 다시 보내는 WebSocket 서버
+
+    Messages are sent in file order. Their recorded trade timestamps set the pause
+    between messages, divided by speed (speed=0 sends everything at once). With
+    rebase_time the timestamps are shifted so the first message is stamped with the
+    moment the client connected, which lets candles close in real time. After the last
+    message the connection stays open until the server stops, so a client does not
+    reconnect and receive the same trades twice.
+
+    port=0이면 빈 포트를 골라 self.port에 둔다.
+
+    speed: 기록된 시간 간격을 몇 배 빠르게 재생할지, 0이면 기다리지 않는다
+    rebase_time: 체결 시각을 접속 시각 기준으로 옮길지 여부
+    binary: 업비트처럼 메시지를 바이너리 프레임으로 보낼지 여부
+    """
+
+    TIME_FIELDS = ("trade_timestamp", "timestamp", "T", "E")
+
+    def __init__(self, messages, host="127.0.0.1", port=0, speed=1.0, rebase_time=False,
+                 binary=False):
+        self.logger = LogManager.get_logger(__class__.__name__)
+        self.messages = [message for message in messages if message.strip()]
+        self.host = host
+        self.port = port
+        self.speed = speed
+        self.rebase_time = rebase_time
+        self.binary = binary
+        self.client_count = 0
+        self.server = None
+        self.thread = None
+        self._stop_event = threading.Event()
+
+    @classmethod
+    def from_file(cls, path, **kwargs):
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(f.read().splitlines(), **kwargs)
+
+    @property
+    def url(self):
+        return f"ws://{self.host}:{self.port}"
+
+    def start(self):
+        if self.server is not None:
+            return
+        self._stop_event.clear()
+        self.server = serve(self._handle, self.host, self.port)
+        self.port = self.server.socket.getsockname()[1]
+        self.thread = threading.Thread(
+            target=self.server.serve_forever, name="StreamReplayServer", daemon=True
+        )
+        self.thread.start()
+        self.logger.info(f"replaying {len(self.messages)} messages at {self.url}")
+
+    def stop(self):
+        if self.server is None:
+            return
+        self._stop_event.set()
+        self.server.shutdown()
+        self.server = None
+        self.thread = None
+
+    def replay(self, connection):
+        """연결 하나에 메시지 전체를 재생한다"""
+        self.client_count += 1
+        first_time = None
+        offset = 0
+        started_at = time.monotonic()
+        for message in self.messages:
+            message_time = self._get_time(message)
+            if message_time is not None:
+                if first_time is None:
+                    first_time = message_time
+                    offset = int(time.time() * 1000) - first_time
+                if self.speed > 0:
+                    delay = (message_time - first_time) / 1000 / self.speed
+                    wait = started_at + delay - time.monotonic()
+                    if wait > 0 and self._stop_event.wait(wait):
+                        return
+                if self.rebase_time:
+                    message = self._shift_time(message, offset)
+            if self._stop_event.is_set():
+                return
+            if self.binary:
+                connection.send(message.encode("utf-8"))
+            else:
+                connection.send(message)
+        self._stop_event.wait()
+
+    def _get_time(self, message):
+        try:
+            data = json.loads(message)
+        except ValueError:
+            return None
+        if not isinstance(data, dict):
+            return None
+        for field in self.TIME_FIELDS:
+            if isinstance(data.get(field), (int, float)):
+                return data[field]
+        return None
+
+    def _shift_time(self, message, offset):
+        data = json.loads(message)
+        for field in self.TIME_FIELDS:
+            if isinstance(data.get(field), (int, float)):
+                data[field] += offset
+        return json.dumps(data)
+
+    def _handle(self, connection):
+        self.logger.debug(f"replay client connected: {connection.request.path}")
+        try:
+            self.replay(connection)
+        except (OSError, WebSocketException):
+            pass
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="replay recorded exchange stream messages")
+    parser.add_argument("path", help="file with one recorded message per line")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--speed", type=float, default=1.0, help="0 sends without waiting")
+    parser.add_argument("--rebase-time", action="store_true",
+                        help="shift trade timestamps so replay starts now")
+    parser.add_argument("--binary", action="store_true", help="send binary frames like Upbit")
+    args = parser.parse_args(argv)
+
+    server = StreamReplayServer.from_file(
+        args.path, host=args.host, port=args.port, speed=args.speed,
+        rebase_time=args.rebase_time, binary=args.binary,
+    )
+    server.start()
+    print(f"replay server: {server.url}")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
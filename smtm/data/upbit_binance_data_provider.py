@@ -1,4 +1,5 @@
 from .data_provider import DataProvider
+from .parallel_fetcher import ParallelFetcher
 from .upbit_data_provider import UpbitDataProvider
 from .binance_data_provider import BinanceDataProvider
 
@@ -16,13 +17,16 @@ class UpbitBinanceDataProvider(DataProvider):
 
     NAME = "UPBIT BINANCE DP"
     CODE = "UBD"
+    DEADLINE = 10
 
-    def __init__(self, currency="BTC", interval=60):
+    def __init__(self, currency="BTC", interval=60, deadline=None):
         self.upbit_dp = UpbitDataProvider(currency, interval)
         self.binance_dp = BinanceDataProvider(currency, interval)
+        self.fetcher = ParallelFetcher(deadline or self.DEADLINE)
 
     def get_info(self):
-        """순차적으로 거래 정보 전달한다
+        """두 거래소를 동시에 조회해서 거래 정보 전달한다
+        Binance 조회가 실패하거나 DEADLINE을 넘기면 Upbit 정보만 전달한다
 
         Returns: 거래 정보 딕셔너리
         {
@@ -36,9 +40,16 @@ class UpbitBinanceDataProvider(DataProvider):
             "acc_volume": 단위 시간내 누적 거래 양
         }
         """
-        upbit_info = self.upbit_dp.get_info()
+        handle = self.fetcher.start([self.binance_dp])
+        upbit_info = self.fetcher.run(self.upbit_dp)
         upbit_info[0]["type"] = "primary_candle"
 
-        binance_info = self.binance_dp.get_info()
+        binance_info = self.fetcher.collect(handle)
+        if not binance_info:
+            return [upbit_info[0]]
         binance_info[0]["type"] = "binance"
         return [upbit_info[0], binance_info[0]]
+
+    def get_latency(self):
+        """거래소별 마지막 조회 소요 시간(초), 마감 시간을 넘긴 소스는 None"""
+        return dict(self.fetcher.latency)
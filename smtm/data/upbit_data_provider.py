@@ -1,3 +1,5 @@
+from datetime import datetime
+from ..date_converter import DateConverter
 from .base_data_provider import BaseDataProvider
 
 
@@ -12,6 +14,7 @@ class UpbitDataProvider(BaseDataProvider):
     """
 
     URL = "https://api.upbit.com/v1/candles/minutes/1"
+    TICKER_URL = "https://api.upbit.com/v1/ticker"
     AVAILABLE_CURRENCY = {
         "BTC": "KRW-BTC",
         "ETH": "KRW-ETH",
@@ -20,6 +23,7 @@ class UpbitDataProvider(BaseDataProvider):
     }
     NAME = "UPBIT DP"
     CODE = "UPB"
+    PAGE_SIZE = 200
 
     def __init__(self, currency="BTC", interval=60):
         if currency not in self.AVAILABLE_CURRENCY:
@@ -28,6 +32,7 @@ class UpbitDataProvider(BaseDataProvider):
         super().__init__(logger_name="UpbitDataProvider")
         self.market = currency
         self.interval = interval
+        self.candle_interval = interval
         if self.interval == 60:
             self.URL = "https://api.upbit.com/v1/candles/minutes/1"
         elif self.interval == 180:
@@ -39,7 +44,10 @@ class UpbitDataProvider(BaseDataProvider):
         else:
             raise UserWarning(f"not supported interval: {interval}")
         self._api_url = self.URL
-        self._query_params = {"market": self.AVAILABLE_CURRENCY[currency], "count": 1}
+        # 현재 캔들과 직전의 완성 캔들을 함께 받는다
+        self._query_params = {"market": self.AVAILABLE_CURRENCY[currency], "count": 2}
+        # 일괄 조회에서 직전 틱과의 차이로 캔들을 만들기 위한 마지막 현재가 정보
+        self._last_ticker = None
 
     def get_info(self):
         """실시간 거래 정보 전달한다
@@ -57,8 +65,89 @@ class UpbitDataProvider(BaseDataProvider):
         }
         """
         data = self._get_data_from_server()
+        # 최신순 응답의 첫 번째는 아직 만들어지고 있는 캔들이므로 저장소에는 직전 캔들만 기록한다
+        self._store_candles([self._create_candle_info(item) for item in data[1:2]])
         return [self._create_candle_info(data[0])]
 
+    @classmethod
+    def get_batch_info(cls, providers):
+        """여러 통화의 현재가를 ticker 요청 한 번으로 받아 통화별 캔들 리스트를 반환한다
+
+        분 캔들 API는 한 번에 한 시장만 조회할 수 있으므로 여러 시장을 받는 현재가(ticker)
+        API를 쓰고, 직전 틱의 현재가 정보와의 차이로 캔들을 만든다.
+        - 시가는 직전 틱의 현재가, 종가는 이번 현재가
+        - 고가/저가는 두 현재가 중 큰/작은 값, 그 사이 당일 고가/저가가 갱신됐으면 그 값
+        - 거래 금액/양은 누적 거래 금액/양의 차이, 누적이 초기화됐으면 이번 누적 값
+
+        직전 정보가 없거나 캔들 두 개 이상 떨어진 통화는 결과에서 빠지므로 호출한 쪽이
+        get_info()로 따로 조회한다. 이렇게 만든 캔들은 거래소 분 캔들과 구간이 다르므로
+        캔들 저장소에 기록하지 않는다.
+
+        Returns: {market: [캔들 정보]}
+        """
+        markets = {provider._query_params["market"]: provider for provider in providers}
+        data = providers[0]._get_data_from_server(
+            {"markets": ",".join(markets)}, url=cls.TICKER_URL
+        )
+        infos = {}
+        for ticker in data:
+            provider = markets.get(ticker.get("market"))
+            if provider is None:
+                continue
+            candle = provider._create_candle_from_ticker(ticker)
+            if candle is None:
+                continue
+            infos[provider.market] = [candle]
+        return infos
+
+    def _create_candle_from_ticker(self, ticker):
+        last = self._last_ticker
+        self._last_ticker = ticker
+        try:
+            if last is None or ticker["timestamp"] - last["timestamp"] > (
+                2 * self.candle_interval * 1000
+            ):
+                return None
+            price = float(ticker["trade_price"])
+            last_price = float(last["trade_price"])
+            high_price = max(price, last_price)
+            low_price = min(price, last_price)
+            if float(ticker["high_price"]) > float(last["high_price"]):
+                high_price = max(high_price, float(ticker["high_price"]))
+            if float(ticker["low_price"]) < float(last["low_price"]):
+                low_price = min(low_price, float(ticker["low_price"]))
+            acc_price = float(ticker["acc_trade_price"]) - float(last["acc_trade_price"])
+            if acc_price < 0:
+                acc_price = float(ticker["acc_trade_price"])
+            acc_volume = float(ticker["acc_trade_volume"]) - float(last["acc_trade_volume"])
+            if acc_volume < 0:
+                acc_volume = float(ticker["acc_trade_volume"])
+            # 캔들 API의 candle_date_time_kst처럼 인터벌 시작 시각으로 맞춘다
+            seconds = ticker["timestamp"] // 1000
+            seconds -= seconds % self.candle_interval
+            date_time = DateConverter.to_iso_string(datetime.fromtimestamp(seconds, tz=self.KST))
+        except (KeyError, TypeError, ValueError) as err:
+            self.logger.warning(f"invalid data for ticker candle info: {err}")
+            return None
+        return {
+            "type": "primary_candle",
+            "market": self.market,
+            "date_time": date_time,
+            "opening_price": last_price,
+            "high_price": high_price,
+            "low_price": low_price,
+            "closing_price": price,
+            "acc_price": acc_price,
+            "acc_volume": acc_volume,
+        }
+
+    def _fetch_recent_candles(self, count):
+        # 최신순으로 응답하고 첫 번째는 아직 만들어지고 있는 현재 캔들
+        query_params = dict(self._query_params, count=min(count + 1, self.PAGE_SIZE))
+        data = self._get_data_from_server(query_params)
+        candles = [self._create_candle_info(item) for item in reversed(data[1:])]
+        return [candle for candle in candles if candle is not None]
+
     def _create_candle_info(self, data):
         try:
             return {
@@ -1,4 +1,5 @@
 from .data_provider import DataProvider
+from .parallel_fetcher import ParallelFetcher
 from .upbit_data_provider import UpbitDataProvider
 from .multi_news_data_provider import MultiNewsDataProvider
 
@@ -13,6 +14,7 @@ class UpbitMultiNewsDataProvider(DataProvider):
 
     NAME = "UPBIT MULTI NEWS DP"
     CODE = "UMN"
+    DEADLINE = 10
 
     def __init__(
         self,
@@ -20,6 +22,7 @@ class UpbitMultiNewsDataProvider(DataProvider):
         interval=60,
         news_providers=None,
         per_source_count=None,
+        deadline=None,
     ):
         self.upbit_dp = UpbitDataProvider(currency, interval)
         self.news_dp = MultiNewsDataProvider(
@@ -28,14 +31,27 @@ class UpbitMultiNewsDataProvider(DataProvider):
             providers=news_providers,
             per_source_count=per_source_count,
         )
+        self.fetcher = ParallelFetcher(deadline or self.DEADLINE)
 
     def get_info(self):
         """Upbit 캔들 + 여러 소스의 뉴스 항목을 합쳐 반환.
 
         Returns: [primary_candle 한 건, news 0~N건]
         """
-        candle_info = self.upbit_dp.get_info() or []
+        handle = self.fetcher.start([self.news_dp])
+        candle_info = self.fetcher.run(self.upbit_dp) or []
         if candle_info:
             candle_info[0]["type"] = "primary_candle"
-        news_info = self.news_dp.get_info() or []
+        news_info = self.fetcher.collect(handle)
         return [*candle_info, *news_info]
+
+    def get_latency(self):
+        """소스별 마지막 조회 소요 시간(초), 마감 시간을 넘긴 소스는 None"""
+        return dict(self.fetcher.latency)
+
+    def get_cache_stats(self):
+        """CACHE_TTL이 있는 소스별 캐시 hit/miss 통계"""
+        stats = self.fetcher.get_cache_stats()
+        for name, value in self.news_dp.get_cache_stats().items():
+            stats[f"MultiNewsDataProvider.{name}"] = value
+        return stats
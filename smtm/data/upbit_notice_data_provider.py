@@ -20,6 +20,7 @@ class UpbitNoticeDataProvider(DataProvider):
 
     NAME = "UPBIT NOTICE DP"
     CODE = "UPT"
+    CACHE_TTL = 1800
 
     DEFAULT_URL = "https://api-manager.upbit.com/api/v1/notices"
     DEFAULT_COUNT = 5
@@ -1,4 +1,5 @@
 from .data_provider import DataProvider
+from .parallel_fetcher import ParallelFetcher
 from .upbit_data_provider import UpbitDataProvider
 from .multi_news_data_provider import MultiNewsDataProvider
 from .reddit_data_provider import (
@@ -19,13 +20,17 @@ class UpbitSocialDataProvider(DataProvider):
 
     CODE="USC"로 Factory에 등록돼 있어 `--exchange USC`로 바로 사용할 수 있다.
     개별 소스가 실패해도 나머지는 정상 반환되도록 설계돼 있다.
+    부가 소스는 공유 스레드 풀에서 동시에 조회하고 DEADLINE 안에 끝난 결과만 합친다.
     """
 
     NAME = "UPBIT SOCIAL DP"
     CODE = "USC"
+    # 틱마다 부가 소스를 기다리는 최대 시간(초), 늦은 소스는 이번 틱에서 빠진다
+    DEADLINE = 10
 
-    def __init__(self, currency="BTC", interval=60, providers=None):
+    def __init__(self, currency="BTC", interval=60, providers=None, deadline=None):
         self.upbit_dp = UpbitDataProvider(currency, interval)
+        self.fetcher = ParallelFetcher(deadline or self.DEADLINE)
         if providers is None:
             providers = [
                 MultiNewsDataProvider(currency=currency, interval=interval),
@@ -44,10 +49,17 @@ class UpbitSocialDataProvider(DataProvider):
 
         Returns: [primary_candle 한 건, news/reddit/sentiment_index 0~N건]
         """
-        candle_info = self.upbit_dp.get_info() or []
+        handle = self.fetcher.start(self.providers)
+        candle_info = self.fetcher.run(self.upbit_dp) or []
         if candle_info:
             candle_info[0]["type"] = "primary_candle"
-        extras = []
-        for provider in self.providers:
-            extras.extend(provider.get_info() or [])
+        extras = self.fetcher.collect(handle)
         return [*candle_info, *extras]
+
+    def get_latency(self):
+        """소스별 마지막 조회 소요 시간(초), 마감 시간을 넘긴 소스는 None"""
+        return dict(self.fetcher.latency)
+
+    def get_cache_stats(self):
+        """CACHE_TTL이 있는 소스별 캐시 hit/miss 통계"""
+        return self.fetcher.get_cache_stats()
@@ -0,0 +1,37 @@
+import json
+import uuid
+from .stream_data_provider import StreamDataProvider
+from .upbit_data_provider import UpbitDataProvider
+
+
+class UpbitStreamDataProvider(StreamDataProvider):
+    """
+    업비트 WebSocket 체결 스트림으로 캔들을 만드는 DataProvider
+    DataProvider that builds candles from the Upbit WebSocket trade stream
+
+    업비트 WebSocket은 인증 없이 사용 가능하고 메시지를 바이너리 프레임의 JSON으로 보낸다.
+    https://docs.upbit.com/reference/websocket-trade
+    """
+
+    REST_PROVIDER_CLASS = UpbitDataProvider
+    STREAM_URL = "wss://api.upbit.com/websocket/v1"
+    NAME = "UPBIT STREAM DP"
+    CODE = "UPS"
+
+    def __init__(self, currency="BTC", interval=60, url=None, record_path=None):
+        super().__init__(currency=currency, interval=interval, url=url, record_path=record_path)
+        self.code = UpbitDataProvider.AVAILABLE_CURRENCY[currency]
+
+    def _get_subscribe_message(self):
+        return json.dumps(
+            [{"ticket": f"smtm-{uuid.uuid4()}"}, {"type": "trade", "codes": [self.code]}]
+        )
+
+    def _parse_trade(self, message):
+        if message.get("type") != "trade" or message.get("code") != self.code:
+            return None
+        return (
+            float(message["trade_price"]),
+            float(message["trade_volume"]),
+            int(message["trade_timestamp"]),
+        )
@@ -0,0 +1,181 @@
+import time
+from datetime import datetime, timedelta, timezone
+from .config import Config
+from .date_converter import DateConverter
+from .trading_operator import TradingOperator
+
+
+class CandleCloseDetector:
+    """
+    캔들 스냅샷과 닫힌 캔들 알림에서 새로 닫힌 캔들을 date_time 순서대로 한 번씩만 꺼낸다
+
+    마지막으로 꺼낸 캔들의 date_time보다 늦은 캔들만 통과시키므로 같은 캔들이 스트림 알림과
+    폴링으로 두 번 들어오거나 진행 중인 캔들이 여러 번 조회되어도 전략에는 한 번만 전달된다.
+    """
+
+    KST = timezone(timedelta(hours=9))
+
+    def __init__(self, candle_interval):
+        self.candle_interval = candle_interval
+        self.last_closed_time = None
+        self.snapshot = None
+
+    def push(self, candle):
+        """닫힌 캔들 하나, 이미 꺼낸 캔들보다 새 캔들이면 그대로 반환하고 아니면 None"""
+        date_time = candle.get("date_time") if isinstance(candle, dict) else None
+        if date_time is None:
+            return None
+        if self.last_closed_time is not None and date_time <= self.last_closed_time:
+            return None
+        self.last_closed_time = date_time
+        return candle
+
+    def observe(self, candle, now=None, close_on_change=True):
+        """진행 중인 캔들의 최신 스냅샷을 보고 닫혔다고 판단된 캔들을 반환한다
+
+        close_on_change면 date_time이 바뀌었을 때 이전 스냅샷을 닫힌 캔들로 본다. now가
+        주어지면 인터벌이 이미 끝난 스냅샷도 다음 체결을 기다리지 않고 닫힌 캔들로 본다.
+        """
+        if not isinstance(candle, dict) or candle.get("date_time") is None:
+            return None
+        previous = self.snapshot
+        self.snapshot = candle
+        if (close_on_change and previous is not None
+                and candle["date_time"] > previous["date_time"]):
+            return self.push(previous)
+        if now is not None and self.get_close_time(candle) <= now:
+            return self.push(candle)
+        return None
+
+    def get_close_time(self, candle):
+        """캔들 인터벌이 끝나는 unix 시각(초)"""
+        start = datetime.strptime(candle["date_time"], DateConverter.ISO_DATEFORMAT)
+        return start.replace(tzinfo=self.KST).timestamp() + self.candle_interval
+
+
+class EventTradingOperator(TradingOperator):
+    """
+    캔들이 닫힐 때마다 파이프라인을 실행하는 TradingOperator
+
+    Instead of running the pipeline every interval on whatever candle is in progress,
+    the strategy only ever receives closed candles, each exactly once. Two sources
+    feed a shared CandleCloseDetector:
+    - push: when the DataProvider (or the provider behind a MarketDataHub
+      subscription) offers add_candle_listener, like the streaming DataProviders, a
+      closed candle is posted to the worker the moment the stream closes it.
+    - poll: every poll_interval the current candle is read with get_info() and a
+      date_time change marks the previous candle as closed. The finished candle is
+      then read once from the exchange (not from the candle store, which may hold an
+      older copy) and written back to the store, because the last snapshot misses
+      whatever traded between that poll and the close (with MarketDataHub, up to its
+      max_age). The snapshot is used only when that fails.
+    While a stream is connected the poll only closes candles whose interval has ended
+    CLOSE_GRACE seconds ago without a new trade, so quiet markets still close on time.
+
+    interval: 프로파일 term, 이 모드에서는 틱 지연 경고 기준이 아니라 기록용이다
+    poll_interval: 현재 캔들을 확인하는 주기(초)
+    candle_interval: DataProvider 캔들 인터벌(초), 지정하지 않으면 Config.candle_interval
+    """
+
+    POLL_INTERVAL = 1
+    CLOSE_GRACE = 1
+
+    def __init__(self, interval=60, currency="BTC", scheduler=None, poll_interval=None,
+                 candle_interval=None):
+        super().__init__(interval=interval, currency=currency, scheduler=scheduler)
+        self.poll_interval = float(poll_interval or self.POLL_INTERVAL)
+        self.detector = CandleCloseDetector(candle_interval or Config.candle_interval)
+        self.stream_source = None
+
+    def start(self) -> bool:
+        if not super().start():
+            return False
+        source = getattr(self.data_provider, "provider", self.data_provider)
+        if callable(getattr(source, "add_candle_listener", None)):
+            self.stream_source = source
+            source.add_candle_listener(self._on_candle_close)
+        return True
+
+    def stop(self):
+        if self.stream_source is not None:
+            self.stream_source.remove_candle_listener(self._on_candle_close)
+            self.stream_source = None
+        super().stop()
+
+    def _warm_up(self, candles):
+        super()._warm_up(candles)
+        if candles:
+            # 워밍업에 들어간 캔들이 다시 전략에 들어가지 않도록 한다
+            self.detector.push(candles[-1])
+
+    def _get_tick_interval(self):
+        return self.poll_interval
+
+    def _on_candle_close(self, candle):
+        # 스트림 스레드에서 불리므로 파이프라인은 워커에서 실행한다
+        self.worker.post_task({"runnable": self._handle_closed_candle, "candle": candle})
+
+    def _handle_closed_candle(self, task):
+        if self.state != "running":
+            return
+        candle = self.detector.push(task["candle"])
+        if candle is not None:
+            self._run_closed_candle(candle, [])
+
+    def _run_tick(self):
+        """현재 캔들을 조회하고 새로 닫힌 캔들이 있으면 파이프라인을 실행한다"""
+        try:
+            with self.metrics.span("data_provider"):
+                info = self.data_provider.get_info()
+            primary = next(
+                (item for item in info or []
+                 if isinstance(item, dict) and item.get("type") == "primary_candle"),
+                None,
+            )
+            stream = self.stream_source
+            if stream is not None and getattr(stream, "connected", False):
+                # 바뀐 date_time은 스트림 알림이 정확한 캔들로 처리한다
+                candle = self.detector.observe(
+                    primary, now=time.time() - self.CLOSE_GRACE, close_on_change=False)
+            else:
+                candle = self.detector.observe(primary)
+                if candle is not None:
+                    candle = self._get_closed_candle(candle)
+        except Exception as err:
+            self.logger.error(f"candle poll error: {err}")
+            return
+        if candle is not None:
+            self._run_closed_candle(candle, info)
+
+    def _get_closed_candle(self, snapshot):
+        """date_time이 바뀌어 닫힌 캔들을 거래소에서 다시 받는다, 받지 못하면 마지막 스냅샷"""
+        from .data.data_provider_factory import DataProviderFactory
+
+        providers = DataProviderFactory.get_exchange_providers(self.data_provider)
+        if not providers:
+            return snapshot
+        provider = providers[0]
+        try:
+            with self.metrics.span("closed_candle"):
+                candles = provider._fetch_recent_candles(1)
+        except Exception as err:
+            self.logger.warning(f"fail to fetch closed candle: {err}")
+            return snapshot
+        if not candles or candles[-1].get("date_time") != snapshot["date_time"]:
+            return snapshot
+        provider._store_candles(candles[-1:])
+        return candles[-1]
+
+    def _run_closed_candle(self, candle, info):
+        others = [
+            item for item in info
+            if not (isinstance(item, dict) and item.get("type") == "primary_candle")
+        ]
+        try:
+            # 캔들이 닫힌 뒤 파이프라인이 시작되기까지 걸린 시간
+            self.metrics.record(
+                "candle_close", max(0.0, time.time() - self.detector.get_close_time(candle)))
+            with self.metrics.span("tick"):
+                self._run_pipeline([candle] + others)
+        except Exception as err:
+            self.logger.error(f"trading tick error: {err}")
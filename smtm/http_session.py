@@ -1,13 +1,119 @@
+import threading
 import time
+from urllib.parse import urlsplit
 import requests
+from requests.adapters import HTTPAdapter
+from .latency_metrics import TickMetrics
+from .rate_limiter import rate_limiter
+
+
+class HttpSessionPool:
+    """호스트별 keep-alive 연결 풀을 여러 스레드가 함께 쓰도록 관리하는 HTTP 세션 풀
+
+    Keeps one HTTPAdapter (urllib3 connection pool) per host, shared by every thread,
+    and hands each thread its own requests.Session mounted on those adapters. Trader
+    workers and data providers therefore reuse open TCP+TLS connections instead of
+    handshaking on every call, without sharing a Session's cookie state across threads.
+
+    POOL_MAXSIZE: 호스트별로 유지하는 최대 연결 수
+    DEFAULT_TIMEOUT: timeout이 지정되지 않은 요청에 적용할 (연결, 읽기) 제한 시간(초)
+    HOST_TIMEOUTS: 호스트별 기본 제한 시간, 주문 경로는 짧게 둔다
+    """
+
+    POOL_MAXSIZE = 16
+    DEFAULT_TIMEOUT = (5, 15)
+    HOST_TIMEOUTS = {
+        "api.upbit.com": (3, 5),
+        "api.binance.com": (3, 5),
+        "api.bithumb.com": (3, 5),
+    }
+
+    def __init__(self):
+        self._adapters = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        # 호스트별 응답 시간 히스토그램과 (호스트, 상태 코드)별 호출 수
+        self.call_metrics = TickMetrics()
+
+    def record_call(self, url, status, elapsed):
+        """request_with_retry가 시도마다 호출한다. 연결 실패는 status="error"로 센다"""
+        host = self.get_host(url)
+        self.call_metrics.record(host, elapsed)
+        self.call_metrics.increment((host, str(status)))
+
+    def get_session(self, url):
+        """현재 스레드에서 url의 호스트에 쓸 Session"""
+        host = self.get_host(url)
+        sessions = getattr(self._local, "sessions", None)
+        if sessions is None:
+            sessions = self._local.sessions = {}
+        session = sessions.get(host)
+        if session is None:
+            adapter = self._get_adapter(host)
+            session = requests.Session()
+            session.mount(f"https://{host}/", adapter)
+            session.mount(f"http://{host}/", adapter)
+            sessions[host] = session
+        return session
+
+    def get_timeout(self, url):
+        return self.HOST_TIMEOUTS.get(self.get_host(url), self.DEFAULT_TIMEOUT)
+
+    def get_stats(self):
+        """호스트별 새 연결(핸드셰이크) 수와 기존 연결을 재사용한 요청 수"""
+        stats = {}
+        with self._lock:
+            adapters = list(self._adapters.items())
+        for host, adapter in adapters:
+            pools = adapter.poolmanager.pools
+            handshakes = 0
+            requests_count = 0
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                handshakes += pool.num_connections
+                requests_count += pool.num_requests
+            stats[host] = {
+                "handshakes": handshakes,
+                "reused": max(0, requests_count - handshakes),
+            }
+        return stats
+
+    @staticmethod
+    def get_host(url):
+        return urlsplit(url).netloc.lower()
+
+    def _get_adapter(self, host):
+        with self._lock:
+            adapter = self._adapters.get(host)
+            if adapter is None:
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.POOL_MAXSIZE)
+                self._adapters[host] = adapter
+            return adapter
+
+
+http_session_pool = HttpSessionPool()
+
+# requests 모듈 함수로 요청하면 같은 메서드의 풀링된 Session으로 바꿔 호출한다
+_SESSION_METHODS = {
+    requests.get: "get",
+    requests.post: "post",
+    requests.put: "put",
+    requests.delete: "delete",
+}
 
 
 def request_with_retry(request_func, *args, retries=2, backoff=0.5,
-                       retry_on_status=(500, 502, 503, 504), **kwargs):
+                       retry_on_status=(429, 500, 502, 503, 504), **kwargs):
     """재시도 로직을 포함한 HTTP 요청 래퍼
 
     Wrapper that adds retry logic to HTTP requests for transient failures.
     Compatible with requests.get, requests.post, requests.delete etc.
+    Calls made with the requests module functions go through the pooled keep-alive
+    session of the URL's host, with the host's default timeout unless one is given.
+    Every attempt waits for the exchange rate limiter first, and a 429 is retried
+    after the server's Retry-After when it sends one.
 
     Args:
         request_func: 호출할 requests 함수 (requests.get, requests.post 등)
@@ -15,15 +121,45 @@ def request_with_retry(request_func, *args, retries=2, backoff=0.5,
         backoff: 재시도 간 대기 시간 배수 (default: 0.5초, 1.0초)
         retry_on_status: 재시도할 HTTP 상태 코드
     """
+    method = _SESSION_METHODS.get(request_func)
+    url = args[0] if args and isinstance(args[0], str) else None
+    if method is not None and url is not None:
+        request_func = getattr(http_session_pool.get_session(url), method)
+        kwargs.setdefault("timeout", http_session_pool.get_timeout(url))
+    http_method = (method or "get").upper()
+    headers = kwargs.get("headers")
+    params = kwargs.get("params")
+
     for attempt in range(retries + 1):
         try:
-            response = request_func(*args, **kwargs)
+            if url is not None:
+                rate_limiter.acquire(url, http_method, headers, params)
+            started = time.perf_counter()
+            try:
+                response = request_func(*args, **kwargs)
+            except requests.exceptions.RequestException:
+                if url is not None:
+                    http_session_pool.record_call(url, "error", time.perf_counter() - started)
+                raise
             status = getattr(response, "status_code", None)
+            if url is not None:
+                http_session_pool.record_call(url, status, time.perf_counter() - started)
+                rate_limiter.update(url, http_method, headers, response, params)
             if status in retry_on_status and attempt < retries:
-                time.sleep(backoff * (2 ** attempt))
+                time.sleep(_get_retry_delay(response, backoff * (2 ** attempt)))
                 continue
             return response
         except requests.exceptions.ConnectionError:
             if attempt >= retries:
                 raise
             time.sleep(backoff * (2 ** attempt))
+
+
+def _get_retry_delay(response, default):
+    """429 응답의 Retry-After(초)가 있으면 그 시간, 없으면 default"""
+    if getattr(response, "status_code", None) != 429:
+        return default
+    retry_after = (getattr(response, "headers", None) or {}).get("Retry-After")
+    if isinstance(retry_after, str) and retry_after.isdigit():
+        return float(retry_after)
+    return default
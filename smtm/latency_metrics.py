@@ -0,0 +1,126 @@
+import bisect
+import math
+import threading
+import time
+from contextlib import contextmanager
+
+
+def _log_bounds(start, growth, count):
+    return tuple(start * growth**i for i in range(count))
+
+
+class LatencyHistogram:
+    """
+    로그 간격 버킷에 소요 시간(초)을 누적하는 히스토그램
+
+    Buckets grow by GROWTH from MIN_VALUE, so recording is O(log buckets) and memory
+    is fixed no matter how many ticks a session runs. Percentiles are interpolated
+    inside the bucket that holds the rank, which bounds the error to one bucket width
+    (about 20% of the value). Values above the last bucket go to an overflow bucket.
+
+    MIN_VALUE: 첫 번째 버킷의 상한(초)
+    GROWTH: 버킷 상한이 커지는 비율
+    BUCKET_COUNT: 오버플로 버킷을 뺀 버킷 수, 기본값으로 0.1ms ~ 약 100초를 다룬다
+    """
+
+    MIN_VALUE = 0.0001
+    GROWTH = 1.2
+    BUCKET_COUNT = 77
+    BOUNDS = _log_bounds(MIN_VALUE, GROWTH, BUCKET_COUNT)
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def record(self, value):
+        value = max(0.0, value)
+        self.counts[bisect.bisect_left(self.BOUNDS, value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def get_percentile(self, percent):
+        """percent(0~100) 분위 소요 시간, 기록이 없으면 None"""
+        if self.count == 0:
+            return None
+        rank = max(1, math.ceil(self.count * percent / 100))
+        cumulative = 0
+        for index, count in enumerate(self.counts):
+            if cumulative + count >= rank:
+                lower = self.BOUNDS[index - 1] if index > 0 else 0.0
+                upper = self.BOUNDS[index] if index < len(self.BOUNDS) else self.max
+                value = lower + (upper - lower) * (rank - cumulative) / count
+                return min(max(value, self.min), self.max)
+            cumulative += count
+        return self.max
+
+    def get_summary(self):
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else None,
+            "p50": self.get_percentile(50),
+            "p95": self.get_percentile(95),
+            "p99": self.get_percentile(99),
+            "max": self.max,
+        }
+
+
+class TickMetrics:
+    """
+    한 세션의 틱 파이프라인 단계별 소요 시간 히스토그램
+
+    TradingOperator가 틱마다 span(stage)으로 각 단계를 감싼다. 기록은 세션 워커에서,
+    조회는 제어 스레드에서 하므로 잠금으로 보호한다. 소요 시간이 아닌 건수는
+    increment(name)로 counters에 누적한다.
+    """
+
+    def __init__(self):
+        self.histograms = {}
+        self.counters = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, stage):
+        """with 블록의 소요 시간을 stage 히스토그램에 기록한다. 예외가 나도 기록한다"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start)
+
+    def record(self, stage, elapsed):
+        with self._lock:
+            histogram = self.histograms.get(stage)
+            if histogram is None:
+                histogram = self.histograms[stage] = LatencyHistogram()
+            histogram.record(elapsed)
+
+    def increment(self, name, value=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def get_counters(self):
+        with self._lock:
+            return dict(self.counters)
+
+    def get_buckets(self):
+        """{stage: (BOUNDS별 누적 건수, 전체 건수, 합계)}, 메트릭 내보내기용"""
+        with self._lock:
+            result = {}
+            for stage, histogram in self.histograms.items():
+                cumulative, running = [], 0
+                for count in histogram.counts[:-1]:
+                    running += count
+                    cumulative.append(running)
+                result[stage] = (cumulative, histogram.count, histogram.total)
+            return result
+
+    def get_summary(self):
+        """{stage: {count, mean, p50, p95, p99, max}}, 단위는 초"""
+        with self._lock:
+            return {stage: histogram.get_summary()
+                    for stage, histogram in self.histograms.items()}
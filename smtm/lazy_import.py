@@ -0,0 +1,31 @@
+import importlib
+import sys
+
+
+def load_attribute(module_name, attribute, package=None):
+    """module_name(상대 경로면 package 기준)을 import해서 attribute를 돌려준다"""
+    return getattr(importlib.import_module(module_name, package), attribute)
+
+
+def lazy_attributes(package, attributes):
+    """
+    패키지 __init__의 공개 이름을 처음 접근할 때 import하는 PEP 562 __getattr__/__dir__
+
+    attributes: {공개 이름: 그 이름을 정의한 (상대) 모듈}. 불러온 값은 패키지 네임스페이스에
+    넣어 두므로 두 번째 접근부터는 일반 속성 조회와 같다.
+
+    __getattr__, __dir__ = lazy_attributes(__name__, {...})
+    """
+
+    def __getattr__(name):
+        module_name = attributes.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = load_attribute(module_name, name, package)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[package])) | set(attributes))
+
+    return __getattr__, __dir__
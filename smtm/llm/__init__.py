@@ -1,8 +1,21 @@
-from .llm_client import LlmClient, LlmResponse, ToolCall
-from .claude_llm_client import ClaudeLlmClient
-from .tool import Tool, ToolResult
-from .tool_router import ToolRouter
-from .safety_guard import SafetyGuard, SafetyConfig, SafetyResult
-from .account_guard import AccountGuard, AccountGuardConfig, CompositeSafetyGuard
-from .system_monitor import SystemMonitor
-from .system_operator import SystemOperator, ContextConfig
+from ..lazy_import import lazy_attributes
+
+# ClaudeLlmClient(anthropic)와 SystemOperator는 쓸 때만 불러온다
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    "LlmClient": ".llm_client",
+    "LlmResponse": ".llm_client",
+    "ToolCall": ".llm_client",
+    "ClaudeLlmClient": ".claude_llm_client",
+    "Tool": ".tool",
+    "ToolResult": ".tool",
+    "ToolRouter": ".tool_router",
+    "SafetyGuard": ".safety_guard",
+    "SafetyConfig": ".safety_guard",
+    "SafetyResult": ".safety_guard",
+    "AccountGuard": ".account_guard",
+    "AccountGuardConfig": ".account_guard",
+    "CompositeSafetyGuard": ".account_guard",
+    "SystemMonitor": ".system_monitor",
+    "SystemOperator": ".system_operator",
+    "ContextConfig": ".system_operator",
+})
@@ -0,0 +1,273 @@
+import bisect
+import json
+import os
+import threading
+from ..log_manager import LogManager
+
+
+class BoundedLog:
+    """
+    최근 기록만 메모리에 두고 오래된 기록은 디스크 세그먼트로 옮기는 추가 전용 로그
+
+    Append-only record log with a bounded in-memory tier. When the memory tier exceeds
+    `capacity`, the oldest records are spilled to append-only JSON-lines segment files
+    under `storage_path`. Each segment keeps a small index (record count, first/last
+    timestamp, sessions) so time- and session-filtered queries only open the segments
+    that can match. Without a storage_path the oldest records are dropped instead.
+    In memory, records are kept with a time-sorted timestamp array and per-session
+    (sequence, timestamp) indexes, so range queries bisect instead of scanning and
+    per-session counts are O(1).
+
+    리스트처럼 len, 인덱스, 순회를 지원하며 디스크로 옮겨진 기록까지 포함한다.
+
+    name: 로그 이름, 세그먼트 디렉터리 이름으로 쓰인다
+    capacity: 메모리에 유지하는 최대 기록 수
+    storage_path: 세그먼트를 저장할 디렉터리, None이면 오래된 기록을 버린다
+    segment_size: 세그먼트 파일 하나에 담는 최대 기록 수
+    """
+
+    SEGMENT_SIZE = 5000
+
+    def __init__(self, name, capacity, storage_path=None, segment_size=None):
+        if capacity < 1:
+            raise ValueError(f"invalid capacity: {capacity}")
+        self.logger = LogManager.get_logger(__class__.__name__)
+        self.name = name
+        self.capacity = capacity
+        self.storage_path = storage_path
+        self.segment_size = segment_size or self.SEGMENT_SIZE
+        self.records = []
+        self.segments = []
+        self.spilled_count = 0
+        self.dropped_count = 0
+        # 세션별 기록 수, 디스크로 옮겨진 기록을 포함하고 버려진 기록은 뺀다
+        self.session_counts = {}
+        self._segment_offsets = []
+        # 메모리 기록의 timestamp와 세션별 (기록 번호, timestamp) 색인, 기록 번호는 _base부터 센다
+        self._timestamps = []
+        self._session_index = {}
+        self._base = 0
+        self._ordered = True
+        self._lock = threading.RLock()
+
+    def append(self, record):
+        timestamp = record.get("timestamp", "")
+        session = record.get("session")
+        with self._lock:
+            if self._timestamps and timestamp < self._timestamps[-1]:
+                self._ordered = False
+            seq = self._base + len(self.records)
+            self.records.append(record)
+            self._timestamps.append(timestamp)
+            positions, timestamps = self._session_index.setdefault(session, ([], []))
+            positions.append(seq)
+            timestamps.append(timestamp)
+            self.session_counts[session] = self.session_counts.get(session, 0) + 1
+            if len(self.records) > self.capacity:
+                self._spill(len(self.records) - self.capacity // 2)
+
+    def count(self, session=None):
+        """전체 또는 session의 기록 수, 기록을 읽지 않고 바로 답한다"""
+        with self._lock:
+            if session is None:
+                return self.spilled_count + len(self.records)
+            return self.session_counts.get(session, 0)
+
+    def __len__(self):
+        with self._lock:
+            return self.spilled_count + len(self.records)
+
+    def __iter__(self):
+        with self._lock:
+            segments = list(self.segments)
+            records = list(self.records)
+        for segment in segments:
+            yield from self._read_segment(segment)
+        yield from records
+
+    def __getitem__(self, index):
+        with self._lock:
+            total = self.spilled_count + len(self.records)
+            if index < 0:
+                index += total
+            if index < 0 or index >= total:
+                raise IndexError("log index out of range")
+            if index >= self.spilled_count:
+                return self.records[index - self.spilled_count]
+            seg_idx = bisect.bisect_right(self._segment_offsets, index) - 1
+            segment = self.segments[seg_idx]
+            offset = index - self._segment_offsets[seg_idx]
+        for idx, record in enumerate(self._read_segment(segment)):
+            if idx == offset:
+                return record
+        raise IndexError("log index out of range")
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def query(self, start_time=None, end_time=None, session=None, limit=None):
+        """timestamp가 [start_time, end_time] 안에 있고 session이 일치하는 기록 리스트
+
+        session이 None이면 모든 세션, start_time/end_time은 ISO 형식 문자열이며 포함한다
+        limit: 조건에 맞는 기록 중 가장 최근 limit개만 반환한다. 메모리 기록부터 세그먼트를
+        최신순으로 읽다가 limit개를 채우면 더 오래된 세그먼트는 열지 않는다
+        """
+        with self._lock:
+            segments = [
+                segment for segment in self.segments
+                if self._segment_matches(segment, start_time, end_time, session)
+            ]
+            records = self._query_memory(start_time, end_time, session)
+
+        if limit is not None:
+            return self._query_tail(segments, records, start_time, end_time, session, limit)
+
+        result = []
+        for segment in segments:
+            result.extend(
+                record for record in self._read_segment(segment)
+                if self._record_matches(record, start_time, end_time, session)
+            )
+        result.extend(records)
+        return result
+
+    def _query_tail(self, segments, records, start_time, end_time, session, limit):
+        if limit <= 0:
+            return []
+        result = records[-limit:]
+        for segment in reversed(segments):
+            if len(result) >= limit:
+                break
+            matched = [
+                record for record in self._read_segment(segment)
+                if self._record_matches(record, start_time, end_time, session)
+            ]
+            result = matched[len(result) - limit:] + result
+        return result
+
+    def _query_memory(self, start_time, end_time, session):
+        if not self._ordered:
+            return [
+                record for record in self.records
+                if self._record_matches(record, start_time, end_time, session)
+            ]
+
+        positions = None
+        timestamps = self._timestamps
+        if session is not None:
+            if session not in self._session_index:
+                return []
+            positions, timestamps = self._session_index[session]
+
+        low = 0 if start_time is None else bisect.bisect_left(timestamps, start_time)
+        high = len(timestamps) if end_time is None else bisect.bisect_right(timestamps, end_time)
+        if positions is None:
+            return self.records[low:high]
+        return [self.records[seq - self._base] for seq in positions[low:high]]
+
+    @staticmethod
+    def _record_matches(record, start_time, end_time, session):
+        if session is not None and record.get("session") != session:
+            return False
+        timestamp = record.get("timestamp", "")
+        if start_time is not None and timestamp < start_time:
+            return False
+        if end_time is not None and timestamp > end_time:
+            return False
+        return True
+
+    @staticmethod
+    def _segment_matches(segment, start_time, end_time, session):
+        if segment["count"] == 0:
+            return False
+        if session is not None and session not in segment["sessions"]:
+            return False
+        if start_time is not None and segment["end_time"] < start_time:
+            return False
+        if end_time is not None and segment["start_time"] > end_time:
+            return False
+        return True
+
+    def _spill(self, count):
+        spilled = self.records[:count]
+        del self.records[:count]
+        del self._timestamps[:count]
+        self._base += count
+        for session in list(self._session_index):
+            positions, timestamps = self._session_index[session]
+            cut = bisect.bisect_left(positions, self._base)
+            del positions[:cut]
+            del timestamps[:cut]
+            if not positions:
+                del self._session_index[session]
+        if not self._ordered:
+            self._ordered = all(
+                prev <= curr for prev, curr in zip(self._timestamps, self._timestamps[1:])
+            )
+
+        if self.storage_path is None:
+            self._drop(spilled)
+            return
+
+        try:
+            os.makedirs(os.path.join(self.storage_path, self.name), exist_ok=True)
+            while spilled:
+                segment = self._get_writable_segment()
+                room = self.segment_size - segment["count"]
+                chunk = spilled[:room]
+                lines = [
+                    json.dumps(record, ensure_ascii=False, default=str) + "\n"
+                    for record in chunk
+                ]
+                with open(segment["path"], "a", encoding="utf-8") as segment_file:
+                    segment_file.writelines(lines)
+                self._index_chunk(segment, chunk)
+                spilled = spilled[room:]
+        except OSError as err:
+            # 디스크에 쓰지 못한 기록은 버리고 메모리 상한은 지킨다
+            self.logger.warning(f"{self.name} spill failed, dropping {len(spilled)} records: {err}")
+            self._drop(spilled)
+
+    def _drop(self, records):
+        self.dropped_count += len(records)
+        for record in records:
+            session = record.get("session")
+            self.session_counts[session] -= 1
+            if self.session_counts[session] <= 0:
+                del self.session_counts[session]
+
+    def _get_writable_segment(self):
+        if self.segments and self.segments[-1]["count"] < self.segment_size:
+            return self.segments[-1]
+        segment = {
+            "path": os.path.join(
+                self.storage_path, self.name, f"segment-{len(self.segments):05d}.jsonl"
+            ),
+            "count": 0,
+            "start_time": None,
+            "end_time": None,
+            "sessions": set(),
+        }
+        self._segment_offsets.append(self.spilled_count)
+        self.segments.append(segment)
+        return segment
+
+    def _index_chunk(self, segment, chunk):
+        for record in chunk:
+            timestamp = record.get("timestamp", "")
+            if segment["start_time"] is None or timestamp < segment["start_time"]:
+                segment["start_time"] = timestamp
+            if segment["end_time"] is None or timestamp > segment["end_time"]:
+                segment["end_time"] = timestamp
+            segment["sessions"].add(record.get("session"))
+        segment["count"] += len(chunk)
+        self.spilled_count += len(chunk)
+
+    @staticmethod
+    def _read_segment(segment):
+        if segment["count"] == 0:
+            return
+        with open(segment["path"], "r", encoding="utf-8") as segment_file:
+            for line in segment_file:
+                if line.strip():
+                    yield json.loads(line)
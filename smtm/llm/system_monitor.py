@@ -1,23 +1,58 @@
+import os
 from datetime import datetime
-from typing import List
+from typing import Optional
+from .bounded_log import BoundedLog
 from ..log_manager import LogManager
 
 
 class SystemMonitor:
-    """독립 시스템 모니터 — LLM 바깥에서 모든 활동을 기록"""
+    """독립 시스템 모니터 — LLM 바깥에서 모든 활동을 기록
+
+    각 로그는 최근 기록만 메모리에 두고, 상한을 넘으면 오래된 기록을 버린다.
+    storage_path를 지정했을 때만 오래된 기록을 그 아래 인스턴스별 디렉터리의
+    세그먼트 파일로 옮긴다. 이 디렉터리는 기록 보관용이므로 지우지 않는다.
+
+    LOG_CAPACITY: 로그별 메모리 보관 기록 수, capacities 인자로 로그별로 바꿀 수 있다
+    """
 
     ISO_DATEFORMAT = "%Y-%m-%dT%H:%M:%S"
+    LOG_CAPACITY = {
+        "market_data_log": 1000,
+        "trade_request_log": 10000,
+        "trade_result_log": 10000,
+        "tool_call_log": 5000,
+        "llm_interaction_log": 2000,
+        "safety_event_log": 5000,
+        "snapshots": 10000,
+    }
 
-    def __init__(self, storage_path: str = "output/monitor/"):
+    def __init__(self, storage_path: Optional[str] = None, capacities: dict = None):
         self.logger = LogManager.get_logger(__class__.__name__)
         self.storage_path = storage_path
-        self.market_data_log: List[dict] = []
-        self.trade_request_log: List[dict] = []
-        self.trade_result_log: List[dict] = []
-        self.tool_call_log: List[dict] = []
-        self.llm_interaction_log: List[dict] = []
-        self.safety_event_log: List[dict] = []
-        self.snapshots: List[dict] = []
+        capacities = {**self.LOG_CAPACITY, **(capacities or {})}
+        run_path = None
+        if storage_path is not None:
+            run_name = f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{id(self):x}"
+            run_path = os.path.join(storage_path, run_name)
+        self.market_data_log = BoundedLog("market_data_log", capacities["market_data_log"], run_path)
+        self.trade_request_log = BoundedLog(
+            "trade_request_log", capacities["trade_request_log"], run_path
+        )
+        self.trade_result_log = BoundedLog(
+            "trade_result_log", capacities["trade_result_log"], run_path
+        )
+        self.tool_call_log = BoundedLog("tool_call_log", capacities["tool_call_log"], run_path)
+        self.llm_interaction_log = BoundedLog(
+            "llm_interaction_log", capacities["llm_interaction_log"], run_path
+        )
+        self.safety_event_log = BoundedLog(
+            "safety_event_log", capacities["safety_event_log"], run_path
+        )
+        self.snapshots = BoundedLog("snapshots", capacities["snapshots"], run_path)
+        # 디스크로 옮겨진 기록까지 다시 읽지 않도록 사용량은 기록할 때 누적한다
+        self.total_input_tokens = 0
+        self.total_output_tokens = 0
+        self.llm_call_count = 0
 
     def _timestamp(self) -> str:
         return datetime.now().strftime(self.ISO_DATEFORMAT)
@@ -40,6 +75,9 @@ class SystemMonitor:
         })
 
     def log_llm_interaction(self, request: dict, response_text: str, usage: dict):
+        self.total_input_tokens += usage.get("input_tokens", 0)
+        self.total_output_tokens += usage.get("output_tokens", 0)
+        self.llm_call_count += 1
         self.llm_interaction_log.append({
             "timestamp": self._timestamp(),
             "request": request,
@@ -53,19 +91,35 @@ class SystemMonitor:
     def take_snapshot(self, portfolio: dict):
         self.snapshots.append({"timestamp": self._timestamp(), "portfolio": portfolio})
 
-    def get_trade_log(self, start_time=None, end_time=None, session=None) -> list:
-        if session is None:
-            return self.trade_result_log
-        return [log for log in self.trade_result_log if log.get("session") == session]
+    def get_trade_log(self, start_time=None, end_time=None, session=None, limit=None) -> list:
+        """거래 결과 기록, start_time/end_time은 ISO 형식 문자열이며 양 끝을 포함한다
+
+        limit: 가장 최근 limit개만 반환, 디스크로 옮겨진 오래된 기록은 필요한 만큼만 읽는다
+        """
+        return self.trade_result_log.query(start_time, end_time, session, limit=limit)
+
+    def get_trade_count(self, session=None) -> int:
+        """전체 또는 session의 거래 결과 기록 수"""
+        return self.trade_result_log.count(session)
 
     def get_snapshots(self, start_time=None, end_time=None) -> list:
-        return self.snapshots
+        return self.snapshots.query(start_time, end_time)
+
+    def get_log_sizes(self) -> dict:
+        """로그별 전체 기록 수, 메모리에 남은 기록 수, 버린 기록 수"""
+        sizes = {}
+        for name in self.LOG_CAPACITY:
+            log = getattr(self, name)
+            sizes[name] = {
+                "records": len(log),
+                "in_memory": len(log.records),
+                "dropped": log.dropped_count,
+            }
+        return sizes
 
     def get_llm_usage(self) -> dict:
-        total_input = sum(log["usage"].get("input_tokens", 0) for log in self.llm_interaction_log)
-        total_output = sum(log["usage"].get("output_tokens", 0) for log in self.llm_interaction_log)
         return {
-            "total_input_tokens": total_input,
-            "total_output_tokens": total_output,
-            "call_count": len(self.llm_interaction_log),
+            "total_input_tokens": self.total_input_tokens,
+            "total_output_tokens": self.total_output_tokens,
+            "call_count": self.llm_call_count,
         }
@@ -34,7 +34,7 @@ class SystemOperator:
         self.account_store = account_store
 
         self.system_monitor = SystemMonitor(
-            storage_path=config.get("monitor_storage_path", "output/monitor/"),
+            storage_path=config.get("monitor_storage_path"),
         )
         self.tool_router = ToolRouter(self.system_monitor)
         self.context_config = ContextConfig(**config.get("context", {}))
@@ -43,6 +43,7 @@ class SystemOperator:
             config.get("strategy_files", [])
         )
         self.session_manager = None
+        self.metrics_server = None
         self.default_strategy_used = False
 
     # ------------------------------------------------------------------
@@ -63,6 +64,23 @@ class SystemOperator:
         if not result.get("success"):
             raise ValueError(result.get("error"))
         self._register_tools()
+        self._start_metrics_server()
+
+    def _start_metrics_server(self):
+        from ..config import Config
+        from ..metrics_server import MetricsServer
+
+        port = self.config.get("metrics_port", Config.metrics_port)
+        if port is None:
+            return
+        self.metrics_server = MetricsServer(
+            self.session_manager, self.system_monitor, port=port)
+        try:
+            self.metrics_server.start()
+        except OSError as err:
+            # 지표 서버를 못 띄워도 매매는 계속한다
+            self.logger.warning(f"metrics server start fail on port {port}: {err}")
+            self.metrics_server = None
 
     def _config_to_profile(self) -> dict:
         cfg = self.config
@@ -84,11 +102,20 @@ class SystemOperator:
         from .tools.portfolio_tool import PortfolioTool
         from .tools.trade_history_tool import TradeHistoryTool
         from .tools.performance_tool import PerformanceTool
+        from .tools.latency_tool import LatencyTool
 
         self.tool_router.register(MarketDataTool(self.session_manager))
         self.tool_router.register(PortfolioTool(self.session_manager))
         self.tool_router.register(TradeHistoryTool(self.system_monitor))
         self.tool_router.register(PerformanceTool(self.session_manager))
+        self.tool_router.register(LatencyTool(self.session_manager))
+
+        from ..data.candle_store import CandleStore
+        candle_store = CandleStore.from_config()
+        if candle_store is not None:
+            from .tools.candle_history_tool import CandleHistoryTool
+            self.tool_router.register(
+                CandleHistoryTool(self.session_manager, candle_store))
 
         from .tools.orchestration_tools import (
             ListStrategiesTool, DescribeStrategyTool, SelectStrategyTool,
@@ -210,6 +237,9 @@ class SystemOperator:
     def shutdown(self):
         if self.session_manager is not None:
             self.session_manager.stop_all()
+        if self.metrics_server is not None:
+            self.metrics_server.stop()
+            self.metrics_server = None
 
     # ------------------------------------------------------------------
     # 대화 (LlmOperator에서 이관)
@@ -0,0 +1,54 @@
+from ..tool import Tool, ToolResult
+from ...log_manager import LogManager
+
+
+class CandleHistoryTool(Tool):
+    """과거 캔들 조회 Tool — 로컬 CandleStore에 기록된 세션 주거래 캔들"""
+
+    name = "get_candle_history"
+    description = (
+        "세션 주거래 마켓의 과거 캔들을 로컬 캔들 저장소에서 조회합니다."
+        " 시간순(오래된 것부터) primary_candle 리스트를 반환합니다."
+    )
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "session": {"type": "string",
+                        "description": "세션 이름 (기본 default)"},
+            "count": {"type": "integer",
+                      "description": "조회할 최근 캔들 수 (기본 60, 최대 500)"},
+        },
+    }
+    DEFAULT_COUNT = 60
+    MAX_COUNT = 500
+
+    def __init__(self, session_manager, candle_store):
+        self.logger = LogManager.get_logger(__class__.__name__)
+        self.session_manager = session_manager
+        self.candle_store = candle_store
+
+    def execute(self, arguments: dict) -> ToolResult:
+        from ...data.data_provider_factory import DataProviderFactory
+
+        try:
+            session = self.session_manager.get_session(
+                arguments.get("session") or "default")
+            count = int(arguments.get("count") or self.DEFAULT_COUNT)
+            count = max(1, min(count, self.MAX_COUNT))
+            providers = DataProviderFactory.get_exchange_providers(
+                session.operator.data_provider)
+            if not providers:
+                return ToolResult(success=False,
+                                  error="캔들을 기록하는 DataProvider가 아닙니다")
+            provider = providers[0]
+            columns = self.candle_store.read(
+                provider.CODE, provider.market, provider.candle_interval, count=count)
+            return ToolResult(success=True, data={
+                "session": session.name,
+                "candles": self.candle_store.to_candles(columns, market=provider.market),
+            })
+        except ValueError as err:
+            return ToolResult(success=False, error=str(err))
+        except Exception as e:
+            self.logger.error(f"CandleHistoryTool error: {e}")
+            return ToolResult(success=False, error=str(e))
@@ -0,0 +1,42 @@
+import os
+from datetime import datetime
+from ..tool import Tool, ToolResult
+from ...log_manager import LogManager
+
+
+class LatencyTool(Tool):
+    """틱 지연 분석 Tool — 세션별 파이프라인 단계 소요 시간 조회"""
+    name = "get_latency"
+    description = ("세션 틱의 단계별 소요 시간(data_provider, strategy_update, strategy, "
+                   "safety_guard, trader, analyzer, tick 전체)과 주문 체결 시간(order_fill)의 "
+                   "p50/p95/p99/최대값(초), 예정 시각 대비 틱 시작 지연을 조회합니다. "
+                   "틱이 느릴 때 원인 단계를 찾는 데 사용하세요. "
+                   "export=true면 전체 리포트를 파일로 저장합니다")
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "session": {"type": "string", "description": "세션 이름 (생략 시 전체 세션)"},
+            "export": {"type": "boolean",
+                       "description": "전체 세션 리포트를 JSON 파일로 저장할지 여부"},
+        },
+    }
+
+    def __init__(self, session_manager, export_dir="output/metrics/"):
+        self.logger = LogManager.get_logger(__class__.__name__)
+        self.session_manager = session_manager
+        self.export_dir = export_dir
+
+    def execute(self, arguments: dict) -> ToolResult:
+        try:
+            if arguments.get("export"):
+                filename = f"latency-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+                path = os.path.join(self.export_dir, filename)
+                dump = self.session_manager.export_metrics(path)
+                return ToolResult(success=True, data={"path": path, **dump})
+            data = self.session_manager.get_latency_report(arguments.get("session"))
+            return ToolResult(success=True, data={"sessions": data})
+        except ValueError as err:
+            return ToolResult(success=False, error=str(err))
+        except Exception as e:
+            self.logger.error(f"LatencyTool error: {e}")
+            return ToolResult(success=False, error=str(e))
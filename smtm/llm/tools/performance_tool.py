@@ -5,7 +5,8 @@ from ...log_manager import LogManager
 class PerformanceTool(Tool):
     """수익률 분석 Tool — 세션의 성과 조회"""
     name = "get_performance"
-    description = "세션의 수익률, 거래 통계, 성과 분석을 조회합니다"
+    description = ("세션의 수익률, 최대 낙폭, 변동성과 샤프 지수, 승률, 평균 보유 시간, "
+                   "회전율, 수수료 등 거래 통계와 성과 분석을 조회합니다")
     input_schema = {
         "type": "object",
         "properties": {"session": {"type": "string",
@@ -11,6 +11,9 @@ PROFILE_PROPERTIES = {
     "strategy_params": {"type": "object", "description": "전략 파라미터"},
     "safety": {"type": "object", "description": "안전장치 설정"},
     "account": {"type": "string", "description": "계좌 별칭 (실거래 세션에 필요, 가상매매는 불필요)"},
+    "operator_mode": {"type": "string", "enum": ["thread", "shared", "event"],
+                      "description": "실행 방식 (shared는 모든 세션이 공유 스레드 풀에서 실행, "
+                                     "event는 캔들이 닫힐 때마다 매매)"},
 }
 
 
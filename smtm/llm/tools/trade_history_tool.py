@@ -22,8 +22,8 @@ class TradeHistoryTool(Tool):
     def execute(self, arguments: dict) -> ToolResult:
         try:
             count = arguments.get("count", 20)
-            log = self.system_monitor.get_trade_log(session=arguments.get("session"))
-            return ToolResult(success=True, data=log[-count:])
+            log = self.system_monitor.get_trade_log(session=arguments.get("session"), limit=count)
+            return ToolResult(success=True, data=log)
         except Exception as e:
             self.logger.error(f"TradeHistoryTool error: {e}")
             return ToolResult(success=False, error=str(e))
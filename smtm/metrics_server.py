@@ -0,0 +1,238 @@
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from .http_session import http_session_pool
+from .latency_metrics import LatencyHistogram
+from .log_manager import LogManager
+from .rate_limiter import rate_limiter
+
+
+class MetricsServer:
+    """
+    봇 프로세스의 운영 지표를 Prometheus 텍스트 형식으로 내보내는 로컬 HTTP 서버
+
+    Opt-in endpoint (GET /metrics) on a stdlib ThreadingHTTPServer. Nothing is
+    collected in the background: each scrape reads the counters and histograms the
+    components already keep (TickMetrics of every session, the HTTP session pool,
+    the rate limiter, SystemMonitor) and renders them, so a process without a
+    scraper pays nothing beyond what it already records.
+
+    기본으로 127.0.0.1에만 바인딩한다. port=0이면 빈 포트를 골라 self.port에 둔다.
+
+    BUCKET_STEP: 히스토그램 버킷을 내보낼 간격, LatencyHistogram.BOUNDS의 몇 번째마다 쓸지
+    """
+
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+    BUCKET_STEP = 4
+
+    def __init__(self, session_manager=None, system_monitor=None, host="127.0.0.1", port=9108):
+        self.logger = LogManager.get_logger(__class__.__name__)
+        self.session_manager = session_manager
+        self.system_monitor = system_monitor
+        self.host = host
+        self.port = port
+        self.server = None
+        self.thread = None
+
+    def start(self):
+        if self.server is not None:
+            return
+        self.server = ThreadingHTTPServer((self.host, self.port), self._make_handler())
+        self.server.daemon_threads = True
+        self.port = self.server.server_address[1]
+        self.thread = threading.Thread(
+            target=self.server.serve_forever, name="MetricsServer", daemon=True
+        )
+        self.thread.start()
+        self.logger.info(f"metrics endpoint: http://{self.host}:{self.port}/metrics")
+
+    def stop(self):
+        if self.server is None:
+            return
+        self.server.shutdown()
+        self.server.server_close()
+        self.server = None
+        self.thread = None
+
+    def render(self):
+        """현재 지표 전체를 텍스트 노출 형식으로 만든다"""
+        writer = _MetricWriter(self.BUCKET_STEP)
+        for collect in (
+            self._collect_sessions,
+            self._collect_http,
+            self._collect_monitor,
+            self._collect_process,
+        ):
+            try:
+                collect(writer)
+            except Exception as err:
+                self.logger.error(f"metrics collect error in {collect.__name__}: {err}")
+        return writer.render()
+
+    def _collect_sessions(self, writer):
+        if self.session_manager is None:
+            return
+        for session in list(self.session_manager.sessions.values()):
+            labels = {"session": session.name}
+            operator = session.operator
+            writer.gauge("smtm_session_running", "1 if the session is trading",
+                         labels, 1 if session.state == "running" else 0)
+            metrics = operator.metrics
+            for stage, buckets in metrics.get_buckets().items():
+                if stage == "order_fill":
+                    writer.histogram("smtm_order_fill_seconds",
+                                     "Time from sending an order to its fill result",
+                                     labels, buckets)
+                else:
+                    writer.histogram("smtm_tick_stage_seconds",
+                                     "Duration of each tick pipeline stage",
+                                     {**labels, "stage": stage}, buckets)
+            counters = metrics.get_counters()
+            writer.counter("smtm_safety_blocked_total", "Requests blocked by SafetyGuard",
+                           labels, counters.get("safety_blocked", 0))
+            tick_stats = operator.get_tick_stats()
+            if tick_stats is not None:
+                writer.counter("smtm_scheduled_ticks_total",
+                               "Ticks started by the tick scheduler",
+                               labels, tick_stats["tick_count"])
+                writer.counter("smtm_coalesced_ticks_total",
+                               "Interval boundaries skipped because a tick was still running",
+                               labels, tick_stats["coalesced_count"])
+                if tick_stats["last_lateness"] is not None:
+                    writer.gauge("smtm_tick_lateness_seconds",
+                                 "Start delay of the last tick after its scheduled boundary",
+                                 labels, tick_stats["last_lateness"])
+                writer.gauge("smtm_tick_lateness_max_seconds",
+                             "Largest tick start delay after its scheduled boundary",
+                             labels, tick_stats["max_lateness"])
+
+    def _collect_http(self, writer):
+        call_metrics = http_session_pool.call_metrics
+        for host, buckets in call_metrics.get_buckets().items():
+            writer.histogram("smtm_http_request_seconds", "HTTP request duration per attempt",
+                             {"host": host}, buckets)
+        for (host, status), count in call_metrics.get_counters().items():
+            writer.counter("smtm_http_requests_total", "HTTP request attempts by status",
+                           {"host": host, "status": status}, count)
+        for key, stat in rate_limiter.get_stats().items():
+            labels = {"key": key}
+            writer.counter("smtm_rate_limit_calls_total", "Calls passed through the rate limiter",
+                           labels, stat["calls"])
+            writer.counter("smtm_rate_limit_delayed_total", "Calls delayed by the rate limiter",
+                           labels, stat["delayed_calls"])
+            writer.counter("smtm_rate_limit_wait_seconds_total",
+                           "Total time calls waited for the rate limiter",
+                           labels, stat["total_wait"])
+
+    def _collect_monitor(self, writer):
+        if self.system_monitor is None:
+            return
+        for name, size in self.system_monitor.get_log_sizes().items():
+            labels = {"log": name}
+            writer.gauge("smtm_monitor_log_records", "Records kept by the SystemMonitor log",
+                         labels, size["records"])
+            writer.gauge("smtm_monitor_log_in_memory_records",
+                         "Records of the SystemMonitor log held in memory",
+                         labels, size["in_memory"])
+            writer.counter("smtm_monitor_log_dropped_total",
+                           "Records the SystemMonitor log discarded", labels, size["dropped"])
+        usage = self.system_monitor.get_llm_usage()
+        writer.counter("smtm_llm_input_tokens_total", "LLM input tokens", {},
+                       usage["total_input_tokens"])
+        writer.counter("smtm_llm_output_tokens_total", "LLM output tokens", {},
+                       usage["total_output_tokens"])
+        writer.counter("smtm_llm_calls_total", "LLM calls", {}, usage["call_count"])
+
+    def _collect_process(self, writer):
+        writer.gauge("smtm_threads", "Live threads in the process", {}, threading.active_count())
+        rss = _get_rss_bytes()
+        if rss is not None:
+            writer.gauge("smtm_process_resident_memory_bytes", "Resident set size", {}, rss)
+
+    def _make_handler(self):
+        metrics_server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = metrics_server.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", metrics_server.CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                metrics_server.logger.debug(format % args)
+
+        return Handler
+
+
+class _MetricWriter:
+    """같은 이름의 샘플을 HELP/TYPE 한 번 아래로 모아 텍스트 노출 형식으로 만든다"""
+
+    def __init__(self, bucket_step):
+        self.bucket_step = bucket_step
+        self.families = {}
+
+    def counter(self, name, help_text, labels, value):
+        self._family(name, help_text, "counter").append((name, labels, value))
+
+    def gauge(self, name, help_text, labels, value):
+        self._family(name, help_text, "gauge").append((name, labels, value))
+
+    def histogram(self, name, help_text, labels, buckets):
+        """buckets: TickMetrics.get_buckets()의 (누적 건수, 전체 건수, 합계)"""
+        cumulative, count, total = buckets
+        samples = self._family(name, help_text, "histogram")
+        bounds = LatencyHistogram.BOUNDS
+        for index in range(self.bucket_step - 1, len(bounds), self.bucket_step):
+            samples.append((f"{name}_bucket", {**labels, "le": format(bounds[index], ".6g")},
+                            cumulative[index]))
+        samples.append((f"{name}_bucket", {**labels, "le": "+Inf"}, count))
+        samples.append((f"{name}_sum", labels, total))
+        samples.append((f"{name}_count", labels, count))
+
+    def render(self):
+        lines = []
+        for name, (help_text, metric_type, samples) in self.families.items():
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            for sample_name, labels, value in samples:
+                lines.append(f"{sample_name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def _family(self, name, help_text, metric_type):
+        family = self.families.get(name)
+        if family is None:
+            family = self.families[name] = (help_text, metric_type, [])
+        return family[2]
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    pairs = []
+    for key, value in labels.items():
+        value = str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+        pairs.append(f'{key}="{value}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+def _format_value(value):
+    if isinstance(value, bool):
+        return str(int(value))
+    if isinstance(value, int):
+        return str(value)
+    return repr(float(value))
+
+
+def _get_rss_bytes():
+    # /proc가 없는 OS에서는 내보내지 않는다
+    try:
+        with open("/proc/self/statm", "r", encoding="utf-8") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
@@ -0,0 +1,155 @@
+import os
+import random
+import shutil
+import tempfile
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from .log_manager import LogManager
+from .backtester import Backtester
+
+# 워커 프로세스마다 한 번 열어두는 읽기 전용 memmap 캔들 배열
+_worker_candles = None
+
+
+def _init_worker(candle_path):
+    global _worker_candles
+    _worker_candles = np.load(candle_path, mmap_mode="r")
+
+
+def _run_backtest(task):
+    strategy_code, params, budget, currency = task
+    row = {"params": params}
+    try:
+        strategy = ParameterOptimizer.create_strategy(strategy_code, params)
+        columns = {key: _worker_candles[key] for key in Backtester.CANDLE_KEYS}
+        report = Backtester(strategy, budget=budget, currency=currency).run(columns)
+        row.update(
+            {
+                "cumulative_return": report["cumulative_return"],
+                "max_drawdown": report["max_drawdown"],
+                "total_trades": report["total_trades"],
+                "current_value": report["current_value"],
+            }
+        )
+    except Exception as err:  # 한 조합의 실패가 전체 탐색을 멈추지 않도록 결과에 남긴다
+        row["error"] = str(err)
+    return row
+
+
+class ParameterOptimizer:
+    """
+    전략 파라미터 조합을 프로세스 풀에서 백테스트해서 비교하는 파라미터 탐색기
+
+    Grid/random search over strategy class parameters (e.g. StrategySma.SHORT/MID/LONG,
+    StrategyRsi.RSI_LOW/RSI_HIGH) that fans backtests out over a ProcessPoolExecutor.
+
+    캔들은 한 번만 .npy 파일로 저장하고 각 워커가 시작할 때 memmap으로 열어 공유한다.
+    작업마다 캔들을 pickle로 넘기지 않으므로 조합 수와 코어 수에 비례해 확장된다.
+
+    strategy_code: StrategyFactory에 등록된 전략 코드
+    candles: primary_candle 딕셔너리 리스트 또는 컬럼 배열 딕셔너리
+    budget: 조합마다 사용할 시작 예산
+    max_workers: 워커 프로세스 수, 기본값은 CPU 수
+    """
+
+    def __init__(self, strategy_code, candles, budget=500000, currency="BTC", max_workers=None):
+        self.logger = LogManager.get_logger(__class__.__name__)
+        if self.create_strategy(strategy_code, {}) is None:
+            raise ValueError(f"올바르지 않은 전략 코드입니다: {strategy_code}")
+        self.strategy_code = strategy_code
+        self.candles = candles
+        self.budget = budget
+        self.currency = currency
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+    @staticmethod
+    def create_strategy(strategy_code, params):
+        """params로 클래스 상수를 덮어쓴 전략 객체를 생성한다
+
+        상수는 __init__에서 지표 윈도우 크기 등으로 쓰이므로 인스턴스가 아닌
+        하위 클래스의 클래스 속성으로 덮어쓴다
+        """
+        from .strategy.strategy_factory import StrategyFactory
+
+        strategy = StrategyFactory.create(strategy_code)
+        if strategy is None or not params:
+            return strategy
+
+        base = type(strategy)
+        for name in params:
+            if not name.isupper() or not hasattr(base, name):
+                raise ValueError(f"{base.__name__}에 없는 파라미터입니다: {name}")
+        return type(base.__name__, (base,), dict(params))()
+
+    def grid_search(self, param_grid):
+        """param_grid의 모든 조합을 백테스트한다
+
+        param_grid: {"SHORT": [5, 10], "MID": [20, 40]} 처럼 파라미터별 후보 리스트
+        Returns: 조합별 결과 리스트, cumulative_return 내림차순
+        """
+        return self._search(self._expand(param_grid))
+
+    def random_search(self, param_grid, count, seed=None):
+        """param_grid의 조합 중 중복 없이 count개를 무작위로 골라 백테스트한다"""
+        combinations = self._expand(param_grid)
+        rand = random.Random(seed)
+        if count < len(combinations):
+            combinations = rand.sample(combinations, count)
+        return self._search(combinations)
+
+    @staticmethod
+    def _expand(param_grid):
+        names = list(param_grid.keys())
+        return [
+            dict(zip(names, values))
+            for values in itertools.product(*(param_grid[name] for name in names))
+        ]
+
+    def _search(self, combinations):
+        if len(combinations) == 0:
+            return []
+
+        work_dir = tempfile.mkdtemp(prefix="smtm-optimizer-")
+        try:
+            candle_path = os.path.join(work_dir, "candles.npy")
+            np.save(candle_path, self._to_array(self.candles))
+            tasks = [
+                (self.strategy_code, params, self.budget, self.currency)
+                for params in combinations
+            ]
+            workers = min(self.max_workers, len(tasks))
+            chunksize = max(1, len(tasks) // (workers * 4))
+            self.logger.info(
+                f"parameter search start: {len(tasks)} combinations, {workers} workers"
+            )
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_worker, initargs=(candle_path,)
+            ) as executor:
+                results = list(executor.map(_run_backtest, tasks, chunksize=chunksize))
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+        results.sort(
+            key=lambda row: row.get("cumulative_return", float("-inf")), reverse=True
+        )
+        return results
+
+    @staticmethod
+    def _to_array(candles):
+        from .data.candle_store import CandleStore
+
+        is_columns = isinstance(candles, dict)
+        if is_columns and "date_time" not in candles:
+            candles = dict(candles)
+            candles["date_time"] = [
+                CandleStore.to_date_time(ts) for ts in candles["timestamp"]
+            ]
+        length = len(candles["date_time"]) if is_columns else len(candles)
+        dtype = [("date_time", "U19")] + [
+            (key, "f8") for key in Backtester.CANDLE_KEYS if key != "date_time"
+        ]
+        array = np.empty(length, dtype=dtype)
+        for key in Backtester.CANDLE_KEYS:
+            array[key] = candles[key] if is_columns else [c[key] for c in candles]
+        return array
@@ -12,8 +12,9 @@ class ProfileStore:
 
     ALLOWED_FIELDS = {
         "name", "exchange", "currency", "budget", "virtual",
-        "term", "strategy", "strategy_params", "safety", "account",
+        "term", "strategy", "strategy_params", "safety", "account", "operator_mode",
     }
+    OPERATOR_MODES = ("thread", "shared", "async", "event")
     NAME_PATTERN = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
 
     def __init__(self, dir_path="config/profiles"):
@@ -30,6 +31,8 @@ class ProfileStore:
         unknown = set(profile.keys()) - self.ALLOWED_FIELDS
         if unknown:
             raise ValueError(f"알 수 없는 프로파일 필드: {', '.join(sorted(unknown))}")
+        if profile.get("operator_mode", "thread") not in self.OPERATOR_MODES:
+            raise ValueError(f"올바르지 않은 실행 방식입니다: {profile.get('operator_mode')}")
 
     def save(self, profile: dict) -> dict:
         self.validate(profile)
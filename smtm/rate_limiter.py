@@ -0,0 +1,219 @@
+import json
+import threading
+import time
+from urllib.parse import urlsplit
+from .log_manager import LogManager
+
+
+class TokenBucket:
+    """period초 동안 count회를 허용하는 토큰 버킷
+
+    토큰이 모자라도 먼저 차감해 음수로 두고, 부족한 만큼 기다릴 시간을 돌려준다.
+    나중에 온 호출은 앞선 호출이 예약한 시간 뒤로 밀리므로 순서대로 한도 안에 배치된다.
+    """
+
+    def __init__(self, count, period):
+        self.capacity = float(count)
+        self.period = period
+        self.rate = count / period
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def reserve(self, cost, now):
+        self._refill(now)
+        self.tokens -= cost
+        return max(0.0, -self.tokens / self.rate)
+
+    def sync(self, remaining, now):
+        """거래소가 알려준 남은 요청 수에 맞춰 토큰을 줄인다"""
+        self._refill(now)
+        self.tokens = min(self.tokens, float(remaining))
+
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+
+class RateLimiter:
+    """
+    거래소별 요청 한도를 지키도록 HTTP 호출을 배치하는 프로세스 공용 레이트 리미터
+
+    Process-wide limiter keyed by (exchange, endpoint group, private). Every call made
+    through request_with_retry reserves tokens before it is sent and sleeps for the
+    queueing delay needed to stay under the exchange quota, so bursts from many
+    sessions are spread out instead of answered with 429. Response headers
+    (Upbit Remaining-Req, Binance X-MBX-USED-WEIGHT-1M) recalibrate the buckets to what
+    the exchange actually counted, and a 429 empties the buckets of that key.
+
+    호스트가 HOSTS에 없는 요청은 제한하지 않는다.
+
+    QUOTAS: (거래소, 그룹, private) -> ((허용 횟수, 기간(초)), ...)
+    BINANCE_WEIGHTS: Binance 경로별 요청 가중치, 없으면 1
+    BINANCE_SYMBOL_WEIGHTS: 심볼 수에 비례하는 Binance 경로별 (심볼당 가중치, 최대 가중치)
+    """
+
+    HOSTS = {
+        "api.upbit.com": "upbit",
+        "api.bithumb.com": "bithumb",
+        "api.binance.com": "binance",
+        "fapi.binance.com": "binance_futures",
+    }
+    QUOTAS = {
+        ("upbit", "order", True): ((8, 1), (200, 60)),
+        ("upbit", "default", True): ((30, 1), (900, 60)),
+        ("upbit", "*", False): ((10, 1), (600, 60)),
+        ("bithumb", "*", False): ((135, 1),),
+        ("bithumb", "*", True): ((15, 1),),
+        ("binance", "weight", False): ((6000, 60),),
+        ("binance", "order", True): ((50, 10),),
+        ("binance_futures", "weight", False): ((2400, 60),),
+    }
+    UPBIT_PUBLIC_GROUPS = ("market", "candles", "trades", "ticker", "orderbook")
+    BINANCE_WEIGHTS = {
+        "/api/v3/klines": 2,
+        "/api/v3/ticker/price": 2,
+        "/api/v3/depth": 5,
+        "/api/v3/openOrders": 6,
+        "/api/v3/account": 20,
+        ("GET", "/api/v3/order"): 4,
+    }
+    BINANCE_SYMBOL_WEIGHTS = {
+        "/api/v3/ticker": (4, 200),
+    }
+
+    def __init__(self):
+        self.logger = LogManager.get_logger(__class__.__name__)
+        self.buckets = {}
+        self.stats = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, url, method="GET", headers=None, params=None):
+        """요청을 보내기 전에 호출한다. 한도에 맞추느라 기다린 시간(초)을 반환한다"""
+        costs = self.classify(url, method, headers, params)
+        if not costs:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            wait = 0.0
+            for key, cost in costs:
+                for bucket in self._get_buckets(key):
+                    wait = max(wait, bucket.reserve(cost, now))
+            for key, _ in costs:
+                self._record(key, wait)
+        if wait > 0:
+            self.logger.debug(f"rate limit delay {wait:.3f}s: {method} {url}")
+            time.sleep(wait)
+        return wait
+
+    def update(self, url, method="GET", headers=None, response=None, params=None):
+        """응답 헤더와 상태 코드로 버킷을 보정한다"""
+        costs = self.classify(url, method, headers, params)
+        if not costs or response is None:
+            return
+        status = getattr(response, "status_code", None)
+        response_headers = getattr(response, "headers", None) or {}
+        exchange = costs[0][0][0]
+        with self._lock:
+            now = time.monotonic()
+            if status == 429:
+                for key, _ in costs:
+                    for bucket in self._get_buckets(key):
+                        bucket.sync(0, now)
+                return
+            if exchange == "upbit":
+                self._sync_upbit(costs[0][0], response_headers.get("Remaining-Req"), now)
+            elif exchange.startswith("binance"):
+                used = response_headers.get("X-MBX-USED-WEIGHT-1M")
+                key = (exchange, "weight", False)
+                if isinstance(used, str) and used.isdigit() and key in self.buckets:
+                    for bucket in self.buckets[key]:
+                        bucket.sync(bucket.capacity - int(used), now)
+
+    def classify(self, url, method="GET", headers=None, params=None):
+        """요청이 차감할 [((거래소, 그룹, private), 비용)] 리스트, 제한하지 않는 요청이면 빈 리스트"""
+        parts = urlsplit(url)
+        exchange = self.HOSTS.get(parts.netloc.lower())
+        if exchange is None:
+            return []
+        path = parts.path
+        method = method.upper()
+        headers = headers or {}
+
+        if exchange == "upbit":
+            if "Authorization" in headers:
+                group = "order" if method == "POST" and path.startswith("/v1/orders") else "default"
+                return [((exchange, group, True), 1)]
+            group = next(
+                (name for name in self.UPBIT_PUBLIC_GROUPS if path.startswith(f"/v1/{name}")),
+                "default",
+            )
+            return [((exchange, group, False), 1)]
+        if exchange == "bithumb":
+            private = path.startswith("/info") or path.startswith("/trade")
+            return [((exchange, "*", private), 1)]
+
+        if path in self.BINANCE_SYMBOL_WEIGHTS:
+            per_symbol, max_weight = self.BINANCE_SYMBOL_WEIGHTS[path]
+            weight = min(per_symbol * self._count_symbols(params), max_weight)
+        else:
+            weight = self.BINANCE_WEIGHTS.get((method, path), self.BINANCE_WEIGHTS.get(path, 1))
+        costs = [((exchange, "weight", False), weight)]
+        if method == "POST" and path == "/api/v3/order":
+            costs.append(((exchange, "order", True), 1))
+        return costs
+
+    def get_stats(self):
+        """키별 호출 수와 대기한 호출 수, 누적/최대 대기 시간(초)"""
+        with self._lock:
+            return {
+                f"{key[0]}:{key[1]}:{'private' if key[2] else 'public'}": dict(stat)
+                for key, stat in self.stats.items()
+            }
+
+    @staticmethod
+    def _count_symbols(params):
+        """Binance symbols 파라미터(JSON 배열)의 심볼 수, 없거나 읽을 수 없으면 1"""
+        symbols = params.get("symbols") if isinstance(params, dict) else None
+        if symbols is None:
+            return 1
+        try:
+            return max(len(json.loads(symbols)), 1)
+        except (TypeError, ValueError):
+            return 1
+
+    def _get_buckets(self, key):
+        buckets = self.buckets.get(key)
+        if buckets is None:
+            exchange, _, private = key
+            quota = self.QUOTAS.get(key) or self.QUOTAS.get((exchange, "*", private), ())
+            buckets = [TokenBucket(count, period) for count, period in quota]
+            self.buckets[key] = buckets
+        return buckets
+
+    def _record(self, key, wait):
+        stat = self.stats.setdefault(
+            key, {"calls": 0, "delayed_calls": 0, "total_wait": 0.0, "max_wait": 0.0}
+        )
+        stat["calls"] += 1
+        if wait > 0:
+            stat["delayed_calls"] += 1
+            stat["total_wait"] += wait
+            stat["max_wait"] = max(stat["max_wait"], wait)
+
+    def _sync_upbit(self, key, remaining_req, now):
+        # 예: "group=candles; min=599; sec=9"
+        if not isinstance(remaining_req, str):
+            return
+        fields = dict(
+            item.strip().split("=", 1) for item in remaining_req.split(";") if "=" in item
+        )
+        group = fields.get("group")
+        if group and group not in ("order", "default") and not key[2]:
+            key = ("upbit", group, False)
+        for bucket in self._get_buckets(key):
+            remaining = fields.get("sec" if bucket.period <= 1 else "min")
+            if remaining is not None and remaining.isdigit():
+                bucket.sync(int(remaining), now)
+
+
+rate_limiter = RateLimiter()
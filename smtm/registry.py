@@ -0,0 +1,100 @@
+import threading
+from .lazy_import import load_attribute
+from .log_manager import LogManager
+
+
+class Registry:
+    """
+    코드 → 구현 클래스 레지스트리, 클래스는 그 코드를 처음 찾을 때 import한다
+
+    Built-in entries are (module, class name) pairs relative to `package`. Third-party
+    packages can add entries through the `group` entry point group, with the code as
+    the entry point name:
+
+        [options.entry_points]
+        smtm.strategies =
+            MYS = my_package.my_strategy:MyStrategy
+
+    Installed entry points are only read when a code is not built in or when every
+    code is listed, and an entry point is only loaded when its code is requested.
+    Built-in codes cannot be replaced by a plugin.
+
+    group: 플러그인 entry point 그룹 이름
+    """
+
+    def __init__(self, group, builtins, package):
+        self.logger = LogManager.get_logger(__class__.__name__)
+        self.group = group
+        self.package = package
+        self.entries = dict(builtins)
+        self.classes = {}
+        self._plugins_loaded = False
+        self._lock = threading.Lock()
+
+    def get(self, code):
+        """code의 클래스, 없으면 None"""
+        cls = self.classes.get(code)
+        if cls is not None:
+            return cls
+        if code not in self.entries:
+            self._discover_plugins()
+        entry = self.entries.get(code)
+        if entry is None:
+            return None
+        try:
+            if isinstance(entry, tuple):
+                cls = load_attribute(*entry, package=self.package)
+            else:
+                cls = entry.load()
+        except Exception as err:
+            # 깨진 플러그인 하나가 다른 코드 조회를 막지 않도록 없는 코드로 취급한다
+            self.logger.error(f"{self.group} {code} load fail: {err}")
+            return None
+        self.classes[code] = cls
+        return cls
+
+    def register(self, code, cls):
+        """클래스를 코드에 직접 등록한다. 같은 코드가 있으면 바꾼다"""
+        with self._lock:
+            self.entries[code] = cls
+            self.classes[code] = cls
+
+    def codes(self):
+        """내장 코드 다음에 플러그인 코드 순서의 전체 코드 리스트"""
+        self._discover_plugins()
+        return list(self.entries)
+
+    def __contains__(self, code):
+        if code not in self.entries:
+            self._discover_plugins()
+        return code in self.entries
+
+    def __iter__(self):
+        return iter(self.codes())
+
+    def _discover_plugins(self):
+        if self._plugins_loaded:
+            return
+        with self._lock:
+            if self._plugins_loaded:
+                return
+            for entry_point in _get_entry_points(self.group):
+                if entry_point.name in self.entries:
+                    self.logger.warning(
+                        f"{self.group} {entry_point.name} is already registered, ignored"
+                    )
+                    continue
+                self.entries[entry_point.name] = entry_point
+            self._plugins_loaded = True
+
+
+def _get_entry_points(group):
+    from importlib import metadata
+
+    try:
+        return list(metadata.entry_points(group=group))
+    except TypeError:
+        # Python 3.9 이하는 group 인자가 없고 그룹 이름을 키로 하는 dict를 돌려준다
+        return list(metadata.entry_points().get(group, []))
+    except Exception:
+        return []
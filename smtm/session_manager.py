@@ -1,3 +1,5 @@
+import json
+import os
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
@@ -31,13 +33,21 @@ class SessionManager:
     DEFAULT_SESSION = "default"
     LEGACY_ACCOUNT = "legacy"
 
-    def __init__(self, account_store=None, llm_client=None, system_monitor=None):
+    def __init__(self, account_store=None, llm_client=None, system_monitor=None,
+                 market_data_hub=None):
+        from .config import Config
+        from .data.market_data_hub import MarketDataHub
+
         self.logger = LogManager.get_logger(__class__.__name__)
         self.account_store = account_store
         self.llm_client = llm_client
         self.system_monitor = system_monitor
+        # 같은 (거래소, 통화, 인터벌) 세션들이 틱마다 한 번의 조회를 공유한다
+        self.market_data_hub = market_data_hub or MarketDataHub(
+            batch=Config.market_data_batch, stream=Config.market_data_stream)
         self.sessions = {}        # name -> TradingSession
         self.account_guards = {}  # alias -> AccountGuard
+        self.order_pollers = {}   # 거래소 계정 키 -> OrderStatusPoller
 
     # ------------------------------------------------------------------
     # 생성/교체
@@ -108,6 +118,7 @@ class SessionManager:
             return {"success": False, "error": f"트레이더 생성 실패: {err}"}
         if trader is None:
             return {"success": False, "error": f"올바르지 않은 거래소 코드입니다: {exchange}"}
+        self._attach_order_poller(trader)
 
         if not virtual:
             account_guard = self.get_account_guard(guard_alias)
@@ -157,25 +168,39 @@ class SessionManager:
 
     def _assemble(self, profile, name, trader, account_guard):
         """DataProvider/Strategy/Analyzer/Guard/TradingOperator 조립.
+        DataProvider는 market_data_hub 구독으로 얻고, 조립 실패 시 구독을 해제한다.
         실패 시 ValueError (호출부가 trader 정리)"""
-        from .data.data_provider_factory import DataProviderFactory
+        from .data.candle_store import CandleStore
+        from .config import Config
+
+        exchange = profile.get("exchange", "UPB")
+        currency = profile.get("currency", "BTC")
+        data_provider = self.market_data_hub.subscribe(
+            exchange, currency=currency, interval=Config.candle_interval,
+            candle_store=CandleStore.from_config())
+        if data_provider is None:
+            raise ValueError(f"올바르지 않은 거래소 코드입니다: {exchange}")
+        try:
+            return self._assemble_operator(
+                profile, name, trader, account_guard, data_provider)
+        except Exception:
+            self.market_data_hub.unsubscribe(data_provider)
+            raise
+
+    def _assemble_operator(self, profile, name, trader, account_guard, data_provider):
         from .strategy.strategy_factory import StrategyFactory
         from .trading_operator import TradingOperator
-        from .analyzer import Analyzer
+        from .async_trading_operator import AsyncTradingOperator
+        from .event_trading_operator import EventTradingOperator
         from .config import Config
+        from .analyzer import Analyzer
         from .llm.safety_guard import SafetyGuard, SafetyConfig
         from .llm.account_guard import CompositeSafetyGuard
 
-        exchange = profile.get("exchange", "UPB")
         currency = profile.get("currency", "BTC")
         budget = float(profile.get("budget", 500000))
         strategy_code = profile.get("strategy") or "BNH"
 
-        data_provider = DataProviderFactory.create(
-            exchange, currency=currency, interval=Config.candle_interval)
-        if data_provider is None:
-            raise ValueError(f"올바르지 않은 거래소 코드입니다: {exchange}")
-
         strategy = StrategyFactory.create(strategy_code, llm_client=self.llm_client)
         if strategy is None:
             raise ValueError(f"올바르지 않은 전략 코드입니다: {strategy_code}")
@@ -187,12 +212,33 @@ class SessionManager:
         if account_guard is not None:
             guard = CompositeSafetyGuard(session_guard, account_guard)
 
-        operator = TradingOperator(
+        operator_cls = TradingOperator
+        operator_mode = profile.get("operator_mode", Config.operator_mode)
+        if operator_mode in ("shared", "async"):
+            operator_cls = AsyncTradingOperator
+        elif operator_mode == "event":
+            operator_cls = EventTradingOperator
+        operator = operator_cls(
             interval=profile.get("term", 60), currency=currency)
         operator.initialize(
-            data_provider, strategy, trader, analyzer, guard, budget=budget)
+            data_provider, strategy, trader, analyzer, guard, budget=budget,
+            warmup_candles=self._load_warmup_candles(data_provider, strategy))
         return operator, session_guard
 
+    def _load_warmup_candles(self, data_provider, strategy):
+        """전략 워밍업용 최근 캔들. 조회 실패는 세션 생성을 막지 않고 빈 워밍업으로 시작"""
+        from .data.data_provider_factory import DataProviderFactory
+
+        count = strategy.get_warmup_count()
+        providers = DataProviderFactory.get_exchange_providers(data_provider)
+        if count <= 0 or not providers:
+            return []
+        try:
+            return providers[0].get_recent_candles(count)
+        except Exception as err:
+            self.logger.warning(f"fail to load warm-up candles: {err}")
+            return []
+
     def replace_session(self, name, profile) -> dict:
         """stopped 세션을 새 프로파일로 교체. 세션 가드 일일 카운터 승계.
         실패 시 기존 세션 유지."""
@@ -224,6 +270,7 @@ class SessionManager:
             new_guard.daily_trade_count = old.session_guard.daily_trade_count
             new_guard.daily_date = old.session_guard.daily_date
             self._discard_trader(old.trader)
+            self.market_data_hub.unsubscribe(old.operator.data_provider)
         return result
 
     # ------------------------------------------------------------------
@@ -260,6 +307,7 @@ class SessionManager:
         if session.account:
             self.get_account_guard(session.account).release(name)
         self._discard_trader(session.trader)
+        self.market_data_hub.unsubscribe(session.operator.data_provider)
         del self.sessions[name]
         return {"success": True, "removed": name}
 
@@ -301,14 +349,39 @@ class SessionManager:
             "created_at": session.created_at,
             "safety": session.operator.safety_guard.get_status(),
             "performance": session.operator.get_score(),
+            "latency": session.operator.get_latency_report(),
+            "tick": session.operator.get_tick_stats(),
         }
 
+    def get_latency_report(self, name=None) -> dict:
+        """세션별 틱 단계 소요 시간 분위수(초)와 틱 지연 통계, name을 주면 그 세션만"""
+        sessions = [self.get_session(name)] if name else self.sessions.values()
+        return {
+            s.name: {
+                "latency": s.operator.get_latency_report(),
+                "tick": s.operator.get_tick_stats(),
+            }
+            for s in sessions
+        }
+
+    def export_metrics(self, path) -> dict:
+        """전체 세션의 지연 리포트를 JSON 파일로 저장하고 저장한 내용을 반환한다"""
+        dump = {
+            "generated_at": datetime.now().isoformat(timespec="seconds"),
+            "sessions": self.get_latency_report(),
+        }
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(dump, f, ensure_ascii=False, indent=2)
+        return dump
+
     def get_performance(self, name) -> dict:
         session = self.get_session(name)
         report = {"session": name, **session.operator.get_score()}
         if self.system_monitor is not None:
-            report["total_trades"] = len(
-                self.system_monitor.get_trade_log(session=name))
+            report["total_trades"] = self.system_monitor.get_trade_count(session=name)
         return report
 
     def compare_performance(self) -> list:
@@ -322,8 +395,7 @@ class SessionManager:
                 **s.operator.get_score(),
             }
             if self.system_monitor is not None:
-                row["total_trades"] = len(
-                    self.system_monitor.get_trade_log(session=s.name))
+                row["total_trades"] = self.system_monitor.get_trade_count(session=s.name)
             result.append(row)
         return result
 
@@ -333,9 +405,26 @@ class SessionManager:
             self.account_guards[alias] = AccountGuard()
         return self.account_guards[alias]
 
+    def _attach_order_poller(self, trader):
+        """같은 거래소 계정의 실거래 trader들이 주문 상태 조회 주기를 공유하도록 연결한다"""
+        from .trader.base_exchange_trader import BaseExchangeTrader
+        from .trader.order_status_poller import OrderStatusPoller
+
+        if not isinstance(trader, BaseExchangeTrader):
+            return
+        key = trader.get_account_key()
+        poller = self.order_pollers.get(key)
+        if poller is None:
+            poller = OrderStatusPoller(interval=trader.RESULT_CHECKING_INTERVAL)
+            self.order_pollers[key] = poller
+        trader.order_poller = poller
+
     @staticmethod
     def _discard_trader(trader):
-        """검증 실패로 버려지는 trader의 워커 정리 (무부작용 보장)"""
+        """버려지는 trader의 워커 정리와 주문 상태 폴러 등록 해제 (무부작용 보장)"""
+        poller = getattr(trader, "order_poller", None)
+        if poller is not None:
+            poller.unregister(trader)
         worker = getattr(trader, "worker", None)
         if worker is not None:
             worker.stop()
@@ -1,6 +1,11 @@
-from .strategy import Strategy
-from .strategy_bnh import StrategyBuyAndHold
-from .strategy_rsi import StrategyRsi
-from .strategy_sma import StrategySma
-from .strategy_llm import StrategyLlm
-from .strategy_factory import StrategyFactory
+from ..lazy_import import lazy_attributes
+
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    "Strategy": ".strategy",
+    "StrategyBuyAndHold": ".strategy_bnh",
+    "StrategyRsi": ".strategy_rsi",
+    "StrategySma": ".strategy_sma",
+    "StrategyLlm": ".strategy_llm",
+    "StrategyFactory": ".strategy_factory",
+    "RollingMean": ".indicator",
+})
@@ -0,0 +1,101 @@
+import math
+from collections import deque
+
+
+class RollingMean:
+    """
+    고정 윈도우 단순 이동 평균을 틱마다 O(1)로 갱신하는 스트리밍 지표
+
+    Streaming simple moving average updated in O(1) per value.
+
+    윈도우 크기만큼의 값만 순환 버퍼에 보관하고, 들어오는 값은 더하고 빠지는 값은 빼는
+    보정 합(Kahan summation)으로 합계를 유지한다. pandas의 rolling(window).mean()과
+    같은 순서, 같은 보정 방식으로 계산하므로 같은 입력에 대해 같은 값을 돌려준다.
+
+    Keeps only `window` values in a ring buffer and maintains a compensated running sum
+    using the same add/remove scheme as pandas' rolling mean, so the values are identical.
+
+    window: 이동 평균 윈도우 크기
+    value: 마지막으로 계산된 이동 평균, 윈도우가 다 차기 전에는 nan
+    """
+
+    def __init__(self, window):
+        if window < 1:
+            raise ValueError(f"invalid window: {window}")
+        self.window = window
+        self.values = deque(maxlen=window)
+        self.value = math.nan
+        # nobs, sum, neg_count, add_compensation, remove_compensation, same_count, prev_value
+        self._state = (0, 0.0, 0, 0.0, 0.0, 0, None)
+
+    def update(self, value):
+        """새 값을 추가하고 갱신된 이동 평균을 반환한다"""
+        leaving = self.values[0] if len(self.values) == self.window else None
+        self._state = self._advance(self._state, leaving, value)
+        self.values.append(value)
+        self.value = self._mean(self._state, self.window)
+        return self.value
+
+    def peek(self, values):
+        """values를 이어서 추가했을 때의 이동 평균 리스트를 상태 변경 없이 반환한다
+
+        Returns the moving averages as if values were appended, without committing them.
+        """
+        state = self._state
+        size = len(self.values)
+        result = []
+        for idx, value in enumerate(values):
+            leaving_idx = size + idx - self.window
+            leaving = None
+            if 0 <= leaving_idx < size:
+                leaving = self.values[leaving_idx]
+            elif leaving_idx >= size:
+                leaving = values[leaving_idx - size]
+            state = self._advance(state, leaving, value)
+            result.append(self._mean(state, self.window))
+        return result
+
+    @staticmethod
+    def _advance(state, leaving, value):
+        nobs, sum_x, neg_ct, comp_add, comp_remove, same_count, prev_value = state
+
+        if leaving is not None and leaving == leaving:
+            nobs -= 1
+            y = -leaving - comp_remove
+            t = sum_x + y
+            comp_remove = t - sum_x - y
+            sum_x = t
+            if math.copysign(1.0, leaving) < 0:
+                neg_ct -= 1
+
+        if value == value:
+            nobs += 1
+            y = value - comp_add
+            t = sum_x + y
+            comp_add = t - sum_x - y
+            sum_x = t
+            if math.copysign(1.0, value) < 0:
+                neg_ct += 1
+            if value == prev_value:
+                same_count += 1
+            else:
+                same_count = 1
+            prev_value = value
+
+        return (nobs, sum_x, neg_ct, comp_add, comp_remove, same_count, prev_value)
+
+    @staticmethod
+    def _mean(state, min_periods):
+        nobs, sum_x, neg_ct, _, _, same_count, prev_value = state
+        if nobs < min_periods or nobs == 0:
+            return math.nan
+
+        if same_count >= nobs:
+            return float(prev_value)
+
+        result = sum_x / nobs
+        if neg_ct == 0 and result < 0:
+            return 0.0
+        if neg_ct == nobs and result > 0:
+            return 0.0
+        return result
@@ -30,6 +30,22 @@ class Strategy(metaclass=ABCMeta):
         alert_callback(msg): 알림을 전달하는 콜백 함수 e.g. Operator나 Controller에 전달
         """
 
+    def get_warmup_count(self) -> int:
+        """
+        첫 틱부터 판단할 수 있도록 시작 전에 update_trading_info로 넣어야 하는 과거 캔들 수
+
+        Number of past candles to feed through update_trading_info before the first live tick
+        """
+        return 0
+
+    def finish_warm_up(self) -> None:
+        """
+        과거 캔들을 모두 넣은 뒤 호출된다. 지표는 유지하고 과거 캔들에서 나온 매매 신호는 버린다
+
+        Called after the warm-up candles are fed. Keep the indicator state but drop trading
+        signals raised by the past candles so the first live tick does not act on them
+        """
+
     @abstractmethod
     def get_request(self) -> List[Dict[str, Any]]:
         """
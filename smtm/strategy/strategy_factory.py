@@ -1,39 +1,44 @@
-from .strategy_bnh import StrategyBuyAndHold
-from .strategy_rsi import StrategyRsi
-from .strategy_sma import StrategySma
-from .strategy_llm import StrategyLlm
+from ..registry import Registry
 
 
 class StrategyFactory:
-    """Strategy 정보 조회 및 생성을 담당하는 Factory 클래스"""
+    """Strategy 정보 조회 및 생성을 담당하는 Factory 클래스
 
-    STRATEGY_LIST = [
-        StrategyBuyAndHold,
-        StrategyRsi,
-        StrategySma,
-        StrategyLlm,
-    ]
+    REGISTRY의 코드로 전략 모듈을 찾아 처음 쓸 때 import한다 (numpy를 쓰는 전략 포함).
+    외부 패키지는 smtm.strategies entry point로 전략을 추가할 수 있다."""
+
+    REGISTRY = Registry("smtm.strategies", {
+        "BNH": (".strategy_bnh", "StrategyBuyAndHold"),
+        "RSI": (".strategy_rsi", "StrategyRsi"),
+        "SMA": (".strategy_sma", "StrategySma"),
+        "LLM": (".strategy_llm", "StrategyLlm"),
+    }, __package__)
+    # 생성할 때 llm_client를 주입하는 전략
+    LLM_CODES = ("LLM",)
 
     @staticmethod
     def create(code, llm_client=None):
         """code에 해당하는 Strategy 객체를 생성하여 반환. llm_client는 LLM 전략에만 주입"""
-        for strategy in StrategyFactory.STRATEGY_LIST:
-            if strategy.CODE == code:
-                if strategy is StrategyLlm:
-                    return StrategyLlm(llm_client=llm_client)
-                return strategy()
-        return None
+        strategy = StrategyFactory.get_class(code)
+        if strategy is None:
+            return None
+        if code in StrategyFactory.LLM_CODES:
+            return strategy(llm_client=llm_client)
+        return strategy()
+
+    @staticmethod
+    def get_class(code):
+        return StrategyFactory.REGISTRY.get(code)
 
     @staticmethod
     def get_name(code):
-        for strategy in StrategyFactory.STRATEGY_LIST:
-            if strategy.CODE == code:
-                return strategy.NAME
-        return None
+        strategy = StrategyFactory.get_class(code)
+        return strategy.NAME if strategy is not None else None
 
     @staticmethod
     def get_all_strategy_info():
         return [
             {"name": s.NAME, "code": s.CODE, "class": s}
-            for s in StrategyFactory.STRATEGY_LIST
+            for s in map(StrategyFactory.get_class, StrategyFactory.REGISTRY.codes())
+            if s is not None
         ]
@@ -62,6 +62,9 @@ class StrategyLlm(Strategy):
         self.balance = budget
         self.min_price = min_price
 
+    def get_warmup_count(self):
+        return self.CANDLE_WINDOW
+
     def update_trading_info(self, info):
         if self.is_initialized is not True or info is None:
             return
@@ -154,6 +154,14 @@ class StrategyRsi(Strategy):
         except AttributeError as msg:
             self.logger.error(msg)
 
+    def get_warmup_count(self):
+        return self.RSI_COUNT + 1
+
+    def finish_warm_up(self):
+        # 마지막 RSI가 기준선 안쪽이면 워밍업 중에 정해진 포지션은 지난 신호이므로 버린다
+        if self.rsi_info is not None and self.RSI_LOW <= self.rsi[-1] <= self.RSI_HIGH:
+            self.position = None
+
     def update_trading_info(self, info):
         """새로운 거래 정보를 업데이트
 
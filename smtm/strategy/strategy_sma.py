@@ -1,9 +1,10 @@
 import copy
+from collections import deque
 from datetime import datetime
 import math
-import pandas as pd
 import numpy as np
 from .strategy import Strategy
+from .indicator import RollingMean
 from ..log_manager import LogManager
 from ..date_converter import DateConverter
 
@@ -23,6 +24,9 @@ class StrategySma(Strategy):
     min_price: 최소 주문 금액
     current_process: 현재 진행해야 할 매매 타입, buy, sell
     process_unit: 분할 매매를 진행할 단위
+    closing_count: 지금까지 처리한 종가 개수
+    sma_short, sma_mid, sma_long: 단기, 중기, 장기 이동 평균 스트리밍 지표
+    sma_long_history: 표준 편차 계산용 최근 STD_K개의 장기 이동 평균
     """
 
     ISO_DATEFORMAT = "%Y-%m-%dT%H:%M:%S"
@@ -48,13 +52,26 @@ class StrategySma(Strategy):
         self.result = []
         self.request = None
         self.current_process = "ready"
-        self.closing_price_list = []
+        self.closing_count = 0
+        self.sma_short = RollingMean(self.SHORT)
+        self.sma_mid = RollingMean(self.MID)
+        self.sma_long = RollingMean(self.LONG)
+        self.sma_long_history = deque(maxlen=self.STD_K)
         self.process_unit = (0, 0)  # budget and amount
         self.logger = LogManager.get_logger(__class__.__name__)
         self.waiting_requests = {}
         self.cross_info = [{"price": 0, "index": 0}, {"price": 0, "index": 0}]
         self.add_spot_callback = None
 
+    def get_warmup_count(self):
+        # 장기 이동 평균과 표준 편차 계산에 필요한 이동 평균 기록까지 채운다
+        return self.LONG + self.STD_K
+
+    def finish_warm_up(self):
+        # 추세(current_process)와 교차 지점은 지표로 남기고 분할 매매 단위만 비워서
+        # 워밍업 중의 교차로는 주문하지 않고 다음 교차부터 매매한다
+        self.process_unit = (0, 0)
+
     def update_trading_info(self, info):
         """새로운 거래 정보를 업데이트
 
@@ -98,16 +115,18 @@ class StrategySma(Strategy):
     def __update_process(self, info):
         try:
             current_price = info["closing_price"]
-            current_idx = len(self.closing_price_list)
+            current_idx = self.closing_count
             self.logger.info(f"# update process :: {current_idx}")
-            self.closing_price_list.append(current_price)
-            feeded_list = copy.deepcopy(self.closing_price_list)
-            for _ in range(self.PREDICT_N):
-                feeded_list.append(current_price)
-
-            sma_short = pd.Series(feeded_list).rolling(self.SHORT).mean().values[-1]
-            sma_mid = pd.Series(feeded_list).rolling(self.MID).mean().values[-1]
-            sma_long_list = pd.Series(feeded_list).rolling(self.LONG).mean().values
+            self.sma_short.update(current_price)
+            self.sma_mid.update(current_price)
+            self.sma_long_history.append(self.sma_long.update(current_price))
+            self.closing_count += 1
+
+            # 현재 가격이 PREDICT_N번 더 유지된다고 가정한 이동 평균
+            predicted = [current_price] * self.PREDICT_N
+            sma_short = self.sma_short.peek(predicted)[-1]
+            sma_mid = self.sma_mid.peek(predicted)[-1]
+            sma_long_list = [*self.sma_long_history, *self.sma_long.peek(predicted)]
             sma_long = sma_long_list[-1]
 
             self.logger.debug(f"[SMA] Start current index {current_idx}")
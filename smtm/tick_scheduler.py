@@ -0,0 +1,166 @@
+import heapq
+import itertools
+import math
+import threading
+import time
+from collections import deque
+from .log_manager import LogManager
+
+
+class TickJob:
+    """
+    TickScheduler에 등록된 한 세션의 틱 예약과 지연 통계
+
+    running: 틱이 발행된 뒤 세션이 done()을 호출하기 전까지 True, 이 동안 온 경계는 건너뛴다
+    coalesced_count: 실행하지 않고 합쳐진 경계 수
+    """
+
+    LATENESS_HISTORY = 100
+
+    def __init__(self, callback, interval, offset=0.0, scheduler=None):
+        self.callback = callback
+        self.interval = float(interval)
+        self.offset = offset
+        self.scheduler = scheduler
+        self.running = False
+        self.cancelled = False
+        self.tick_count = 0
+        self.coalesced_count = 0
+        self.last_lateness = None
+        self.max_lateness = 0.0
+        self.total_lateness = 0.0
+        self.lateness = deque(maxlen=self.LATENESS_HISTORY)
+
+    def record_start(self, scheduled_time, now=None):
+        """틱이 실제로 시작된 시각과 예정 경계의 차이(초)를 기록하고 반환한다"""
+        now = time.time() if now is None else now
+        lateness = max(0.0, now - scheduled_time)
+        self.tick_count += 1
+        self.last_lateness = lateness
+        self.max_lateness = max(self.max_lateness, lateness)
+        self.total_lateness += lateness
+        self.lateness.append(lateness)
+        return lateness
+
+    def done(self):
+        """틱 실행이 끝났음을 알린다. 다음 경계부터 다시 발행된다"""
+        self.running = False
+
+    def cancel(self):
+        self.cancelled = True
+        if self.scheduler is not None:
+            self.scheduler.remove(self)
+
+    def get_stats(self):
+        return {
+            "interval": self.interval,
+            "tick_count": self.tick_count,
+            "coalesced_count": self.coalesced_count,
+            "last_lateness": self.last_lateness,
+            "avg_lateness": self.total_lateness / self.tick_count if self.tick_count else None,
+            "max_lateness": self.max_lateness,
+        }
+
+
+class TickScheduler:
+    """
+    모든 세션의 틱을 캔들 경계에 맞춰 발행하는 프로세스 공용 스케줄러
+
+    Fires each registered job on wall-clock boundaries that are multiples of its
+    interval, OFFSET seconds after the boundary so the candle that just closed is
+    already published by the exchange. Fire times are computed from the clock, not
+    from the end of the previous tick, so slow ticks do not push later ticks back.
+    When a job is still running at its next boundary, or the scheduler wakes up past
+    several boundaries, those boundaries are coalesced into the next one instead of
+    being queued, and counted in coalesced_count.
+
+    콜백은 스케줄러 스레드에서 불리므로 워커에 작업을 넘기는 정도로 짧아야 한다.
+
+    OFFSET: 경계 뒤에 틱을 발행할 지연(초), interval보다 길면 적용하지 않는다
+    """
+
+    OFFSET = 0.3
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self):
+        self.logger = LogManager.get_logger(__class__.__name__)
+        self._heap = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self.thread = threading.Thread(target=self._run, name="TickScheduler", daemon=True)
+        self.thread.start()
+
+    @classmethod
+    def get_instance(cls):
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    @classmethod
+    def get_offset(cls, interval, offset=None):
+        offset = cls.OFFSET if offset is None else offset
+        return offset if offset < interval else 0.0
+
+    @staticmethod
+    def get_next_time(interval, offset=0.0, now=None):
+        """now보다 뒤에 오는 첫 번째 (interval 배수 경계 + offset) 시각"""
+        now = time.time() if now is None else now
+        return (math.floor((now - offset) / interval) + 1) * interval + offset
+
+    def add(self, callback, interval, offset=None):
+        """다음 경계부터 callback(scheduled_time)을 발행하는 TickJob을 등록한다"""
+        interval = float(interval)
+        job = TickJob(callback, interval, self.get_offset(interval, offset), scheduler=self)
+        with self._condition:
+            self._push(job, self.get_next_time(job.interval, job.offset))
+            self._condition.notify()
+        return job
+
+    def remove(self, job):
+        # 힙에서 바로 빼지 않고 꺼낼 때 버린다
+        with self._condition:
+            job.cancelled = True
+            self._condition.notify()
+
+    def get_job_count(self):
+        with self._condition:
+            return sum(1 for _, _, job in self._heap if not job.cancelled)
+
+    def _push(self, job, fire_time):
+        heapq.heappush(self._heap, (fire_time, next(self._sequence), job))
+
+    def _run(self):
+        while True:
+            due = []
+            with self._condition:
+                while not due:
+                    now = time.time()
+                    while self._heap and self._heap[0][0] <= now:
+                        fire_time, _, job = heapq.heappop(self._heap)
+                        if job.cancelled:
+                            continue
+                        due.append((job, fire_time))
+                        self._push(job, self.get_next_time(job.interval, job.offset, now))
+                    while self._heap and self._heap[0][2].cancelled:
+                        heapq.heappop(self._heap)
+                    if not due:
+                        timeout = self._heap[0][0] - now if self._heap else None
+                        self._condition.wait(timeout)
+            for job, fire_time in due:
+                self._fire(job, fire_time, now)
+
+    def _fire(self, job, fire_time, now):
+        # 스케줄러가 늦게 깨어나 지나쳐 버린 경계는 이번 발행에 합친다
+        missed = int((now - fire_time) // job.interval)
+        if job.running:
+            job.coalesced_count += missed + 1
+            return
+        job.coalesced_count += missed
+        job.running = True
+        try:
+            job.callback(fire_time + missed * job.interval)
+        except Exception as err:
+            job.running = False
+            self.logger.error(f"tick callback error: {err}")
@@ -1 +1,5 @@
-from .binance_trader import BinanceTrader
+from ..lazy_import import lazy_attributes
+
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    "BinanceTrader": ".binance_trader",
+})
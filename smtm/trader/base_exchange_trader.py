@@ -1,12 +1,14 @@
 import os
 import copy
 import threading
+import time
 from datetime import datetime
 import requests
 from ..log_manager import LogManager
 from ..http_session import request_with_retry
 from .trader import Trader
 from ..worker import Worker
+from ..trading_event_loop import SharedPoolWorker
 
 
 class BaseExchangeTrader(Trader):
@@ -19,9 +21,21 @@ class BaseExchangeTrader(Trader):
         - cancel_request(request_id)
         - get_account_info()
         - get_trade_tick()
+        - _query_quote()
+
+    QUOTE_MAX_AGE: update_quote로 받은 시세를 거래소 조회 없이 평가에 쓰는 시간(초)
+    ORDER_ID_KEY: order_map 항목에서 거래소 주문 id를 담는 키
+    SUPPORTS_ORDER_BATCH: 여러 주문 상태를 한 번에 조회하는 _query_order_batch 지원 여부
+
+    order_poller가 지정되면 자체 타이머 대신 계정 단위 OrderStatusPoller로 주문 상태를 확인한다.
+    use_shared_pool()을 부르면 주문 실행과 체결 확인 타이머가 세션별 Worker 스레드 대신
+    TradingEventLoop의 공유 스레드 풀과 스케줄러에서 실행된다.
     """
 
     RESULT_CHECKING_INTERVAL = 5
+    QUOTE_MAX_AGE = 90
+    ORDER_ID_KEY = "order_id"
+    SUPPORTS_ORDER_BATCH = False
     ISO_DATEFORMAT = "%Y-%m-%dT%H:%M:%S"
 
     def __init__(
@@ -58,6 +72,10 @@ class BaseExchangeTrader(Trader):
         self.asset = (0, 0)  # avr_price, amount
         self.balance = budget
         self.commission_ratio = commission_ratio
+        self.currency = currency
+        self.quote_max_age = self.QUOTE_MAX_AGE
+        self.quotes = {}  # {통화: (가격, 기록 시각)}
+        self.order_poller = None
 
     @staticmethod
     def _create_success_result(request):
@@ -100,10 +118,56 @@ class BaseExchangeTrader(Trader):
         for request_id in orders.keys():
             self.cancel_request(request_id)
 
+    def use_shared_pool(self, event_loop):
+        """세션별 Worker 스레드를 멈추고 event_loop의 공유 스레드 풀로 주문 task를 실행한다"""
+        worker = self.worker
+        if isinstance(worker, SharedPoolWorker):
+            return
+        self.worker = event_loop.create_worker(worker.name)
+        worker.stop()
+
+    def update_quote(self, currency, price):
+        """틱의 primary_candle 종가를 평가용 시세로 기록한다"""
+        self.quotes[currency] = (float(price), time.monotonic())
+
+    def get_quote(self):
+        """평가용 현재가. quote_max_age 안에 기록된 시세가 없을 때만 거래소에 조회한다"""
+        cached = self.quotes.get(self.currency)
+        if cached is not None and time.monotonic() - cached[1] < self.quote_max_age:
+            return cached[0]
+        price = self._query_quote()
+        if price is not None:
+            self.quotes[self.currency] = (price, time.monotonic())
+        return price
+
+    def _query_quote(self):
+        """거래소에서 현재가를 조회한다. 실패하면 None"""
+        raise NotImplementedError()
+
+    def get_account_key(self):
+        """같은 거래소 계정을 쓰는 Trader를 묶는 키"""
+        return (self.CODE, self.SERVER_URL, self.ACCESS_KEY)
+
+    def get_open_order_ids(self):
+        return [order[self.ORDER_ID_KEY] for order in list(self.order_map.values())]
+
+    def _query_order_batch(self, order_ids):
+        """주문 id 리스트의 상태를 한 번에 조회해 {주문 id: 조회 결과}로 반환한다. 실패하면 None"""
+        raise NotImplementedError()
+
     def _start_timer(self):
+        if self.order_poller is not None:
+            self.order_poller.register(self)
+            return
         if self.timer is not None:
             return
 
+        if isinstance(self.worker, SharedPoolWorker):
+            self.timer = self.worker.post_delayed_task(
+                self.RESULT_CHECKING_INTERVAL, {"runnable": self._update_order_result}
+            )
+            return
+
         def post_query_result_task():
             self.worker.post_task({"runnable": self._update_order_result})
 
@@ -113,6 +177,7 @@ class BaseExchangeTrader(Trader):
         self.timer.start()
 
     def _stop_timer(self):
+        # OrderStatusPoller는 미체결 주문이 없는 trader를 스스로 등록 해제한다
         if self.timer is None:
             return
 
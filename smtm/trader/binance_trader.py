@@ -87,7 +87,7 @@ class BinanceTrader(BaseExchangeTrader):
         )
 
     def get_account_info(self):
-        """계좌 정보를 요청한다 (로컬 잔고/자산 + 실시간 시세)
+        """계좌 정보를 요청한다 (로컬 잔고/자산 + 최근 틱 또는 실시간 시세)
 
         Returns:
             {
@@ -105,14 +105,19 @@ class BinanceTrader(BaseExchangeTrader):
             "quote": {},
             "date_time": datetime.now().strftime(self.ISO_DATEFORMAT),
         }
-        trade_info = self.get_trade_tick()
-        if trade_info is not None and "price" in trade_info:
-            result["quote"][self.market_currency] = float(trade_info["price"])
-        else:
-            self.logger.error("fail query quote")
+        price = self.get_quote()
+        if price is not None:
+            result["quote"][self.market_currency] = price
         self.logger.debug(f"account info {result}")
         return result
 
+    def _query_quote(self):
+        trade_info = self.get_trade_tick()
+        if trade_info is not None and "price" in trade_info:
+            return float(trade_info["price"])
+        self.logger.error("fail query quote")
+        return None
+
     def _query_order(self, order_id):
         """주문 상태 조회 (signed GET /api/v3/order)"""
         if not self._validate_credentials():
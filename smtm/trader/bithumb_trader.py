@@ -77,22 +77,27 @@ class BithumbTrader(BaseExchangeTrader):
                 date_time: 현재 시간
             }
         """
-        trade_info = self.get_trade_tick()
         result = {
             "balance": self.balance,
             "asset": {self.market: self.asset},
             "quote": {},
             "date_time": datetime.now().strftime(self.ISO_DATEFORMAT),
         }
-        if trade_info is not None and trade_info["status"] == "0000":
-            result["quote"][self.market] = float(trade_info["data"][0]["price"])
-        else:
-            self.logger.error("fail query quote")
+        price = self.get_quote()
+        if price is not None:
+            result["quote"][self.market] = price
         self.logger.debug(
             f"account {result['balance']}, {result['asset']}, {result['quote']}"
         )
         return result
 
+    def _query_quote(self):
+        trade_info = self.get_trade_tick()
+        if trade_info is not None and trade_info["status"] == "0000":
+            return float(trade_info["data"][0]["price"])
+        self.logger.error("fail query quote")
+        return None
+
     def cancel_request(self, request_id):
         """
         거래 요청을 취소한다
@@ -0,0 +1,122 @@
+import threading
+from ..log_manager import LogManager
+
+
+class OrderStatusPoller:
+    """
+    한 거래소 계정에 묶인 모든 Trader의 미체결 주문 상태를 한 주기에 모아 조회하는 폴러
+
+    Per-account order-status poller. Traders bound to the same exchange account
+    register here instead of running their own result-checking timer. Each cycle
+    collects the open order ids of every registered trader and, when the exchange
+    supports it (SUPPORTS_ORDER_BATCH), issues a single batched status query and
+    routes each trader its own results on that trader's worker. Exchanges without
+    a batch endpoint still share one timer, and each trader queries its own orders.
+
+    주기는 미체결 주문 수에 맞춰 바뀐다. 일괄 조회는 주문이 많아도 요청 한 번이므로
+    주문이 많을수록 자주 확인하고, 주문마다 조회하는 거래소는 초당 요청 수가 일정하도록
+    주문이 많을수록 천천히 확인한다.
+
+    interval: 미체결 주문이 하나일 때의 조회 주기(초)
+    MIN_INTERVAL, MAX_INTERVAL: 조회 주기의 하한, 상한(초)
+    QUERIES_PER_CYCLE: 주문마다 조회하는 거래소에서 기본 주기 동안 허용하는 조회 수
+    """
+
+    MIN_INTERVAL = 1
+    MAX_INTERVAL = 30
+    QUERIES_PER_CYCLE = 5
+
+    def __init__(self, interval=5):
+        self.logger = LogManager.get_logger(__class__.__name__)
+        self.interval = interval
+        self.traders = []
+        self.timer = None
+        self.poll_count = 0
+        self.query_count = 0
+        self._polling = False
+        self._lock = threading.Lock()
+
+    def register(self, trader):
+        """미체결 주문이 생긴 trader를 등록하고 조회 주기를 시작한다. 여러 번 호출해도 안전"""
+        with self._lock:
+            if trader not in self.traders:
+                self.traders.append(trader)
+            if self.timer is None and not self._polling:
+                self._schedule(self.interval)
+
+    def unregister(self, trader):
+        with self._lock:
+            if trader in self.traders:
+                self.traders.remove(trader)
+            if not self.traders and self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+
+    def get_interval(self, open_count, batched):
+        if open_count <= 1:
+            return self.interval
+        if batched:
+            interval = self.interval / open_count**0.5
+        else:
+            interval = self.interval * max(1, open_count / self.QUERIES_PER_CYCLE)
+        return min(self.MAX_INTERVAL, max(self.MIN_INTERVAL, interval))
+
+    def get_stats(self):
+        return {
+            "traders": len(self.traders),
+            "poll_count": self.poll_count,
+            "query_count": self.query_count,
+        }
+
+    def poll(self):
+        """등록된 trader들의 미체결 주문을 한 번 조회하고 다음 주기를 예약한다"""
+        with self._lock:
+            self.timer = None
+            self._polling = True
+            traders = list(self.traders)
+
+        open_orders = {trader: trader.get_open_order_ids() for trader in traders}
+        traders = [trader for trader in traders if open_orders[trader]]
+        order_ids = [order_id for trader in traders for order_id in open_orders[trader]]
+        batched = bool(traders) and getattr(traders[0], "SUPPORTS_ORDER_BATCH", False)
+        try:
+            if traders:
+                self.poll_count += 1
+                if batched:
+                    self._dispatch_batch(traders, open_orders, order_ids)
+                else:
+                    self.query_count += len(order_ids)
+                    for trader in traders:
+                        trader.worker.post_task({"runnable": trader._update_order_result})
+        finally:
+            with self._lock:
+                self._polling = False
+                # 미체결 주문이 없는 trader는 새 주문을 넣을 때 다시 등록한다
+                self.traders = [
+                    trader for trader in self.traders if trader.get_open_order_ids()
+                ]
+                if self.traders and self.timer is None:
+                    self._schedule(self.get_interval(len(order_ids), batched))
+
+    def _dispatch_batch(self, traders, open_orders, order_ids):
+        self.query_count += 1
+        try:
+            results = traders[0]._query_order_batch(order_ids)
+        except Exception as err:
+            self.logger.error(f"batched order query fail: {err}")
+            return
+        if results is None:
+            return
+
+        for trader in traders:
+            order_results = [
+                results[order_id] for order_id in open_orders[trader] if order_id in results
+            ]
+            trader.worker.post_task(
+                {"runnable": trader._update_order_result, "order_results": order_results}
+            )
+
+    def _schedule(self, interval):
+        self.timer = threading.Timer(interval, self.poll)
+        self.timer.daemon = True
+        self.timer.start()
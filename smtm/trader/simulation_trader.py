@@ -18,7 +18,7 @@ class SimulationTrader(Trader):
         self.logger = LogManager.get_logger(__class__.__name__)
         self.balance = float(budget)
         self.currency = currency
-        self.commission_ratio = 0
+        self.commission_ratio = commission_ratio
         self.assets = {}
         self.quotes = {}
         self.order_history = []
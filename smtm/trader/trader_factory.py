@@ -1,6 +1,4 @@
-from .upbit_trader import UpbitTrader
-from .bithumb_trader import BithumbTrader
-from .binance_trader import BinanceTrader
+from ..registry import Registry
 from .simulation_trader import SimulationTrader
 
 
@@ -8,13 +6,16 @@ class TraderFactory:
     """
     Trader 정보 조회 및 생성을 담당하는 Factory 클래스
     Factory class responsible for retrieving and creating Trader information
+
+    거래소 Trader(jwt, hmac 서명)는 REGISTRY에서 코드로 찾아 처음 쓸 때 import한다.
+    외부 패키지는 smtm.traders entry point로 Trader를 추가할 수 있다.
     """
 
-    TRADER_LIST = [
-        UpbitTrader,
-        BithumbTrader,
-        BinanceTrader,
-    ]
+    REGISTRY = Registry("smtm.traders", {
+        "UPB": (".upbit_trader", "UpbitTrader"),
+        "BTH": (".bithumb_trader", "BithumbTrader"),
+        "BNC": (".binance_trader", "BinanceTrader"),
+    }, __package__)
 
     @staticmethod
     def create(code, budget=50000, currency="BTC", commission_ratio=0.0005,
@@ -26,30 +27,35 @@ class TraderFactory:
                 commission_ratio=commission_ratio,
             )
 
-        for trader in TraderFactory.TRADER_LIST:
-            if trader.CODE == code:
-                kwargs = {
-                    "budget": budget,
-                    "currency": currency,
-                    "commission_ratio": commission_ratio,
-                }
-                if account:
-                    kwargs["access_key_env"] = account.get("access_key_env")
-                    kwargs["secret_key_env"] = account.get("secret_key_env")
-                return trader(**kwargs)
-        return None
+        trader = TraderFactory.get_class(code)
+        if trader is None:
+            return None
+        kwargs = {
+            "budget": budget,
+            "currency": currency,
+            "commission_ratio": commission_ratio,
+        }
+        if account:
+            kwargs["access_key_env"] = account.get("access_key_env")
+            kwargs["secret_key_env"] = account.get("secret_key_env")
+        return trader(**kwargs)
+
+    @staticmethod
+    def get_class(code):
+        return TraderFactory.REGISTRY.get(code)
 
     @staticmethod
     def get_name(code):
-        for trader in TraderFactory.TRADER_LIST:
-            if trader.CODE == code:
-                return trader.NAME
-        return None
+        trader = TraderFactory.get_class(code)
+        return trader.NAME if trader is not None else None
 
     @staticmethod
     def get_all_trader_info():
         all_trader = []
-        for trader in TraderFactory.TRADER_LIST:
+        for code in TraderFactory.REGISTRY.codes():
+            trader = TraderFactory.get_class(code)
+            if trader is None:
+                continue
             all_trader.append(
                 {
                     "name": trader.NAME,
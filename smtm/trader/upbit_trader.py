@@ -28,6 +28,9 @@ class UpbitTrader(BaseExchangeTrader):
     }
     NAME = "Upbit"
     CODE = "UPB"
+    ORDER_ID_KEY = "uuid"
+    SUPPORTS_ORDER_BATCH = True
+    ORDER_QUERY_LIMIT = 100
     SUPPORTED_ORD_TYPES = frozenset({"limit", "market"})
 
     def __init__(
@@ -98,17 +101,26 @@ class UpbitTrader(BaseExchangeTrader):
         """
         from datetime import datetime
 
-        trade_info = self.get_trade_tick()
         result = {
             "balance": self.balance,
             "asset": {self.market_currency: self.asset},
             "quote": {},
             "date_time": datetime.now().strftime(self.ISO_DATEFORMAT),
         }
-        result["quote"][self.market_currency] = float(trade_info[0]["trade_price"])
+        price = self.get_quote()
+        if price is not None:
+            result["quote"][self.market_currency] = price
         self.logger.debug(f"account info {result}")
         return result
 
+    def _query_quote(self):
+        trade_info = self.get_trade_tick()
+        try:
+            return float(trade_info[0]["trade_price"])
+        except (TypeError, KeyError, IndexError, ValueError):
+            self.logger.error("fail query quote")
+            return None
+
     def cancel_request(self, request_id):
         """거래 요청을 취소한다
         request_id: 취소하고자 하는 request의 id
@@ -234,15 +246,14 @@ class UpbitTrader(BaseExchangeTrader):
         self._start_timer()
 
     def _update_order_result(self, task):
-        del task
-        uuids = []
-        for request_id, order in self.order_map.items():
-            uuids.append(order["uuid"])
-
-        if len(uuids) == 0:
-            return
-
-        results = self._query_order_list(uuids)
+        """미체결 주문의 체결 여부를 확인한다. OrderStatusPoller가 이미 조회한 결과를
+        task["order_results"]로 전달하면 다시 조회하지 않는다"""
+        results = task.get("order_results") if task else None
+        if results is None:
+            uuids = self.get_open_order_ids()
+            if len(uuids) == 0:
+                return
+            results = self._query_order_list(uuids)
         if results is None:
             return
 
@@ -280,6 +291,12 @@ class UpbitTrader(BaseExchangeTrader):
         if len(self.order_map) > 0:
             self._start_timer()
 
+    def _query_order_batch(self, order_ids):
+        results = self._query_order_list(order_ids)
+        if results is None:
+            return None
+        return {result["uuid"]: result for result in results}
+
     def _send_order(self, market, is_buy, price=None, volume=None):
         """
         Upbit에 거래 주문 전송
@@ -390,10 +407,25 @@ class UpbitTrader(BaseExchangeTrader):
             locked: 거래에 사용중인 비용, NumberString
             executed_volume: 체결된 양, NumberString
             trade_count: 해당 주문에 걸린 체결 수, Integer
+
+        한 번에 조회할 수 있는 uuid는 ORDER_QUERY_LIMIT 개이므로 나누어 요청한 뒤 결과를 합친다
         """
         if not self._validate_credentials():
             return None
 
+        if len(uuids) <= self.ORDER_QUERY_LIMIT:
+            return self._query_order_chunk(uuids, is_done_state)
+
+        results = []
+        for start in range(0, len(uuids), self.ORDER_QUERY_LIMIT):
+            chunk = uuids[start : start + self.ORDER_QUERY_LIMIT]
+            response = self._query_order_chunk(chunk, is_done_state)
+            if response is None:
+                return None
+            results.extend(response)
+        return results
+
+    def _query_order_chunk(self, uuids, is_done_state):
         query_states = ["wait", "watch"]
         if is_done_state:
             query_states = ["done", "cancel"]
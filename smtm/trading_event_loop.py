@@ -0,0 +1,140 @@
+import asyncio
+import threading
+import traceback
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from .log_manager import LogManager
+
+
+class TradingEventLoop:
+    """
+    shared 모드 세션과 그 Trader가 함께 쓰는 틱 스케줄러와 공유 스레드 풀
+
+    One scheduler thread runs an asyncio loop that only waits for interval boundaries
+    and delayed tasks, so an idle session costs no thread. Everything that blocks -
+    session ticks, order execution and order status checks of the session traders -
+    runs on one bounded thread pool shared by all sessions. The DataProvider,
+    Strategy and Trader calls themselves stay blocking: a tick holds a pool thread for
+    its whole duration, including HTTP requests and RateLimiter waits.
+
+    MAX_WORKERS: 동시에 실행되는 블로킹 호출 수의 상한. 풀 스레드가 모두 일하는 동안 들어온
+    틱과 주문 작업은 풀의 대기열(길이 제한 없음)에서 들어온 순서대로 기다렸다가 늦게 시작하고,
+    늦어진 시간은 틱마다 TickJob lateness로 기록된다.
+    """
+
+    MAX_WORKERS = 16
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, max_workers=None):
+        self.logger = LogManager.get_logger(__class__.__name__)
+        self.loop = asyncio.new_event_loop()
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers or self.MAX_WORKERS, thread_name_prefix="smtm-tick"
+        )
+        self.thread = threading.Thread(
+            target=self._run_forever, name="TradingEventLoop", daemon=True
+        )
+        self.thread.start()
+
+    @classmethod
+    def get_instance(cls):
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def submit(self, coroutine):
+        """다른 스레드에서 코루틴을 루프에 예약한다. concurrent.futures.Future를 반환"""
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+
+    async def run_blocking(self, func, *args):
+        """블로킹 함수를 공유 스레드 풀에서 실행하고 결과를 기다린다"""
+        return await self.loop.run_in_executor(self.executor, func, *args)
+
+    def call_later(self, delay, callback):
+        """delay초 뒤 스케줄러 스레드에서 callback을 부른다. cancel()할 수 있는 Future를 반환"""
+
+        async def wait_and_call():
+            await asyncio.sleep(delay)
+            callback()
+
+        return self.submit(wait_and_call())
+
+    def create_worker(self, name):
+        """세션별 Worker 스레드 대신 공유 스레드 풀에서 task를 차례대로 실행하는 SharedPoolWorker"""
+        return SharedPoolWorker(self, name)
+
+    def get_task_count(self):
+        """루프에 예약된 코루틴 수, 실행 중인 세션 수를 확인할 때 쓴다"""
+        return len(asyncio.all_tasks(self.loop))
+
+    def _run_forever(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+
+class SharedPoolWorker:
+    """
+    Worker와 같은 인터페이스로 task를 TradingEventLoop의 공유 스레드 풀에서 차례대로 실행한다
+
+    자기 스레드는 없고, 대기 중인 task가 있을 때만 풀 스레드 하나를 빌려 들어온 순서대로 비운다.
+    그래서 한 Worker의 task는 Worker와 같이 한 번에 하나씩 순서대로 실행된다.
+    task에서 난 예외는 기록하고 다음 task를 계속 실행한다.
+    """
+
+    def __init__(self, event_loop, name):
+        self.event_loop = event_loop
+        self.name = name
+        self.logger = LogManager.get_logger(name)
+        self.on_terminated = None
+        self._tasks = deque()
+        self._draining = False
+        self._drain_thread = None
+        self._stopped = False
+        self._idle = threading.Condition()
+
+    def register_on_terminated(self, callback):
+        self.on_terminated = callback
+
+    def post_task(self, task):
+        with self._idle:
+            if self._stopped:
+                return
+            self._tasks.append(task)
+            if self._draining:
+                return
+            self._draining = True
+        self.event_loop.executor.submit(self._drain)
+
+    def post_delayed_task(self, delay, task):
+        """delay초 뒤에 task를 추가한다. 반환값의 cancel()로 취소할 수 있다"""
+        return self.event_loop.call_later(delay, lambda: self.post_task(task))
+
+    def start(self):
+        return
+
+    def stop(self):
+        """이미 추가된 task를 모두 실행한 뒤 멈춘다"""
+        with self._idle:
+            self._stopped = True
+            # task 안에서 stop()을 부르면 자기 자신을 기다리게 되므로 기다리지 않는다
+            if self._drain_thread is not threading.current_thread():
+                self._idle.wait_for(lambda: not self._draining)
+        if self.on_terminated is not None:
+            self.on_terminated()
+
+    def _drain(self):
+        self._drain_thread = threading.current_thread()
+        while True:
+            with self._idle:
+                if not self._tasks:
+                    self._draining = False
+                    self._drain_thread = None
+                    self._idle.notify_all()
+                    return
+                task = self._tasks.popleft()
+            try:
+                task["runnable"](task)
+            except Exception:
+                self.logger.error(traceback.format_exc())
@@ -1,13 +1,22 @@
 import threading
+import time
+from .latency_metrics import TickMetrics
 from .log_manager import LogManager
+from .tick_scheduler import TickScheduler
 from .worker import Worker
 
 
 class TradingOperator:
     """고정 주기로 DataProvider → Strategy → SafetyGuard → Trader → Analyzer
-    파이프라인을 수행하는 트레이딩 오퍼레이터"""
+    파이프라인을 수행하는 트레이딩 오퍼레이터
 
-    def __init__(self, interval=60, currency="BTC"):
+    틱의 각 단계 소요 시간과 주문 체결 시간(order_fill)은 metrics(TickMetrics)에
+    단계 이름별로 기록하고, SafetyGuard 차단 수는 safety_blocked 카운터로 센다.
+    첫 틱은 start() 즉시 실행하고, 이후 틱은 TickScheduler가 interval 경계에 맞춰 발행한다.
+    scheduler: 사용할 TickScheduler, 지정하지 않으면 프로세스 공용 스케줄러
+    """
+
+    def __init__(self, interval=60, currency="BTC", scheduler=None):
         self.logger = LogManager.get_logger(__class__.__name__)
         self.interval = float(interval)
         self.currency = currency
@@ -17,12 +26,18 @@ class TradingOperator:
         self.analyzer = None
         self.safety_guard = None
         self.state = None
+        self.scheduler = scheduler
         self.timer = None
         self.is_timer_running = False
-        self.worker = Worker("TradingOperator-Worker")
+        # 틱이 끝나며 스케줄을 등록하는 것과 stop()이 스케줄을 취소하는 것이 엇갈리지 않게 한다
+        self._timer_lock = threading.Lock()
+        self.metrics = TickMetrics()
+        self.worker = self._create_worker()
 
     def initialize(self, data_provider, strategy, trader, analyzer, safety_guard,
-                   budget=500000):
+                   budget=500000, warmup_candles=None):
+        """컴포넌트를 연결하고 전략을 초기화한다.
+        warmup_candles: 시작 전에 전략에 넣을 과거 primary_candle 리스트 (시간순)"""
         if self.state is not None:
             return
         self.data_provider = data_provider
@@ -36,7 +51,11 @@ class TradingOperator:
             add_line_callback=analyzer.add_value_for_line_graph,
             alert_callback=lambda msg: self.logger.warning(f"strategy alert: {msg}"),
         )
-        analyzer.initialize(trader.get_account_info)
+        analyzer.initialize(
+            trader.get_account_info,
+            commission_ratio=getattr(trader, "commission_ratio", 0),
+        )
+        self._warm_up(warmup_candles)
         self.state = "ready"
 
     def start(self) -> bool:
@@ -52,51 +71,111 @@ class TradingOperator:
     def stop(self):
         if self.state != "running":
             return
-        if self.timer is not None:
-            self.timer.cancel()
-        self.is_timer_running = False
+        with self._timer_lock:
+            self.state = "ready"
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+            self.is_timer_running = False
         self.trader.cancel_all_requests()
         self.logger.info("===== TradingOperator Stop =====")
-        self.state = "ready"
         self.worker.stop()
 
+    def _create_worker(self):
+        """틱을 차례로 실행할 Worker, 틱을 다른 방식으로 실행하는 하위 클래스는 None을 반환한다"""
+        return Worker("TradingOperator-Worker")
+
     def get_score(self) -> dict:
         return self.analyzer.get_return_report()
 
+    def get_latency_report(self):
+        """틱 단계별 소요 시간 분위수(초)"""
+        return self.metrics.get_summary()
+
+    def get_tick_stats(self):
+        """예정된 경계 대비 틱 시작 지연(초)과 건너뛴 경계 수, 스케줄 전이면 None"""
+        return self.timer.get_stats() if self.timer is not None else None
+
+    def _warm_up(self, candles):
+        """과거 캔들을 전략에 한꺼번에 넣어 첫 실시간 틱부터 지표가 준비되도록 한다"""
+        if not candles:
+            return
+        # 과거 캔들에서 나온 매매 지점이 그래프에 그려지지 않도록 잠시 콜백을 뗀다
+        spot_callback = getattr(self.strategy, "add_spot_callback", None)
+        if spot_callback is not None:
+            self.strategy.add_spot_callback = None
+        try:
+            for candle in candles:
+                self.strategy.update_trading_info([candle])
+            self.strategy.finish_warm_up()
+        except Exception as err:
+            self.logger.warning(f"strategy warm-up error: {err}")
+        finally:
+            if spot_callback is not None:
+                self.strategy.add_spot_callback = spot_callback
+        self._sync_trader_quote(candles[-1:])
+        self.logger.info(f"strategy warmed up with {len(candles)} candles")
+
     def _execute_trading(self, task):
-        del task
-        self.is_timer_running = False
         if self.state != "running":
             return
+        timer = self.timer
+        scheduled_time = task.get("scheduled_time") if isinstance(task, dict) else None
+        if timer is not None and scheduled_time is not None:
+            lateness = timer.record_start(scheduled_time)
+            if lateness > self._get_tick_interval() / 2:
+                self.logger.warning(f"tick started {lateness:.3f}s late")
+        try:
+            self._run_tick()
+        finally:
+            if timer is not None:
+                timer.done()
+        self._start_timer()
+
+    def _run_tick(self):
+        """한 틱의 DataProvider → Strategy → SafetyGuard → Trader → Analyzer 파이프라인"""
+        metrics = self.metrics
         try:
-            info = self.data_provider.get_info()
-            self._sync_trader_quote(info)
+            with metrics.span("tick"):
+                with metrics.span("data_provider"):
+                    info = self.data_provider.get_info()
+                self._run_pipeline(info)
+        except Exception as err:
+            self.logger.error(f"trading tick error: {err}")
+
+    def _run_pipeline(self, info):
+        """조회한 info로 Strategy → SafetyGuard → Trader → Analyzer를 수행한다"""
+        metrics = self.metrics
+        self._sync_trader_quote(info)
+        with metrics.span("strategy_update"):
             self.strategy.update_trading_info(info)
-            self.analyzer.put_trading_info(info)
+        self.analyzer.put_trading_info(info)
 
+        with metrics.span("strategy"):
             requests = self.strategy.get_request()
-            if requests:
-                self._send_requests(requests)
+        if requests:
+            self._send_requests(requests)
 
-            self.safety_guard.update_portfolio_value(
-                self.analyzer.current_account_value()
-            )
-        except Exception as err:
-            self.logger.error(f"trading tick error: {err}")
-        self._start_timer()
+        with metrics.span("analyzer"):
+            value = self.analyzer.current_account_value()
+            self.analyzer.update_portfolio_value(value)
+        self.safety_guard.update_portfolio_value(value)
 
     def _send_requests(self, requests):
         allowed = []
-        for request in requests:
-            verdict = self.safety_guard.check_request(request)
-            if verdict.allowed:
-                allowed.append(request)
-            else:
-                self.analyzer.put_safety_event({
-                    "type": "blocked", "request": request, "reason": verdict.reason,
-                })
+        with self.metrics.span("safety_guard"):
+            for request in requests:
+                verdict = self.safety_guard.check_request(request)
+                if verdict.allowed:
+                    allowed.append(request)
+                else:
+                    self.metrics.increment("safety_blocked")
+                    self.analyzer.put_safety_event({
+                        "type": "blocked", "request": request, "reason": verdict.reason,
+                    })
         if not allowed:
             return
+        sent_at = time.perf_counter()
 
         def callback(result):
             if not isinstance(result, dict):
@@ -107,13 +186,18 @@ class TradingOperator:
                 return
             self.analyzer.put_result(result)
             if result.get("state") == "done" and result.get("type") in ("buy", "sell"):
+                # 주문을 보낸 뒤 체결 결과를 받기까지 걸린 시간
+                self.metrics.record("order_fill", time.perf_counter() - sent_at)
                 self.safety_guard.record_trade(result)
 
-        self.trader.send_request(allowed, callback)
+        with self.metrics.span("trader"):
+            self.trader.send_request(allowed, callback)
         self.analyzer.put_requests(allowed)
 
     def _sync_trader_quote(self, market_data):
-        """가상매매 트레이더에 최신 종가 주입 (덕 타이핑 — 실거래 트레이더는 no-op)"""
+        """트레이더에 최신 종가 주입 (덕 타이핑 — update_quote가 없는 트레이더는 no-op)
+
+        가상매매 트레이더는 체결가로, 거래소 트레이더는 계좌 평가용 시세로 쓴다"""
         if not hasattr(self.trader, "update_quote") or not market_data:
             return
         for item in market_data:
@@ -125,13 +209,18 @@ class TradingOperator:
                 return
 
     def _start_timer(self):
-        if self.is_timer_running or self.state != "running":
-            return
+        def on_tick(scheduled_time):
+            self.worker.post_task(
+                {"runnable": self._execute_trading, "scheduled_time": scheduled_time}
+            )
 
-        def on_timer_expired():
-            self.worker.post_task({"runnable": self._execute_trading})
+        with self._timer_lock:
+            if self.is_timer_running or self.state != "running":
+                return
+            if self.scheduler is None:
+                self.scheduler = TickScheduler.get_instance()
+            self.timer = self.scheduler.add(on_tick, self._get_tick_interval())
+            self.is_timer_running = True
 
-        self.timer = threading.Timer(self.interval, on_timer_expired)
-        self.timer.daemon = True
-        self.timer.start()
-        self.is_timer_running = True
+    def _get_tick_interval(self):
+        return self.interval
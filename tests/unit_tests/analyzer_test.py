@@ -60,3 +60,68 @@ class AnalyzerTests(unittest.TestCase):
         analyzer.put_result({"state": "done"})
         self.monitor.log_trade_result.assert_called_once_with(
             {"state": "done"}, session="s9")
+
+
+class AnalyzerStreamingStatsTests(unittest.TestCase):
+    def setUp(self):
+        self.analyzer = Analyzer(MagicMock())
+        self.account = {"balance": 1000, "asset": {}, "quote": {}}
+        self.analyzer.initialize(lambda: self.account, commission_ratio=0.001)
+        self.analyzer.make_start_point()
+
+    @staticmethod
+    def _result(trade_type, price, amount, date_time, **kwargs):
+        return {
+            "request": {"currency": "BTC"}, "type": trade_type, "price": price,
+            "amount": amount, "state": "done", "date_time": date_time, **kwargs,
+        }
+
+    def test_update_portfolio_value_tracks_equity_and_max_drawdown(self):
+        for value in [1100, 990, 1200, 1080, 1300]:
+            self.analyzer.update_portfolio_value(value)
+
+        self.assertEqual(list(self.analyzer.equity), [1000, 1100, 990, 1200, 1080, 1300])
+        # 최고점 1100 → 990, 1200 → 1080 모두 10% 하락
+        self.assertEqual(self.analyzer.get_return_report()["max_drawdown"], 10.0)
+
+    def test_volatility_and_sharpe_use_rolling_window(self):
+        self.analyzer.ROLLING_WINDOW = 3
+        values = [1010, 1000, 1030, 1020, 1040]
+        for value in values:
+            self.analyzer.update_portfolio_value(value)
+
+        equity = [1000] + values
+        returns = [curr / prev - 1 for prev, curr in zip(equity, equity[1:])][-3:]
+        mean = sum(returns) / 3
+        std = (sum((ret - mean) ** 2 for ret in returns) / 2) ** 0.5
+        self.assertAlmostEqual(self.analyzer.get_volatility(), std)
+        self.assertAlmostEqual(self.analyzer.get_sharpe_ratio(), mean / std)
+
+    def test_put_result_counts_win_loss_holding_time_turnover_and_fee(self):
+        self.analyzer.put_result(self._result("buy", 100, 2, "2026-01-01T00:00:00"))
+        self.analyzer.put_result(self._result("sell", 110, 2, "2026-01-01T01:00:00"))
+        self.analyzer.put_result(self._result("buy", 100, 1, "2026-01-02T00:00:00", fee=0))
+        self.analyzer.put_result(self._result("sell", 90, 0.5, "2026-01-02T00:30:00", fee=0))
+        self.analyzer.put_result(self._result("sell", 95, 0.5, "2026-01-02T03:00:00", fee=0))
+
+        report = self.analyzer.get_return_report()
+
+        self.assertEqual(report["win_count"], 1)
+        self.assertEqual(report["loss_count"], 2)
+        self.assertEqual(report["win_rate"], 33.333)
+        # 보유 시간 1시간, 3시간
+        self.assertEqual(report["avg_holding_time"], 7200)
+        self.assertEqual(report["turnover"], 200 + 220 + 100 + 45 + 47.5)
+        self.assertEqual(report["turnover_ratio"], 0.6125)
+        self.assertEqual(report["total_fee"], 0.42)
+        # (220 - 0.22 - 200.2) + (45 - 50) + (47.5 - 50)
+        self.assertEqual(report["realized_pnl"], 12.08)
+
+    def test_put_result_ignores_unfinished_and_unknown_position_results(self):
+        self.analyzer.put_result(self._result("buy", 100, 1, "2026-01-01T00:00:00", state="requested"))
+        self.analyzer.put_result(self._result("sell", 100, 1, "2026-01-01T00:00:00"))
+
+        report = self.analyzer.get_return_report()
+
+        self.assertEqual(report["win_count"] + report["loss_count"], 0)
+        self.assertEqual(report["turnover"], 100)
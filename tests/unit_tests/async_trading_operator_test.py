@@ -0,0 +1,206 @@
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+from smtm import AsyncTradingOperator, Analyzer, StrategyBuyAndHold
+from smtm.trading_event_loop import SharedPoolWorker, TradingEventLoop
+from smtm.trader.upbit_trader import UpbitTrader
+from smtm.trader.simulation_trader import SimulationTrader
+from smtm.llm.safety_guard import SafetyGuard, SafetyConfig
+from smtm.llm.system_monitor import SystemMonitor
+
+
+class CountingDataProvider:
+    def __init__(self):
+        self.count = 0
+
+    def get_info(self):
+        self.count += 1
+        return [{
+            "type": "primary_candle", "market": "BTC",
+            "date_time": "2026-07-03T12:00:00",
+            "opening_price": 50000, "high_price": 51000, "low_price": 49000,
+            "closing_price": 50000, "acc_price": 1000000000, "acc_volume": 200,
+        }]
+
+
+class AsyncTradingOperatorTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.event_loop = TradingEventLoop(max_workers=4)
+
+    def _make(self, interval=0.05):
+        data_provider = CountingDataProvider()
+        trader = SimulationTrader(budget=500000, currency="BTC")
+        guard = SafetyGuard(SafetyConfig(
+            max_trade_amount=1000000, max_daily_trades=20,
+            max_loss_ratio=-0.9, initial_budget=500000,
+        ))
+        operator = AsyncTradingOperator(
+            interval=interval, currency="BTC", event_loop=self.event_loop)
+        operator.initialize(
+            data_provider, StrategyBuyAndHold(), trader,
+            Analyzer(SystemMonitor()), guard, budget=500000,
+        )
+        self.addCleanup(operator.stop)
+        return operator, data_provider, trader
+
+    def _wait_until(self, condition, timeout=2):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if condition():
+                return True
+            time.sleep(0.01)
+        return False
+
+    def test_start_runs_ticks_on_shared_loop(self):
+        operator, data_provider, trader = self._make()
+
+        self.assertTrue(operator.start())
+
+        self.assertTrue(self._wait_until(lambda: data_provider.count >= 3))
+        self.assertGreater(len(trader.order_history), 0)
+        self.assertIsNone(operator.worker)
+        self.assertFalse(operator.start())
+
+    def test_stop_cancels_ticks(self):
+        operator, data_provider, _ = self._make()
+        operator.start()
+        self._wait_until(lambda: data_provider.count >= 1)
+
+        operator.stop()
+        time.sleep(0.1)
+        count = data_provider.count
+        time.sleep(0.15)
+
+        self.assertEqual(operator.state, "ready")
+        self.assertEqual(data_provider.count, count)
+
+    def test_stop_waits_for_in_flight_tick_before_cancelling_orders(self):
+        operator, data_provider, trader = self._make(interval=60)
+        in_tick = threading.Event()
+        release = threading.Event()
+        events = []
+        get_info = data_provider.get_info
+
+        def blocking_get_info():
+            in_tick.set()
+            release.wait(2)
+            return get_info()
+
+        run_tick = operator._run_tick
+
+        def run_tick_and_record():
+            run_tick()
+            events.append("tick")
+
+        data_provider.get_info = blocking_get_info
+        operator._run_tick = run_tick_and_record
+        trader.cancel_all_requests = lambda: events.append("cancel")
+
+        operator.start()
+        self.assertTrue(in_tick.wait(2))
+        releaser = threading.Timer(0.1, release.set)
+        releaser.start()
+        operator.stop()
+        releaser.join()
+
+        self.assertEqual(events, ["tick", "cancel"])
+
+    def test_many_sessions_do_not_add_threads(self):
+        before = threading.active_count()
+        operators = [self._make(interval=0.05) for _ in range(30)]
+        for operator, _, _ in operators:
+            operator.start()
+
+        self.assertTrue(self._wait_until(
+            lambda: all(provider.count >= 2 for _, provider, _ in operators)))
+        self.assertLessEqual(threading.active_count() - before, 4)
+
+    def test_tick_error_does_not_stop_session(self):
+        operator, _, _ = self._make()
+        operator.data_provider = MagicMock(get_info=MagicMock(side_effect=RuntimeError("x")))
+
+        operator.start()
+
+        self.assertTrue(self._wait_until(
+            lambda: operator.data_provider.get_info.call_count >= 2))
+        self.assertEqual(operator.state, "running")
+
+    def test_start_routes_exchange_trader_through_shared_pool(self):
+        operator, _, _ = self._make(interval=60)
+        trader = UpbitTrader(budget=500000, currency="BTC")
+        trader.RESULT_CHECKING_INTERVAL = 0.05
+        session_worker = trader.worker
+        operator.trader = trader
+        threads = []
+        checked = threading.Event()
+
+        def execute_order(task):
+            threads.append(threading.current_thread().name)
+            trader._start_timer()
+
+        def update_order_result(task):
+            threads.append(threading.current_thread().name)
+            checked.set()
+
+        trader._execute_order = execute_order
+        trader._update_order_result = update_order_result
+        operator._run_tick = lambda: None
+        operator.start()
+        trader.send_request([{"id": "1", "type": "buy", "price": 1, "amount": 1}], None)
+
+        self.assertTrue(checked.wait(2))
+        self.assertIsInstance(trader.worker, SharedPoolWorker)
+        self.assertIsNone(session_worker.thread)
+        self.assertEqual(len(threads), 2)
+        self.assertTrue(all(name.startswith("smtm-tick") for name in threads))
+
+
+class TradingEventLoopTests(unittest.TestCase):
+    def test_blocking_calls_beyond_max_workers_wait_in_queue(self):
+        event_loop = TradingEventLoop(max_workers=2)
+        started = []
+        release = threading.Event()
+
+        def blocking_call(idx):
+            started.append(idx)
+            release.wait(2)
+            return idx
+
+        async def run(idx):
+            return await event_loop.run_blocking(blocking_call, idx)
+
+        futures = [event_loop.submit(run(idx)) for idx in range(3)]
+        time.sleep(0.1)
+        # 풀 스레드 두 개가 모두 막혀 있으므로 세 번째 호출은 대기열에서 기다린다
+        self.assertEqual(sorted(started), [0, 1])
+
+        release.set()
+        self.assertEqual([future.result(2) for future in futures], [0, 1, 2])
+        self.assertEqual(started[-1], 2)
+
+    def test_shared_pool_worker_run_tasks_in_order_one_at_a_time(self):
+        event_loop = TradingEventLoop(max_workers=4)
+        worker = event_loop.create_worker("test-worker")
+        active = []
+        overlapped = []
+        done = []
+
+        def runnable(task):
+            active.append(task["n"])
+            if len(active) > 1:
+                overlapped.append(task["n"])
+            time.sleep(0.01)
+            active.remove(task["n"])
+            if task["n"] == 1:
+                raise RuntimeError("x")
+            done.append(task["n"])
+
+        for idx in range(5):
+            worker.post_task({"runnable": runnable, "n": idx})
+        worker.stop()
+
+        # 예외가 난 task 뒤의 task도 실행된다
+        self.assertEqual(done, [0, 2, 3, 4])
+        self.assertEqual(overlapped, [])
@@ -0,0 +1,77 @@
+import unittest
+from smtm import Backtester, StrategyBuyAndHold, StrategySma
+from smtm.llm.system_monitor import SystemMonitor
+
+UPBIT_DATA = "tests/unit_tests/data/upbit_1m_20200220_170000-20200220_202000.json"
+
+
+class BacktesterTests(unittest.TestCase):
+    def test_load_candles_convert_upbit_data_in_time_order(self):
+        candles = Backtester.load_candles(UPBIT_DATA, source="upbit")
+        self.assertEqual(len(candles), 200)
+        self.assertEqual(candles[0]["type"], "primary_candle")
+        self.assertEqual(candles[0]["market"], "BTC")
+        self.assertLess(candles[0]["date_time"], candles[-1]["date_time"])
+
+    def test_load_candles_raise_error_when_source_is_invalid(self):
+        with self.assertRaises(UserWarning):
+            Backtester.load_candles(UPBIT_DATA, source="mango")
+
+    def test_run_return_report_with_analyzer_fields(self):
+        candles = Backtester.load_candles(UPBIT_DATA, source="upbit")
+        monitor = SystemMonitor()
+        backtester = Backtester(StrategyBuyAndHold(), budget=1000000, system_monitor=monitor)
+        report = backtester.run(candles)
+
+        self.assertEqual(report["start_value"], 1000000)
+        self.assertIn("current_value", report)
+        self.assertIn("cumulative_return", report)
+        self.assertEqual(report["candle_count"], 200)
+        self.assertEqual(report["start_date_time"], candles[0]["date_time"])
+        self.assertEqual(report["end_date_time"], candles[-1]["date_time"])
+        # BnH는 예산의 1/5씩 5번 매수한다
+        self.assertEqual(report["total_trades"], 5)
+        self.assertEqual(len(monitor.trade_request_log), 5)
+        self.assertLess(backtester.trader.balance, 1000000)
+
+    def test_run_apply_commission_ratio_to_trades(self):
+        candles = Backtester.load_candles(UPBIT_DATA, source="upbit")
+
+        free = Backtester(StrategyBuyAndHold(), budget=1000000).run(candles)
+        paid = Backtester(StrategyBuyAndHold(), budget=1000000, commission_ratio=0.001).run(candles)
+
+        self.assertEqual(paid["total_trades"], free["total_trades"])
+        self.assertLess(paid["current_value"], free["current_value"])
+        self.assertLess(paid["cumulative_return"], free["cumulative_return"])
+
+    def test_run_accept_column_arrays(self):
+        candles = Backtester.load_candles(UPBIT_DATA, source="upbit")
+        columns = {key: [c[key] for c in candles] for key in Backtester.CANDLE_KEYS}
+
+        expected = Backtester(StrategySma(), budget=1000000).run(candles)
+        report = Backtester(StrategySma(), budget=1000000).run(columns)
+        self.assertEqual(report, expected)
+
+    def test_run_restore_strategy_logger(self):
+        strategy = StrategyBuyAndHold()
+        logger = strategy.logger
+        Backtester(strategy).run(Backtester.load_candles(UPBIT_DATA, source="upbit"))
+        self.assertIs(strategy.logger, logger)
+
+    def test_run_accept_candle_store_columns(self):
+        import shutil
+        import tempfile
+        from smtm.data.candle_store import CandleStore
+
+        candles = Backtester.load_candles(UPBIT_DATA, source="upbit")
+        root = tempfile.mkdtemp()
+        try:
+            store = CandleStore(root)
+            store.append("UPB", "BTC", 60, candles)
+            expected = Backtester(StrategySma(), budget=1000000).run(candles)
+            report = Backtester(StrategySma(), budget=1000000).run(
+                store.read("UPB", "BTC", 60)
+            )
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+        self.assertEqual(report, expected)
@@ -33,7 +33,7 @@ class BinanceDataProviderTests(unittest.TestCase):
         )
         self.assertEqual(
             mock_get.call_args_list[0][1]["params"],
-            {"symbol": "BTCUSDT", "limit": 1, "interval": "1m"},
+            {"symbol": "BTCUSDT", "limit": 2, "interval": "1m"},
         )
 
         data_provider = BinanceDataProvider("ETH", 180)
@@ -43,7 +43,7 @@ class BinanceDataProviderTests(unittest.TestCase):
         )
         self.assertEqual(
             mock_get.call_args_list[1][1]["params"],
-            {"symbol": "ETHUSDT", "limit": 1, "interval": "3m"},
+            {"symbol": "ETHUSDT", "limit": 2, "interval": "3m"},
         )
 
         data_provider = BinanceDataProvider("XRP", 600)
@@ -53,7 +53,7 @@ class BinanceDataProviderTests(unittest.TestCase):
         )
         self.assertEqual(
             mock_get.call_args_list[2][1]["params"],
-            {"symbol": "XRPUSDT", "limit": 1, "interval": "10m"},
+            {"symbol": "XRPUSDT", "limit": 2, "interval": "10m"},
         )
 
         with self.assertRaises(UserWarning):
@@ -91,3 +91,33 @@ class BinanceDataProviderTests(unittest.TestCase):
         data_provider = BinanceDataProvider("BTC", 60)
         data = data_provider.get_info()
         self.assertEqual(data[0], expected)
+
+    @patch("requests.get")
+    def test_get_batch_info_should_request_all_symbols_at_once(self, mock_get):
+        btc = BinanceDataProvider("BTC", 60)
+        eth = BinanceDataProvider("ETH", 60)
+        btc.candle_store = MagicMock()
+        response = MagicMock()
+        response.json.return_value = [
+            {
+                "symbol": "BTCUSDT", "openPrice": "100", "highPrice": "120",
+                "lowPrice": "90", "lastPrice": "110", "volume": "2",
+                "quoteVolume": "210", "openTime": 1622563145000,
+                "closeTime": 1622563205000,
+            },
+            {"symbol": "ETHUSDT", "openPrice": "bad"},
+        ]
+        mock_get.return_value = response
+
+        infos = BinanceDataProvider.get_batch_info([btc, eth])
+
+        mock_get.assert_called_once_with(
+            BinanceDataProvider.TICKER_URL,
+            params={"symbols": '["BTCUSDT","ETHUSDT"]', "windowSize": "1m"},
+        )
+        self.assertEqual(infos, {"BTC": [{
+            "type": "primary_candle", "market": "BTC", "date_time": "2021-06-02T01:00:00",
+            "opening_price": 100, "high_price": 120, "low_price": 90,
+            "closing_price": 110, "acc_price": 210, "acc_volume": 2,
+        }]})
+        btc.candle_store.append.assert_not_called()
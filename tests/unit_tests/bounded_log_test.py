@@ -0,0 +1,174 @@
+import os
+import shutil
+import tempfile
+import unittest
+from smtm.llm.bounded_log import BoundedLog
+
+
+class BoundedLogTests(unittest.TestCase):
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    @staticmethod
+    def _record(idx, session="s1"):
+        return {"timestamp": f"2026-01-01T00:00:{idx:02d}", "session": session, "n": idx}
+
+    def test_keeps_memory_tier_bounded_and_spills_oldest_records(self):
+        log = BoundedLog("trade", 4, self.path, segment_size=3)
+        for idx in range(10):
+            log.append(self._record(idx))
+
+        self.assertLessEqual(len(log.records), 4)
+        self.assertEqual(len(log), 10)
+        self.assertEqual([record["n"] for record in log], list(range(10)))
+        self.assertTrue(all(segment["count"] <= 3 for segment in log.segments))
+        self.assertTrue(os.path.isfile(log.segments[0]["path"]))
+
+    def test_getitem_reads_spilled_and_memory_records(self):
+        log = BoundedLog("trade", 4, self.path, segment_size=3)
+        for idx in range(10):
+            log.append(self._record(idx))
+
+        self.assertEqual(log[0]["n"], 0)
+        self.assertEqual(log[4]["n"], 4)
+        self.assertEqual(log[-1]["n"], 9)
+        with self.assertRaises(IndexError):
+            log[10]
+
+    def test_drops_oldest_records_without_storage_path(self):
+        log = BoundedLog("trade", 4)
+        for idx in range(10):
+            log.append(self._record(idx))
+
+        self.assertLessEqual(len(log.records), 4)
+        self.assertEqual(log.dropped_count + len(log), 10)
+        self.assertEqual(log[-1]["n"], 9)
+        self.assertEqual(os.listdir(self.path), [])
+
+    def test_query_filters_session_and_time_range_across_tiers(self):
+        log = BoundedLog("trade", 4, self.path, segment_size=3)
+        for idx in range(10):
+            log.append(self._record(idx, "s1" if idx % 2 == 0 else "s2"))
+
+        result = log.query(
+            start_time="2026-01-01T00:00:02", end_time="2026-01-01T00:00:08", session="s1"
+        )
+
+        self.assertEqual([record["n"] for record in result], [2, 4, 6, 8])
+
+    def test_query_skips_segments_outside_index(self):
+        log = BoundedLog("trade", 4, self.path, segment_size=3)
+        for idx in range(10):
+            log.append(self._record(idx, "old" if idx < 3 else "new"))
+        read = []
+        original = BoundedLog._read_segment
+
+        def read_segment(segment):
+            read.append(segment["path"])
+            return original(segment)
+
+        log._read_segment = read_segment
+
+        log.query(session="new")
+        log.query(start_time="2026-01-01T00:00:09")
+
+        self.assertNotIn(log.segments[0]["path"], read)
+
+    def test_query_limit_reads_only_newest_segments(self):
+        log = BoundedLog("trade", 4, self.path, segment_size=3)
+        for idx in range(20):
+            log.append(self._record(idx, "s1" if idx % 2 == 0 else "s2"))
+        read = []
+        original = BoundedLog._read_segment
+
+        def read_segment(segment):
+            read.append(segment["path"])
+            return original(segment)
+
+        log._read_segment = read_segment
+
+        result = log.query(session="s1", limit=4)
+
+        self.assertEqual([record["n"] for record in result], [12, 14, 16, 18])
+        self.assertNotIn(log.segments[0]["path"], read)
+        self.assertEqual(
+            [record["n"] for record in log.query(session="s2", limit=100)],
+            list(range(1, 20, 2)),
+        )
+        self.assertEqual(log.query(limit=0), [])
+
+    def test_invalid_capacity_raise_ValueError(self):
+        with self.assertRaises(ValueError):
+            BoundedLog("trade", 0)
+
+
+class BoundedLogIndexTests(unittest.TestCase):
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    @staticmethod
+    def _record(idx, session="s1"):
+        return {"timestamp": f"2026-01-01T00:{idx // 60:02d}:{idx % 60:02d}", "session": session, "n": idx}
+
+    def test_count_returns_session_counts_including_spilled_records(self):
+        log = BoundedLog("trade", 10, self.path, segment_size=7)
+        for idx in range(50):
+            log.append(self._record(idx, f"s{idx % 3}"))
+
+        self.assertEqual(log.count(), 50)
+        self.assertEqual(log.count("s0"), 17)
+        self.assertEqual(log.count("s1"), 17)
+        self.assertEqual(log.count("s2"), 16)
+        self.assertEqual(log.count("unknown"), 0)
+
+    def test_count_excludes_dropped_records(self):
+        log = BoundedLog("trade", 10)
+        for idx in range(50):
+            log.append(self._record(idx, f"s{idx % 2}"))
+
+        self.assertEqual(log.count(), len(log.records))
+        self.assertEqual(log.count("s0") + log.count("s1"), len(log.records))
+        self.assertEqual(log.count("s0"), len(log.query(session="s0")))
+
+    def test_query_memory_matches_linear_scan(self):
+        log = BoundedLog("trade", 200)
+        for idx in range(150):
+            log.append(self._record(idx, f"s{idx % 4}"))
+        ranges = [
+            (None, None), ("2026-01-01T00:00:30", None), (None, "2026-01-01T00:01:10"),
+            ("2026-01-01T00:00:45", "2026-01-01T00:01:45"), ("2026-01-01T01:00:00", None),
+        ]
+
+        for start, end in ranges:
+            for session in [None, "s0", "s3", "none"]:
+                expected = [
+                    record for record in log.records
+                    if (session is None or record["session"] == session)
+                    and (start is None or record["timestamp"] >= start)
+                    and (end is None or record["timestamp"] <= end)
+                ]
+                self.assertEqual(log.query(start, end, session), expected)
+
+    def test_query_keeps_index_after_spill(self):
+        log = BoundedLog("trade", 10, self.path, segment_size=4)
+        for idx in range(35):
+            log.append(self._record(idx, f"s{idx % 2}"))
+
+        result = log.query("2026-01-01T00:00:05", "2026-01-01T00:00:33", "s1")
+
+        self.assertEqual([record["n"] for record in result], list(range(5, 34, 2)))
+
+    def test_query_handles_out_of_order_timestamps(self):
+        log = BoundedLog("trade", 100)
+        for idx in [3, 1, 2, 5, 4]:
+            log.append(self._record(idx))
+
+        result = log.query("2026-01-01T00:00:02", "2026-01-01T00:00:04")
+
+        self.assertEqual([record["n"] for record in result], [3, 2, 4])
@@ -0,0 +1,131 @@
+import threading
+import time
+import unittest
+from unittest.mock import *
+from smtm import FearGreedDataProvider
+from smtm.data.cached_data_provider import CachedDataProvider
+from smtm.data.parallel_fetcher import ParallelFetcher
+
+
+class SlowSource:
+    CACHE_TTL = 60
+    NAME = "SLOW SOURCE"
+
+    def __init__(self):
+        self.count = 0
+        self.items = [{"type": "sentiment_index", "value": 1}]
+
+    def get_info(self):
+        self.count += 1
+        return self.items
+
+
+class CachedDataProviderTests(unittest.TestCase):
+    def test_get_info_reuse_result_until_ttl(self):
+        source = SlowSource()
+        cache = CachedDataProvider(source)
+
+        first = cache.get_info()
+        cache._fetched_at -= 59
+        second = cache.get_info()
+
+        self.assertEqual(first, second)
+        self.assertEqual(source.count, 1)
+        self.assertEqual(cache.get_stats(), {"ttl": 60, "hits": 1, "stale_hits": 0, "misses": 1, "expired": 0})
+        self.assertEqual(cache.NAME, "SLOW SOURCE")
+
+    def test_get_info_return_stale_result_and_refresh_in_background(self):
+        source = SlowSource()
+        cache = CachedDataProvider(source)
+        cache.get_info()
+        release = threading.Event()
+        source.items = [{"type": "sentiment_index", "value": 2}]
+        original = source.get_info
+        source.get_info = lambda: release.wait(2) and original()
+
+        cache._fetched_at -= 61
+        stale = cache.get_info()
+        again = cache.get_info()
+        release.set()
+        for _ in range(200):
+            if not cache._refreshing:
+                break
+            time.sleep(0.01)
+
+        self.assertEqual(stale[0]["value"], 1)
+        self.assertEqual(again[0]["value"], 1)
+        self.assertEqual(source.count, 2)
+        self.assertEqual(cache.stale_hits, 2)
+        self.assertEqual(cache.get_info()[0]["value"], 2)
+
+    def test_get_info_keep_previous_result_when_refresh_is_empty(self):
+        source = SlowSource()
+        cache = CachedDataProvider(source, ttl=0)
+        cache.get_info()
+        source.items = []
+
+        cache._refresh()
+
+        self.assertEqual(cache.get_info(), [{"type": "sentiment_index", "value": 1}])
+
+    def test_get_info_do_not_cache_empty_result(self):
+        source = SlowSource()
+        source.items = []
+        cache = CachedDataProvider(source)
+
+        self.assertEqual(cache.get_info(), [])
+        self.assertEqual(cache.get_info(), [])
+        self.assertEqual(cache.misses, 2)
+
+    def test_get_info_drop_result_older_than_max_stale(self):
+        source = SlowSource()
+        cache = CachedDataProvider(source)
+        cache.logger = MagicMock()
+        cache.get_info()
+        source.items = []
+
+        self.assertEqual(cache.max_stale, 180)
+        cache._fetched_at -= 179
+        self.assertEqual(cache.get_info()[0]["value"], 1)
+        for _ in range(200):
+            if not cache._refreshing:
+                break
+            time.sleep(0.01)
+
+        cache._fetched_at -= 1
+        self.assertEqual(cache.get_info(), [])
+        self.assertEqual(cache.expired, 1)
+        self.assertEqual(cache.misses, 2)
+        cache.logger.warning.assert_called_once()
+
+        source.items = [{"type": "sentiment_index", "value": 3}]
+        self.assertEqual(cache.get_info()[0]["value"], 3)
+
+    def test_get_info_keep_stale_result_without_max_stale(self):
+        source = SlowSource()
+        cache = CachedDataProvider(source, max_stale=0)
+        cache.get_info()
+        cache._fetched_at -= 3600
+
+        self.assertEqual(cache.get_info()[0]["value"], 1)
+        self.assertEqual(cache.expired, 0)
+
+    def test_get_ttl_read_class_attribute(self):
+        self.assertEqual(CachedDataProvider.get_ttl(FearGreedDataProvider()), 3600)
+        self.assertEqual(CachedDataProvider.get_ttl(MagicMock()), 0)
+
+
+class ParallelFetcherCacheTests(unittest.TestCase):
+    def test_fetch_use_cache_for_provider_with_cache_ttl(self):
+        fetcher = ParallelFetcher(deadline=2)
+        source = SlowSource()
+        live = MagicMock()
+        live.get_info.return_value = [{"type": "live"}]
+
+        for _ in range(3):
+            result = fetcher.fetch([source, live])
+
+        self.assertEqual(result, [{"type": "sentiment_index", "value": 1}, {"type": "live"}])
+        self.assertEqual(source.count, 1)
+        self.assertEqual(live.get_info.call_count, 3)
+        self.assertEqual(fetcher.get_cache_stats()["SlowSource"]["hits"], 2)
@@ -0,0 +1,181 @@
+import shutil
+import tempfile
+import unittest
+from unittest.mock import *
+from smtm.data.candle_store import CandleStore
+from smtm.data.candle_backfiller import CandleBackfiller
+
+
+def make_upbit_item(date_time, price):
+    return {
+        "candle_date_time_kst": date_time,
+        "opening_price": price,
+        "high_price": price,
+        "low_price": price,
+        "trade_price": price,
+        "candle_acc_trade_price": 1.0,
+        "candle_acc_trade_volume": 1.0,
+    }
+
+
+class CandleBackfillerTests(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.store = CandleStore(self.root)
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_get_chunks_split_period_by_page_size(self):
+        backfiller = CandleBackfiller(self.store, exchange="UPB")
+        chunks = backfiller.get_chunks("200220-200221")
+
+        self.assertEqual(len(chunks), 8)
+        self.assertEqual(chunks[0], ("2020-02-20T00:00:00", "2020-02-20T03:20:00", 200))
+        self.assertEqual(chunks[-1], ("2020-02-20T23:20:00", "2020-02-21T00:00:00", 40))
+
+    def test_get_chunks_resume_after_last_stored_candle(self):
+        self.store.append("UPB", "BTC", 60, [
+            {"date_time": f"2020-02-20T{m // 60:02d}:{m % 60:02d}:00", "closing_price": 1}
+            for m in range(11 * 60)
+        ])
+        backfiller = CandleBackfiller(self.store, exchange="UPB")
+        chunks = backfiller.get_chunks("200220-200220.120000")
+
+        self.assertEqual(chunks, [("2020-02-20T11:00:00", "2020-02-20T12:00:00", 60)])
+
+    def test_get_chunks_return_empty_when_period_is_already_stored(self):
+        self.store.append("UPB", "BTC", 60, [
+            {"date_time": f"2020-02-20T{m // 60:02d}:{m % 60:02d}:00", "closing_price": 1}
+            for m in range(12 * 60)
+        ])
+        backfiller = CandleBackfiller(self.store, exchange="UPB")
+
+        self.assertEqual(backfiller.get_chunks("200220-200220.120000"), [])
+
+    def test_get_chunks_request_missing_periods_inside_range_only(self):
+        self.store.append("UPB", "BTC", 60, [
+            {"date_time": "2020-02-20T00:30:00", "closing_price": 1},
+            {"date_time": "2020-02-20T00:31:00", "closing_price": 1},
+            {"date_time": "2020-02-20T00:50:00", "closing_price": 1},
+            {"date_time": "2020-03-01T00:00:00", "closing_price": 1},
+        ])
+        backfiller = CandleBackfiller(self.store, exchange="UPB")
+        backfiller.page_size = 10
+
+        self.assertEqual(
+            backfiller.get_chunks("200220-200220.010000"),
+            [
+                ("2020-02-20T00:00:00", "2020-02-20T00:10:00", 10),
+                ("2020-02-20T00:10:00", "2020-02-20T00:20:00", 10),
+                ("2020-02-20T00:20:00", "2020-02-20T00:30:00", 10),
+                ("2020-02-20T00:32:00", "2020-02-20T00:42:00", 10),
+                ("2020-02-20T00:42:00", "2020-02-20T00:50:00", 8),
+                ("2020-02-20T00:51:00", "2020-02-20T01:00:00", 9),
+            ],
+        )
+
+    @patch("requests.get")
+    def test_backfill_fill_history_before_live_candles_in_store(self, mock_get):
+        def fake_get(url, params=None, **kwargs):
+            end_min = int(params["to"][14:16]) if params["to"][11:13] == "00" else 60
+            response = MagicMock()
+            response.status_code = 200
+            response.json.return_value = [
+                make_upbit_item(f"2020-02-20T00:{minute:02d}:00", minute)
+                for minute in reversed(range(end_min - params["count"], end_min))
+            ]
+            return response
+
+        mock_get.side_effect = fake_get
+        self.store.append("UPB", "BTC", 60, [
+            {"date_time": "2020-02-21T09:00:00", "closing_price": 1000}
+        ])
+        backfiller = CandleBackfiller(self.store, exchange="UPB", max_workers=2)
+        backfiller.page_size = 10
+        backfiller._min_request_gap = 0
+
+        stored = backfiller.backfill("200220-200220.003000")
+
+        self.assertEqual(stored, 30)
+        self.assertEqual(mock_get.call_count, 3)
+        columns = self.store.read("UPB", "BTC", 60)
+        self.assertEqual(list(columns["closing_price"]), list(range(30)) + [1000])
+        self.assertEqual(backfiller.get_chunks("200220-200220.003000"), [])
+
+    def test_init_raise_error_when_exchange_is_not_supported(self):
+        with self.assertRaises(UserWarning):
+            CandleBackfiller(self.store, exchange="BTH")
+
+    @patch("requests.get")
+    def test_backfill_store_pages_in_time_order(self, mock_get):
+        def fake_get(url, params=None, **kwargs):
+            end = params["to"][:19]
+            end_min = int(end[14:16]) if end[11:13] == "00" else 60
+            response = MagicMock()
+            response.status_code = 200
+            # 업비트는 최신 캔들부터 내림차순으로 응답한다
+            response.json.return_value = [
+                make_upbit_item(f"2020-02-20T00:{minute:02d}:00", minute)
+                for minute in reversed(range(end_min - params["count"], end_min))
+            ]
+            return response
+
+        mock_get.side_effect = fake_get
+        backfiller = CandleBackfiller(self.store, exchange="UPB", max_workers=3)
+        backfiller.page_size = 10
+        backfiller._min_request_gap = 0
+
+        stored = backfiller.backfill("200220-200220.004500")
+
+        self.assertEqual(stored, 45)
+        self.assertEqual(mock_get.call_count, 5)
+        self.assertEqual(mock_get.call_args_list[0][1]["params"]["market"], "KRW-BTC")
+        columns = self.store.read("UPB", "BTC", 60)
+        self.assertEqual(list(columns["closing_price"]), list(range(45)))
+
+    @patch("requests.get")
+    def test_backfill_keep_stored_pages_and_raise_error_when_page_fails(self, mock_get):
+        ok_response = MagicMock()
+        ok_response.status_code = 200
+        ok_response.json.return_value = [
+            make_upbit_item(f"2020-02-20T00:{minute:02d}:00", minute) for minute in range(10)
+        ]
+        bad_response = MagicMock()
+        bad_response.status_code = 200
+        bad_response.json.side_effect = ValueError("broken")
+        mock_get.side_effect = [ok_response, bad_response]
+        backfiller = CandleBackfiller(self.store, exchange="UPB", max_workers=1)
+        backfiller.page_size = 10
+        backfiller._min_request_gap = 0
+
+        with self.assertRaises(UserWarning):
+            backfiller.backfill("200220-200220.002000")
+
+        self.assertEqual(self.store.count("UPB", "BTC", 60), 10)
+        self.assertEqual(
+            backfiller.get_chunks("200220-200220.002000"),
+            [("2020-02-20T00:10:00", "2020-02-20T00:20:00", 10)],
+        )
+
+    @patch("requests.get")
+    def test_backfill_request_binance_klines_with_time_range(self, mock_get):
+        response = MagicMock()
+        response.status_code = 200
+        response.json.return_value = [
+            [1582124400000, "1", "2", "0.5", "1.5", "10", 0, "15", 1, "0", "0", "0"]
+        ]
+        mock_get.return_value = response
+        backfiller = CandleBackfiller(self.store, exchange="BNC")
+        backfiller._min_request_gap = 0
+
+        stored = backfiller.backfill("200220-200220.000100")
+
+        params = mock_get.call_args[1]["params"]
+        self.assertEqual(params["symbol"], "BTCUSDT")
+        self.assertEqual(params["interval"], "1m")
+        self.assertEqual(params["startTime"], 1582124400000)
+        self.assertEqual(params["endTime"], 1582124459999)
+        self.assertEqual(params["limit"], 1)
+        self.assertEqual(stored, 1)
+        self.assertEqual(self.store.read("BNC", "BTC", 60)["closing_price"][0], 1.5)
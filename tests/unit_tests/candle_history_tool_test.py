@@ -0,0 +1,47 @@
+import shutil
+import tempfile
+import unittest
+from unittest.mock import *
+from smtm import UpbitDataProvider
+from smtm.data.candle_store import CandleStore
+from smtm.llm.tools.candle_history_tool import CandleHistoryTool
+
+
+class CandleHistoryToolTests(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.store = CandleStore(self.root)
+        self.store.append("UPB", "BTC", 60, [
+            {"date_time": f"2020-02-20T20:{m:02d}:00", "opening_price": m,
+             "high_price": m, "low_price": m, "closing_price": m,
+             "acc_price": 0, "acc_volume": 0}
+            for m in range(5)
+        ])
+        self.session = MagicMock()
+        self.session.name = "default"
+        self.session.operator.data_provider = UpbitDataProvider("BTC")
+        self.manager = MagicMock()
+        self.manager.get_session.return_value = self.session
+        self.tool = CandleHistoryTool(self.manager, self.store)
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_execute_return_recent_candles_in_time_order(self):
+        result = self.tool.execute({"count": 2})
+        self.manager.get_session.assert_called_with("default")
+        self.assertTrue(result.success)
+        candles = result.data["candles"]
+        self.assertEqual([c["closing_price"] for c in candles], [3, 4])
+        self.assertEqual(candles[-1]["date_time"], "2020-02-20T20:04:00")
+        self.assertEqual(candles[-1]["market"], "BTC")
+
+    def test_execute_return_error_when_provider_does_not_store_candles(self):
+        self.session.operator.data_provider = MagicMock(spec=[])
+        result = self.tool.execute({"session": "s1"})
+        self.assertFalse(result.success)
+
+    def test_unknown_session_returns_error(self):
+        self.manager.get_session.side_effect = ValueError("세션을 찾을 수 없습니다: x")
+        result = self.tool.execute({"session": "x"})
+        self.assertFalse(result.success)
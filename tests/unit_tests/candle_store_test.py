@@ -0,0 +1,160 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+import numpy as np
+from smtm.data.candle_store import CandleStore
+from smtm.config import Config
+
+
+def make_candle(date_time, price):
+    return {
+        "type": "primary_candle",
+        "market": "BTC",
+        "date_time": date_time,
+        "opening_price": price,
+        "high_price": price + 10,
+        "low_price": price - 10,
+        "closing_price": price + 5,
+        "acc_price": 1000.5,
+        "acc_volume": 0.25,
+    }
+
+
+class CandleStoreTests(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.store = CandleStore(self.root)
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_timestamp_round_trip_date_time(self):
+        ts = CandleStore.to_timestamp("2020-02-20T20:19:00")
+        self.assertEqual(CandleStore.to_date_time(ts), "2020-02-20T20:19:00")
+
+    def test_append_write_columns_in_time_order(self):
+        added = self.store.append(
+            "UPB", "BTC", 60,
+            [make_candle("2020-02-20T20:02:00", 300), make_candle("2020-02-20T20:01:00", 200)],
+        )
+        self.assertEqual(added, 2)
+        self.assertEqual(self.store.count("UPB", "BTC", 60), 2)
+
+        columns = self.store.read("UPB", "BTC", 60)
+        self.assertIsInstance(columns["closing_price"], np.memmap)
+        self.assertEqual(list(columns["opening_price"]), [200, 300])
+        self.assertEqual(columns["timestamp"].dtype, np.int64)
+        self.assertTrue(
+            os.path.exists(os.path.join(self.root, "UPB", "BTC", "60", "closing_price.bin"))
+        )
+
+    def test_append_overwrite_last_row_and_merge_older_candle(self):
+        self.store.append("UPB", "BTC", 60, [make_candle("2020-02-20T20:01:00", 200)])
+        self.store.append("UPB", "BTC", 60, [make_candle("2020-02-20T20:02:00", 300)])
+        self.assertEqual(
+            self.store.append("UPB", "BTC", 60, [make_candle("2020-02-20T20:02:00", 310)]), 0
+        )
+        self.assertEqual(
+            self.store.append("UPB", "BTC", 60, [make_candle("2020-02-20T20:00:00", 100)]), 1
+        )
+
+        columns = self.store.read("UPB", "BTC", 60)
+        self.assertEqual(list(columns["opening_price"]), [100, 200, 310])
+        self.assertEqual(
+            self.store.last_timestamp("UPB", "BTC", 60),
+            CandleStore.to_timestamp("2020-02-20T20:02:00"),
+        )
+
+    def test_append_merge_gap_and_prepend_candles_in_time_order(self):
+        self.store.append(
+            "UPB",
+            "BTC",
+            60,
+            [make_candle("2020-02-20T20:05:00", 500), make_candle("2020-02-20T20:06:00", 600)],
+        )
+        old_columns = self.store.read("UPB", "BTC", 60)
+
+        added = self.store.append(
+            "UPB",
+            "BTC",
+            60,
+            [
+                make_candle("2020-02-20T20:03:00", 300),
+                make_candle("2020-02-20T20:01:00", 100),
+                make_candle("2020-02-20T20:05:00", 510),
+                make_candle("2020-02-20T20:07:00", 700),
+            ],
+        )
+
+        self.assertEqual(added, 3)
+        columns = self.store.read("UPB", "BTC", 60)
+        self.assertEqual(list(columns["opening_price"]), [100, 300, 510, 600, 700])
+        self.assertEqual(list(columns["closing_price"]), [105, 305, 515, 605, 705])
+        self.assertEqual(
+            [CandleStore.to_date_time(ts) for ts in columns["timestamp"]],
+            [
+                "2020-02-20T20:01:00",
+                "2020-02-20T20:03:00",
+                "2020-02-20T20:05:00",
+                "2020-02-20T20:06:00",
+                "2020-02-20T20:07:00",
+            ],
+        )
+        # 병합 전에 열어둔 memmap은 이전 파일을 그대로 본다
+        self.assertEqual(list(old_columns["opening_price"]), [500, 600])
+        self.assertEqual(sorted(os.listdir(os.path.join(self.root, "UPB", "BTC"))), ["60"])
+
+    def test_append_restore_store_when_merge_was_interrupted_before_swap(self):
+        self.store.append("UPB", "BTC", 60, [make_candle("2020-02-20T20:01:00", 200)])
+        path = os.path.join(self.root, "UPB", "BTC", "60")
+        os.makedirs(path + ".merge")
+        os.rename(path, path + ".old")
+
+        self.store.append("UPB", "BTC", 60, [make_candle("2020-02-20T20:02:00", 300)])
+
+        columns = self.store.read("UPB", "BTC", 60)
+        self.assertEqual(list(columns["opening_price"]), [200, 300])
+        self.assertEqual(sorted(os.listdir(os.path.join(self.root, "UPB", "BTC"))), ["60"])
+
+    def test_read_return_range_and_recent_count(self):
+        candles = [make_candle(f"2020-02-20T20:{m:02d}:00", 100 + m) for m in range(10)]
+        self.store.append("UPB", "BTC", 60, candles)
+
+        columns = self.store.read(
+            "UPB", "BTC", 60, start="2020-02-20T20:03:00", end="2020-02-20T20:06:00"
+        )
+        self.assertEqual(list(columns["opening_price"]), [103, 104, 105, 106])
+
+        columns = self.store.read("UPB", "BTC", 60, end="2020-02-20T20:06:00", count=2)
+        self.assertEqual(list(columns["opening_price"]), [105, 106])
+
+    def test_read_return_empty_columns_when_no_data(self):
+        columns = self.store.read("UPB", "ETH", 60)
+        self.assertEqual(len(columns["timestamp"]), 0)
+        self.assertEqual(self.store.last_timestamp("UPB", "ETH", 60), None)
+
+    def test_append_drop_partially_written_row(self):
+        self.store.append("UPB", "BTC", 60, [make_candle("2020-02-20T20:01:00", 200)])
+        path = os.path.join(self.root, "UPB", "BTC", "60", "timestamp.bin")
+        with open(path, "ab") as column_file:
+            column_file.write(np.asarray([999], dtype="<i8").tobytes())
+        self.assertEqual(self.store.count("UPB", "BTC", 60), 1)
+
+        self.store.append("UPB", "BTC", 60, [make_candle("2020-02-20T20:02:00", 300)])
+        columns = self.store.read("UPB", "BTC", 60)
+        self.assertEqual(list(columns["opening_price"]), [200, 300])
+
+    def test_to_candles_convert_columns(self):
+        self.store.append("UPB", "BTC", 60, [make_candle("2020-02-20T20:01:00", 200)])
+        candles = CandleStore.to_candles(self.store.read("UPB", "BTC", 60), market="BTC")
+        self.assertEqual(candles, [make_candle("2020-02-20T20:01:00", 200)])
+
+    def test_from_config_return_shared_store(self):
+        with patch.object(Config, "candle_store_path", None):
+            self.assertIsNone(CandleStore.from_config())
+        with patch.object(Config, "candle_store_path", self.root):
+            store = CandleStore.from_config()
+            self.assertIs(store, CandleStore.from_config())
+            self.assertEqual(store.root_path, self.root)
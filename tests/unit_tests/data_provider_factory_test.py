@@ -34,6 +34,10 @@ class DataProviderFactoryTests(unittest.TestCase):
             isinstance(DataProviderFactory.create("UBD"), UpbitBinanceDataProvider)
         )
 
+    def test_registry_codes_match_class_codes(self):
+        for code in DataProviderFactory.REGISTRY:
+            self.assertEqual(DataProviderFactory.get_class(code).CODE, code)
+
     def test_get_name_return_None_when_called_with_invalid_code(self):
         strategy = DataProviderFactory.get_name("")
         self.assertEqual(strategy, None)
@@ -60,3 +64,20 @@ class DataProviderFactoryTests(unittest.TestCase):
         self.assertTrue(all[3]["name"], UpbitBinanceDataProvider.NAME)
         self.assertTrue(all[3]["code"], UpbitBinanceDataProvider.CODE)
         self.assertTrue(all[3]["class"], UpbitBinanceDataProvider)
+
+    def test_create_attach_candle_store_to_exchange_providers(self):
+        store = MagicMock()
+        provider = DataProviderFactory.create("UBD", candle_store=store)
+        self.assertIs(provider.upbit_dp.candle_store, store)
+        self.assertIs(provider.binance_dp.candle_store, store)
+
+        provider = DataProviderFactory.create("UPB", candle_store=store)
+        self.assertIs(provider.candle_store, store)
+        self.assertIsNone(DataProviderFactory.create("UPB").candle_store)
+
+    def test_get_exchange_providers_return_primary_provider_first(self):
+        provider = DataProviderFactory.create("UBD")
+        self.assertEqual(
+            DataProviderFactory.get_exchange_providers(provider),
+            [provider.upbit_dp, provider.binance_dp],
+        )
@@ -0,0 +1,257 @@
+import shutil
+import tempfile
+import threading
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+from smtm import EventTradingOperator, Analyzer, UpbitDataProvider
+from smtm.data.candle_store import CandleStore
+from smtm.event_trading_operator import CandleCloseDetector
+from smtm.tick_scheduler import TickScheduler
+from smtm.trader.simulation_trader import SimulationTrader
+from smtm.llm.safety_guard import SafetyGuard, SafetyConfig
+from smtm.llm.system_monitor import SystemMonitor
+
+
+def minute_start(minutes_ago=0):
+    now = datetime.now(timezone(timedelta(hours=9))).replace(second=0, microsecond=0)
+    return (now - timedelta(minutes=minutes_ago)).strftime("%Y-%m-%dT%H:%M:%S")
+
+
+def candle(date_time, price=50000):
+    return {
+        "type": "primary_candle", "market": "BTC", "date_time": date_time,
+        "opening_price": price, "high_price": price, "low_price": price,
+        "closing_price": price, "acc_price": 0, "acc_volume": 0,
+    }
+
+
+class SequenceDataProvider:
+    def __init__(self, candles):
+        self.candles = list(candles)
+
+    def get_info(self):
+        current = self.candles.pop(0) if len(self.candles) > 1 else self.candles[0]
+        return [current, {"type": "exchange_rate", "usd_krw": 1350.0}]
+
+
+class StreamingDataProvider(SequenceDataProvider):
+    def __init__(self, candles, connected=True):
+        super().__init__(candles)
+        self.connected = connected
+        self.listeners = []
+
+    def add_candle_listener(self, listener):
+        self.listeners.append(listener)
+
+    def remove_candle_listener(self, listener):
+        self.listeners.remove(listener)
+
+
+def make_strategy():
+    strategy = MagicMock()
+    strategy.get_request.return_value = None
+    return strategy
+
+
+def make_operator(data_provider, warmup_candles=None, **kwargs):
+    strategy = make_strategy()
+    operator = EventTradingOperator(
+        interval=60, currency="BTC", scheduler=TickScheduler(), candle_interval=60, **kwargs)
+    operator.initialize(
+        data_provider, strategy, SimulationTrader(budget=500000, currency="BTC"),
+        Analyzer(SystemMonitor()),
+        SafetyGuard(SafetyConfig(
+            max_trade_amount=1000000, max_daily_trades=20,
+            max_loss_ratio=-0.9, initial_budget=500000,
+        )),
+        warmup_candles=warmup_candles,
+    )
+    return operator, strategy
+
+
+def received_candles(strategy):
+    return [
+        call.args[0][0] for call in strategy.update_trading_info.call_args_list
+    ]
+
+
+class CandleCloseDetectorTests(unittest.TestCase):
+    def test_observe_close_previous_snapshot_when_date_time_changes(self):
+        detector = CandleCloseDetector(60)
+        first = candle("2026-07-03T12:00:00", 1)
+        latest = candle("2026-07-03T12:00:00", 2)
+
+        self.assertIsNone(detector.observe(first))
+        self.assertIsNone(detector.observe(latest))
+        self.assertIs(detector.observe(candle("2026-07-03T12:01:00")), latest)
+        self.assertIsNone(detector.observe(candle("2026-07-03T12:01:00")))
+
+    def test_push_drop_duplicate_and_older_candles(self):
+        detector = CandleCloseDetector(60)
+        closed = candle("2026-07-03T12:01:00")
+
+        self.assertIs(detector.push(closed), closed)
+        self.assertIsNone(detector.push(dict(closed)))
+        self.assertIsNone(detector.push(candle("2026-07-03T12:00:00")))
+        self.assertIsNone(detector.observe(candle("2026-07-03T12:01:00")))
+        self.assertIsNone(detector.observe(candle("2026-07-03T12:02:00")))
+
+    def test_observe_close_candle_after_its_interval_ends(self):
+        detector = CandleCloseDetector(60)
+        current = candle("2026-07-03T12:00:00")
+        close_time = detector.get_close_time(current)
+
+        self.assertIsNone(detector.observe(current, now=close_time - 1))
+        self.assertIs(detector.observe(current, now=close_time), current)
+        self.assertIsNone(detector.observe(current, now=close_time + 1))
+
+
+class EventTradingOperatorTests(unittest.TestCase):
+    def test_poll_feed_each_closed_candle_once(self):
+        operator, strategy = make_operator(SequenceDataProvider([
+            candle("2026-07-03T12:00:00", 1),
+            candle("2026-07-03T12:00:00", 2),
+            candle("2026-07-03T12:01:00", 3),
+            candle("2026-07-03T12:01:00", 4),
+        ]))
+        operator.state = "running"
+
+        for _ in range(4):
+            operator._run_tick()
+
+        self.assertEqual(received_candles(strategy), [candle("2026-07-03T12:00:00", 2)])
+        # primary_candle 외의 정보는 그대로 전달된다
+        info = strategy.update_trading_info.call_args[0][0]
+        self.assertEqual(info[1]["type"], "exchange_rate")
+        self.assertEqual(operator.get_latency_report()["candle_close"]["count"], 1)
+
+    def test_poll_fetch_finished_candle_from_exchange_provider(self):
+        operator, strategy = make_operator(SequenceDataProvider([
+            candle("2026-07-03T12:00:00", 1),
+            candle("2026-07-03T12:01:00", 3),
+        ]))
+        operator.state = "running"
+        exchange = MagicMock()
+        exchange._fetch_recent_candles.return_value = [candle("2026-07-03T12:00:00", 2)]
+
+        with patch(
+            "smtm.data.data_provider_factory.DataProviderFactory.get_exchange_providers",
+            return_value=[exchange],
+        ):
+            operator._run_tick()
+            operator._run_tick()
+
+        exchange._fetch_recent_candles.assert_called_once_with(1)
+        self.assertEqual(received_candles(strategy), [candle("2026-07-03T12:00:00", 2)])
+
+    @patch("requests.get")
+    def test_poll_read_finished_candle_from_exchange_not_from_candle_store(self, mock_get):
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root, True)
+        exchange = UpbitDataProvider("BTC")
+        exchange.candle_store = CandleStore(root)
+        # 닫히기 전 마지막 조회 때 저장된 것처럼 만들어지던 중의 캔들이 저장소에 있다
+        exchange.candle_store.append("UPB", "BTC", 60, [candle(minute_start(1), 1)])
+        response = MagicMock()
+        response.json.return_value = [
+            {
+                "candle_date_time_kst": date_time, "opening_price": price,
+                "high_price": price, "low_price": price, "trade_price": price,
+                "candle_acc_trade_price": 0, "candle_acc_trade_volume": 0,
+            }
+            for date_time, price in ((minute_start(), 3), (minute_start(1), 2))
+        ]
+        mock_get.return_value = response
+        operator, strategy = make_operator(SequenceDataProvider([
+            candle(minute_start(1), 1),
+            candle(minute_start(), 3),
+        ]))
+        operator.state = "running"
+
+        with patch(
+            "smtm.data.data_provider_factory.DataProviderFactory.get_exchange_providers",
+            return_value=[exchange],
+        ):
+            operator._run_tick()
+            operator._run_tick()
+
+        self.assertEqual(received_candles(strategy)[0]["closing_price"], 2)
+        stored = exchange.candle_store.read("UPB", "BTC", 60)
+        self.assertEqual(list(stored["closing_price"]), [2])
+
+    def test_poll_fall_back_to_snapshot_when_finished_candle_is_not_available(self):
+        operator, strategy = make_operator(SequenceDataProvider([
+            candle("2026-07-03T12:00:00", 1),
+            candle("2026-07-03T12:01:00", 3),
+            candle("2026-07-03T12:02:00", 4),
+        ]))
+        operator.state = "running"
+        exchange = MagicMock()
+        exchange._fetch_recent_candles.side_effect = [
+            [candle("2026-07-03T11:59:00", 9)],
+            UserWarning("fail"),
+        ]
+
+        with patch(
+            "smtm.data.data_provider_factory.DataProviderFactory.get_exchange_providers",
+            return_value=[exchange],
+        ):
+            for _ in range(3):
+                operator._run_tick()
+
+        self.assertEqual(
+            received_candles(strategy),
+            [candle("2026-07-03T12:00:00", 1), candle("2026-07-03T12:01:00", 3)],
+        )
+
+    def test_warmup_candles_are_not_processed_again(self):
+        operator, strategy = make_operator(
+            SequenceDataProvider([
+                candle("2026-07-03T12:00:00"),
+                candle("2026-07-03T12:01:00"),
+            ]),
+            warmup_candles=[candle("2026-07-03T12:00:00")],
+        )
+        operator.state = "running"
+        strategy.update_trading_info.reset_mock()
+
+        operator._run_tick()
+        operator._run_tick()
+
+        strategy.update_trading_info.assert_not_called()
+
+    def test_stream_close_trigger_pipeline_and_poll_does_not_repeat_it(self):
+        # 진행 중인 캔들은 아직 인터벌이 끝나지 않아 폴링으로 닫히지 않는다
+        data_provider = StreamingDataProvider([candle(minute_start())])
+        operator, strategy = make_operator(data_provider, poll_interval=60)
+        self.assertTrue(operator.start())
+        self.addCleanup(operator.stop)
+        self.assertEqual(data_provider.listeners, [operator._on_candle_close])
+
+        closed = candle(minute_start(1), 7)
+        data_provider.listeners[0](closed)
+        data_provider.listeners[0](dict(closed))
+        # 폴링도 워커에서 실행해 앞서 들어온 알림이 처리된 뒤에 돌게 한다
+        polled = threading.Event()
+
+        def poll(task):
+            operator._run_tick()
+            polled.set()
+
+        operator.worker.post_task({"runnable": poll})
+        self.assertTrue(polled.wait(2))
+
+        self.assertEqual(received_candles(strategy), [closed])
+        operator.stop()
+        self.assertEqual(data_provider.listeners, [])
+
+    def test_poll_close_quiet_candle_while_stream_is_connected(self):
+        data_provider = StreamingDataProvider([candle("2026-07-03T12:00:00")])
+        operator, strategy = make_operator(data_provider)
+        operator.state = "running"
+        operator.stream_source = data_provider
+
+        operator._run_tick()
+
+        self.assertEqual(received_candles(strategy), [candle("2026-07-03T12:00:00")])
@@ -0,0 +1,159 @@
+import http.server
+import threading
+import unittest
+from unittest.mock import *
+import requests
+from smtm.http_session import HttpSessionPool, request_with_retry, http_session_pool
+
+
+class _OkHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+
+class RequestWithRetryTests(unittest.TestCase):
+    @patch("time.sleep")
+    def test_retry_on_server_error_status(self, mock_sleep):
+        request_func = MagicMock(
+            side_effect=[MagicMock(status_code=503), MagicMock(status_code=200)]
+        )
+
+        response = request_with_retry(request_func, "https://example.com/a", timeout=1)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(request_func.call_count, 2)
+        mock_sleep.assert_called_once_with(0.5)
+
+    @patch("time.sleep")
+    def test_raise_connection_error_after_retries(self, mock_sleep):
+        request_func = MagicMock(side_effect=requests.exceptions.ConnectionError("fail"))
+
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            request_with_retry(request_func, "https://example.com/a", retries=1)
+        self.assertEqual(request_func.call_count, 2)
+
+    @patch("time.sleep")
+    def test_retry_on_429_after_retry_after_header(self, mock_sleep):
+        request_func = MagicMock(
+            side_effect=[
+                MagicMock(status_code=429, headers={"Retry-After": "3"}),
+                MagicMock(status_code=200),
+            ]
+        )
+
+        response = request_with_retry(request_func, "https://example.com/a")
+
+        self.assertEqual(response.status_code, 200)
+        mock_sleep.assert_called_once_with(3.0)
+
+    @patch("time.sleep")
+    @patch("smtm.http_session.http_session_pool")
+    def test_record_each_attempt_with_status(self, mock_pool, mock_sleep):
+        request_func = MagicMock(
+            side_effect=[
+                requests.exceptions.ConnectionError("fail"),
+                MagicMock(status_code=503),
+                MagicMock(status_code=200),
+            ]
+        )
+
+        request_with_retry(request_func, "https://example.com/a")
+
+        statuses = [call[0][1] for call in mock_pool.record_call.call_args_list]
+        self.assertEqual(statuses, ["error", 503, 200])
+
+    @patch("smtm.http_session.rate_limiter")
+    def test_wait_for_rate_limiter_before_each_attempt(self, mock_limiter):
+        response = MagicMock(status_code=200)
+        request_func = MagicMock(return_value=response)
+
+        request_with_retry(
+            request_func, "https://api.upbit.com/v1/ticker", headers={"a": "b"}, params={"c": 1}
+        )
+
+        mock_limiter.acquire.assert_called_once_with(
+            "https://api.upbit.com/v1/ticker", "GET", {"a": "b"}, {"c": 1}
+        )
+        mock_limiter.update.assert_called_once_with(
+            "https://api.upbit.com/v1/ticker", "GET", {"a": "b"}, response, {"c": 1}
+        )
+
+    def test_call_custom_function_as_is(self):
+        request_func = MagicMock(return_value=MagicMock(status_code=200))
+
+        request_with_retry(request_func, "https://example.com/a", params={"a": 1})
+
+        request_func.assert_called_once_with("https://example.com/a", params={"a": 1})
+
+    @patch.object(requests.Session, "get")
+    def test_use_pooled_session_with_host_default_timeout(self, mock_session_get):
+        mock_session_get.return_value = MagicMock(status_code=200)
+
+        request_with_retry(requests.get, "https://api.upbit.com/v1/orders", params={"a": 1})
+
+        mock_session_get.assert_called_once_with(
+            "https://api.upbit.com/v1/orders", params={"a": 1}, timeout=(3, 5)
+        )
+
+    @patch.object(requests.Session, "post")
+    def test_keep_given_timeout(self, mock_session_post):
+        mock_session_post.return_value = MagicMock(status_code=200)
+
+        request_with_retry(requests.post, "https://example.com/a", timeout=30)
+
+        mock_session_post.assert_called_once_with("https://example.com/a", timeout=30)
+
+
+class HttpSessionPoolTests(unittest.TestCase):
+    def test_get_session_reuse_session_per_thread_and_host(self):
+        pool = HttpSessionPool()
+        session = pool.get_session("https://api.upbit.com/v1/a")
+
+        self.assertIs(session, pool.get_session("https://api.upbit.com/v1/b"))
+        self.assertIsNot(session, pool.get_session("https://api.binance.com/api/v3/klines"))
+
+        other = []
+        thread = threading.Thread(
+            target=lambda: other.append(pool.get_session("https://api.upbit.com/v1/a"))
+        )
+        thread.start()
+        thread.join()
+        self.assertIsNot(session, other[0])
+        # 스레드마다 Session은 다르지만 연결 풀은 공유한다
+        self.assertIs(
+            session.get_adapter("https://api.upbit.com/v1/a"),
+            other[0].get_adapter("https://api.upbit.com/v1/a"),
+        )
+
+    def test_record_call_keeps_latency_per_host_and_count_per_status(self):
+        pool = HttpSessionPool()
+        pool.record_call("https://api.upbit.com/v1/ticker", 200, 0.1)
+        pool.record_call("https://api.upbit.com/v1/orders", 200, 0.3)
+        pool.record_call("https://api.upbit.com/v1/orders", "error", 5)
+
+        summary = pool.call_metrics.get_summary()
+        self.assertEqual(summary["api.upbit.com"]["count"], 3)
+        self.assertEqual(pool.call_metrics.get_counters(), {
+            ("api.upbit.com", "200"): 2, ("api.upbit.com", "error"): 1,
+        })
+
+    def test_get_stats_count_handshakes_and_reused_connections(self):
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _OkHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        url = f"http://127.0.0.1:{server.server_port}/ok"
+
+        for _ in range(3):
+            self.assertEqual(request_with_retry(requests.get, url).text, "ok")
+
+        stats = http_session_pool.get_stats()[f"127.0.0.1:{server.server_port}"]
+        self.assertEqual(stats, {"handshakes": 1, "reused": 2})
@@ -0,0 +1,43 @@
+import math
+import unittest
+import pandas as pd
+from smtm.strategy.indicator import RollingMean
+
+
+class RollingMeanTests(unittest.TestCase):
+    def test_update_return_nan_until_window_is_full(self):
+        mean = RollingMean(3)
+        self.assertTrue(math.isnan(mean.update(1)))
+        self.assertTrue(math.isnan(mean.update(2)))
+        self.assertEqual(mean.update(3), 2)
+        self.assertEqual(mean.update(7), 4)
+        self.assertEqual(mean.value, 4)
+
+    def test_update_keep_only_window_values(self):
+        mean = RollingMean(2)
+        for value in range(10):
+            mean.update(value)
+        self.assertEqual(list(mean.values), [8, 9])
+
+    def test_update_return_same_value_as_pandas_rolling_mean(self):
+        values = [0.1 * i + (i % 3) * 0.07 for i in range(300)]
+        mean = RollingMean(40)
+        result = [mean.update(value) for value in values]
+        expected = pd.Series(values).rolling(40).mean().values
+        self.assertEqual(result[39:], list(expected[39:]))
+
+    def test_peek_return_means_without_changing_state(self):
+        values = [0.3, 1.7, 2.2, 5.9, 4.1]
+        mean = RollingMean(3)
+        for value in values:
+            mean.update(value)
+
+        peeked = mean.peek([4.1, 4.1, 4.1])
+        expected = pd.Series(values + [4.1] * 3).rolling(3).mean().values[-3:]
+        self.assertEqual(peeked, list(expected))
+        self.assertEqual(list(mean.values), [2.2, 5.9, 4.1])
+        self.assertEqual(mean.update(1.0), pd.Series(values + [1.0]).rolling(3).mean().values[-1])
+
+    def test_init_raise_error_when_window_is_invalid(self):
+        with self.assertRaises(ValueError):
+            RollingMean(0)
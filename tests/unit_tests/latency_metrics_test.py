@@ -0,0 +1,56 @@
+import unittest
+from smtm.latency_metrics import LatencyHistogram, TickMetrics
+
+
+class LatencyHistogramTests(unittest.TestCase):
+    def test_empty_histogram_has_no_percentiles(self):
+        summary = LatencyHistogram().get_summary()
+        self.assertEqual(summary["count"], 0)
+        self.assertIsNone(summary["p50"])
+        self.assertIsNone(summary["mean"])
+
+    def test_percentiles_are_within_bucket_error(self):
+        histogram = LatencyHistogram()
+        for i in range(1, 1001):
+            histogram.record(i / 1000)
+
+        for percent, expected in ((50, 0.5), (95, 0.95), (99, 0.99)):
+            self.assertAlmostEqual(
+                histogram.get_percentile(percent), expected, delta=expected * 0.2)
+        self.assertAlmostEqual(histogram.get_summary()["mean"], 0.5005)
+        self.assertEqual(histogram.max, 1.0)
+
+    def test_percentile_is_clamped_to_observed_range(self):
+        histogram = LatencyHistogram()
+        histogram.record(0.25)
+        self.assertEqual(histogram.get_percentile(50), 0.25)
+        self.assertEqual(histogram.get_percentile(99), 0.25)
+
+    def test_overflow_and_negative_values(self):
+        histogram = LatencyHistogram()
+        histogram.record(1000)
+        histogram.record(-1)
+        self.assertEqual(histogram.counts[-1], 1)
+        self.assertEqual(histogram.counts[0], 1)
+        self.assertEqual(histogram.get_percentile(100), 1000)
+
+
+class TickMetricsTests(unittest.TestCase):
+    def test_span_records_stage_even_on_error(self):
+        metrics = TickMetrics()
+        with metrics.span("data_provider"):
+            pass
+        with self.assertRaises(RuntimeError):
+            with metrics.span("strategy"):
+                raise RuntimeError("x")
+
+        summary = metrics.get_summary()
+        self.assertEqual(set(summary), {"data_provider", "strategy"})
+        self.assertEqual(summary["strategy"]["count"], 1)
+
+    def test_record_accumulates_per_stage(self):
+        metrics = TickMetrics()
+        metrics.record("trader", 0.1)
+        metrics.record("trader", 0.3)
+        self.assertEqual(metrics.get_summary()["trader"]["count"], 2)
+        self.assertEqual(metrics.get_summary()["trader"]["max"], 0.3)
@@ -0,0 +1,36 @@
+import os
+import unittest
+from unittest.mock import *
+from smtm.llm.tools.latency_tool import LatencyTool
+
+
+class LatencyToolTests(unittest.TestCase):
+    def setUp(self):
+        self.manager = MagicMock()
+        self.manager.get_latency_report.return_value = {
+            "default": {"latency": {"tick": {"count": 1, "p50": 0.2}}, "tick": None},
+        }
+        self.tool = LatencyTool(self.manager, export_dir="metrics")
+
+    def test_all_sessions_when_session_omitted(self):
+        result = self.tool.execute({})
+        self.manager.get_latency_report.assert_called_with(None)
+        self.assertTrue(result.success)
+        self.assertIn("default", result.data["sessions"])
+
+    def test_explicit_session_routed(self):
+        self.tool.execute({"session": "s2"})
+        self.manager.get_latency_report.assert_called_with("s2")
+
+    def test_unknown_session_returns_error(self):
+        self.manager.get_latency_report.side_effect = ValueError("세션을 찾을 수 없습니다: x")
+        result = self.tool.execute({"session": "x"})
+        self.assertFalse(result.success)
+
+    def test_export_writes_under_export_dir(self):
+        self.manager.export_metrics.return_value = {"sessions": {}}
+        result = self.tool.execute({"export": True})
+        self.assertTrue(result.success)
+        path = self.manager.export_metrics.call_args[0][0]
+        self.assertEqual(os.path.dirname(path), "metrics")
+        self.assertEqual(result.data["path"], path)
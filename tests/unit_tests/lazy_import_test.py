@@ -0,0 +1,45 @@
+import subprocess
+import sys
+import unittest
+import smtm
+from smtm.lazy_import import lazy_attributes, load_attribute
+
+
+class LazyImportTests(unittest.TestCase):
+    def test_import_smtm_does_not_load_heavy_dependencies(self):
+        code = (
+            "import sys, smtm\n"
+            "heavy = ('anthropic', 'numpy', 'pandas', 'jwt', 'smtm.data.upbit_data_provider',"
+            " 'smtm.trader.upbit_trader', 'smtm.llm.claude_llm_client')\n"
+            "print(','.join(m for m in heavy if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.strip(), "")
+
+    def test_public_names_resolve_on_first_access(self):
+        from smtm.strategy.strategy_sma import StrategySma
+
+        self.assertIs(smtm.StrategySma, StrategySma)
+        self.assertIn("StrategySma", vars(smtm))
+        self.assertIn("UpbitTrader", dir(smtm))
+
+    def test_unknown_name_raises_attribute_error(self):
+        with self.assertRaises(AttributeError):
+            smtm.NoSuchThing
+        with self.assertRaises(ImportError):
+            from smtm import NoSuchThing  # noqa: F401
+
+    def test_lazy_attributes_for_subpackage(self):
+        from smtm.llm import SafetyGuard
+        from smtm.llm.safety_guard import SafetyGuard as Expected
+
+        self.assertIs(SafetyGuard, Expected)
+
+    def test_load_attribute_relative_to_package(self):
+        self.assertIs(load_attribute(".worker", "Worker", "smtm"), smtm.Worker)
+
+    def test_lazy_attributes_reject_names_outside_mapping(self):
+        getattr_func, _ = lazy_attributes("smtm", {"Worker": ".worker"})
+        with self.assertRaises(AttributeError):
+            getattr_func("Analyzer")
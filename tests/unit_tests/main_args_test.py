@@ -15,12 +15,28 @@ class MainArgsTests(unittest.TestCase):
 
         self.assertEqual(args.log, "smtm.log")
 
+    def test_metrics_port_is_parsed(self):
+        args = parse_args(["--metrics-port", "9108"])
+
+        self.assertEqual(args.metrics_port, 9108)
+
+    def test_batch_market_data_is_parsed(self):
+        self.assertTrue(parse_args(["--batch-market-data"]).batch_market_data)
+        self.assertFalse(parse_args([]).batch_market_data)
+
+    def test_stream_options_are_parsed(self):
+        args = parse_args(["--stream-market-data", "--stream-url", "ws://127.0.0.1:8765"])
+
+        self.assertTrue(args.stream_market_data)
+        self.assertEqual(args.stream_url, "ws://127.0.0.1:8765")
+
     def test_defaults_are_none(self):
         args = parse_args([])
 
         self.assertIsNone(args.token)
         self.assertIsNone(args.chatid)
         self.assertIsNone(args.log)
+        self.assertIsNone(args.metrics_port)
 
     def test_removed_flags_are_rejected(self):
         # CLI 인터랙티브 모드가 사라지면서 함께 제거된 플래그들
@@ -0,0 +1,280 @@
+import threading
+import time
+import unittest
+from unittest.mock import *
+from smtm import UpbitDataProvider
+from smtm.data.data_provider_factory import DataProviderFactory
+from smtm.data.market_data_hub import MarketDataHub
+
+
+class CountingProvider:
+    NAME = "COUNTING DP"
+    CODE = "CNT"
+
+    def __init__(self, delay=0):
+        self.count = 0
+        self.delay = delay
+
+    def get_info(self):
+        self.count += 1
+        if self.delay:
+            time.sleep(self.delay)
+        return [{"type": "primary_candle", "closing_price": self.count}]
+
+
+class BatchProvider(CountingProvider):
+    batch_calls = []
+
+    def __init__(self, market):
+        super().__init__()
+        self.market = market
+
+    @classmethod
+    def get_batch_info(cls, providers):
+        cls.batch_calls.append([provider.market for provider in providers])
+        # DOGE는 일괄 조회 결과에서 빠져 혼자 조회되어야 한다
+        return {
+            provider.market: [{"type": "primary_candle", "market": provider.market}]
+            for provider in providers
+            if provider.market != "DOGE"
+        }
+
+
+class MarketDataHubTests(unittest.TestCase):
+    def setUp(self):
+        patcher = patch(
+            "smtm.data.data_provider_factory.DataProviderFactory.create",
+            side_effect=lambda *a, **k: CountingProvider(),
+        )
+        self.mock_create = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_subscribe_share_provider_for_same_market(self):
+        hub = MarketDataHub()
+        first = hub.subscribe("UPB", "BTC", 60)
+        second = hub.subscribe("UPB", "BTC", 60)
+        other = hub.subscribe("UPB", "ETH", 60)
+
+        self.assertIs(first.provider, second.provider)
+        self.assertIsNot(first.provider, other.provider)
+        self.assertEqual(self.mock_create.call_count, 2)
+        self.assertEqual(first.NAME, "COUNTING DP")
+
+    def test_get_info_fetch_once_within_max_age(self):
+        hub = MarketDataHub(max_age=10)
+        first = hub.subscribe("UPB", "BTC", 60)
+        second = hub.subscribe("UPB", "BTC", 60)
+
+        info1 = first.get_info()
+        info2 = second.get_info()
+
+        self.assertEqual(first.provider.count, 1)
+        self.assertEqual(info1, info2)
+        # 한 구독자가 결과를 바꿔도 다른 구독자에게 영향이 없다
+        info1[0]["type"] = "changed"
+        self.assertEqual(second.get_info()[0]["type"], "primary_candle")
+
+    def test_get_info_fetch_again_after_max_age(self):
+        hub = MarketDataHub(max_age=0)
+        subscription = hub.subscribe("UPB", "BTC", 60)
+
+        subscription.get_info()
+        info = subscription.get_info()
+
+        self.assertEqual(info[0]["closing_price"], 2)
+
+    def test_get_info_concurrent_requests_share_one_fetch(self):
+        self.mock_create.side_effect = lambda *a, **k: CountingProvider(delay=0.1)
+        hub = MarketDataHub()
+        subscriptions = [hub.subscribe("UPB", "BTC", 60) for _ in range(5)]
+        results = []
+        threads = [
+            threading.Thread(target=lambda s=s: results.append(s.get_info()))
+            for s in subscriptions
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(subscriptions[0].provider.count, 1)
+        self.assertEqual(len(results), 5)
+
+    def test_get_info_propagate_error_without_caching(self):
+        hub = MarketDataHub()
+        subscription = hub.subscribe("UPB", "BTC", 60)
+        subscription.provider.get_info = MagicMock(
+            side_effect=[UserWarning("fail"), [{"type": "primary_candle"}]]
+        )
+
+        with self.assertRaises(UserWarning):
+            subscription.get_info()
+        self.assertEqual(subscription.get_info(), [{"type": "primary_candle"}])
+
+    def test_unsubscribe_close_feed_after_last_subscriber(self):
+        hub = MarketDataHub()
+        first = hub.subscribe("UPB", "BTC", 60)
+        second = hub.subscribe("UPB", "BTC", 60)
+
+        hub.unsubscribe(first)
+        hub.unsubscribe(first)
+        self.assertEqual(hub.get_stats()[0]["subscribers"], 1)
+
+        hub.unsubscribe(second)
+        self.assertEqual(hub.get_stats(), [])
+        third = hub.subscribe("UPB", "BTC", 60)
+        self.assertIsNot(third.provider, first.provider)
+
+    def test_subscribe_return_none_for_invalid_code(self):
+        self.mock_create.side_effect = None
+        self.mock_create.return_value = None
+        hub = MarketDataHub()
+
+        self.assertIsNone(hub.subscribe("XXX", "BTC", 60))
+        self.assertEqual(hub.get_stats(), [])
+
+
+class MarketDataHubBatchTests(unittest.TestCase):
+    def setUp(self):
+        BatchProvider.batch_calls = []
+        patcher = patch(
+            "smtm.data.data_provider_factory.DataProviderFactory.create",
+            side_effect=lambda code, currency="BTC", **k: BatchProvider(currency),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_get_info_fetch_all_markets_with_one_request(self):
+        hub = MarketDataHub(batch=True)
+        btc = hub.subscribe("UPB", "BTC", 60)
+        eth = hub.subscribe("UPB", "ETH", 60)
+        other_interval = hub.subscribe("UPB", "XRP", 180)
+
+        self.assertEqual(btc.get_info(), [{"type": "primary_candle", "market": "BTC"}])
+        self.assertEqual(eth.get_info(), [{"type": "primary_candle", "market": "ETH"}])
+        other_interval.get_info()
+
+        self.assertEqual(BatchProvider.batch_calls, [["BTC", "ETH"], ["XRP"]])
+        self.assertEqual(btc.provider.count + eth.provider.count, 0)
+        self.assertTrue(all(stat["batched"] for stat in hub.get_stats()))
+
+    def test_get_info_fall_back_to_single_fetch_for_missing_market(self):
+        hub = MarketDataHub(max_age=0, batch=True)
+        btc = hub.subscribe("UPB", "BTC", 60)
+        doge = hub.subscribe("UPB", "DOGE", 60)
+
+        info = doge.get_info()
+
+        self.assertEqual(info, [{"type": "primary_candle", "closing_price": 1}])
+        self.assertEqual(BatchProvider.batch_calls, [["BTC", "DOGE"]])
+        self.assertEqual(btc.get_info()[0]["market"], "BTC")
+
+    def test_unsubscribe_remove_feed_from_batch(self):
+        hub = MarketDataHub(batch=True)
+        btc = hub.subscribe("UPB", "BTC", 60)
+        eth = hub.subscribe("UPB", "ETH", 60)
+
+        hub.unsubscribe(btc)
+        eth.get_info()
+        self.assertEqual(BatchProvider.batch_calls, [["ETH"]])
+
+        hub.unsubscribe(eth)
+        self.assertEqual(hub.batches, {})
+
+    def test_batch_disabled_by_default(self):
+        hub = MarketDataHub()
+        subscription = hub.subscribe("UPB", "BTC", 60)
+
+        subscription.get_info()
+
+        self.assertEqual(BatchProvider.batch_calls, [])
+        self.assertFalse(hub.get_stats()[0]["batched"])
+
+
+class MarketDataHubUpbitBatchTests(unittest.TestCase):
+    TIMESTAMP = 1583848320000
+
+    def setUp(self):
+        self.ticker_count = 0
+        self.candle_markets = []
+        patcher = patch("requests.get", side_effect=self._get)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _get(self, url, params=None, **kwargs):
+        response = MagicMock()
+        if url == UpbitDataProvider.TICKER_URL:
+            timestamp = self.TIMESTAMP + self.ticker_count * 60000
+            self.ticker_count += 1
+            response.json.return_value = [{
+                "market": market, "timestamp": timestamp, "trade_price": 100,
+                "high_price": 100, "low_price": 100,
+                "acc_trade_price": 1000 * self.ticker_count,
+                "acc_trade_volume": 10 * self.ticker_count,
+            } for market in params["markets"].split(",")]
+        else:
+            self.candle_markets.append(params["market"])
+            response.json.return_value = [{
+                "market": params["market"], "candle_date_time_kst": "2020-03-10T22:52:00",
+                "opening_price": 100, "high_price": 100, "low_price": 100,
+                "trade_price": 100, "candle_acc_trade_price": 1000,
+                "candle_acc_trade_volume": 10,
+            }]
+        return response
+
+    def test_first_tick_fetch_every_market_once_without_second_ticker_request(self):
+        hub = MarketDataHub(batch=True)
+        subscriptions = [hub.subscribe("UPB", currency, 60) for currency in ("BTC", "ETH", "XRP")]
+
+        for subscription in subscriptions:
+            self.assertEqual(subscription.get_info()[0]["date_time"], "2020-03-10T22:52:00")
+
+        # 첫 틱은 직전 현재가가 없어 모든 시장을 개별 조회하고 현재가 요청은 한 번만 보낸다
+        self.assertEqual(self.ticker_count, 1)
+        self.assertCountEqual(self.candle_markets, ["KRW-BTC", "KRW-ETH", "KRW-XRP"])
+
+        for feed in hub.feeds.values():
+            feed._fetched_at -= hub.max_age
+        infos = [subscription.get_info()[0] for subscription in subscriptions]
+
+        self.assertEqual(self.ticker_count, 2)
+        self.assertEqual(len(self.candle_markets), 3)
+        self.assertEqual([info["acc_volume"] for info in infos], [10, 10, 10])
+
+
+class MarketDataSubscriptionTests(unittest.TestCase):
+    def test_get_exchange_providers_unwrap_subscription(self):
+        hub = MarketDataHub()
+        subscription = hub.subscribe("UPB", "BTC", 60)
+
+        providers = DataProviderFactory.get_exchange_providers(subscription)
+
+        self.assertEqual(len(providers), 1)
+        self.assertIsInstance(providers[0], UpbitDataProvider)
+
+
+class MarketDataHubStreamTests(unittest.TestCase):
+    @patch("smtm.data.data_provider_factory.DataProviderFactory.create")
+    def test_subscribe_use_stream_provider_without_cache_and_close_it(self, mock_create):
+        provider = CountingProvider()
+        provider.close = MagicMock()
+        mock_create.return_value = provider
+        hub = MarketDataHub(max_age=10, stream=True)
+
+        subscription = hub.subscribe("UPB", "BTC", 60)
+        subscription.get_info()
+        subscription.get_info()
+        hub.unsubscribe(subscription)
+
+        self.assertEqual(mock_create.call_args[0][0], "UPS")
+        self.assertEqual(provider.count, 2)
+        provider.close.assert_called_once_with()
+
+    @patch("smtm.data.data_provider_factory.DataProviderFactory.create")
+    def test_subscribe_keep_rest_provider_for_exchange_without_stream(self, mock_create):
+        mock_create.return_value = CountingProvider()
+        hub = MarketDataHub(stream=True)
+
+        hub.subscribe("BTH", "BTC", 60)
+
+        self.assertEqual(mock_create.call_args[0][0], "BTH")
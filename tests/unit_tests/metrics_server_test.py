@@ -0,0 +1,98 @@
+import re
+import unittest
+import urllib.error
+import urllib.request
+from unittest.mock import MagicMock
+from smtm.latency_metrics import TickMetrics
+from smtm.llm.system_monitor import SystemMonitor
+from smtm.metrics_server import MetricsServer
+
+
+def make_session(name="s1", state="running"):
+    metrics = TickMetrics()
+    metrics.record("data_provider", 0.05)
+    metrics.record("strategy", 1.5)
+    metrics.record("order_fill", 0.2)
+    metrics.increment("safety_blocked", 2)
+    operator = MagicMock(metrics=metrics)
+    operator.get_tick_stats.return_value = {
+        "tick_count": 3, "coalesced_count": 1, "last_lateness": 0.31,
+        "max_lateness": 0.5, "avg_lateness": 0.4, "interval": 60.0,
+    }
+    session = MagicMock(state=state, operator=operator)
+    session.name = name
+    return session
+
+
+class MetricsServerRenderTests(unittest.TestCase):
+    def setUp(self):
+        session = make_session()
+        manager = MagicMock(sessions={"s1": session})
+        monitor = SystemMonitor(storage_path=None)
+        monitor.log_llm_interaction({}, "ok", {"input_tokens": 10, "output_tokens": 4})
+        self.text = MetricsServer(manager, monitor).render()
+
+    def _value(self, sample):
+        match = re.search(rf"^{re.escape(sample)} (\S+)$", self.text, re.MULTILINE)
+        self.assertIsNotNone(match, sample)
+        return float(match.group(1))
+
+    def test_tick_stage_histogram(self):
+        self.assertIn("# TYPE smtm_tick_stage_seconds histogram", self.text)
+        self.assertEqual(self._value(
+            'smtm_tick_stage_seconds_bucket{session="s1",stage="strategy",le="+Inf"}'), 1)
+        self.assertEqual(self._value(
+            'smtm_tick_stage_seconds_sum{session="s1",stage="strategy"}'), 1.5)
+        self.assertEqual(self._value(
+            'smtm_tick_stage_seconds_count{session="s1",stage="data_provider"}'), 1)
+
+    def test_buckets_are_cumulative(self):
+        values = [float(v) for v in re.findall(
+            r'^smtm_tick_stage_seconds_bucket\{session="s1",stage="strategy",le="[^"]+"\} (\S+)$',
+            self.text, re.MULTILINE)]
+        self.assertEqual(values, sorted(values))
+        self.assertEqual(values[0], 0)
+
+    def test_session_counters_and_gauges(self):
+        self.assertEqual(self._value('smtm_order_fill_seconds_count{session="s1"}'), 1)
+        self.assertEqual(self._value('smtm_safety_blocked_total{session="s1"}'), 2)
+        self.assertEqual(self._value('smtm_session_running{session="s1"}'), 1)
+        self.assertEqual(self._value('smtm_coalesced_ticks_total{session="s1"}'), 1)
+        self.assertEqual(self._value('smtm_tick_lateness_seconds{session="s1"}'), 0.31)
+
+    def test_monitor_llm_and_process_metrics(self):
+        self.assertEqual(self._value("smtm_llm_input_tokens_total"), 10)
+        self.assertEqual(self._value("smtm_llm_calls_total"), 1)
+        self.assertEqual(self._value('smtm_monitor_log_records{log="llm_interaction_log"}'), 1)
+        self.assertGreater(self._value("smtm_threads"), 0)
+
+    def test_each_family_has_single_help_and_type(self):
+        types = re.findall(r"^# TYPE (\S+) ", self.text, re.MULTILINE)
+        self.assertEqual(len(types), len(set(types)))
+
+    def test_collect_error_does_not_break_other_metrics(self):
+        manager = MagicMock()
+        manager.sessions.values.side_effect = RuntimeError("boom")
+        text = MetricsServer(manager, None).render()
+        self.assertIn("smtm_threads", text)
+
+
+class MetricsServerHttpTests(unittest.TestCase):
+    def setUp(self):
+        self.server = MetricsServer(port=0)
+        self.server.start()
+        self.addCleanup(self.server.stop)
+
+    def test_serve_metrics(self):
+        url = f"http://127.0.0.1:{self.server.port}/metrics"
+        with urllib.request.urlopen(url, timeout=5) as response:
+            body = response.read().decode("utf-8")
+            content_type = response.headers["Content-Type"]
+
+        self.assertTrue(content_type.startswith("text/plain; version=0.0.4"))
+        self.assertIn("# TYPE smtm_threads gauge", body)
+
+    def test_unknown_path_is_not_found(self):
+        with self.assertRaises(urllib.error.HTTPError) as ctx:
+            urllib.request.urlopen(f"http://127.0.0.1:{self.server.port}/", timeout=5)
+        self.assertEqual(ctx.exception.code, 404)
@@ -0,0 +1,62 @@
+import unittest
+from smtm import Backtester, StrategySma
+from smtm.optimizer import ParameterOptimizer
+
+UPBIT_DATA = "tests/unit_tests/data/upbit_1m_20200220_170000-20200220_202000.json"
+
+
+class ParameterOptimizerTests(unittest.TestCase):
+    def setUp(self):
+        self.candles = Backtester.load_candles(UPBIT_DATA, source="upbit")
+
+    def test_create_strategy_override_class_parameters(self):
+        strategy = ParameterOptimizer.create_strategy("SMA", {"SHORT": 5, "LONG": 30})
+        self.assertIsInstance(strategy, StrategySma)
+        self.assertEqual(strategy.SHORT, 5)
+        self.assertEqual(strategy.sma_short.window, 5)
+        self.assertEqual(strategy.sma_long.window, 30)
+        self.assertEqual(StrategySma.SHORT, 10)
+
+    def test_create_strategy_raise_error_when_parameter_is_unknown(self):
+        with self.assertRaises(ValueError):
+            ParameterOptimizer.create_strategy("SMA", {"mango": 1})
+        with self.assertRaises(ValueError):
+            ParameterOptimizer.create_strategy("SMA", {"RSI_LOW": 1})
+
+    def test_init_raise_error_when_strategy_code_is_invalid(self):
+        with self.assertRaises(ValueError):
+            ParameterOptimizer("mango", self.candles)
+
+    def test_grid_search_return_sorted_result_for_every_combination(self):
+        optimizer = ParameterOptimizer("RSI", self.candles, budget=1000000, max_workers=2)
+        results = optimizer.grid_search({"RSI_LOW": [25, 30], "RSI_HIGH": [65, 70, 75]})
+
+        self.assertEqual(len(results), 6)
+        for row in results:
+            self.assertIn("cumulative_return", row)
+            self.assertIn("max_drawdown", row)
+            self.assertIn("total_trades", row)
+        returns = [row["cumulative_return"] for row in results]
+        self.assertEqual(returns, sorted(returns, reverse=True))
+
+        expected = Backtester(
+            ParameterOptimizer.create_strategy("RSI", results[0]["params"]), budget=1000000
+        ).run(self.candles)
+        self.assertEqual(results[0]["cumulative_return"], expected["cumulative_return"])
+        self.assertEqual(results[0]["total_trades"], expected["total_trades"])
+
+    def test_grid_search_keep_error_of_failed_combination(self):
+        optimizer = ParameterOptimizer("SMA", self.candles, max_workers=1)
+        results = optimizer.grid_search({"SHORT": [0, 5]})
+        self.assertEqual(len(results), 2)
+        self.assertIn("cumulative_return", results[0])
+        self.assertEqual(results[1]["params"], {"SHORT": 0})
+        self.assertIn("error", results[1])
+
+    def test_random_search_run_requested_count_of_combinations(self):
+        optimizer = ParameterOptimizer("RSI", self.candles, max_workers=1)
+        results = optimizer.random_search(
+            {"RSI_LOW": [20, 25, 30], "RSI_HIGH": [70, 75, 80]}, 3, seed=1
+        )
+        self.assertEqual(len(results), 3)
+        self.assertEqual(len({str(row["params"]) for row in results}), 3)
@@ -0,0 +1,114 @@
+import unittest
+from unittest.mock import MagicMock, patch
+from smtm.trader.order_status_poller import OrderStatusPoller
+
+
+class FakeTrader:
+    SUPPORTS_ORDER_BATCH = True
+
+    def __init__(self, order_ids):
+        self.order_ids = list(order_ids)
+        self.worker = MagicMock()
+        self._query_order_batch = MagicMock(
+            side_effect=lambda ids: {order_id: {"uuid": order_id} for order_id in ids}
+        )
+
+    def get_open_order_ids(self):
+        return list(self.order_ids)
+
+    def _update_order_result(self, task):
+        pass
+
+
+class NoBatchTrader(FakeTrader):
+    SUPPORTS_ORDER_BATCH = False
+
+
+@patch("threading.Timer")
+class OrderStatusPollerTests(unittest.TestCase):
+    def test_register_starts_one_timer_for_all_traders(self, mock_timer):
+        poller = OrderStatusPoller(interval=5)
+
+        poller.register(FakeTrader(["a"]))
+        poller.register(FakeTrader(["b"]))
+
+        mock_timer.assert_called_once_with(5, poller.poll)
+        self.assertEqual(len(poller.traders), 2)
+
+    def test_poll_issues_one_batched_query_and_routes_results(self, mock_timer):
+        poller = OrderStatusPoller(interval=5)
+        first = FakeTrader(["a", "b"])
+        second = FakeTrader(["c"])
+        poller.register(first)
+        poller.register(second)
+
+        poller.poll()
+
+        first._query_order_batch.assert_called_once_with(["a", "b", "c"])
+        second._query_order_batch.assert_not_called()
+        first.worker.post_task.assert_called_once_with({
+            "runnable": first._update_order_result,
+            "order_results": [{"uuid": "a"}, {"uuid": "b"}],
+        })
+        second.worker.post_task.assert_called_once_with({
+            "runnable": second._update_order_result,
+            "order_results": [{"uuid": "c"}],
+        })
+        self.assertEqual(poller.get_stats()["query_count"], 1)
+
+    def test_poll_without_batch_support_posts_per_trader_update(self, mock_timer):
+        poller = OrderStatusPoller(interval=5)
+        trader = NoBatchTrader(["a", "b"])
+        poller.register(trader)
+
+        poller.poll()
+
+        trader._query_order_batch.assert_not_called()
+        trader.worker.post_task.assert_called_once_with(
+            {"runnable": trader._update_order_result}
+        )
+        self.assertEqual(poller.get_stats()["query_count"], 2)
+
+    def test_poll_keeps_orders_when_batched_query_fails(self, mock_timer):
+        poller = OrderStatusPoller(interval=5)
+        trader = FakeTrader(["a"])
+        trader._query_order_batch = MagicMock(return_value=None)
+        poller.register(trader)
+
+        poller.poll()
+
+        trader.worker.post_task.assert_not_called()
+        self.assertEqual(poller.traders, [trader])
+        self.assertEqual(mock_timer.call_count, 2)
+
+    def test_poll_drops_traders_without_open_orders_and_stops(self, mock_timer):
+        poller = OrderStatusPoller(interval=5)
+        trader = FakeTrader(["a"])
+        poller.register(trader)
+        trader.order_ids = []
+
+        poller.poll()
+
+        self.assertEqual(poller.traders, [])
+        self.assertIsNone(poller.timer)
+        self.assertEqual(mock_timer.call_count, 1)
+
+    def test_get_interval_adapts_to_open_order_count(self, mock_timer):
+        poller = OrderStatusPoller(interval=5)
+
+        self.assertEqual(poller.get_interval(1, batched=True), 5)
+        self.assertAlmostEqual(poller.get_interval(4, batched=True), 2.5)
+        self.assertEqual(poller.get_interval(100, batched=True), poller.MIN_INTERVAL)
+        self.assertEqual(poller.get_interval(4, batched=False), 5)
+        self.assertEqual(poller.get_interval(10, batched=False), 10)
+        self.assertEqual(poller.get_interval(1000, batched=False), poller.MAX_INTERVAL)
+
+    def test_unregister_cancels_timer_when_no_trader_remains(self, mock_timer):
+        poller = OrderStatusPoller(interval=5)
+        trader = FakeTrader(["a"])
+        poller.register(trader)
+
+        poller.unregister(trader)
+
+        mock_timer.return_value.cancel.assert_called_once()
+        self.assertIsNone(poller.timer)
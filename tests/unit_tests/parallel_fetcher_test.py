@@ -0,0 +1,124 @@
+import threading
+import time
+import unittest
+from unittest.mock import *
+from smtm.data.parallel_fetcher import ParallelFetcher
+
+
+class FakeProvider:
+    def __init__(self, items, delay=0, error=None, barrier=None):
+        self.items = items
+        self.delay = delay
+        self.error = error
+        self.barrier = barrier
+
+    def get_info(self):
+        if self.barrier is not None:
+            self.barrier.wait()
+        if self.delay:
+            time.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return self.items
+
+
+class SlowProvider(FakeProvider):
+    pass
+
+
+class NestedProvider:
+    def __init__(self, children, barrier=None):
+        self.children = children
+        self.barrier = barrier
+        self.fetcher = ParallelFetcher(deadline=1)
+
+    def get_info(self):
+        if self.barrier is not None:
+            self.barrier.wait()
+        return self.fetcher.fetch(self.children)
+
+
+class ParallelFetcherTests(unittest.TestCase):
+    def test_fetch_return_results_in_provider_order(self):
+        fetcher = ParallelFetcher(deadline=2)
+        providers = [
+            FakeProvider([{"type": "a"}], delay=0.05),
+            FakeProvider([{"type": "b"}]),
+            FakeProvider([]),
+        ]
+
+        result = fetcher.fetch(providers)
+
+        self.assertEqual(result, [{"type": "a"}, {"type": "b"}])
+        self.assertCountEqual(
+            fetcher.latency.keys(), ["FakeProvider", "FakeProvider#1", "FakeProvider#2"]
+        )
+
+    def test_fetch_call_providers_concurrently(self):
+        fetcher = ParallelFetcher(deadline=2)
+        # 다섯 소스가 모두 동시에 get_info 안에 있어야 barrier를 통과한다
+        barrier = threading.Barrier(5, timeout=1)
+        providers = [FakeProvider([{"type": str(idx)}], barrier=barrier) for idx in range(5)]
+
+        result = fetcher.fetch(providers)
+
+        self.assertEqual(len(result), 5)
+        self.assertFalse(barrier.broken)
+
+    def test_fetch_drop_provider_exceeding_deadline(self):
+        fetcher = ParallelFetcher(deadline=0.1)
+        release = threading.Event()
+        slow = SlowProvider([{"type": "slow"}])
+        slow.get_info = lambda: release.wait(2) and [{"type": "slow"}]
+
+        result = fetcher.fetch([FakeProvider([{"type": "fast"}]), slow])
+
+        self.assertEqual(result, [{"type": "fast"}])
+        self.assertIsNone(fetcher.latency["SlowProvider"])
+        self.assertIsNotNone(fetcher.latency["FakeProvider"])
+
+        # 이전 요청이 끝나지 않은 소스는 다시 요청하지 않는다
+        slow.get_info = MagicMock(return_value=[])
+        fetcher.fetch([slow])
+        slow.get_info.assert_not_called()
+        release.set()
+
+    def test_fetch_ignore_failed_provider(self):
+        fetcher = ParallelFetcher(deadline=2)
+        result = fetcher.fetch([
+            FakeProvider(None, error=UserWarning("fail")),
+            FakeProvider([{"type": "ok"}]),
+        ])
+        self.assertEqual(result, [{"type": "ok"}])
+
+    def test_run_record_latency_and_propagate_error(self):
+        fetcher = ParallelFetcher()
+        self.assertEqual(fetcher.run(FakeProvider([{"type": "a"}])), [{"type": "a"}])
+        self.assertIn("FakeProvider", fetcher.latency)
+
+        with self.assertRaises(UserWarning):
+            fetcher.run(FakeProvider(None, error=UserWarning("fail")))
+
+    def test_fetch_nested_composites_more_than_pool_workers(self):
+        fetcher = ParallelFetcher(deadline=3)
+        workers = ParallelFetcher.MAX_WORKERS
+        # 풀 워커가 모두 복합 소스를 잡은 뒤에야 하위 소스를 요청하도록 한다
+        barrier = threading.Barrier(workers, timeout=2)
+        providers = [
+            NestedProvider(
+                [FakeProvider([{"type": idx}]), FakeProvider([{"type": idx}])],
+                barrier if idx < workers else None,
+            )
+            for idx in range(workers + 4)
+        ]
+
+        with patch.object(ParallelFetcher, "_executor", None):
+            try:
+                result = fetcher.fetch(providers)
+            finally:
+                ParallelFetcher.get_executor().shutdown(wait=False)
+
+        self.assertEqual(len(result), len(providers) * 2)
+        self.assertNotIn(None, fetcher.latency.values())
+        for provider in providers:
+            self.assertNotIn(None, provider.fetcher.latency.values())
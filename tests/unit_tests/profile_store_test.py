@@ -85,3 +85,9 @@ class ProfileStoreTests(unittest.TestCase):
         profile = {**PROFILE, "account": "main"}
         self.store.save(profile)
         self.assertEqual(self.store.load(PROFILE["name"])["account"], "main")
+
+    def test_operator_mode_field_is_validated(self):
+        self.store.save({**PROFILE, "operator_mode": "shared"})
+        self.assertEqual(self.store.load(PROFILE["name"])["operator_mode"], "shared")
+        with self.assertRaises(ValueError):
+            self.store.save({**PROFILE, "operator_mode": "fiber"})
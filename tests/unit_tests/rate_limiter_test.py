@@ -0,0 +1,143 @@
+import json
+import unittest
+from unittest.mock import *
+from smtm.rate_limiter import RateLimiter, TokenBucket
+
+
+class TokenBucketTests(unittest.TestCase):
+    def test_reserve_returns_wait_time_when_tokens_run_out(self):
+        bucket = TokenBucket(10, 1)
+        bucket.updated = 100
+
+        waits = [bucket.reserve(1, 100) for _ in range(12)]
+
+        self.assertEqual(waits[:10], [0.0] * 10)
+        self.assertAlmostEqual(waits[10], 0.1)
+        self.assertAlmostEqual(waits[11], 0.2)
+
+    def test_reserve_refills_over_time(self):
+        bucket = TokenBucket(10, 1)
+        bucket.updated = 100
+        for _ in range(10):
+            bucket.reserve(1, 100)
+
+        self.assertEqual(bucket.reserve(1, 100.5), 0.0)
+
+    def test_sync_lowers_tokens_to_remaining(self):
+        bucket = TokenBucket(10, 1)
+        bucket.updated = 100
+
+        bucket.sync(0, 100)
+
+        self.assertAlmostEqual(bucket.reserve(1, 100), 0.1)
+
+
+class RateLimiterClassifyTests(unittest.TestCase):
+    def setUp(self):
+        self.limiter = RateLimiter()
+
+    def test_classify_upbit_public_and_private_groups(self):
+        self.assertEqual(
+            self.limiter.classify("https://api.upbit.com/v1/candles/minutes/1"),
+            [(("upbit", "candles", False), 1)],
+        )
+        self.assertEqual(
+            self.limiter.classify(
+                "https://api.upbit.com/v1/orders", "POST", {"Authorization": "Bearer x"}
+            ),
+            [(("upbit", "order", True), 1)],
+        )
+        self.assertEqual(
+            self.limiter.classify(
+                "https://api.upbit.com/v1/orders", "GET", {"Authorization": "Bearer x"}
+            ),
+            [(("upbit", "default", True), 1)],
+        )
+
+    def test_classify_binance_uses_request_weight(self):
+        self.assertEqual(
+            self.limiter.classify("https://api.binance.com/api/v3/klines"),
+            [(("binance", "weight", False), 2)],
+        )
+        self.assertEqual(
+            self.limiter.classify("https://api.binance.com/api/v3/order", "POST"),
+            [(("binance", "weight", False), 1), (("binance", "order", True), 1)],
+        )
+        self.assertEqual(
+            self.limiter.classify("https://api.binance.com/api/v3/order", "GET"),
+            [(("binance", "weight", False), 4)],
+        )
+
+    def test_classify_binance_rolling_ticker_weight_per_symbol(self):
+        url = "https://api.binance.com/api/v3/ticker"
+
+        self.assertEqual(
+            self.limiter.classify(url, params={"symbols": '["BTCUSDT","ETHUSDT","XRPUSDT"]'}),
+            [(("binance", "weight", False), 12)],
+        )
+        self.assertEqual(
+            self.limiter.classify(url, params={"symbol": "BTCUSDT"}),
+            [(("binance", "weight", False), 4)],
+        )
+        symbols = json.dumps([f"S{i}USDT" for i in range(60)])
+        self.assertEqual(
+            self.limiter.classify(url, params={"symbols": symbols}),
+            [(("binance", "weight", False), 200)],
+        )
+        self.assertEqual(
+            self.limiter.classify("https://api.binance.com/api/v3/ticker/price"),
+            [(("binance", "weight", False), 2)],
+        )
+
+    def test_classify_unknown_host_is_not_limited(self):
+        self.assertEqual(self.limiter.classify("https://example.com/a"), [])
+        self.assertEqual(self.limiter.acquire("https://example.com/a"), 0.0)
+
+
+@patch("time.sleep")
+class RateLimiterAcquireTests(unittest.TestCase):
+    def setUp(self):
+        self.limiter = RateLimiter()
+        self.url = "https://api.upbit.com/v1/candles/minutes/1"
+
+    def test_acquire_delays_calls_over_quota_and_reports_stats(self, mock_sleep):
+        with patch("time.monotonic", return_value=100):
+            waits = [self.limiter.acquire(self.url) for _ in range(11)]
+
+        self.assertEqual(waits[:10], [0.0] * 10)
+        self.assertAlmostEqual(waits[10], 0.1)
+        mock_sleep.assert_called_once_with(waits[10])
+        stats = self.limiter.get_stats()["upbit:candles:public"]
+        self.assertEqual(stats["calls"], 11)
+        self.assertEqual(stats["delayed_calls"], 1)
+        self.assertAlmostEqual(stats["max_wait"], 0.1)
+
+    def test_update_syncs_upbit_remaining_req(self, mock_sleep):
+        response = MagicMock(
+            status_code=200, headers={"Remaining-Req": "group=candles; min=500; sec=0"}
+        )
+        with patch("time.monotonic", return_value=100):
+            self.limiter.acquire(self.url)
+            self.limiter.update(self.url, response=response)
+            wait = self.limiter.acquire(self.url)
+
+        self.assertAlmostEqual(wait, 0.1)
+
+    def test_update_syncs_binance_used_weight(self, mock_sleep):
+        url = "https://api.binance.com/api/v3/klines"
+        response = MagicMock(status_code=200, headers={"X-MBX-USED-WEIGHT-1M": "6000"})
+        with patch("time.monotonic", return_value=100):
+            self.limiter.acquire(url)
+            self.limiter.update(url, response=response)
+            wait = self.limiter.acquire(url)
+
+        # 분당 6000 가중치 = 초당 100, 가중치 2를 기다린다
+        self.assertAlmostEqual(wait, 0.02)
+
+    def test_update_empties_buckets_on_429(self, mock_sleep):
+        with patch("time.monotonic", return_value=100):
+            self.limiter.acquire(self.url)
+            self.limiter.update(self.url, response=MagicMock(status_code=429, headers={}))
+            wait = self.limiter.acquire(self.url)
+
+        self.assertGreater(wait, 0)
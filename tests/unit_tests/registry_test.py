@@ -0,0 +1,79 @@
+import unittest
+from unittest.mock import MagicMock, patch
+from smtm.registry import Registry
+from smtm.worker import Worker
+
+
+class PluginStrategy:
+    NAME = "Plugin"
+    CODE = "PLG"
+
+
+def make_entry_point(name, loaded=None, error=None):
+    entry_point = MagicMock()
+    entry_point.name = name
+    if error is not None:
+        entry_point.load.side_effect = error
+    else:
+        entry_point.load.return_value = loaded
+    return entry_point
+
+
+class RegistryTests(unittest.TestCase):
+    def setUp(self):
+        self.registry = Registry("smtm.tests", {"WRK": (".worker", "Worker")}, "smtm")
+        patcher = patch("smtm.registry._get_entry_points", return_value=[])
+        self.get_entry_points = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_builtin_code_does_not_read_entry_points(self):
+        self.assertIs(self.registry.get("WRK"), Worker)
+        self.assertIs(self.registry.get("WRK"), Worker)
+        self.get_entry_points.assert_not_called()
+
+    def test_plugin_is_discovered_once_and_loaded_on_request(self):
+        plugin = make_entry_point("PLG", loaded=PluginStrategy)
+        self.get_entry_points.return_value = [plugin]
+
+        self.assertIn("PLG", self.registry)
+        plugin.load.assert_not_called()
+        self.assertIs(self.registry.get("PLG"), PluginStrategy)
+        self.assertIsNone(self.registry.get("NOPE"))
+
+        self.get_entry_points.assert_called_once_with("smtm.tests")
+        plugin.load.assert_called_once()
+
+    def test_plugin_cannot_replace_builtin_code(self):
+        self.get_entry_points.return_value = [make_entry_point("WRK", loaded=PluginStrategy)]
+        self.assertEqual(self.registry.codes(), ["WRK"])
+        self.assertIs(self.registry.get("WRK"), Worker)
+
+    def test_broken_plugin_is_treated_as_missing(self):
+        self.get_entry_points.return_value = [
+            make_entry_point("BAD", error=ImportError("no module")),
+            make_entry_point("PLG", loaded=PluginStrategy),
+        ]
+        self.assertIsNone(self.registry.get("BAD"))
+        self.assertIs(self.registry.get("PLG"), PluginStrategy)
+
+    def test_codes_lists_builtins_before_plugins(self):
+        self.get_entry_points.return_value = [make_entry_point("PLG", loaded=PluginStrategy)]
+        self.assertEqual(list(self.registry), ["WRK", "PLG"])
+
+    def test_register_adds_class_directly(self):
+        self.registry.register("PLG", PluginStrategy)
+        self.assertIs(self.registry.get("PLG"), PluginStrategy)
+
+
+class FactoryPluginTests(unittest.TestCase):
+    def test_strategy_factory_creates_plugin_strategy(self):
+        from smtm.strategy.strategy_factory import StrategyFactory
+
+        registry = Registry("smtm.strategies", {}, "smtm.strategy")
+        with patch.object(StrategyFactory, "REGISTRY", registry), \
+                patch("smtm.registry._get_entry_points",
+                      return_value=[make_entry_point("PLG", loaded=PluginStrategy)]):
+            self.assertIsInstance(StrategyFactory.create("PLG"), PluginStrategy)
+            self.assertEqual(StrategyFactory.get_name("PLG"), "Plugin")
+            self.assertEqual(
+                [info["code"] for info in StrategyFactory.get_all_strategy_info()], ["PLG"])
@@ -65,6 +65,25 @@ class SessionManagerVirtualTests(unittest.TestCase):
         self.manager.stop_session("v1")
         self.manager.stop_session("v2")
 
+    def test_shared_operator_mode_uses_async_trading_operator(self):
+        from smtm import AsyncTradingOperator, TradingOperator
+
+        self.manager.create_session({**VIRTUAL_PROFILE, "operator_mode": "shared"})
+        self.manager.create_session({**VIRTUAL_PROFILE, "name": "v2"})
+        # 이전 이름인 async도 같은 방식으로 실행한다
+        self.manager.create_session({**VIRTUAL_PROFILE, "name": "v3", "operator_mode": "async"})
+
+        self.assertIsInstance(self.manager.get_session("v1").operator, AsyncTradingOperator)
+        self.assertIs(type(self.manager.get_session("v2").operator), TradingOperator)
+        self.assertIsInstance(self.manager.get_session("v3").operator, AsyncTradingOperator)
+
+    def test_event_operator_mode_uses_event_trading_operator(self):
+        from smtm import EventTradingOperator
+
+        self.manager.create_session({**VIRTUAL_PROFILE, "operator_mode": "event"})
+
+        self.assertIsInstance(self.manager.get_session("v1").operator, EventTradingOperator)
+
     def test_duplicate_name_rejected(self):
         self.manager.create_session(VIRTUAL_PROFILE)
         result = self.manager.create_session(VIRTUAL_PROFILE)
@@ -107,6 +126,22 @@ class SessionManagerVirtualTests(unittest.TestCase):
         rows = self.manager.compare_performance()
         self.assertEqual(rows[0]["total_trades"], 1)
 
+    def test_latency_report_and_export(self):
+        self.manager.create_session(VIRTUAL_PROFILE)
+        operator = self.manager.get_session("v1").operator
+        operator.metrics.record("strategy", 0.2)
+
+        status = self.manager.get_session_status("v1")
+        self.assertEqual(status["latency"]["strategy"]["count"], 1)
+        self.assertIsNone(status["tick"])
+
+        path = os.path.join(self.tmp.name, "metrics", "latency.json")
+        dump = self.manager.export_metrics(path)
+        self.assertTrue(os.path.exists(path))
+        self.assertEqual(dump["sessions"]["v1"]["latency"]["strategy"]["max"], 0.2)
+        with self.assertRaises(ValueError):
+            self.manager.get_latency_report("missing")
+
     def test_replace_session_preserves_daily_count_and_rolls_back(self):
         self.manager.create_session(VIRTUAL_PROFILE)
         self.manager.get_session("v1").session_guard.record_trade({})
@@ -131,6 +166,94 @@ class SessionManagerVirtualTests(unittest.TestCase):
         self.assertEqual(self.manager.list_sessions(), [])
 
 
+class SessionManagerMarketDataHubTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.manager, self.store = make_manager(self.tmp.name)
+        patcher = patch(
+            "smtm.data.data_provider_factory.DataProviderFactory.create",
+            side_effect=lambda *a, **k: StubDataProvider())
+        self.mock_create = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.manager.stop_all()
+        self.tmp.cleanup()
+
+    def test_sessions_on_same_market_share_data_provider(self):
+        self.manager.create_session(VIRTUAL_PROFILE)
+        self.manager.create_session({**VIRTUAL_PROFILE, "name": "v2"})
+        self.manager.create_session({**VIRTUAL_PROFILE, "name": "v3", "currency": "ETH"})
+
+        s1 = self.manager.get_session("v1").operator.data_provider
+        s2 = self.manager.get_session("v2").operator.data_provider
+        self.assertIs(s1.provider, s2.provider)
+        self.assertEqual(self.mock_create.call_count, 2)
+
+    def test_remove_session_releases_subscription(self):
+        self.manager.create_session(VIRTUAL_PROFILE)
+        self.manager.create_session({**VIRTUAL_PROFILE, "name": "v2"})
+
+        self.manager.remove_session("v1")
+        self.assertEqual(self.manager.market_data_hub.get_stats()[0]["subscribers"], 1)
+        self.manager.remove_session("v2")
+        self.assertEqual(self.manager.market_data_hub.get_stats(), [])
+
+    def test_failed_assemble_releases_subscription(self):
+        result = self.manager.create_session({**VIRTUAL_PROFILE, "strategy": "NOPE"})
+        self.assertFalse(result["success"])
+        self.assertEqual(self.manager.market_data_hub.get_stats(), [])
+
+    def test_replace_session_keeps_one_subscription(self):
+        self.manager.create_session(VIRTUAL_PROFILE)
+        result = self.manager.replace_session(
+            "v1", {**VIRTUAL_PROFILE, "strategy": "RSI"})
+        self.assertTrue(result["success"])
+        self.assertEqual(self.manager.market_data_hub.get_stats()[0]["subscribers"], 1)
+
+
+class SessionManagerWarmUpTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.manager, self.store = make_manager(self.tmp.name)
+
+    def tearDown(self):
+        self.manager.stop_all()
+        self.tmp.cleanup()
+
+    def _candles(self, count):
+        return [{
+            "type": "primary_candle", "market": "BTC",
+            "date_time": f"2026-07-06T11:{idx:02d}:00",
+            "opening_price": 50000, "high_price": 51000, "low_price": 49000,
+            "closing_price": 50000 + (idx % 3) * 100, "acc_price": 0, "acc_volume": 0,
+        } for idx in range(count)]
+
+    @patch("smtm.data.upbit_data_provider.UpbitDataProvider.get_recent_candles")
+    def test_create_session_warms_up_strategy_with_recent_candles(self, mock_recent):
+        mock_recent.side_effect = self._candles
+        result = self.manager.create_session(
+            {**VIRTUAL_PROFILE, "strategy": "RSI"})
+        self.assertTrue(result["success"])
+        strategy = self.manager.get_session("v1").operator.strategy
+        mock_recent.assert_called_once_with(strategy.get_warmup_count())
+        self.assertEqual(len(strategy.data), strategy.get_warmup_count())
+
+    @patch("smtm.data.upbit_data_provider.UpbitDataProvider.get_recent_candles")
+    def test_create_session_succeeds_when_warmup_load_fails(self, mock_recent):
+        mock_recent.side_effect = UserWarning("Fail get data from sever")
+        result = self.manager.create_session(
+            {**VIRTUAL_PROFILE, "strategy": "RSI"})
+        self.assertTrue(result["success"])
+        self.assertEqual(self.manager.get_session("v1").operator.strategy.data, [])
+
+    @patch("smtm.data.upbit_data_provider.UpbitDataProvider.get_recent_candles")
+    def test_create_session_skips_warmup_for_strategy_without_indicators(self, mock_recent):
+        result = self.manager.create_session(VIRTUAL_PROFILE)
+        self.assertTrue(result["success"])
+        mock_recent.assert_not_called()
+
+
 class SessionManagerRealTradeValidationTests(unittest.TestCase):
     """실거래 검증 경로 — Trader/잔고는 전부 mock"""
 
@@ -268,3 +391,34 @@ class SessionManagerRealTradeValidationTests(unittest.TestCase):
                  "date_time": "2026-07-06T12:00:00"})
             self.assertFalse(verdict.allowed)
             self.assertIn("계좌 일일 거래횟수", verdict.reason)
+
+
+@patch.dict(os.environ, {
+    "UPBIT_OPEN_API_ACCESS_KEY": "k",
+    "UPBIT_OPEN_API_SECRET_KEY": "s",
+    "UPBIT_OPEN_API_SERVER_URL": "http://test_server",
+})
+class SessionManagerOrderPollerTests(unittest.TestCase):
+    def test_traders_on_same_account_share_order_poller(self):
+        from smtm import UpbitTrader
+
+        manager = SessionManager()
+        traders = [UpbitTrader(currency="BTC"), UpbitTrader(currency="ETH")]
+        for trader in traders:
+            self.addCleanup(trader.worker.stop)
+            manager._attach_order_poller(trader)
+
+        self.assertIsNotNone(traders[0].order_poller)
+        self.assertIs(traders[0].order_poller, traders[1].order_poller)
+        self.assertEqual(len(manager.order_pollers), 1)
+
+    def test_virtual_trader_has_no_order_poller(self):
+        from smtm.trader.simulation_trader import SimulationTrader
+
+        manager = SessionManager()
+        trader = SimulationTrader()
+
+        manager._attach_order_poller(trader)
+
+        self.assertFalse(hasattr(trader, "order_poller"))
+        self.assertEqual(manager.order_pollers, {})
@@ -96,6 +96,19 @@ class SimulationTraderSellTest(unittest.TestCase):
         self.assertEqual(trader.balance, 499600)
         self.assertEqual(trader.assets["BTC"], (50000, 0.01))
 
+    def test_buy_and_sell_charge_commission(self):
+        trader = SimulationTrader(budget=500000, currency="BTC", commission_ratio=0.001)
+        trader.update_quote("BTC", 50000)
+        trader.send_request([
+            {"id": "1", "type": "buy", "price": 50000, "amount": 0.02}
+        ], lambda result: None)
+        self.assertAlmostEqual(trader.balance, 500000 - 1000 - 1)
+
+        trader.send_request([
+            {"id": "2", "type": "sell", "price": 50000, "amount": 0.02}
+        ], lambda result: None)
+        self.assertAlmostEqual(trader.balance, 500000 - 2)
+
     def test_sell_removes_asset_when_amount_goes_to_zero(self):
         trader = SimulationTrader(budget=500000, currency="BTC")
         trader.update_quote("BTC", 50000)
@@ -20,3 +20,8 @@ class StrategyFactoryTests(unittest.TestCase):
         self.assertIn("BNH", codes)
         self.assertIn("RSI", codes)
         self.assertIn("SMA", codes)
+
+    def test_registry_codes_match_class_codes(self):
+        for code in StrategyFactory.REGISTRY:
+            self.assertEqual(StrategyFactory.get_class(code).CODE, code)
+        self.assertIsNone(StrategyFactory.get_class("NOPE"))
@@ -1,8 +1,54 @@
+import json
+import math
+import random
 import unittest
+import numpy as np
+import pandas as pd
 from smtm import StrategySma
 from unittest.mock import *
 
 
+class _PandasSmaReference:
+    """매 틱 전체 종가 리스트를 pandas rolling으로 다시 계산하던 기존 방식"""
+
+    def __init__(self, sma):
+        self.sma = sma
+        self.closing_price_list = []
+        self.current_process = "ready"
+        self.process_unit = (0, 0)
+        self.cross_info = [{"price": 0, "index": 0}, {"price": 0, "index": 0}]
+
+    def update(self, current_price):
+        sma = self.sma
+        current_idx = len(self.closing_price_list)
+        self.closing_price_list.append(current_price)
+        feeded_list = self.closing_price_list + [current_price] * sma.PREDICT_N
+        sma_short = pd.Series(feeded_list).rolling(sma.SHORT).mean().values[-1]
+        sma_mid = pd.Series(feeded_list).rolling(sma.MID).mean().values[-1]
+        sma_long_list = pd.Series(feeded_list).rolling(sma.LONG).mean().values
+        sma_long = sma_long_list[-1]
+        if np.isnan(sma_long) or current_idx + 1 < sma.LONG:
+            return
+
+        if sma_short > sma_mid > sma_long and self.current_process != "buy":
+            self.current_process = "buy"
+            self.process_unit = (round(sma.balance / sma.STEP), 0)
+            if current_idx > sma.LONG:
+                deviation_count = min(current_idx - sma.LONG, sma.STD_K)
+                std_ratio = sma._get_deviation_ratio(
+                    np.std(sma_long_list[-deviation_count:]), sma_long_list[-1]
+                )
+                if std_ratio > sma.STD_RATIO:
+                    self.cross_info[1] = {"price": 0, "index": current_idx}
+        elif sma_short < sma_mid < sma_long and self.current_process != "sell":
+            self.current_process = "sell"
+            self.process_unit = (0, sma.asset_amount / sma.STEP)
+        else:
+            return
+        self.cross_info[0] = self.cross_info[1]
+        self.cross_info[1] = {"price": current_price, "index": current_idx}
+
+
 class StrategySmaTests(unittest.TestCase):
     def setUp(self):
         pass
@@ -37,7 +83,7 @@ class StrategySmaTests(unittest.TestCase):
         sma.update_trading_info(dummy_info)
         self.assertEqual(sma.data.pop(), dummy_info[0])
 
-    def test_update_trading_info_append_closing_price(self):
+    def test_update_trading_info_update_moving_average(self):
         sma = StrategySma()
         sma.initialize(100, 10)
         dummy_info = [
@@ -49,191 +95,119 @@ class StrategySmaTests(unittest.TestCase):
             }
         ]
         sma.update_trading_info(dummy_info)
-        self.assertEqual(sma.closing_price_list.pop(), 500)
-
-    @patch("numpy.isnan")
-    @patch("pandas.Series")
-    def test_update_trading_info_update_process_when_long_gt_short(
-        self, mock_series, mock_np
-    ):
+        self.assertEqual(sma.closing_count, 1)
+        self.assertEqual(list(sma.sma_short.values), [500])
+        self.assertTrue(math.isnan(sma.sma_short.value))
+
+    @staticmethod
+    def _feed(sma, prices):
+        for price in prices:
+            sma.update_trading_info(
+                [
+                    {
+                        "type": "primary_candle",
+                        "market": "orange",
+                        "date_time": "2020-02-25T15:41:09",
+                        "closing_price": price,
+                    }
+                ]
+            )
+
+    def test_update_trading_info_update_process_when_long_gt_short(self):
         sma = StrategySma()
-
-        for i in range(sma.LONG):
-            sma.closing_price_list.append(500)
-
-        class DummyMean:
-            pass
-
-        dummy_mean_short = DummyMean()
-        dummy_mean_mid = DummyMean()
-        dummy_mean_long = DummyMean()
-
-        dummy_mean_short.values = [5]
-        dummy_mean_mid.values = [7]
-        dummy_mean_long.values = [10]
-
-        rolling_return_mock = MagicMock()
-        rolling_return_mock.mean.side_effect = [
-            dummy_mean_short,
-            dummy_mean_mid,
-            dummy_mean_long,
-            dummy_mean_short,
-            dummy_mean_mid,
-            dummy_mean_long,
-        ]
-        series_return = MagicMock()
-        series_return.rolling.return_value = rolling_return_mock
-        mock_series.return_value = series_return
-
-        dummy_info = [
-            {
-                "type": "primary_candle",
-                "market": "orange",
-                "date_time": "2020-02-25T15:41:09",
-                "closing_price": 500,
-            }
-        ]
-        mock_np.return_value = False
         sma.initialize(100, 10)
         sma.current_process = "buy"
         sma.asset_amount = 12
-        sma.update_trading_info(dummy_info)
+        prices = [1000 - i for i in range(sma.LONG)]
+        self._feed(sma, prices)
         self.assertEqual(sma.current_process, "sell")
         self.assertEqual(sma.process_unit[0], 0)
         self.assertEqual(sma.process_unit[1], 12 / sma.STEP)
 
         self.assertEqual(sma.cross_info[0], {"price": 0, "index": 0})
-        self.assertEqual(sma.cross_info[1], {"price": 500, "index": 60})
+        self.assertEqual(sma.cross_info[1], {"price": prices[-1], "index": 59})
 
         # current_process가 "sell" 일때는 업데이트 되지 않아야함
         sma.current_process = "sell"
         sma.asset_amount = 9
-        sma.update_trading_info(dummy_info)
+        self._feed(sma, [prices[-1] - 1])
         self.assertEqual(sma.current_process, "sell")
         self.assertEqual(sma.process_unit[0], 0)
         self.assertEqual(sma.process_unit[1], 12)  # 12 / STEP
 
-    @patch("numpy.isnan")
-    @patch("pandas.Series")
-    def test_update_trading_info_update_process_when_long_lt_short(
-        self, mock_series, mock_np
-    ):
+    def test_update_trading_info_update_process_when_long_lt_short(self):
         sma = StrategySma()
-
-        for i in range(sma.LONG):
-            sma.closing_price_list.append(500)
-
-        class DummyMean:
-            pass
-
-        dummy_mean_short = DummyMean()
-        dummy_mean_mid = DummyMean()
-        dummy_mean_long = DummyMean()
-
-        dummy_mean_short.values = [10]
-        dummy_mean_mid.values = [7]
-        dummy_mean_long.values = [5]
-
-        rolling_return_mock = MagicMock()
-        rolling_return_mock.mean.side_effect = [
-            dummy_mean_short,
-            dummy_mean_mid,
-            dummy_mean_long,
-            dummy_mean_short,
-            dummy_mean_mid,
-            dummy_mean_long,
-        ]
-        series_return = MagicMock()
-        series_return.rolling.return_value = rolling_return_mock
-        mock_series.return_value = series_return
-
-        dummy_info = [
-            {
-                "type": "primary_candle",
-                "market": "orange",
-                "date_time": "2020-02-25T15:41:09",
-                "closing_price": 500,
-            }
-        ]
-        mock_np.return_value = False
         sma.initialize(100, 10)
         sma.current_process = "sell"
         sma.balance = 90000
         expected_price = 90000 / sma.STEP
-        sma.update_trading_info(dummy_info)
+        prices = [1000 + i for i in range(sma.LONG)]
+        self._feed(sma, prices)
         self.assertEqual(sma.current_process, "buy")
         self.assertEqual(sma.process_unit[0], expected_price)
         self.assertEqual(sma.process_unit[1], 0)
 
         self.assertEqual(sma.cross_info[0], {"price": 0, "index": 0})
-        self.assertEqual(sma.cross_info[1], {"price": 500, "index": 60})
+        self.assertEqual(sma.cross_info[1], {"price": prices[-1], "index": 59})
 
         # current_process가 "buy" 일때는 업데이트 되지 않아야함
         sma.current_process = "buy"
         sma.balance = 90000
-        sma.update_trading_info(dummy_info)
+        self._feed(sma, [prices[-1] + 1])
         self.assertEqual(sma.current_process, "buy")
         self.assertEqual(sma.process_unit[0], 90000)  # 90000 / STEP
         self.assertEqual(sma.process_unit[1], 0)
 
-    @patch("numpy.isnan")
-    @patch("pandas.Series")
     def test_update_trading_info_update_process_and_cross_info_when_long_lt_short(
-        self, mock_series, mock_np
+        self,
     ):
         sma = StrategySma()
-
-        for i in range(sma.LONG + sma.STD_K):
-            sma.closing_price_list.append(500)
-
-        class DummyMean:
-            pass
-
-        dummy_mean_short = DummyMean()
-        dummy_mean_mid = DummyMean()
-        dummy_mean_long = DummyMean()
-
-        dummy_mean_short.values = [10]
-        dummy_mean_mid.values = [7]
-        dummy_mean_long.values = []
-
-        for i in range(sma.STD_K):
-            dummy_mean_long.values.append(i)
-
-        dummy_mean_long.values.append(5)
-
-        rolling_return_mock = MagicMock()
-        rolling_return_mock.mean.side_effect = [
-            dummy_mean_short,
-            dummy_mean_mid,
-            dummy_mean_long,
-            dummy_mean_short,
-            dummy_mean_mid,
-            dummy_mean_long,
-        ]
-        series_return = MagicMock()
-        series_return.rolling.return_value = rolling_return_mock
-        mock_series.return_value = series_return
-
-        dummy_info = [
-            {
-                "type": "primary_candle",
-                "market": "orange",
-                "date_time": "2020-02-25T15:41:09",
-                "closing_price": 500,
-            }
-        ]
-        mock_np.return_value = False
         sma.initialize(100, 10)
         sma.current_process = "sell"
         sma.balance = 90000
-        sma.update_trading_info(dummy_info)
-        self.assertEqual(sma.current_process, "buy")
+        # 장기 이동 평균이 크게 흔들린 뒤 매수 신호가 나면 표준 편차 때문에 매수를 건너뛴다
+        self._feed(sma, [1000 - i * 10 for i in range(sma.LONG + sma.STD_K)])
+        self.assertEqual(sma.current_process, "sell")
+        price = 200
+        while sma.current_process != "buy":
+            price += 50
+            self._feed(sma, [price])
+
+        index = sma.closing_count - 1
+        self.assertGreater(index, sma.LONG)
         self.assertEqual(sma.process_unit[0], 90000 / sma.STEP)
         self.assertEqual(sma.process_unit[1], 0)
 
-        self.assertEqual(sma.cross_info[0], {"price": 0, "index": 85})
-        self.assertEqual(sma.cross_info[1], {"price": 500, "index": 85})
+        self.assertEqual(sma.cross_info[0], {"price": 0, "index": index})
+        self.assertEqual(sma.cross_info[1], {"price": price, "index": index})
+
+    def test_update_trading_info_keep_same_signal_as_pandas_rolling(self):
+        random.seed(7)
+        series = [
+            [float(random.choice([100, 101, 102])) for _ in range(400)],
+            [round(random.uniform(50000000, 50100000)) for _ in range(400)],
+            [round(random.gauss(300, 2), 2) for _ in range(400)],
+        ]
+        with open(
+            "tests/unit_tests/data/upbit_1m_20200220_170000-20200220_202000.json",
+            "r",
+        ) as f:
+            series.append([candle["trade_price"] for candle in reversed(json.load(f))])
+
+        for prices in series:
+            sma = StrategySma()
+            sma.initialize(100000, 10)
+            expected = _PandasSmaReference(sma)
+            for price in prices:
+                self._feed(sma, [price])
+                expected.update(price)
+                self.assertEqual(sma.current_process, expected.current_process)
+                self.assertEqual(sma.process_unit, expected.process_unit)
+                self.assertEqual(sma.cross_info, expected.cross_info)
+
+    def test_get_warmup_count_cover_long_average_and_deviation_history(self):
+        sma = StrategySma()
+        self.assertEqual(sma.get_warmup_count(), sma.LONG + sma.STD_K)
 
     def test_update_trading_info_ignore_info_when_not_yet_initialzed(self):
         sma = StrategySma()
@@ -374,7 +348,7 @@ class StrategySmaTests(unittest.TestCase):
         sma = StrategySma()
         sma.initialize(100, 10)
         dummy_info = {"closing_price": 2000}
-        sma.closing_price_list.append(dummy_info)
+        sma.data.append(dummy_info)
         sma.cross_info[0] = {"price": 0, "index": 1}
         requests = sma.get_request()
         self.assertEqual(requests, None)
@@ -0,0 +1,195 @@
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from unittest.mock import *
+from smtm import BinanceStreamDataProvider, UpbitStreamDataProvider
+from smtm.data.data_provider_factory import DataProviderFactory
+from smtm.data.stream_data_provider import TradeCandleAggregator
+from smtm.data.stream_replay_server import StreamReplayServer
+
+# 2020-03-10T22:52:00 KST
+MINUTE = 1583848320000
+
+
+def upbit_trade(price, volume, timestamp, code="KRW-BTC"):
+    return json.dumps({
+        "type": "trade", "code": code, "trade_price": price,
+        "trade_volume": volume, "trade_timestamp": timestamp,
+    })
+
+
+def wait_until(condition, timeout=3):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class TradeCandleAggregatorTests(unittest.TestCase):
+    def test_add_trade_build_candle_and_close_on_next_interval(self):
+        aggregator = TradeCandleAggregator("BTC", 60)
+
+        self.assertIsNone(aggregator.add_trade(100, 1, MINUTE + 1000))
+        aggregator.add_trade(120, 2, MINUTE + 20000)
+        aggregator.add_trade(90, 1, MINUTE + 40000)
+        closed = aggregator.add_trade(95, 1, MINUTE + 61000)
+
+        self.assertEqual(closed, {
+            "type": "primary_candle", "market": "BTC", "date_time": "2020-03-10T22:52:00",
+            "opening_price": 100, "high_price": 120, "low_price": 90,
+            "closing_price": 90, "acc_price": 430, "acc_volume": 4,
+        })
+        self.assertEqual(aggregator.get_candle()["date_time"], "2020-03-10T22:53:00")
+        self.assertEqual(aggregator.get_candle()["opening_price"], 95)
+        self.assertEqual(list(aggregator.closed), [closed])
+
+    def test_add_trade_ignore_late_trade_of_closed_candle(self):
+        aggregator = TradeCandleAggregator("BTC", 60)
+        aggregator.add_trade(100, 1, MINUTE + 61000)
+
+        self.assertIsNone(aggregator.add_trade(1, 1, MINUTE + 59000))
+        self.assertEqual(aggregator.get_candle()["low_price"], 100)
+
+    def test_seed_continue_from_rest_candle(self):
+        aggregator = TradeCandleAggregator("BTC", 60)
+        aggregator.seed({
+            "type": "primary_candle", "market": "BTC", "date_time": "2020-03-10T22:52:00",
+            "opening_price": 100, "high_price": 110, "low_price": 100,
+            "closing_price": 105, "acc_price": 1000, "acc_volume": 10,
+        })
+        aggregator.add_trade(120, 1, MINUTE + 30000)
+
+        candle = aggregator.get_candle()
+        self.assertEqual(candle["high_price"], 120)
+        self.assertEqual(candle["acc_volume"], 11)
+        # 더 오래된 캔들로는 덮어쓰지 않는다
+        aggregator.seed(dict(candle, date_time="2020-03-10T22:51:00", closing_price=1))
+        self.assertEqual(aggregator.get_candle()["closing_price"], 120)
+
+
+class StreamDataProviderTests(unittest.TestCase):
+    def _serve(self, messages, **kwargs):
+        server = StreamReplayServer(messages, speed=0, **kwargs)
+        server.start()
+        self.addCleanup(server.stop)
+        return server
+
+    def _provider(self, provider_class, url, **kwargs):
+        provider = provider_class("BTC", 60, url=url, **kwargs)
+        provider.rest_dp.get_info = MagicMock(return_value=[{
+            "type": "primary_candle", "market": "BTC", "date_time": "2020-03-10T22:51:00",
+            "opening_price": 1, "high_price": 1, "low_price": 1, "closing_price": 1,
+            "acc_price": 1, "acc_volume": 1,
+        }])
+        self.addCleanup(provider.close)
+        return provider
+
+    def test_get_info_serve_candle_built_from_replayed_upbit_trades(self):
+        server = self._serve([
+            upbit_trade(100, 1, MINUTE + 1000),
+            json.dumps({"type": "ticker"}),
+            upbit_trade(110, 2, MINUTE + 2000),
+        ], binary=True)
+        provider = self._provider(UpbitStreamDataProvider, server.url)
+
+        # 스트림이 연결되기 전에는 REST로 조회한다
+        self.assertEqual(provider.get_info()[0]["closing_price"], 1)
+        self.assertTrue(wait_until(lambda: provider.trade_count == 2))
+
+        info = provider.get_info()
+        self.assertEqual(info[0]["date_time"], "2020-03-10T22:52:00")
+        self.assertEqual(info[0]["closing_price"], 110)
+        self.assertEqual(info[0]["acc_volume"], 3)
+        self.assertEqual(provider.rest_dp.get_info.call_count, 1)
+        self.assertEqual(provider.get_stream_stats()["messages"], 3)
+
+    def test_binance_stream_record_messages_and_store_closed_candles(self):
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root, True)
+        record_path = os.path.join(root, "trades.jsonl")
+        messages = [
+            json.dumps({"e": "trade", "s": "BTCUSDT", "p": "100", "q": "1", "T": MINUTE}),
+            json.dumps({"e": "trade", "s": "BTCUSDT", "p": "101", "q": "1", "T": MINUTE + 60000}),
+        ]
+        server = self._serve(messages)
+        provider = self._provider(BinanceStreamDataProvider, server.url, record_path=record_path)
+        provider.rest_dp._store_candles = MagicMock()
+        listener = MagicMock()
+        provider.add_candle_listener(listener)
+
+        provider.get_info()
+        self.assertTrue(wait_until(lambda: provider.trade_count == 2))
+        provider.close()
+
+        stored = provider.rest_dp._store_candles.call_args[0][0]
+        self.assertEqual(stored[0]["date_time"], "2020-03-10T22:52:00")
+        # REST로 받아 이어서 집계하던 캔들도 스트림의 첫 체결에서 닫힌다
+        self.assertEqual(
+            [call.args[0]["date_time"] for call in listener.call_args_list],
+            ["2020-03-10T22:51:00", "2020-03-10T22:52:00"],
+        )
+        with open(record_path, "r", encoding="utf-8") as f:
+            self.assertEqual(f.read().splitlines(), messages)
+
+    def test_replay_with_mixed_markets_aggregate_only_own_market(self):
+        upbit_server = self._serve([
+            upbit_trade(100, 1, MINUTE + 1000),
+            upbit_trade(5, 7, MINUTE + 1500, code="KRW-ETH"),
+            upbit_trade(110, 2, MINUTE + 2000),
+        ], binary=True)
+        binance_server = self._serve([
+            json.dumps({"e": "trade", "s": "ETHUSDT", "p": "5", "q": "7", "T": MINUTE}),
+            json.dumps({"e": "trade", "s": "BTCUSDT", "p": "100", "q": "1", "T": MINUTE + 1000}),
+        ])
+        upbit = self._provider(UpbitStreamDataProvider, upbit_server.url)
+        binance = self._provider(BinanceStreamDataProvider, binance_server.url)
+
+        upbit.get_info()
+        binance.get_info()
+        # 두 스트림 모두 마지막 메시지가 BTC 체결이다
+        self.assertTrue(wait_until(lambda: upbit.trade_count == 2 and binance.trade_count == 1))
+
+        self.assertEqual(upbit.get_stream_stats()["messages"], 3)
+        self.assertEqual(binance.get_stream_stats()["messages"], 2)
+        info = upbit.get_info()[0]
+        self.assertEqual((info["low_price"], info["acc_volume"]), (100, 3))
+        info = binance.get_info()[0]
+        self.assertEqual((info["low_price"], info["acc_volume"]), (100, 1))
+
+    def test_stalled_stream_fall_back_to_rest_and_drop_connection(self):
+        server = self._serve([upbit_trade(100, 1, MINUTE + 1000)], binary=True)
+        provider = self._provider(UpbitStreamDataProvider, server.url)
+        provider.RECV_TIMEOUT = 0.05
+        provider.STALL_TIMEOUT = 0.3
+        # 다시 접속해서 같은 체결을 또 받기 전에 상태를 확인한다
+        provider.RECONNECT_DELAY = 10
+
+        provider.get_info()
+        self.assertTrue(wait_until(lambda: provider.trade_count == 1))
+        self.assertEqual(provider.get_info()[0]["closing_price"], 100)
+
+        # 서버는 마지막 메시지 뒤로 연결만 열어 두고 아무것도 보내지 않는다
+        time.sleep(0.35)
+        self.assertEqual(provider.get_info()[0]["closing_price"], 1)
+        self.assertTrue(wait_until(lambda: provider.connection is None))
+        self.assertFalse(provider.connected)
+        self.assertEqual(provider.rest_dp.get_info.call_count, 2)
+
+    def test_upbit_subscribe_message_and_binance_default_url(self):
+        provider = UpbitStreamDataProvider("ETH")
+        message = json.loads(provider._get_subscribe_message())
+        self.assertEqual(message[1], {"type": "trade", "codes": ["KRW-ETH"]})
+        self.assertEqual(
+            BinanceStreamDataProvider("XRP").url,
+            "wss://stream.binance.com:9443/ws/xrpusdt@trade",
+        )
+
+    def test_exchange_providers_resolve_to_rest_provider(self):
+        provider = DataProviderFactory.create("UPS")
+        self.assertIsInstance(provider, UpbitStreamDataProvider)
+        self.assertEqual(DataProviderFactory.get_exchange_providers(provider), [provider.rest_dp])
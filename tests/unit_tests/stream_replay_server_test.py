@@ -0,0 +1,40 @@
+import json
+import time
+import unittest
+from smtm.data.stream_replay_server import StreamReplayServer
+from websockets.sync.client import connect
+
+
+class StreamReplayServerTests(unittest.TestCase):
+    def _start(self, server):
+        server.start()
+        self.addCleanup(server.stop)
+        return server
+
+    def test_replay_messages_with_recorded_pace(self):
+        server = StreamReplayServer([
+            json.dumps({"T": 1000, "p": "1"}),
+            "",
+            json.dumps({"T": 1200, "p": "2"}),
+        ], speed=2)
+        self._start(server)
+
+        with connect(server.url, open_timeout=2) as client:
+            started = time.monotonic()
+            first = json.loads(client.recv())
+            second = json.loads(client.recv())
+
+        self.assertEqual((first["p"], second["p"]), ("1", "2"))
+        self.assertGreaterEqual(time.monotonic() - started, 0.08)
+        self.assertEqual(server.client_count, 1)
+
+    def test_rebase_time_stamp_first_message_with_connect_time(self):
+        server = StreamReplayServer([json.dumps({"trade_timestamp": 1000})], speed=0,
+                                    rebase_time=True, binary=True)
+        self._start(server)
+
+        with connect(server.url, open_timeout=2) as client:
+            message = client.recv()
+
+        self.assertIsInstance(message, bytes)
+        self.assertAlmostEqual(json.loads(message)["trade_timestamp"] / 1000, time.time(), delta=5)
@@ -1,4 +1,8 @@
+import os
+import shutil
+import tempfile
 import unittest
+from unittest.mock import patch
 from smtm.llm.system_monitor import SystemMonitor
 
 
@@ -83,3 +87,84 @@ class SystemMonitorSessionTagTests(unittest.TestCase):
         self.assertEqual(len(logs), 1)
         self.assertEqual(logs[0]["result"]["n"], 1)
         self.assertEqual(len(self.monitor.get_trade_log()), 2)
+
+
+class SystemMonitorBoundedStorageTests(unittest.TestCase):
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def test_market_data_log_spills_to_storage_path_over_capacity(self):
+        monitor = SystemMonitor(storage_path=self.path, capacities={"market_data_log": 10})
+        for idx in range(25):
+            monitor.log_market_data([{"n": idx}], session="s1")
+
+        self.assertLessEqual(len(monitor.market_data_log.records), 10)
+        self.assertEqual(len(monitor.market_data_log), 25)
+        self.assertEqual(monitor.market_data_log[0]["data"][0]["n"], 0)
+        self.assertEqual(len(os.listdir(self.path)), 1)
+
+    def test_default_monitor_drops_old_records_without_writing_files(self):
+        cwd = os.getcwd()
+        os.chdir(self.path)
+        try:
+            monitor = SystemMonitor(capacities={"market_data_log": 10})
+            for idx in range(25):
+                monitor.log_market_data([{"n": idx}], session="s1")
+        finally:
+            os.chdir(cwd)
+
+        self.assertIsNone(monitor.storage_path)
+        self.assertEqual(monitor.market_data_log.dropped_count + len(monitor.market_data_log), 25)
+        self.assertEqual(monitor.market_data_log[-1]["data"][0]["n"], 24)
+        self.assertEqual(os.listdir(self.path), [])
+
+    def test_get_trade_log_uses_time_range_and_session(self):
+        monitor = SystemMonitor(storage_path=self.path, capacities={"trade_result_log": 2})
+        timestamps = [
+            "2026-01-01T00:00:00", "2026-01-01T01:00:00",
+            "2026-01-01T02:00:00", "2026-01-01T03:00:00",
+        ]
+        for idx, timestamp in enumerate(timestamps):
+            with patch.object(monitor, "_timestamp", return_value=timestamp):
+                monitor.log_trade_result({"n": idx}, session="s1" if idx != 2 else "s2")
+
+        logs = monitor.get_trade_log(
+            start_time="2026-01-01T01:00:00", end_time="2026-01-01T03:00:00", session="s1"
+        )
+
+        self.assertEqual([log["result"]["n"] for log in logs], [1, 3])
+
+    def test_get_llm_usage_counts_spilled_interactions(self):
+        monitor = SystemMonitor(storage_path=None, capacities={"llm_interaction_log": 2})
+        for _ in range(5):
+            monitor.log_llm_interaction({}, "r", {"input_tokens": 10, "output_tokens": 5})
+
+        usage = monitor.get_llm_usage()
+
+        self.assertEqual(usage["total_input_tokens"], 50)
+        self.assertEqual(usage["total_output_tokens"], 25)
+        self.assertEqual(usage["call_count"], 5)
+
+    def test_get_trade_count_returns_count_per_session(self):
+        monitor = SystemMonitor(storage_path=self.path, capacities={"trade_result_log": 4})
+        for idx in range(9):
+            monitor.log_trade_result({"n": idx}, session="s1" if idx < 6 else "s2")
+
+        self.assertEqual(monitor.get_trade_count(), 9)
+        self.assertEqual(monitor.get_trade_count(session="s1"), 6)
+        self.assertEqual(monitor.get_trade_count(session="s2"), 3)
+
+    def test_get_log_sizes_reports_kept_and_dropped_records(self):
+        monitor = SystemMonitor(storage_path=None, capacities={"trade_result_log": 4})
+        for i in range(10):
+            monitor.log_trade_result({"id": i})
+
+        sizes = monitor.get_log_sizes()
+        self.assertEqual(set(sizes), set(SystemMonitor.LOG_CAPACITY))
+        self.assertEqual(sizes["trade_result_log"]["in_memory"], len(monitor.trade_result_log))
+        self.assertGreater(sizes["trade_result_log"]["dropped"], 0)
+        self.assertEqual(sizes["market_data_log"],
+                         {"records": 0, "in_memory": 0, "dropped": 0})
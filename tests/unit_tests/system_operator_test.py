@@ -87,6 +87,16 @@ class SystemOperatorSetupTests(unittest.TestCase):
         self.assertIn("get_portfolio", tool_names)
         self.assertIn("get_trade_history", tool_names)
         self.assertIn("get_performance", tool_names)
+        self.assertIn("get_latency", tool_names)
+
+    def test_metrics_server_is_opt_in(self):
+        operator = make_operator()
+        self.assertIsNone(operator.metrics_server)
+
+        operator = make_operator(config_extra={"metrics_port": 0})
+        self.assertIsNotNone(operator.metrics_server.server)
+        operator.shutdown()
+        self.assertIsNone(operator.metrics_server)
 
 
 class SystemOperatorOrchestrationTests(unittest.TestCase):
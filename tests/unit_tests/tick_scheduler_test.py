@@ -0,0 +1,106 @@
+import time
+import unittest
+from smtm.tick_scheduler import TickJob, TickScheduler
+
+
+class TickSchedulerNextTimeTests(unittest.TestCase):
+    def test_next_time_is_aligned_to_interval_boundary_plus_offset(self):
+        self.assertEqual(TickScheduler.get_next_time(60, 0.3, now=1200.0), 1200.3)
+        self.assertEqual(TickScheduler.get_next_time(60, 0.3, now=1200.3), 1260.3)
+        self.assertEqual(TickScheduler.get_next_time(60, 0.3, now=1259.9), 1260.3)
+
+    def test_next_time_without_offset(self):
+        self.assertEqual(TickScheduler.get_next_time(10, now=1234.5), 1240)
+
+    def test_offset_is_dropped_when_longer_than_interval(self):
+        self.assertEqual(TickScheduler.get_offset(60), TickScheduler.OFFSET)
+        self.assertEqual(TickScheduler.get_offset(0.1), 0.0)
+
+
+class TickJobTests(unittest.TestCase):
+    def test_record_start_updates_lateness_stats(self):
+        job = TickJob(None, 60)
+        job.record_start(100.0, now=100.5)
+        job.record_start(160.0, now=160.1)
+
+        stats = job.get_stats()
+        self.assertEqual(stats["tick_count"], 2)
+        self.assertAlmostEqual(stats["last_lateness"], 0.1)
+        self.assertAlmostEqual(stats["max_lateness"], 0.5)
+        self.assertAlmostEqual(stats["avg_lateness"], 0.3)
+
+
+class TickSchedulerTests(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = TickScheduler()
+
+    def _wait_until(self, condition, timeout=2):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if condition():
+                return True
+            time.sleep(0.01)
+        return False
+
+    def test_fires_on_aligned_boundaries(self):
+        fired = []
+        job = self.scheduler.add(
+            lambda scheduled: (fired.append((scheduled, time.time())), job.done()), 0.05)
+        self.addCleanup(job.cancel)
+
+        self.assertTrue(self._wait_until(lambda: len(fired) >= 3))
+        for scheduled, actual in fired:
+            self.assertAlmostEqual((scheduled / 0.05) % 1, 0, delta=1e-6)
+            self.assertGreaterEqual(actual, scheduled)
+
+    def test_running_job_coalesces_boundaries(self):
+        fired = []
+
+        def callback(scheduled):
+            fired.append(scheduled)
+
+        job = self.scheduler.add(callback, 0.02)
+        self.addCleanup(job.cancel)
+        self.assertTrue(self._wait_until(lambda: len(fired) == 1))
+
+        # done()을 부르기 전까지는 경계가 와도 다시 발행하지 않는다
+        time.sleep(0.15)
+        self.assertEqual(len(fired), 1)
+        self.assertGreater(job.coalesced_count, 0)
+
+        job.done()
+        self.assertTrue(self._wait_until(lambda: len(fired) == 2))
+
+    def test_scheduler_woken_late_fires_once(self):
+        fired = []
+        job = TickJob(fired.append, 10)
+
+        self.scheduler._fire(job, 100.0, now=135.0)
+
+        self.assertEqual(fired, [130.0])
+        self.assertEqual(job.coalesced_count, 3)
+
+    def test_cancel_stops_firing(self):
+        fired = []
+        job = self.scheduler.add(lambda scheduled: (fired.append(scheduled), job.done()), 0.02)
+        self.assertTrue(self._wait_until(lambda: len(fired) >= 1))
+
+        job.cancel()
+        time.sleep(0.05)
+        count = len(fired)
+        time.sleep(0.1)
+
+        self.assertEqual(len(fired), count)
+        self.assertEqual(self.scheduler.get_job_count(), 0)
+
+    def test_callback_error_does_not_stop_scheduler(self):
+        calls = []
+
+        def callback(scheduled):
+            calls.append(scheduled)
+            raise RuntimeError("x")
+
+        job = self.scheduler.add(callback, 0.02)
+        self.addCleanup(job.cancel)
+
+        self.assertTrue(self._wait_until(lambda: len(calls) >= 2))
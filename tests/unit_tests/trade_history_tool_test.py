@@ -19,11 +19,11 @@ class TradeHistoryToolTests(unittest.TestCase):
 
     def test_session_omitted_queries_all(self):
         self.tool.execute({})
-        self.monitor.get_trade_log.assert_called_with(session=None)
+        self.monitor.get_trade_log.assert_called_with(session=None, limit=20)
 
     def test_explicit_session_routed(self):
-        self.tool.execute({"session": "s2"})
-        self.monitor.get_trade_log.assert_called_with(session="s2")
+        self.tool.execute({"session": "s2", "count": 5})
+        self.monitor.get_trade_log.assert_called_with(session="s2", limit=5)
 
     def test_execute_returns_error_on_exception(self):
         self.monitor.get_trade_log.side_effect = Exception("db error")
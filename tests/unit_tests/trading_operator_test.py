@@ -1,9 +1,12 @@
+import threading
+import time
 import unittest
 from unittest.mock import MagicMock
-from smtm import TradingOperator, Analyzer, StrategyBuyAndHold
+from smtm import TradingOperator, Analyzer, StrategyBuyAndHold, StrategyRsi, StrategySma
 from smtm.trader.simulation_trader import SimulationTrader
 from smtm.llm.safety_guard import SafetyGuard, SafetyConfig
 from smtm.llm.system_monitor import SystemMonitor
+from smtm.tick_scheduler import TickJob, TickScheduler
 
 
 class FakeDataProvider:
@@ -50,6 +53,65 @@ class TradingOperatorInitTests(unittest.TestCase):
         self.assertIsNotNone(operator.strategy)
 
 
+class TradingOperatorWarmUpTests(unittest.TestCase):
+    def _candles(self, prices):
+        return [{
+            "type": "primary_candle", "market": "BTC",
+            "date_time": f"2026-07-03T11:{idx:02d}:00",
+            "opening_price": price, "high_price": price, "low_price": price,
+            "closing_price": price, "acc_price": 0, "acc_volume": 0,
+        } for idx, price in enumerate(prices)]
+
+    def test_initialize_feeds_warmup_candles_to_strategy(self):
+        monitor = SystemMonitor()
+        analyzer = Analyzer(monitor)
+        trader = SimulationTrader(budget=500000, currency="BTC")
+        strategy = StrategyRsi()
+        operator = TradingOperator(interval=60, currency="BTC")
+        prices = [50000 - idx * 100 for idx in range(strategy.get_warmup_count())]
+
+        operator.initialize(
+            FakeDataProvider(), strategy, trader, analyzer, MagicMock(),
+            warmup_candles=self._candles(prices))
+
+        self.assertEqual(len(strategy.data), len(prices))
+        self.assertIsNotNone(strategy.rsi_info)
+        self.assertEqual(strategy.position, "buy")
+        self.assertEqual(trader.quotes["BTC"], prices[-1])
+        # 워밍업 중 생긴 매매 지점은 그래프에 남지 않고 콜백은 원래대로 돌아온다
+        self.assertEqual(strategy.add_spot_callback, analyzer.add_drawing_spot)
+        self.assertEqual(monitor.get_trade_log(), [])
+
+    def test_first_live_tick_does_not_order_on_cross_inside_warmup(self):
+        trader = SimulationTrader(budget=500000, currency="BTC")
+        strategy = StrategySma()
+        guard = SafetyGuard(SafetyConfig(
+            max_trade_amount=1000000, max_daily_trades=20,
+            max_loss_ratio=-0.9, initial_budget=500000,
+        ))
+        operator = TradingOperator(interval=60, currency="BTC")
+        # 하락 후 상승해서 워밍업 마지막 캔들 근처에서 골든 크로스가 난다
+        prices = [50000 - idx for idx in range(60)] + [49940 + idx * 2 for idx in range(1, 30)]
+        candles = self._candles(prices)
+        for idx, candle in enumerate(candles):
+            candle["date_time"] = f"2026-07-03T{10 + idx // 60}:{idx % 60:02d}:00"
+        operator.initialize(
+            FakeDataProvider(50000), strategy, trader, Analyzer(SystemMonitor()), guard,
+            warmup_candles=candles)
+        self.assertEqual(strategy.current_process, "buy")
+
+        operator.state = "running"
+        operator._execute_trading(None)
+        operator.timer.cancel()
+
+        self.assertEqual(trader.order_history, [])
+        self.assertEqual(trader.balance, 500000)
+
+    def test_initialize_without_warmup_candles_keeps_strategy_empty(self):
+        _, _, strategy, _ = make_operator()
+        self.assertEqual(strategy.data, [])
+
+
 class TradingOperatorTickTests(unittest.TestCase):
     def _make(self, **kwargs):
         operator_tuple = make_operator(**kwargs)
@@ -65,6 +127,33 @@ class TradingOperatorTickTests(unittest.TestCase):
                 if operator.timer is not None:
                     operator.timer.cancel()
 
+    def test_tick_records_stage_latency(self):
+        operator, _, _, _ = self._make()
+        operator.state = "running"
+        operator._execute_trading(None)
+
+        report = operator.get_latency_report()
+        for stage in ("tick", "data_provider", "strategy_update", "strategy",
+                      "safety_guard", "trader", "analyzer"):
+            self.assertEqual(report[stage]["count"], 1, stage)
+        self.assertGreaterEqual(report["tick"]["max"], report["strategy"]["max"])
+
+    def test_fill_latency_and_safety_blocks_are_counted(self):
+        operator, _, _, _ = self._make(max_trade_amount=1)
+        operator._send_requests([{
+            "id": "t1", "type": "buy", "price": 50000, "amount": 0.5,
+            "date_time": "2026-07-03T12:00:00",
+        }])
+        self.assertEqual(operator.metrics.get_counters(), {"safety_blocked": 1})
+
+        operator, trader, _, _ = self._make()
+        trader.update_quote("BTC", 50000)
+        operator._send_requests([{
+            "id": "t2", "type": "buy", "price": 50000, "amount": 0.001,
+            "date_time": "2026-07-03T12:00:00",
+        }])
+        self.assertEqual(operator.get_latency_report()["order_fill"]["count"], 1)
+
     def test_tick_executes_full_pipeline_and_buys(self):
         operator, trader, _, monitor = self._make()
         operator.state = "running"
@@ -157,3 +246,82 @@ class TradingOperatorLifecycleTests(unittest.TestCase):
         operator.start()
         self.assertFalse(operator.start())
         operator.stop()
+
+    def test_stop_during_tick_does_not_reschedule(self):
+        operator, trader, _, _ = make_operator()
+        operator.scheduler = TickScheduler()
+        in_tick = threading.Event()
+        release = threading.Event()
+        tick_done = threading.Event()
+        get_info = operator.data_provider.get_info
+
+        def blocking_get_info():
+            in_tick.set()
+            release.wait(2)
+            return get_info()
+
+        start_timer = operator._start_timer
+
+        def start_timer_and_notify():
+            start_timer()
+            tick_done.set()
+
+        def cancel_all_requests():
+            # stop()이 스케줄을 취소한 뒤에 진행 중이던 틱이 끝나도록 한다
+            release.set()
+            tick_done.wait(2)
+
+        operator.data_provider.get_info = blocking_get_info
+        operator._start_timer = start_timer_and_notify
+        trader.cancel_all_requests = cancel_all_requests
+
+        operator.start()
+        self.assertTrue(in_tick.wait(2))
+        operator.stop()
+
+        self.assertTrue(tick_done.is_set())
+        self.assertEqual(operator.state, "ready")
+        self.assertIsNone(operator.timer)
+        self.assertFalse(operator.is_timer_running)
+        self.assertEqual(operator.scheduler.get_job_count(), 0)
+
+
+class TradingOperatorScheduleTests(unittest.TestCase):
+    def test_ticks_follow_aligned_schedule_and_record_lateness(self):
+        monitor = SystemMonitor()
+        operator = TradingOperator(interval=0.05, currency="BTC", scheduler=TickScheduler())
+        operator.initialize(
+            FakeDataProvider(), StrategyBuyAndHold(),
+            SimulationTrader(budget=500000, currency="BTC"), Analyzer(monitor),
+            SafetyGuard(SafetyConfig(
+                max_trade_amount=1000000, max_daily_trades=20,
+                max_loss_ratio=-0.9, initial_budget=500000,
+            )),
+        )
+        self.assertIsNone(operator.get_tick_stats())
+
+        operator.start()
+        deadline = time.monotonic() + 2
+        while time.monotonic() < deadline and (operator.get_tick_stats() or {}).get(
+                "tick_count", 0) < 2:
+            time.sleep(0.01)
+        stats = operator.get_tick_stats()
+        operator.stop()
+
+        self.assertGreaterEqual(stats["tick_count"], 2)
+        self.assertGreaterEqual(stats["max_lateness"], 0)
+        self.assertIsNone(operator.timer)
+
+    def test_scheduled_tick_records_lateness_and_releases_job(self):
+        operator, _, _, _ = make_operator()
+        operator.state = "running"
+        job = TickJob(None, 60)
+        operator.timer = job
+        operator.is_timer_running = True
+        job.running = True
+
+        operator._execute_trading({"scheduled_time": time.time() - 1})
+
+        self.assertFalse(job.running)
+        self.assertEqual(job.tick_count, 1)
+        self.assertGreaterEqual(job.last_lateness, 1)
@@ -55,3 +55,24 @@ class UpbitBinanceDataProviderTests(unittest.TestCase):
         self.assertEqual(info[1]["closing_price"], 0.015771)
         self.assertEqual(info[1]["acc_price"], 2434.19055334)
         self.assertEqual(info[1]["acc_volume"], 148976.11427815)
+
+    def test_get_info_return_upbit_only_when_binance_fails(self):
+        dp = UpbitBinanceDataProvider("BTC")
+        dp.upbit_dp = MagicMock()
+        dp.upbit_dp.get_info.return_value = [{"market": "BTC-KRW"}]
+        dp.binance_dp = MagicMock()
+        dp.binance_dp.get_info.side_effect = UserWarning("Fail get data from sever")
+
+        info = dp.get_info()
+
+        self.assertEqual(info, [{"market": "BTC-KRW", "type": "primary_candle"}])
+
+    def test_get_info_raise_error_when_upbit_fails(self):
+        dp = UpbitBinanceDataProvider("BTC")
+        dp.upbit_dp = MagicMock()
+        dp.upbit_dp.get_info.side_effect = UserWarning("Fail get data from sever")
+        dp.binance_dp = MagicMock()
+        dp.binance_dp.get_info.return_value = [{"market": "BTC-USDT"}]
+
+        with self.assertRaises(UserWarning):
+            dp.get_info()
@@ -1,5 +1,9 @@
+import shutil
+import tempfile
 import unittest
+from datetime import datetime, timedelta
 from smtm import UpbitDataProvider
+from smtm.data.candle_store import CandleStore
 from unittest.mock import *
 import requests
 
@@ -43,7 +47,7 @@ class UpbitDataProviderTests(unittest.TestCase):
         self.assertEqual(info[0]["acc_price"], 11277224.71063000)
         self.assertEqual(info[0]["acc_volume"], 1.15377852)
         mock_get.assert_called_once_with(
-            dp.URL, params={"market": "KRW-BTC", "count": 1}
+            dp.URL, params={"market": "KRW-BTC", "count": 2}
         )
 
     @patch("requests.get")
@@ -106,26 +110,170 @@ class UpbitDataProviderTests(unittest.TestCase):
         dp.get_info()
         expected_url = "https://api.upbit.com/v1/candles/minutes/1"
         mock_get.assert_called_once_with(
-            expected_url, params={"market": "KRW-BTC", "count": 1}
+            expected_url, params={"market": "KRW-BTC", "count": 2}
         )
 
         dp = UpbitDataProvider("BTC", 180)
         dp.get_info()
         expected_url = "https://api.upbit.com/v1/candles/minutes/3"
         mock_get.assert_called_with(
-            expected_url, params={"market": "KRW-BTC", "count": 1}
+            expected_url, params={"market": "KRW-BTC", "count": 2}
         )
 
         dp = UpbitDataProvider("BTC", 300)
         dp.get_info()
         expected_url = "https://api.upbit.com/v1/candles/minutes/5"
         mock_get.assert_called_with(
-            expected_url, params={"market": "KRW-BTC", "count": 1}
+            expected_url, params={"market": "KRW-BTC", "count": 2}
         )
 
         dp = UpbitDataProvider("BTC", 600)
         dp.get_info()
         expected_url = "https://api.upbit.com/v1/candles/minutes/10"
         mock_get.assert_called_with(
-            expected_url, params={"market": "KRW-BTC", "count": 1}
+            expected_url, params={"market": "KRW-BTC", "count": 2}
         )
+
+    @patch("requests.get")
+    def test_get_info_store_only_closed_candles(self, mock_get):
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root, True)
+        dp = UpbitDataProvider("BTC")
+        dp.candle_store = CandleStore(root)
+
+        def candle(minute, price):
+            return {
+                "candle_date_time_kst": f"2020-03-10T22:{minute}:00",
+                "opening_price": 100, "high_price": price, "low_price": 100,
+                "trade_price": price, "candle_acc_trade_price": price,
+                "candle_acc_trade_volume": 1,
+            }
+
+        responses = []
+        # 같은 분에 두 번, 다음 분에 한 번 조회한다. 최신 캔들이 먼저 온다
+        for data in (
+            [candle(52, 101), candle(51, 90)],
+            [candle(52, 105), candle(51, 90)],
+            [candle(53, 100), candle(52, 110)],
+        ):
+            response = MagicMock()
+            response.json.return_value = data
+            responses.append(response)
+        mock_get.side_effect = responses
+
+        infos = [dp.get_info()[0] for _ in range(3)]
+
+        self.assertEqual([info["closing_price"] for info in infos], [101, 105, 100])
+        stored = CandleStore.to_candles(dp.candle_store.read("UPB", "BTC", 60), "BTC")
+        self.assertEqual(
+            [(c["date_time"], c["closing_price"]) for c in stored],
+            [("2020-03-10T22:51:00", 90), ("2020-03-10T22:52:00", 110)],
+        )
+
+    @patch("requests.get")
+    def test_get_recent_candles_fetch_completed_candles_in_time_order(self, mock_get):
+        dp = UpbitDataProvider("BTC")
+        dummy_response = MagicMock()
+        dummy_response.json.return_value = [
+            {
+                "candle_date_time_kst": f"2020-03-10T22:5{minute}:00",
+                "opening_price": minute,
+                "high_price": minute,
+                "low_price": minute,
+                "trade_price": minute,
+                "candle_acc_trade_price": 1.0,
+                "candle_acc_trade_volume": 1.0,
+            }
+            for minute in (3, 2, 1)
+        ]
+        mock_get.return_value = dummy_response
+
+        candles = dp.get_recent_candles(2)
+
+        mock_get.assert_called_once_with(
+            "https://api.upbit.com/v1/candles/minutes/1",
+            params={"market": "KRW-BTC", "count": 3},
+        )
+        # 가장 최신 캔들은 아직 만들어지고 있으므로 제외된다
+        self.assertEqual([c["closing_price"] for c in candles], [1, 2])
+        self.assertEqual(candles[0]["date_time"], "2020-03-10T22:51:00")
+
+    @patch("requests.get")
+    def test_get_recent_candles_read_from_candle_store_when_recent_candles_are_stored(
+        self, mock_get
+    ):
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root, True)
+        dp = UpbitDataProvider("BTC")
+        dp.candle_store = CandleStore(root)
+        now = datetime.now(dp.KST).replace(second=0, microsecond=0, tzinfo=None)
+        dp.candle_store.append("UPB", "BTC", 60, [
+            {
+                "date_time": (now - timedelta(minutes=minute)).strftime("%Y-%m-%dT%H:%M:%S"),
+                "closing_price": minute,
+            }
+            for minute in range(5)
+        ])
+
+        candles = dp.get_recent_candles(3)
+
+        mock_get.assert_not_called()
+        self.assertEqual([c["closing_price"] for c in candles], [3, 2, 1])
+
+    @patch("requests.get")
+    def test_get_batch_info_build_candles_from_one_ticker_request(self, mock_get):
+        btc = UpbitDataProvider("BTC")
+        eth = UpbitDataProvider("ETH")
+        btc.candle_store = MagicMock()
+
+        def ticker(market, timestamp, price, high, low, acc_price, acc_volume):
+            return {
+                "market": market, "timestamp": timestamp, "trade_price": price,
+                "high_price": high, "low_price": low,
+                "acc_trade_price": acc_price, "acc_trade_volume": acc_volume,
+            }
+
+        first = MagicMock()
+        first.json.return_value = [
+            ticker("KRW-BTC", 1583848320000, 100, 120, 80, 1000, 10),
+            ticker("KRW-ETH", 1583848320000, 10, 12, 8, 500, 50),
+        ]
+        second = MagicMock()
+        second.json.return_value = [
+            # 그 사이 당일 고가가 갱신됨
+            ticker("KRW-BTC", 1583848385000, 110, 125, 80, 1600, 16),
+            # 누적 거래량이 초기화됨
+            ticker("KRW-ETH", 1583848385000, 9, 12, 8, 30, 3),
+        ]
+        mock_get.side_effect = [first, second]
+
+        self.assertEqual(UpbitDataProvider.get_batch_info([btc, eth]), {})
+        infos = UpbitDataProvider.get_batch_info([btc, eth])
+
+        mock_get.assert_called_with(
+            UpbitDataProvider.TICKER_URL, params={"markets": "KRW-BTC,KRW-ETH"}
+        )
+        self.assertEqual(infos["BTC"], [{
+            "type": "primary_candle", "market": "BTC", "date_time": "2020-03-10T22:53:00",
+            "opening_price": 100, "high_price": 125, "low_price": 100,
+            "closing_price": 110, "acc_price": 600, "acc_volume": 6,
+        }])
+        self.assertEqual(infos["ETH"][0]["low_price"], 9)
+        self.assertEqual(infos["ETH"][0]["acc_price"], 30)
+        self.assertEqual(infos["ETH"][0]["acc_volume"], 3)
+        # 현재가 차이로 만든 캔들은 거래소 캔들 대신 저장되지 않는다
+        btc.candle_store.append.assert_not_called()
+
+    @patch("requests.get")
+    def test_get_batch_info_skip_market_after_long_gap(self, mock_get):
+        dp = UpbitDataProvider("BTC")
+        dp._last_ticker = {"timestamp": 1583848000000}
+        response = MagicMock()
+        response.json.return_value = [{
+            "market": "KRW-BTC", "timestamp": 1583848385000, "trade_price": 1,
+            "high_price": 1, "low_price": 1, "acc_trade_price": 1, "acc_trade_volume": 1,
+        }]
+        mock_get.return_value = response
+
+        self.assertEqual(UpbitDataProvider.get_batch_info([dp]), {})
+        self.assertEqual(dp._last_ticker["timestamp"], 1583848385000)
@@ -48,3 +48,25 @@ class UpbitFullContextDataProviderTests(unittest.TestCase):
         self.assertEqual(info[0]["type"], "primary_candle")
         self.assertEqual(info[1]["type"], "price_snapshot")
         self.assertEqual(info[2]["type"], "funding_rate")
+
+    def test_get_info_return_sources_finished_before_deadline(self):
+        import threading
+
+        dp = UpbitFullContextDataProvider("BTC", deadline=0.1)
+        dp.upbit_dp = MagicMock()
+        dp.upbit_dp.get_info.return_value = [{"market": "BTC"}]
+        release = threading.Event()
+        fast = MagicMock()
+        fast.get_info.return_value = [{"type": "fear_greed"}]
+        slow = MagicMock()
+        slow.get_info.side_effect = lambda: release.wait(2) and []
+        dp.providers = [slow, fast]
+
+        info = dp.get_info()
+        release.set()
+
+        self.assertEqual([item["type"] for item in info], ["primary_candle", "fear_greed"])
+        latency = dp.get_latency()
+        self.assertIn("MagicMock", latency)
+        self.assertIsNone(latency["MagicMock"])
+        self.assertIsNotNone(latency["MagicMock#1"])
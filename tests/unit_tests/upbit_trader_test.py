@@ -310,6 +310,43 @@ class UpditTraderTests(unittest.TestCase):
         trader._start_timer.assert_not_called()
         trader._query_order_list.assert_called_once_with(["mango", "orange"])
 
+    def test__update_order_result_should_use_order_results_from_poller(self):
+        trader = UpbitTrader()
+        trader._call_callback = MagicMock()
+        trader._query_order_list = MagicMock()
+        trader.order_map["mango"] = {
+            "uuid": "mango",
+            "callback": MagicMock(),
+            "result": {"id": "mango_result", "state": "requested", "type": "buy"},
+        }
+        order_results = [
+            {"uuid": "mango", "created_at": "today", "price": 500, "executed_volume": 0.1}
+        ]
+
+        trader._update_order_result({"order_results": order_results})
+
+        trader._query_order_list.assert_not_called()
+        self.assertEqual(trader._call_callback.call_args[0][1]["amount"], 0.1)
+        self.assertEqual(len(trader.order_map), 0)
+
+    def test_start_timer_should_register_to_order_poller(self):
+        trader = UpbitTrader()
+        trader.order_poller = MagicMock()
+
+        trader._start_timer()
+
+        trader.order_poller.register.assert_called_once_with(trader)
+        self.assertIsNone(trader.timer)
+
+    def test__query_order_batch_should_map_results_by_uuid(self):
+        trader = UpbitTrader()
+        trader._query_order_list = MagicMock(return_value=[{"uuid": "a"}, {"uuid": "b"}])
+
+        results = trader._query_order_batch(["a", "b"])
+
+        self.assertEqual(results, {"a": {"uuid": "a"}, "b": {"uuid": "b"}})
+        trader._query_order_list.assert_called_once_with(["a", "b"])
+
     def test__create_limit_order_query_return_correct_query(self):
         expected_query = {
             "market": "mango",
@@ -423,6 +460,28 @@ class UpditTraderTests(unittest.TestCase):
             headers={"Authorization": "Bearer mango_token"},
         )
 
+    def test__query_order_list_should_split_uuids_by_query_limit(self):
+        uuids = [f"id{i}" for i in range(250)]
+        trader = UpbitTrader()
+        trader._query_order_chunk = MagicMock(
+            side_effect=lambda chunk, is_done_state: [{"uuid": uuid} for uuid in chunk]
+        )
+
+        response = trader._query_order_list(uuids)
+
+        self.assertEqual([call.args[0] for call in trader._query_order_chunk.call_args_list], [
+            uuids[:100],
+            uuids[100:200],
+            uuids[200:],
+        ])
+        self.assertEqual([result["uuid"] for result in response], uuids)
+
+    def test__query_order_list_should_return_None_when_a_chunk_fails(self):
+        trader = UpbitTrader()
+        trader._query_order_chunk = MagicMock(side_effect=[[{"uuid": "id0"}], None])
+
+        self.assertIsNone(trader._query_order_list([f"id{i}" for i in range(101)]))
+
     @patch("requests.get")
     def test__query_account_should_send_correct_request(self, mock_requests):
         class DummyResponse:
@@ -782,6 +841,51 @@ class UpditTraderGetAccountTests(unittest.TestCase):
         self.assertEqual("date_time" in result, True)
         trader.get_trade_tick.assert_called_once_with()
 
+    def test_get_account_info_should_use_fresh_quote_without_ticker_request(self):
+        trader = UpbitTrader()
+        trader.worker = MagicMock()
+        trader.asset = (50000, 0.5)
+        trader.get_trade_tick = MagicMock(return_value=[{"trade_price": 777}])
+        trader.update_quote("BTC", 51000)
+
+        result = trader.get_account_info()
+        trader.get_account_info()
+
+        self.assertEqual(result["quote"], {"BTC": 51000})
+        trader.get_trade_tick.assert_not_called()
+
+    def test_get_account_info_should_query_ticker_when_quote_is_stale(self):
+        trader = UpbitTrader()
+        trader.worker = MagicMock()
+        trader.get_trade_tick = MagicMock(return_value=[{"trade_price": 777}])
+        trader.update_quote("BTC", 51000)
+        trader.quote_max_age = 0
+
+        result = trader.get_account_info()
+
+        self.assertEqual(result["quote"], {"BTC": 777})
+        trader.get_trade_tick.assert_called_once_with()
+
+    def test_get_account_info_should_reuse_queried_quote(self):
+        trader = UpbitTrader()
+        trader.worker = MagicMock()
+        trader.get_trade_tick = MagicMock(return_value=[{"trade_price": 777}])
+
+        trader.get_account_info()
+        result = trader.get_account_info()
+
+        self.assertEqual(result["quote"], {"BTC": 777})
+        trader.get_trade_tick.assert_called_once_with()
+
+    def test_get_account_info_should_omit_quote_when_query_fails(self):
+        trader = UpbitTrader()
+        trader.worker = MagicMock()
+        trader.get_trade_tick = MagicMock(return_value=None)
+
+        result = trader.get_account_info()
+
+        self.assertEqual(result["quote"], {})
+
 
 @patch.dict(os.environ, TEST_UPBIT_ENV)
 class UpditTraderCancelRequestTests(unittest.TestCase):